@@ -0,0 +1,188 @@
+"""
+Benchmark of XDR packing/unpacking of transaction envelope with shipped packer
+(generated by xdrgen in fast mode, on top of struct based stellar.xdr.codec)
+against packer generated by xdrgen without fast mode (needs ply) and against
+xdrlib, when xdrlib is available. Also compares time and memory allocated to
+build payment operations with shipped (__slots__) types and non-slots types.
+
+    python benchmarks/benchxdr.py [operations-per-transaction] [iterations]
+"""
+import os
+import sys
+import timeit
+import base64
+import shutil
+import tempfile
+import importlib
+import tracemalloc
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import stellar
+from stellar.xdr import Xdr
+from stellar.xdr import codec
+
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+    try:
+        import xdrlib
+    except ImportError:
+        xdrlib = None
+
+SECRET = 'SABS6T5RZCOGXH6RZJM6BNHAN7KXVK6VKJRUPBW2KFABEWDBTIEPCRUO'
+ACCOUNT = 'GAO4R7CQGQAV2BEPPQ2LRQP3ANUFOJOBNDEM7AAVCWZA5IIUKIO2FKR5'
+DESTINATION = 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
+ISSUER = 'GDUWG5CZ6YJNWOPQB33DOKWVWSNHJAWPWOUNAEBVTM7QRJ66NGFYEFAJ'
+
+def envelope(n_ops):
+    trx = stellar.new_transaction(ACCOUNT, signers=[SECRET], seq=42, memo='bench')
+    for i in range(n_ops):
+        if i % 2:
+            trx.pay(DESTINATION, '%d.01' % i)
+        else:
+            trx.pay(DESTINATION, '%d.01' % i, asset=('USD', ISSUER))
+    return base64.b64decode(trx.build())
+
+def compat_classes():
+    """Packer/unpacker and types module generated by xdrgen without fast and
+    slots modes, i.e. with filter hook lookup on every call, enum checks against
+    lists, field by field packing of fixed size structs and types with __dict__"""
+    try:
+        from stellar.xdr import xdrgen
+    except ImportError:
+        return None, None, None
+
+    tmp = tempfile.mkdtemp()
+    try:
+        package = os.path.join(tmp, 'xdrcompat')
+        os.mkdir(package)
+        open(os.path.join(package, '__init__.py'), 'w').close()
+        shutil.copy(codec.__file__, package)
+        source = os.path.join(os.path.dirname(codec.__file__), 'StellarXDR.x')
+        xdrgen.run(source, outdir=package)
+        sys.path.insert(0, tmp)
+        compat = importlib.import_module('xdrcompat.StellarXDR_pack')
+    finally:
+        shutil.rmtree(tmp)
+    return compat.StellarXDRPacker, compat.StellarXDRUnpacker, compat.types
+
+def legacy_classes(compat_packer, compat_unpacker):
+    """Generated packer/unpacker on top of xdrlib, as shipped before codec"""
+    class LegacyPacker(compat_packer):
+        def __init__(self, check_enum=True, check_array=True):
+            xdrlib.Packer.__init__(self)
+            self.check_enum = check_enum
+            self.check_array = check_array
+
+    class LegacyUnpacker(compat_unpacker):
+        def __init__(self, data, check_enum=True, check_array=True):
+            xdrlib.Unpacker.__init__(self, data)
+            self.check_enum = check_enum
+            self.check_array = check_array
+
+    #replace codec methods, including aliases such as pack_uint32 = pack_uint
+    for legacy, generated, base, xdrlib_base in (
+            (LegacyPacker, compat_packer, compat_packer.__bases__[0], xdrlib.Packer),
+            (LegacyUnpacker, compat_unpacker, compat_unpacker.__bases__[0], xdrlib.Unpacker)):
+        codec_methods = dict((v, k) for k, v in vars(base).items()
+                if callable(v) and not k.startswith('__'))
+        for name, value in list(vars(base).items()) + list(vars(generated).items()):
+            if callable(value) and value in codec_methods and hasattr(xdrlib_base, value.__name__):
+                setattr(legacy, name, getattr(xdrlib_base, value.__name__))
+    return LegacyPacker, LegacyUnpacker
+
+def bench(packer_class, unpacker_class, raw, iterations, repeat=5):
+    """Returns packed output and best of repeat timings of pack and unpack"""
+    tre = Xdr.StellarXDRUnpacker(raw).unpack_TransactionEnvelope()
+
+    def pack():
+        p = packer_class()
+        p.pack_TransactionEnvelope(tre)
+        return p.get_buffer()
+
+    def unpack():
+        unpacker_class(raw).unpack_TransactionEnvelope()
+
+    pack_time = min(timeit.repeat(pack, number=iterations, repeat=repeat))
+    unpack_time = min(timeit.repeat(unpack, number=iterations, repeat=repeat))
+    return pack(), pack_time, unpack_time
+
+def payments(types, n_ops):
+    """Builds payment operations same way as NewTransaction.pay does"""
+    key = types.PublicKey(Xdr.const.KEY_TYPE_ED25519, b'k' * 32)
+    ops = []
+    for i in range(n_ops):
+        code = Xdr.nullclass()
+        code.assetCode = b'USD\x00'
+        code.issuer = types.PublicKey(Xdr.const.KEY_TYPE_ED25519, key.ed25519)
+        asset = types.Asset(type=Xdr.const.ASSET_TYPE_CREDIT_ALPHANUM4, alphaNum4=code)
+
+        body = Xdr.nullclass()
+        body.type = Xdr.const.PAYMENT
+        body.paymentOp = types.PaymentOp(
+                types.PublicKey(Xdr.const.KEY_TYPE_ED25519, key.ed25519), asset, i)
+        ops.append(types.Operation([types.PublicKey(Xdr.const.KEY_TYPE_ED25519,
+            key.ed25519)], body))
+    return ops
+
+def bench_types(types, n_ops, repeat=5):
+    """Returns best of repeat timings and bytes allocated by building payments"""
+    build_time = min(timeit.repeat(lambda: payments(types, n_ops), number=1, repeat=repeat))
+    tracemalloc.start()
+    ops = payments(types, n_ops)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return build_time, allocated
+
+def main():
+    n_ops = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    raw = envelope(n_ops)
+
+    print('TransactionEnvelope with %d operations (%d bytes), %d iterations'
+            % (n_ops, len(raw), iterations))
+    out, pack_time, unpack_time = bench(Xdr.StellarXDRPacker, Xdr.StellarXDRUnpacker,
+            raw, iterations)
+    assert out == raw
+    print('fast  : pack %8.1f us  unpack %8.1f us' %
+            (pack_time*1e6/iterations, unpack_time*1e6/iterations))
+
+    compat_packer, compat_unpacker, compat_types = compat_classes()
+    if compat_packer is None:
+        print('ply not available, skipping comparison with non-fast xdrgen output')
+    else:
+        compat_out, compat_pack, compat_unpack = bench(compat_packer, compat_unpacker,
+                raw, iterations)
+        assert compat_out == out, 'fast output differs from non-fast output'
+        print('compat: pack %8.1f us  unpack %8.1f us' %
+                (compat_pack*1e6/iterations, compat_unpack*1e6/iterations))
+        print('speedup: pack %.2fx  unpack %.2fx (output byte-identical)' %
+                (compat_pack/pack_time, compat_unpack/unpack_time))
+
+    n_payments = n_ops * 100
+    build_time, allocated = bench_types(Xdr.types, n_payments)
+    print('%d payment operations' % n_payments)
+    print('slots : build %8.1f ms  allocated %8.1f KiB' % (build_time*1e3, allocated/1024.))
+    if compat_types is not None:
+        compat_build, compat_allocated = bench_types(compat_types, n_payments)
+        print('dict  : build %8.1f ms  allocated %8.1f KiB' %
+                (compat_build*1e3, compat_allocated/1024.))
+        print('speedup: build %.2fx  allocated %.2fx less' %
+                (compat_build/build_time, compat_allocated/float(allocated)))
+
+    if xdrlib is None or compat_packer is None:
+        print('xdrlib not available, skipping comparison')
+        return
+
+    legacy_packer, legacy_unpacker = legacy_classes(compat_packer, compat_unpacker)
+    legacy_out, legacy_pack, legacy_unpack = bench(legacy_packer, legacy_unpacker,
+            raw, iterations)
+    assert legacy_out == out, 'codec output differs from xdrlib'
+    print('xdrlib: pack %8.1f us  unpack %8.1f us' %
+            (legacy_pack*1e6/iterations, legacy_unpack*1e6/iterations))
+    print('speedup: pack %.2fx  unpack %.2fx (output byte-identical)' %
+            (legacy_pack/pack_time, legacy_unpack/unpack_time))
+
+if __name__ == '__main__':
+    main()
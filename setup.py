@@ -11,21 +11,29 @@ setup(
     include_package_data=True,
     packages=find_packages(),
     test_suite = 'nose.collector',
+    python_requires='>=3.7',
     classifiers=[
         'Development Status :: 0 - Alpha/unstable',
         'Intended Audience :: Developers',
         'License :: OSI Approved :: Apache License',
         'Operating System :: OS Independent',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         'Topic :: Software Development :: Libraries :: Python Modules',
     ],
     install_requires=[
         'ed25519', 'crc16', 'requests', 'sseclient',
     ],
+    extras_require={
+        'aio': ['aiohttp'],
+        'analytics': ['numpy'],
+    },
     tests_require = [
         'mock', 'nose',
     ],
@@ -1,25 +1,38 @@
 # -*- coding: utf-8 -*-
 __all__ = [
-        'random_keypair', 'account_from_secret', 
+        'random_keypair', 'account_from_secret', 'Keyring',
         'setup_test_network', 'setup_public_network', 'setup_custom_network', 'get_current_network',
+        'setup_http', 'setup_sequences', 'setup_history_cache', 'setup_account_cache',
+        'setup_federation_cache',
         'account', 'transaction', 'ledger', 'operation',
         'transactions', 'ledgers', 'effects', 'operations', 'payments',
         'find_payment_path', 'assets', 'trades', 'orderbook',
-        'new_transaction', 'post_transaction',
-        'Fetchable', 'NewTransaction',
+        'new_transaction', 'post_transaction', 'channel_pool', 'bulk_pay', 'sign_batch',
+        'Fetchable', 'NewTransaction', 'SequenceAllocator', 'ChannelPool', 'BatchSigner',
+        'HistoryCache', 'AccountCache', 'Stream', 'Router',
+        'LiveOrderbook',
         'Asset', 'Accounts', 'Transactions', 'Ledgers', 'Operations', 'Payments',
         'Effects', 'Offers', 'Orderbooks', 'Assets', 'PaymentPaths',
         ]
 
-from .keys import random_keypair, account_from_secret
+from .keys import random_keypair, account_from_secret, Keyring
 from .api import setup_test_network, setup_public_network, setup_custom_network, get_current_network
+from .api import setup_http, setup_sequences, setup_history_cache, setup_account_cache
+from .api import setup_federation_cache
 from .api import account, transaction, ledger, operation
 from .api import transactions, ledgers, effects, operations, payments
 from .api import find_payment_path, assets, trades, orderbook
 from .api import new_transaction, post_transaction
-from .api import Fetchable, NewTransaction
+from .api import Fetchable, NewTransaction, SequenceAllocator
 from .api import Asset, Accounts, Transactions, Ledgers, Operations, Payments
 from .api import Effects, Offers, Orderbooks, Assets, PaymentPaths
+from .channels import channel_pool, ChannelPool
+from .payouts import bulk_pay
+from .signing import sign_batch, BatchSigner
+from .cache import HistoryCache, AccountCache
+from .streams import Stream
+from .router import Router
+from .livebook import LiveOrderbook
 
 import logging
 try:  # Python 2.7+
@@ -0,0 +1,562 @@
+# -*- coding: utf-8 -*-
+"""
+Asyncio counterpart of the stellar API. Queries return the same model objects
+(Accounts.Account, Operations.Operation etc.) as the blocking API, but network
+io is done on the event loop, so that many horizon queries and streams can run
+concurrently in single thread.
+
+    account = await stellar.aio.account('GAEE..IB4V..').fetch()
+
+    page = await stellar.aio.payments().fetch(limit=200)
+    async for page in stellar.aio.payments().pages(limit=200):
+        ...
+
+    async for payment in stellar.aio.account('GAEE..IB4V..').payments().stream():
+        ...
+
+    async with stellar.aio.new_transaction(secret) as t:
+        t.pay(destination, '42.01')
+
+Many streams can be followed by StreamHub, which runs all of them on single event
+loop (in background thread if started by start()):
+
+    hub = stellar.aio.StreamHub()
+    for accid in accounts:
+        hub.subscribe(stellar.aio.account(accid).payments(), key=accid)
+    hub.start()
+    while True:
+        subscription, payment = hub.get_sync()
+
+Needs aiohttp to be installed (pip install sirius[aio]).
+"""
+
+import asyncio
+import calendar
+import json
+import logging
+import threading
+import time
+import weakref
+
+import aiohttp
+
+from . import api
+from .api import Fetchable, NewTransaction, TransactionResult
+from .api import Accounts, Transactions, Ledgers, Operations, Payments
+from .api import Effects, Orderbooks, Trades, Assets, PaymentPaths
+from .utils import HTTP, HttpException, FED
+from .streams import _backoff, _retriable
+
+logger = logging.getLogger(__name__)
+
+class AsyncHTTP(object):
+    """
+    Async counterpart of utils.HTTP. Each event loop gets its own pooled
+    aiohttp session, configured from the same pool and timeout options as HTTP.
+    """
+    _sessions = weakref.WeakKeyDictionary()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def session():
+        """Returns aiohttp session for the running event loop, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        with AsyncHTTP._lock:
+            session = AsyncHTTP._sessions.get(loop)
+            if session is None or session.closed:
+                connector = aiohttp.TCPConnector(
+                        limit=HTTP.pool_connections*HTTP.pool_maxsize,
+                        limit_per_host=HTTP.pool_maxsize,
+                        force_close=not HTTP.keep_alive)
+                session = aiohttp.ClientSession(connector=connector)
+                AsyncHTTP._sessions[loop] = session
+        return session
+
+    @staticmethod
+    def set_session(session):
+        """Sets aiohttp session to be used for requests on the running event loop"""
+        with AsyncHTTP._lock:
+            AsyncHTTP._sessions[asyncio.get_running_loop()] = session
+
+    @staticmethod
+    async def close():
+        """Closes session of the running event loop"""
+        with AsyncHTTP._lock:
+            session = AsyncHTTP._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    @staticmethod
+    def timeout(read=True):
+        return aiohttp.ClientTimeout(sock_connect=HTTP.connect_timeout,
+                sock_read=HTTP.read_timeout if read else None)
+
+    @staticmethod
+    def _check(json):
+        status = json['status'] if 'status' in json else 0
+        if status > 400 and status <= 500:
+            raise HttpException(json['title'], status)
+        return json
+
+    @staticmethod
+    async def get(url):
+        try:
+            async with AsyncHTTP.session().get(url, timeout=AsyncHTTP.timeout()) as r:
+                json = await r.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise HttpException(str(e), -1)
+
+        return AsyncHTTP._check(json)
+
+    @staticmethod
+    async def post(url, data):
+        try:
+            async with AsyncHTTP.session().post(url, data=data, timeout=AsyncHTTP.timeout()) as r:
+                json = await r.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise HttpException(str(e), -1)
+
+        return AsyncHTTP._check(json)
+
+    @staticmethod
+    async def stream(url, last_id=None, session=None):
+        """Async generator yielding (event-id, data) pairs of server sent events,
+        session of the running event loop is used unless session is given"""
+        headers = {'Accept' : 'text/event-stream', 'Cache-Control' : 'no-cache'}
+        if last_id:
+            headers['Last-Event-ID'] = last_id
+        try:
+            async with (session or AsyncHTTP.session()).get(url, headers=headers,
+                    timeout=AsyncHTTP.timeout(read=False)) as r:
+                r.raise_for_status()
+                event_id, data = None, []
+                async for line in r.content:
+                    line = line.decode('utf-8').rstrip('\r\n')
+                    if not line:
+                        if data:
+                            yield event_id, '\n'.join(data)
+                        event_id, data = None, []
+                    elif line.startswith(':'):
+                        continue
+                    else:
+                        field, _, value = line.partition(':')
+                        if value.startswith(' '):
+                            value = value[1:]
+                        if field == 'data':
+                            data.append(value)
+                        elif field == 'id':
+                            event_id = value
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise HttpException(str(e), -1)
+
+async def _run_blocking(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+async def _address_to_account(address):
+    if '*' in address:
+        return await _run_blocking(FED.resolve_to_account, address)
+    return address
+
+class AsyncFetchable(object):
+    """Async counterpart of Fetchable. Wraps Fetchable resource (or coroutine
+    function returning one) and retrieves it using event loop.
+    """
+    class Page(Fetchable.Page):
+        """Page containing records, link to next page and previous page. """
+        async def next(self):
+            """fetches next page from the network and returns page object"""
+            r = await AsyncHTTP.get(self.nextlink)
+            return AsyncFetchable.Page(self.mapper, r)
+
+        async def prev(self):
+            """fetches prev page from the network and returns page object"""
+            r = await AsyncHTTP.get(self.prevlink)
+            return AsyncFetchable.Page(self.mapper, r)
+
+    def __init__(self, resource):
+        self._resource = resource
+
+    async def resource(self):
+        """Returns underlying Fetchable resource"""
+        if not isinstance(self._resource, Fetchable):
+            self._resource = await self._resource()
+        return self._resource
+
+    async def fetch(self, cursor=None, limit=10, order='asc'):
+        """Returns single or page object for given query. Same as Fetchable.fetch"""
+        resource = await self.resource()
+        url = resource._query_url(cursor, limit, order) if resource.paginated else resource.url
+
+        r = await AsyncHTTP.get(api.horizon + url)
+        if not resource.paginated:
+            return resource._map2obj(r)
+        return AsyncFetchable.Page(resource._map2obj, r)
+
+    async def first(self):
+        """Returns first record for given paged resource or None"""
+        r = (await self.fetch(limit=1, order='asc')).records
+        return r[0] if len(r) > 0 else None
+
+    async def last(self):
+        """Returns last record for given paged resource or None"""
+        r = (await self.fetch(limit=1, order='desc')).records
+        return r[0] if len(r) > 0 else None
+
+    async def pages(self, cursor=None, limit=10, order='asc'):
+        """Async generator over pages of given query, until empty page is returned"""
+        page = await self.fetch(cursor, limit, order)
+        while len(page.records) > 0:
+            yield page
+            page = await page.next()
+
+    async def stream(self, cursor=None, limit=10, order='asc'):
+        """Async generator over stream of records for given query"""
+        resource = await self.resource()
+        if not resource.streamed:
+            raise Exception('stream not supported')
+        url = api.horizon + resource._query_url(cursor, limit, order)
+        async for _, data in AsyncHTTP.stream(url):
+            if data == '"hello"':
+                continue
+            yield resource._map2obj(json.loads(data))
+
+    def _chain(self, name):
+        async def resource():
+            return getattr(await self.resource(), name)()
+        return AsyncFetchable(resource)
+
+    def transactions(self):
+        """Returns async fetchable for transactions of this resource"""
+        return self._chain('transactions')
+
+    def operations(self):
+        """Returns async fetchable for operations of this resource"""
+        return self._chain('operations')
+
+    def payments(self):
+        """Returns async fetchable for payments of this resource"""
+        return self._chain('payments')
+
+    def effects(self):
+        """Returns async fetchable for effects of this resource"""
+        return self._chain('effects')
+
+    def offers(self):
+        """Returns async fetchable for offers of this resource"""
+        return self._chain('offers')
+
+class AsyncNewTransaction(NewTransaction):
+    """NewTransaction which fetches sequence and submits using event loop.
+    Can be used with async with-statement. Accounts must be account ids, federation
+    addresses are resolved by resolve_address() beforehand:
+
+        t.pay(await stellar.aio.resolve_address('name*domain.com'), '42.01')
+    """
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.submit()
+
+    async def build(self):
+        """Creates transaction and returns 'Transaction Envelope XDR' without submitting it to network """
+        return self._build(await self._account_seq())
+
+    async def prepare(self):
+        """Packs transaction without signing it and returns (transaction XDR bytes, hash)
+        pair, see NewTransaction.prepare"""
+        return self._prepare(await self._account_seq())
+
+    async def _account_seq(self):
+        #allocator may fetch sequence using blocking HTTP
+        account_seq = self.seq if self.seq else (await _run_blocking(self._reserve_seq))
+        if not account_seq:
+            account_seq = int((await account(self.account).fetch()).sequence) + 1
+        return account_seq
+
+    async def submit(self):
+        """Submits transaction to network in context of this new transaction. """
+        self._submitted(await post_transaction(await self.build()))
+
+    #Federation lookup would block the event loop
+    def _resolve(self, address):
+        if '*' in address:
+            raise ValueError('federation address %s must be resolved by '
+                    'stellar.aio.resolve_address()' % address)
+        return address
+
+#Returns seconds since record (having created_at or closed_at) was created
+def _lag(record):
+    created = record.get('created_at') or record.get('closed_at')
+    if not created:
+        return None
+    try:
+        return time.time() - calendar.timegm(time.strptime(created, '%Y-%m-%dT%H:%M:%SZ'))
+    except ValueError:
+        return None
+
+class Subscription(object):
+    """Stream followed by StreamHub"""
+    def __init__(self, hub, fetchable, callback, cursor, key):
+        self.hub = hub
+        self.fetchable = fetchable
+        self.callback = callback
+        self.key = key
+        '''key given to subscribe (e.g. account id)'''
+        self.cursor = cursor
+        '''paging token of the last received record, stream reconnects from it'''
+        self.events = 0
+        '''number of received records'''
+        self.reconnects = 0
+        '''number of reconnects so far'''
+        self.lag = None
+        '''seconds between creation of the last record and its receipt'''
+        self.connected = False
+        '''whether stream is connected'''
+        self.error = None
+        '''error which ended the stream (e.g. account not found)'''
+        self._task = None
+
+    def cancel(self):
+        """Stops following the stream"""
+        self.hub.unsubscribe(self)
+
+    def __repr__(self):
+        return 'Subscription(key=%s,cursor=%s,events=%d,reconnects=%d)' % (self.key,
+                self.cursor, self.events, self.reconnects)
+
+class StreamHub(object):
+    """
+    Follows many streams on single event loop. Records are passed to callback of
+    their subscription (function or coroutine function called as callback(record)),
+    or put to shared bounded queue as (subscription, record) pairs. Full queue
+    (or slow coroutine callback) holds reading of the stream.
+    Streams reconnect from their last record, waiting exponentially longer (with
+    random jitter) after each failed attempt.
+    """
+    def __init__(self, queue_size=10000, limit=200, min_delay=0.5, max_delay=60.0):
+        self.queue_size = queue_size
+        '''maximum number of records in shared queue'''
+        self.limit = limit
+        '''limit parameter of stream queries'''
+        self.min_delay = min_delay
+        '''seconds to wait (at most) before first reconnect'''
+        self.max_delay = max_delay
+        '''maximum seconds to wait before reconnect'''
+        self.subscriptions = set()
+        '''followed subscriptions'''
+        self._loop = None
+        self._queue = None
+        self._session = None
+        self._stopped = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, fetchable, callback=None, cursor='now', key=None):
+        """Follows stream of given async fetchable (e.g. stellar.aio.account(accid).payments())
+        from given cursor and returns Subscription. Can be called from any thread,
+        before or after hub is started."""
+        subscription = Subscription(self, fetchable, callback, cursor, key)
+        with self._lock:
+            self.subscriptions.add(subscription)
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._follow, subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Stops following given subscription"""
+        with self._lock:
+            self.subscriptions.discard(subscription)
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._cancel, subscription)
+
+    async def run(self, started=None):
+        """Follows subscribed streams on the running event loop until stop() is called,
+        sets given threading.Event once hub accepts stop() and get_sync()"""
+        self._queue = asyncio.Queue(self.queue_size)
+        self._stopped = asyncio.Event()
+        #single unlimited pool, streams are long lived connections to the same host
+        self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0,
+            force_close=not HTTP.keep_alive))
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            for subscription in self.subscriptions:
+                self._follow(subscription)
+        if started is not None:
+            started.set()
+        try:
+            await self._stopped.wait()
+        finally:
+            with self._lock:
+                self._loop = None
+                tasks = [s._task for s in self.subscriptions if s._task is not None]
+                #streams are followed again (from their cursor) when hub is restarted
+                for subscription in self.subscriptions:
+                    subscription._task = None
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._session.close()
+
+    def start(self):
+        """Runs hub in background thread"""
+        started = threading.Event()
+        def run():
+            try:
+                asyncio.run(self.run(started))
+            finally:
+                #do not leave start() waiting if run() failed early
+                started.set()
+        self._thread = threading.Thread(target=run, name='stellar-stream-hub')
+        self._thread.daemon = True
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        """Stops following streams (and background thread if hub was started)"""
+        with self._lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._stopped.set)
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+            self._thread = None
+
+    async def get(self):
+        """Returns next (subscription, record) pair from shared queue"""
+        return await self._queue.get()
+
+    def get_sync(self, timeout=None):
+        """Returns next (subscription, record) pair from shared queue of hub running
+        in background thread, raises TimeoutError after timeout seconds"""
+        future = asyncio.run_coroutine_threadsafe(
+                asyncio.wait_for(self._queue.get(), timeout), self._loop)
+        try:
+            return future.result()
+        except asyncio.TimeoutError:
+            raise TimeoutError('no record within %s seconds' % timeout)
+
+    def _follow(self, subscription):
+        if subscription._task is None and subscription in self.subscriptions:
+            subscription._task = asyncio.ensure_future(self._stream(subscription))
+
+    def _cancel(self, subscription):
+        if subscription._task is not None:
+            subscription._task.cancel()
+            subscription._task = None
+
+    async def _stream(self, subscription):
+        attempt = 0
+        try:
+            resource = await subscription.fetchable.resource()
+            if not resource.streamed:
+                raise Exception('stream not supported')
+            while True:
+                try:
+                    url = api.horizon + resource._query_url(subscription.cursor, self.limit)
+                    async for event_id, data in AsyncHTTP.stream(url, session=self._session):
+                        subscription.connected = True
+                        if data == '"hello"':
+                            continue
+                        attempt = 0
+                        record = json.loads(data)
+                        subscription.cursor = record.get('paging_token') or event_id
+                        subscription.events += 1
+                        subscription.lag = _lag(record)
+                        await self._deliver(subscription, resource._map2obj(record))
+                except HttpException as e:
+                    if not _retriable(e):
+                        raise
+                    logger.warning('stream %s failed: %s', subscription.key, e)
+                subscription.connected = False
+                attempt += 1
+                subscription.reconnects += 1
+                await asyncio.sleep(_backoff(attempt, self.min_delay, self.max_delay))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error('stream %s ended: %s', subscription.key, e)
+            subscription.error = e
+        finally:
+            subscription.connected = False
+
+    async def _deliver(self, subscription, record):
+        if subscription.callback is None:
+            await self._queue.put((subscription, record))
+            return
+        try:
+            result = subscription.callback(record)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception:
+            logger.exception('callback of stream %s failed', subscription.key)
+
+def account(accid):
+    """Async counterpart of stellar.account"""
+    if not accid:
+        raise ValueError('accid expected')
+    async def resource():
+        return Accounts(await _address_to_account(accid))
+    return AsyncFetchable(resource)
+
+def transactions():
+    """Async counterpart of stellar.transactions"""
+    return AsyncFetchable(Transactions._All())
+
+def transaction(trxid):
+    """Async counterpart of stellar.transaction"""
+    return AsyncFetchable(Transactions(trxid))
+
+def ledgers():
+    """Async counterpart of stellar.ledgers"""
+    return AsyncFetchable(Ledgers._All())
+
+def ledger(ledseq):
+    """Async counterpart of stellar.ledger"""
+    return AsyncFetchable(Ledgers(ledseq))
+
+def effects():
+    """Async counterpart of stellar.effects"""
+    return AsyncFetchable(Effects._All())
+
+def operations():
+    """Async counterpart of stellar.operations"""
+    return AsyncFetchable(Operations._All())
+
+def operation(opid):
+    """Async counterpart of stellar.operation"""
+    return AsyncFetchable(Operations(opid))
+
+def payments():
+    """Async counterpart of stellar.payments"""
+    return AsyncFetchable(Payments._All())
+
+def trades(buying=None, selling=None):
+    """Async counterpart of stellar.trades"""
+    return AsyncFetchable(Trades._All(buying=buying, selling=selling))
+
+def find_payment_path(from_account, to_account, to_asset, amount):
+    """Async counterpart of stellar.find_payment_path"""
+    return AsyncFetchable(PaymentPaths._All(from_account, to_account, to_asset, amount))
+
+def assets(asset_code=None, asset_issuer=None):
+    """Async counterpart of stellar.assets"""
+    return AsyncFetchable(Assets._All(asset_code, asset_issuer))
+
+def orderbook(buying, selling):
+    """Async counterpart of stellar.orderbook"""
+    return AsyncFetchable(Orderbooks._All(selling, buying))
+
+def new_transaction(account, signers=[], seq=None, fee=None, memo=None, time_bounds=[],
+        allocator=None):
+    """Async counterpart of stellar.new_transaction. build() and submit() are coroutines."""
+    return AsyncNewTransaction(account, signers, seq, fee, memo, time_bounds, allocator)
+
+async def resolve_address(address):
+    """Returns account id of given federation address (account id is returned as is),
+    federation lookup does not block the event loop"""
+    return await _address_to_account(address)
+
+async def post_transaction(envelope_xdr):
+    """Async counterpart of stellar.post_transaction"""
+    res = await AsyncHTTP.post(api.horizon + '/transactions/', {'tx': envelope_xdr })
+    return TransactionResult(res)
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized order book analytics. BookMatrix packs price levels of many order books
+(Orderbooks.Orderbook or LiveOrderbook) into NumPy arrays, one row per book, so that
+depth, VWAP and slippage of all books are computed at once:
+
+    books = [stellar.orderbook(selling=s, buying=b).fetch() for s, b in pairs]
+    m = stellar.analytics.BookMatrix(books, levels=20)
+    m.vwap('ask', 100)          #price of buying 100 units of base asset, per book
+    m.slippage('bid', sizes)    #relative price impact of selling sizes, per book
+
+    history = stellar.analytics.SpreadHistory(capacity=3600)
+    history.record(m)
+
+Amounts are in units of base asset on both sides (horizon bid amounts, which are in
+counter asset, are converted), prices are amounts of counter asset per base asset.
+
+Needs numpy to be installed (pip install sirius[analytics]).
+"""
+
+import time
+import warnings
+
+import numpy as np
+
+SIDES = ('ask', 'bid')
+
+#Returns asks and bids of Orderbook (attributes) or LiveOrderbook (methods)
+def _levels(book):
+    asks, bids = book.asks, book.bids
+    return (asks() if callable(asks) else asks), (bids() if callable(bids) else bids)
+
+class BookMatrix(object):
+    """
+    Price levels of given order books as (books, levels) arrays, levels of each book
+    ordered from the best one. Rows of books with fewer levels are padded with NaN
+    price and zero amount.
+    """
+    def __init__(self, books, levels=None):
+        sides = [_levels(b) for b in books]
+        if levels is None:
+            levels = max([max(len(a), len(b)) for a, b in sides] + [1])
+        shape = (len(sides), levels)
+        self.price_n = dict((s, np.zeros(shape, np.int64)) for s in SIDES)
+        '''numerators of level prices by side'''
+        self.price_d = dict((s, np.ones(shape, np.int64)) for s in SIDES)
+        '''denominators of level prices by side'''
+        counter = dict((s, np.zeros(shape, np.float64)) for s in SIDES)
+        for i, book_sides in enumerate(sides):
+            for side, entries in zip(SIDES, book_sides):
+                entries = entries[:levels]
+                if not entries:
+                    continue
+                n = len(entries)
+                self.price_n[side][i, :n] = [e[1][0] for e in entries]
+                self.price_d[side][i, :n] = [e[1][1] for e in entries]
+                counter[side][i, :n] = [float(e[0]) for e in entries]
+
+        self.prices = {}
+        '''level prices (float64) by side, NaN for padding'''
+        self.amounts = {}
+        '''level amounts in base asset (float64) by side, 0 for padding'''
+        for side in SIDES:
+            prices = self.price_n[side] / self.price_d[side]
+            prices[counter[side] == 0] = np.nan
+            self.prices[side] = prices
+        self.amounts['ask'] = counter['ask']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.amounts['bid'] = np.nan_to_num(counter['bid'] / self.prices['bid'])
+
+    def __len__(self):
+        return self.prices['ask'].shape[0]
+
+    def best(self, side):
+        """Returns best price of given side per book, NaN if side is empty"""
+        return self.prices[side][:, 0]
+
+    def spread(self):
+        """Returns best ask minus best bid per book"""
+        return self.best('ask') - self.best('bid')
+
+    def mid(self):
+        """Returns mid price per book"""
+        return (self.best('ask') + self.best('bid')) / 2
+
+    def cumulative_depth(self, side):
+        """Returns (books, levels) array of total amount up to and including each level"""
+        return np.cumsum(self.amounts[side], axis=1)
+
+    def fill(self, side, size):
+        """Returns (books, levels) array of amounts taken from each level when
+        market order of given size (scalar or per book) consumes given side"""
+        size = np.broadcast_to(np.asarray(size, np.float64), (len(self),))[:, None]
+        amounts = self.amounts[side]
+        before = self.cumulative_depth(side) - amounts
+        return np.clip(size - before, 0, amounts)
+
+    def vwap(self, side, size):
+        """Returns average price of market order of given size (scalar or per book)
+        consuming given side ('ask' to buy, 'bid' to sell base asset), NaN where
+        book is not deep enough"""
+        size = np.broadcast_to(np.asarray(size, np.float64), (len(self),))
+        taken = self.fill(side, size)
+        filled = taken.sum(axis=1)
+        cost = np.nansum(taken * self.prices[side], axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            vwap = cost / filled
+        vwap[filled < size * (1 - 1e-12)] = np.nan
+        return vwap
+
+    def slippage(self, side, size):
+        """Returns relative price impact of market order of given size per book,
+        vwap compared to best price (positive means worse price)"""
+        best = self.best(side)
+        impact = (self.vwap(side, size) - best) / best
+        return impact if side == 'ask' else -impact
+
+class SpreadHistory(object):
+    """
+    Ring buffer of spreads of the same books over time, see record()
+    """
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        '''maximum number of recorded spreads per book'''
+        self._times = np.zeros(capacity, np.float64)
+        self._spreads = None
+        self._count = 0
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def record(self, matrix, timestamp=None):
+        """Records spreads of books of given BookMatrix"""
+        if self._spreads is None:
+            self._spreads = np.full((self.capacity, len(matrix)), np.nan)
+        i = self._count % self.capacity
+        self._times[i] = time.time() if timestamp is None else timestamp
+        self._spreads[i] = matrix.spread()
+        self._count += 1
+
+    @property
+    def times(self):
+        """Times of recorded spreads, oldest first"""
+        return self._ordered(self._times)
+
+    @property
+    def spreads(self):
+        """(records, books) array of recorded spreads, oldest first"""
+        if self._spreads is None:
+            return np.zeros((0, 0))
+        return self._ordered(self._spreads)
+
+    def mean(self):
+        """Returns mean spread per book, ignoring empty books"""
+        with warnings.catch_warnings():
+            #books which were always empty have NaN mean
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return np.nanmean(self.spreads, axis=0)
+
+    def _ordered(self, values):
+        if self._count <= self.capacity:
+            return values[:self._count]
+        i = self._count % self.capacity
+        return np.concatenate((values[i:], values[:i]))
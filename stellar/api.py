@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import ed25519
 import crc16
 import sseclient
 import json
@@ -9,10 +8,21 @@ import datetime
 import binascii
 import hashlib
 import struct
+import threading
+
+try:
+    from urllib.parse import urlparse, parse_qs
+except ImportError:
+    from urlparse import urlparse, parse_qs
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 from .xdr import Xdr
 from .utils import HTTP, XDR, FED
-from .keys import account_from_secret
+from .keys import account_from_secret, account_from_public_key, Keyring
+from .cache import HistoryCache, AccountCache
+from .streams import Stream
 
 HORIZON_PUBLIC_ENDPOINT = 'https://horizon.stellar.org'
 HORIZON_TESTNET_ENDPOINT = 'https://horizon-testnet.stellar.org'
@@ -26,6 +36,10 @@ horizon = HORIZON_TESTNET_ENDPOINT
 network_password = NETWORK_PASSWORD_TESTNET
 network_id = hashlib.sha256(network_password.encode('utf-8')).digest()
 
+sequences = None
+history_cache = None
+account_cache = None
+
 def setup_test_network():
     """Sets the current network to stellar.org test network"""
     global horizon, network_id, network_password
@@ -47,6 +61,82 @@ def setup_custom_network(horizon_url, password):
     network_password = password
     network_id = hashlib.sha256(network_password.encode('utf-8')).digest()
 
+def setup_http(session=None, **options):
+    """Configures pooled keep-alive HTTP session used for all horizon and federation
+    requests. options can be pool_connections, pool_maxsize, pool_block, max_retries,
+    keep_alive, connect_timeout and read_timeout. If session (e.g. requests.Session) is
+    given then it is used as-is for all the requests.
+
+        stellar.setup_http(pool_maxsize=50, read_timeout=10)
+    """
+    HTTP.configure(**options)
+    if session is not None:
+        HTTP.set_session(session)
+
+def setup_sequences(enabled=True, allocator=None):
+    """Enables (or disables) local allocation of transaction sequence numbers.
+    When enabled, NewTransaction.build does not fetch account from horizon for each
+    transaction, but reserves next sequence number from SequenceAllocator (given
+    allocator or a new one), so that many transactions of single account can be
+    built and submitted concurrently.
+
+        stellar.setup_sequences()
+    """
+    global sequences
+    sequences = (allocator or SequenceAllocator()) if enabled else None
+
+def setup_history_cache(path=':memory:', max_bytes=256 << 20, enabled=True):
+    """Enables (or disables) cache of closed history. Ledgers, transactions,
+    operations and payments never change once closed, so when cache is enabled,
+    fetched single records and full pages of them are kept in SQLite database at
+    given path (least recently used ones are evicted above max_bytes) and are not
+    fetched again. Returns HistoryCache, which counts hits and misses.
+
+        cache = stellar.setup_history_cache('horizon.sqlite')
+    """
+    global history_cache
+    history_cache = HistoryCache(path, max_bytes) if enabled else None
+    return history_cache
+
+def setup_account_cache(ttl=5.0, max_entries=10000, invalidate=False, enabled=True):
+    """Enables (or disables) in-process cache of accounts fetched by
+    stellar.account(accid).fetch(). Cached account is returned for ttl seconds.
+    If invalidate is True, effects are streamed in background thread and accounts
+    are removed from cache as soon as they change. Returns AccountCache, which counts
+    hits and misses.
+
+        stellar.setup_account_cache(ttl=30, invalidate=True)
+    """
+    global account_cache
+    if account_cache is not None:
+        account_cache.stop()
+    account_cache = AccountCache(ttl, max_entries) if enabled else None
+    if account_cache is not None and invalidate:
+        account_cache.watch(_changed_accounts)
+    return account_cache
+
+#Returns generator of accounts changed by effects from now on
+def _changed_accounts():
+    for event in HTTP.stream(horizon + '/effects?cursor=now'):
+        if event.data == '"hello"':
+            continue
+        data = json.loads(event.data)
+        if 'account' in data:
+            yield data['account']
+
+def setup_federation_cache(ttl=300, negative_ttl=60, toml_ttl=3600, max_entries=10000,
+        enabled=True):
+    """Configures cache of federation addresses. Resolved addresses are cached for
+    ttl seconds, unknown ones for negative_ttl seconds. Federation server of domain is
+    cached as long as cache headers of its stellar.toml allow (toml_ttl seconds if
+    there are none). Concurrent lookups of the same address are always coalesced.
+
+        stellar.setup_federation_cache(ttl=3600)
+    """
+    if not enabled:
+        ttl = negative_ttl = toml_ttl = 0
+    FED.configure(ttl, negative_ttl, toml_ttl, max_entries)
+
 def get_current_network():
     """Returns tuple containing horizon endpoint url and current network_id"""
     global horizon, network_id, network_password
@@ -56,18 +146,30 @@ def get_current_network():
 def _shorten_address(address):
     return '%s__%s' % (address[:4], address[-4:])
 
-def _get_seed_from_secret(secret):
-    decoded = base64.b32decode(secret)
-    return decoded[1:-2]
+#Keys of secrets passed as signers, which are not in Keyring
+_keyring = Keyring()
+
+#Signs given trx_hash with all signers, which are list of secrets or Keyring
+def _sign_trx_hash_all(signers, trx_hash):
+    keyring = signers if isinstance(signers, Keyring) else _keyring
+    return [Xdr.types.DecoratedSignature(*keyring.key(signer).sign(trx_hash))
+            for signer in signers]
+
+_ENVELOPE_TYPE_TX = struct.pack('>i', Xdr.const.ENVELOPE_TYPE_TX)
+
+#Returns hash (hex) of transaction of given base64 TransactionEnvelope XDR
+def _envelope_hash(envelope):
+    raw = base64.b64decode(envelope)
+    unpacker = Xdr.StellarXDRUnpacker(raw)
+    unpacker.unpack_Transaction()
+    trx = raw[:unpacker.get_position()]
+    return binascii.hexlify(hashlib.sha256(network_id + _ENVELOPE_TYPE_TX + trx).digest()).decode('utf-8')
 
-#Signs given trx_hash with provided secret key
-def _sign_trx_hash(signer, trx_hash):
-    signing_key = ed25519.SigningKey(_get_seed_from_secret(signer))
-    public_key = Xdr.types.PublicKey(Xdr.const.KEY_TYPE_ED25519, 
-            signing_key.get_verifying_key().to_bytes())
-    signature = signing_key.sign(trx_hash)
-    hint = bytes(public_key.ed25519[-4:])
-    return Xdr.types.DecoratedSignature(hint, signature)    
+#Returns base64 TransactionEnvelope XDR given packed transaction and its signatures
+def _pack_envelope(trx, signatures):
+    packer = Xdr.StellarXDRPacker()
+    packer.pack_array(signatures, packer.pack_DecoratedSignature)
+    return base64.b64encode(trx + packer.get_buffer()).decode('utf-8')
 
 #if input is federation address resolve it to account-id
 def _address_to_account(address):
@@ -128,19 +230,50 @@ class Asset(object):
 #constant representing stellar native asset (lumens, XLM)
 native_asset = Asset({'asset_type' : 'native'})
 
+#Returns whether horizon response of given url (of closed history resource) does
+#not change anymore. Last page of ascending query can get more records, as well as
+#first page of descending query without cursor.
+def _is_closed(url, data):
+    if 'status' in data:
+        return False
+    if '_embedded' not in data:
+        return True
+    query = parse_qs(urlparse(url).query)
+    if query.get('order', ['asc'])[0] == 'desc' and 'cursor' not in query:
+        return False
+    return len(data['_embedded']['records']) == int(query.get('limit', ['10'])[0])
+
+#Gets given url, using history cache if resource is closed history
+def _get(url, cacheable=False):
+    cache = history_cache
+    if not cacheable or cache is None:
+        return HTTP.get(url)
+    data = cache.get(url)
+    if data is None:
+        data = HTTP.get(url)
+        if _is_closed(url, data):
+            cache.put(url, data)
+    return data
+
 class Fetchable(object):
     """Base class representing resource that can be retrieved from horizon endpoint. 
     Resource can be fetched or streamed. Fetched object returns single object for point queries
     or Page object for paginated queries. Stream object returns generator which 
     can be iterated.
     """
+    cacheable = False
+    '''whether resource is closed history, which can be kept in history cache'''
+    paired_cursor = False
+    '''whether paging tokens are pairs of operation id and index (effects, trades)'''
+
     class Page(object):
         """Page containing records, link to next page and previous page. """
-        def __init__(self, mapper, data):
+        def __init__(self, mapper, data, cacheable=False):
             self.mapper = mapper
             self.records = [self.mapper(r) for r in data['_embedded']['records']]
             self.nextlink = data['_links']['next']['href']
             self.prevlink = data['_links']['prev']['href']
+            self.cacheable = cacheable
 
         def entries(self):
             """returns records in current page"""
@@ -148,32 +281,25 @@ class Fetchable(object):
 
         def next(self):
             """fetches next page from the network and returns page object"""
-            r = HTTP.get(self.nextlink)
-            return Fetchable.Page(self.mapper, r)
+            r = _get(self.nextlink, self.cacheable)
+            return Fetchable.Page(self.mapper, r, self.cacheable)
 
         def prev(self):
             """fetches prev page from the network and returns page object"""
-            r = HTTP.get(self.prevlink)
-            return Fetchable.Page(self.mapper, r)
+            r = _get(self.prevlink, self.cacheable)
+            return Fetchable.Page(self.mapper, r, self.cacheable)
 
     def fetch(self, cursor=None, limit=10, order='asc'):
         """Returns single or page object for given query. If paged object
         then optionally accepts cursor (default none), limit (default 10)
         and order (default asc). order can be 'asc' or 'desc'.
         """
-        if self.paginated:
-            urlsep = '&' if self.url.find('?') >= 0 else '?' 
-            if cursor:
-                self.url = '%s%scursor=%s&limit=%s&order=%s' %\
-                        (self.url, urlsep, cursor, limit, order)
-            else:
-                self.url = '%s%slimit=%s&order=%s' % (self.url,\
-                        urlsep, limit, order)
+        url = self._query_url(cursor, limit, order) if self.paginated else self.url
 
-        r = HTTP.get(horizon + self.url)
+        r = _get(horizon + url, self.cacheable)
         if not self.paginated:
             return self._map2obj(r)
-        return Fetchable.Page(lambda x : self._map2obj(x), r)
+        return Fetchable.Page(lambda x : self._map2obj(x), r, self.cacheable)
 
     def first(self):
         """Helper method for paginated query. returns first record for given paged
@@ -201,27 +327,116 @@ class Fetchable(object):
         else:
             return None
 
-    def stream(self, cursor=None, limit=10, order='asc'):
+    def iterate(self, cursor=None, limit=200, order='asc', max_records=None):
+        """Helper method for paginated query. Returns generator over records of
+        all the pages for given query, stopping at first empty page or after
+        max_records records. Next page is fetched in background while records
+        of current page are being consumed. e.g. to go through all the payments:
+
+            >>> for p in stellar.payments().iterate(limit=200):
+            ...     print(p)
+        """
+        if not self.paginated:
+            raise Exception('iterate not supported')
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            page = self.fetch(cursor=cursor, limit=limit, order=order)
+            count = 0
+            while len(page.records) > 0:
+                if max_records is not None and count + len(page.records) >= max_records:
+                    prefetched = None
+                else:
+                    prefetched = executor.submit(page.next)
+                for r in page.records:
+                    if max_records is not None and count >= max_records:
+                        return
+                    count += 1
+                    yield r
+                if prefetched is None:
+                    return
+                page = prefetched.result()
+        finally:
+            executor.shutdown(wait=False)
+
+    def backfill(self, start_ledger, end_ledger, workers=4, ledgers_per_range=None,
+            limit=200, processes=False):
+        """Helper method for history queries (ledgers, transactions, operations, payments,
+        effects and trades). Returns generator over records from start_ledger (inclusive)
+        to end_ledger (exclusive) in ascending order. Ledger range is split into disjoint
+        cursor ranges (paging token of record has ledger sequence in higher 32 bits) whose
+        pages are fetched concurrently using workers threads, or processes if processes is
+        True. At most about 2*workers pages are fetched ahead of consumed records. e.g. to
+        import all operations of ledgers 1000000 to 2000000 using 16 threads:
+
+            >>> for op in stellar.operations().backfill(1000000, 2000000, workers=16):
+            ...     print(op)
+        """
+        if not self.paginated:
+            raise Exception('backfill not supported')
+        if end_ledger <= start_ledger:
+            return
+
+        if not ledgers_per_range:
+            ledgers_per_range = max(1, (end_ledger - start_ledger) // (workers*4))
+        ranges = [(l, min(l + ledgers_per_range, end_ledger))
+                for l in range(start_ledger, end_ledger, ledgers_per_range)]
+
+        pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        executor = pool(max_workers=workers)
+        ranges = deque(_LedgerRange(_ledger_cursor(self, l), end) for l, end in ranges)
+        active = deque()
+        try:
+            while active or ranges:
+                while len(active) < workers and ranges:
+                    active.append(ranges.popleft())
+                #pages of each range are fetched one after another, first range
+                #(whose records are consumed) always gets its next page
+                ahead = 0
+                for r in active:
+                    if r.future is not None and r.future.done():
+                        r.collect()
+                    ahead += len(r.pages) + (r.future is not None)
+                for r in active:
+                    if r.future is None and r.cursor is not None and \
+                            (r is active[0] or ahead < 2*workers):
+                        r.future = executor.submit(_fetch_ledger_page, self, horizon,
+                                r.cursor, r.end_ledger, limit)
+                        ahead += 1
+
+                head = active[0]
+                if head.pages:
+                    for record in head.pages.popleft():
+                        yield record
+                elif head.future is not None:
+                    head.collect()
+                else:
+                    active.popleft()
+        finally:
+            for r in active:
+                if r.future is not None:
+                    r.future.cancel()
+            executor.shutdown(wait=False)
+
+    def stream(self, cursor=None, limit=10, order='asc', **options):
         """Returns iterable stream for the given query.
         You can start stream from given cursor and order specified in the input.
-        Returned stream can be iterable using for-loop.
+        Returned stream can be iterable using for-loop. When connection drops, stream
+        reconnects from the last record. options are passed to streams.Stream, e.g.
+        checkpoint (file where cursor is persisted), min_delay, max_delay and max_retries.
         """
-        if self.streamed:
-            urlsep = '&' if self.url.find('?') >= 0 else '?' 
-            if cursor:
-                self.url = '%s%scursor=%s&limit=%s&order=%s' %\
-                        (self.url, urlsep, cursor, limit, order)
-            else:
-                self.url = '%s%slimit=%s&order=%s' % (self.url,\
-                        urlsep, limit, order)
-
-            eventsource = HTTP.stream(horizon + self.url)
-            for event in eventsource:
-                if event.data == '"hello"':
-                    continue
-                yield self._map2obj(json.loads(event.data))
-        else:
+        if not self.streamed:
             raise Exception('stream not supported')
+        return Stream(lambda c: horizon + self._query_url(c, limit, order), self._map2obj,
+                cursor, **options)
+
+    def _query_url(self, cursor=None, limit=10, order='asc'):
+        """Returns resource url with cursor, limit and order query parameters"""
+        urlsep = '&' if self.url.find('?') >= 0 else '?'
+        if cursor:
+            return '%s%scursor=%s&limit=%s&order=%s' %\
+                    (self.url, urlsep, cursor, limit, order)
+        return '%s%slimit=%s&order=%s' % (self.url, urlsep, limit, order)
 
     def _map2obj(self, data):
         """Function that subclass need to implemet to convert parsed json object to
@@ -229,6 +444,49 @@ class Fetchable(object):
         """
         pass
 
+class _LedgerRange(object):
+    """Ledger range of backfill, its fetched pages and fetch of the next one"""
+    def __init__(self, cursor, end_ledger):
+        self.cursor = cursor
+        '''cursor of the next page, None once range is fetched'''
+        self.end_ledger = end_ledger
+        self.pages = deque()
+        self.future = None
+
+    def collect(self):
+        """Waits for fetch of the next page and adds the page"""
+        records, self.cursor = self.future.result()
+        self.future = None
+        if records:
+            self.pages.append(records)
+
+#Returns cursor preceding records of given ledger
+def _ledger_cursor(resource, ledger):
+    if resource.paired_cursor:
+        #operation ids of ledger are above ledger << 32
+        return '%d-0' % (ledger << 32)
+    return (ledger << 32) - 1
+
+#Returns id of paging token ("<id>" or "<operation id>-<index>"), which has ledger
+#sequence in higher 32 bits
+def _token_id(paging_token):
+    return int(paging_token.split('-')[0])
+
+#Fetches page of records of resource after given cursor, which are before end_ledger.
+#Returns the records and cursor of the next page, None if there are no more records.
+#Module level so that it can be run in process pool.
+def _fetch_ledger_page(resource, horizon_url, cursor, end_ledger, limit):
+    end_token = end_ledger << 32
+    url = resource._query_url(cursor, limit, 'asc')
+    page = Fetchable.Page(resource._map2obj, _get(horizon_url + url, resource.cacheable),
+            resource.cacheable)
+    for i, r in enumerate(page.records):
+        if _token_id(r.paging_token) >= end_token:
+            return page.records[:i], None
+    if not page.records:
+        return [], None
+    return page.records, page.records[-1].paging_token
+
 class Accounts(Fetchable):
     class Thresholds(object):
         def __init__(self, data):
@@ -302,6 +560,13 @@ class Accounts(Fetchable):
         self.streamed = False
         self.url = '/accounts/%s' % self.accid
 
+    def fetch(self, cursor=None, limit=10, order='asc'):
+        """Returns account, cached one if account cache is enabled (see setup_account_cache)"""
+        cache = account_cache
+        if cache is None:
+            return Fetchable.fetch(self)
+        return cache.fetch(self.accid, lambda: Fetchable.fetch(self))
+
     def _map2obj(self, data):
         return Accounts.Account(data)
 
@@ -339,6 +604,13 @@ class Transactions(Fetchable):
             self.operation_count = int(data['operation_count'])
             self.created_at = datetime.datetime.strptime(
                     data['created_at'], '%Y-%m-%dT%H:%M:%SZ')
+            self.envelope_xdr = data.get('envelope_xdr')
+            '''base64 TransactionEnvelope XDR, see envelope for decoded one'''
+            self.result_xdr = data.get('result_xdr')
+            '''base64 TransactionResult XDR, see result for decoded one'''
+            self.result_meta_xdr = data.get('result_meta_xdr')
+            '''base64 TransactionMeta XDR, see result_meta for decoded one'''
+            self._decoded = {}
 
             memo_type = data['memo_type']
             if memo_type == 'text':
@@ -354,6 +626,34 @@ class Transactions(Fetchable):
             return 'Transaction(id=%s,ledger=%s,account=%s,seq=%s)' % (self.trxid,\
                     self.ledger, _shorten_address(self.account), self.account_seq)
 
+        @property
+        def envelope(self):
+            """TransactionEnvelope XDR object (with operations and signatures),
+            decoded on first access"""
+            return self._decode('envelope_xdr', 'unpack_TransactionEnvelope')
+
+        @property
+        def result(self):
+            """TransactionResult XDR object (with result of each operation), decoded
+            on first access"""
+            return self._decode('result_xdr', 'unpack_TransactionResult')
+
+        @property
+        def result_meta(self):
+            """TransactionMeta XDR object (with ledger changes of each operation),
+            decoded on first access"""
+            return self._decode('result_meta_xdr', 'unpack_TransactionMeta')
+
+        #Unpacks and caches base64 XDR of given attribute
+        def _decode(self, name, unpack):
+            if name not in self._decoded:
+                xdr = getattr(self, name)
+                if xdr is None:
+                    return None
+                unpacker = Xdr.StellarXDRUnpacker(base64.b64decode(xdr))
+                self._decoded[name] = getattr(unpacker, unpack)()
+            return self._decoded[name]
+
     def __init__(self, trxid):
         if not trxid:
             raise ValueError('transaction id required')
@@ -361,6 +661,7 @@ class Transactions(Fetchable):
         self.paginated = False
         self.streamed = False
         self.url = '/transactions/%s' % self.trxid
+        self.cacheable = True
 
     def _map2obj(self, data):
         return Transactions.Transaction(data)
@@ -382,6 +683,7 @@ class Transactions(Fetchable):
             self.paginated = True
             self.streamed = True
             self.url = baseurl + '/transactions'
+            self.cacheable = True
 
         def _map2obj(self, data):
             return Transactions.Transaction(data)
@@ -416,6 +718,7 @@ class Ledgers(Fetchable):
         self.paginated = False
         self.streamed = False
         self.url = '/ledgers/%s' % self.ledseq
+        self.cacheable = True
 
     def _map2obj(self, data):
         return Ledgers.Ledger(data)
@@ -441,6 +744,7 @@ class Ledgers(Fetchable):
             self.paginated = True
             self.streamed = True
             self.url = baseurl + '/ledgers'
+            self.cacheable = True
 
         def _map2obj(self, data):
             return Ledgers.Ledger(data)
@@ -558,6 +862,7 @@ class Operations(Fetchable):
         self.paginated = False
         self.streamed = False
         self.url = '/operations/%s' % self.opid
+        self.cacheable = True
 
     def _map2obj(self, data):
             return Operations.Operation(data)
@@ -571,6 +876,7 @@ class Operations(Fetchable):
             self.paginated = True
             self.streamed = True
             self.url = baseurl + '/operations'
+            self.cacheable = True
 
         def _map2obj(self, data):
             return Operations.Operation(data)
@@ -605,6 +911,7 @@ class Payments(object):
             self.paginated = True
             self.streamed = True
             self.url = baseurl + '/payments'
+            self.cacheable = True
 
         def _map2obj(self, data):
             return Payments.Payment(data)
@@ -671,6 +978,7 @@ class Effects(object):
             self.paginated = True
             self.streamed = True
             self.url = baseurl + '/effects'
+            self.paired_cursor = True
 
         def _map2obj(self, data):
             return Effects.Effect(data)
@@ -762,6 +1070,7 @@ class Trades(object):
             self.paginated = True
             self.streamed = False
             self.url = '/trades?'
+            self.paired_cursor = True
             if selling:
                 self.url = self.url + Asset.format_url_parameters(selling, 'base_') + '&'
             if buying:
@@ -874,8 +1183,74 @@ class TransactionResult(object):
         else:
             return (self.error, self.transaction_error, self.operation_errors)
 
+#Returns current sequence of the account from horizon, never from account cache
+def _fetch_sequence(accid):
+    return int(Fetchable.fetch(account(accid)).sequence)
+
+class SequenceAllocator(object):
+    """
+    Thread-safe allocator of transaction sequence numbers per source account.
+    Sequence of an account is fetched from horizon on first reservation (and after
+    resync), subsequent numbers are reserved locally without any network round-trip.
+
+    Reservation that is never submitted leaves gap, and transactions after it fail
+    with tx_bad_seq. NewTransaction resyncs the account on tx_bad_seq result.
+    """
+    class _Account(object):
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.next = None
+            self.epoch = 0
+
+    def __init__(self, fetch_sequence=None):
+        self.fetch_sequence = fetch_sequence or _fetch_sequence
+        '''function returning current sequence of given account, horizon by default'''
+        self._accounts = {}
+        self._lock = threading.Lock()
+
+    def _account(self, accid):
+        with self._lock:
+            state = self._accounts.get(accid)
+            if state is None:
+                state = self._accounts[accid] = SequenceAllocator._Account()
+            return state
+
+    def reserve(self, accid):
+        """Reserves next sequence number of given account. Returns pair of
+        sequence number and epoch (which is changed by each resync)"""
+        state = self._account(accid)
+        with state.lock:
+            if state.next is None:
+                state.next = self.fetch_sequence(accid) + 1
+            seq = state.next
+            state.next += 1
+            return (seq, state.epoch)
+
+    def next(self, accid):
+        """Reserves and returns next sequence number of given account"""
+        return self.reserve(accid)[0]
+
+    def resync(self, accid, epoch=None):
+        """Forgets reserved sequence numbers of given account, so that sequence is
+        fetched from horizon on next reservation. If epoch is given, then sequence
+        numbers are forgotten only if they were not resynced since that epoch (so
+        that failures of many pipelined transactions cause single resync)."""
+        state = self._account(accid)
+        with state.lock:
+            if epoch is None or epoch == state.epoch:
+                state.next = None
+                state.epoch += 1
+
 class NewTransaction(object):
-    def __init__(self, account, signers, seq, fee, memo, time_bounds):
+    def __init__(self, account, signers, seq, fee, memo, time_bounds, allocator=None):
+        if len(signers) == 0 and account.startswith('G'):
+            raise ValueError('signer(s) missing')
+        elif len(signers) == 0 and account.startswith('S'):
+            signers = [account]
+        self._init(account, signers, seq, fee, memo, time_bounds, allocator)
+
+    #Sets up transaction, signers are not required (see from_xdr)
+    def _init(self, account, signers, seq, fee, memo, time_bounds, allocator=None):
         self.account = account
         '''account on which transaction will be executed'''
         self.signers = signers
@@ -887,21 +1262,73 @@ class NewTransaction(object):
         self.memo = memo
         '''memo of the transaction'''
         self.time_bounds = time_bounds
+        self.allocator = allocator
+        '''sequence allocator used if seq is not given, global one (setup_sequences) by default'''
+        self.op_source = None
+        '''source account of operations added after it is set, transaction account by default'''
         self.ops = []
         '''operations in transaction'''
         self.set_options_op = {}
 
-        if len(signers) == 0 and account.startswith('G'):
-            raise ValueError('signer(s) missing')
-        elif len(signers) == 0 and account.startswith('S'):
-            self.signers = [account]
-
         if self.account.startswith('S'):
             self.account = account_from_secret(account)
 
-        self.account = _address_to_account(self.account)
+        self.account = self._resolve(self.account)
+
+        self.signatures = []
+        '''signatures of prepared transaction, see sign()'''
 
         self.trx_result = None
+        self._reserved = None
+        self._prepared = None
+        #(fee, number of operations) of envelope given to from_xdr
+        self._envelope_fee = None
+        #packed transaction of envelope given to from_xdr, whose signatures are kept
+        self._parsed = None
+
+    @classmethod
+    def from_xdr(cls, envelope, signers=[]):
+        """
+        Creates transaction from given 'Transaction Envelope XDR' (base64), e.g. to
+        co-sign transaction built by other party:
+
+            trx = NewTransaction.from_xdr(envelope, [secret])
+            envelope = trx.sign().envelope()
+
+        Transaction is prepared with the signatures of the envelope, so sign() adds
+        signatures and envelope() serializes it without packing transaction again.
+        build() and submit() keep the signatures of the envelope as well, they raise
+        exception if transaction was changed since. Operations of the envelope are in
+        ops. If operations are added or changed, transaction must be prepared again
+        (which discards the signatures). fee is then the fee of the envelope scaled to
+        number of operations, unless fee is set.
+        """
+        raw = base64.b64decode(envelope)
+        unpacker = Xdr.StellarXDRUnpacker(raw)
+        source = unpacker.unpack_AccountID()
+        fee = unpacker.unpack_uint()
+        seq = unpacker.unpack_uhyper()
+        time_bounds = unpacker.unpack_array(unpacker.unpack_TimeBounds)
+        memo = unpacker.unpack_Memo()
+
+        ops = unpacker.unpack_array(unpacker.unpack_Operation)
+        if unpacker.unpack_int() != 0:
+            raise Exception('Unsupported transaction version')
+        packed = raw[:unpacker.get_position()]
+        signatures = unpacker.unpack_array(unpacker.unpack_DecoratedSignature)
+        unpacker.done()
+
+        #signers are optional, signatures can be added by sign(signers)
+        account = account_from_public_key(source.ed25519)
+        time_bounds = [time_bounds[0].minTime, time_bounds[0].maxTime] if time_bounds else []
+        trx = cls.__new__(cls)
+        trx._init(account, signers, seq, None, XDR.xdr_to_memo(memo), time_bounds)
+        trx.ops = ops
+        trx._envelope_fee = (fee, len(ops)) if ops else None
+        trx._parsed = packed
+        trx._prepared = (packed, hashlib.sha256(network_id + _ENVELOPE_TYPE_TX + packed).digest())
+        trx.signatures = signatures
+        return trx
 
     def __enter__(self):
         return self
@@ -911,11 +1338,78 @@ class NewTransaction(object):
 
     def build(self):
         """Creates transaction and returns 'Transaction Envelope XDR' without submitting it to network """
-        account_seq = self.seq if self.seq else (int(account(self.account).fetch().sequence) + 1)
+        return self._build(self._account_seq())
+
+    def prepare(self):
+        """Packs transaction without signing it and returns (transaction XDR bytes, hash)
+        pair. Signatures can be then added by sign() (possibly by multiple parties)
+        and envelope() returns 'Transaction Envelope XDR' without packing transaction
+        again. Signatures added before are discarded. See also stellar.sign_batch.
+        """
+        self._parsed = None
+        return self._prepare(self._account_seq())
+
+    def sign(self, signers=None):
+        """Signs prepared transaction with given signers (secrets or Keyring), or
+        with signers of this transaction, and adds the signatures to it."""
+        if self._prepared is None:
+            raise Exception('Transaction not prepared')
+        self.signatures += _sign_trx_hash_all(
+                self.signers if signers is None else signers, self._prepared[1])
+        return self
 
+    def envelope(self):
+        """Returns 'Transaction Envelope XDR' of prepared transaction with signatures
+        added by sign()"""
+        if self._prepared is None:
+            raise Exception('Transaction not prepared')
+        return _pack_envelope(self._prepared[0], self.signatures)
+
+    #Returns given sequence, reserved one or the one after current sequence of account
+    def _account_seq(self):
+        account_seq = self.seq if self.seq else self._reserve_seq()
+        if not account_seq:
+            account_seq = _fetch_sequence(self.account) + 1
+        return account_seq
+
+    def _reserve_seq(self):
+        """Returns sequence reserved from sequence allocator, None if there is no allocator"""
+        allocator = self.allocator or sequences
+        if allocator is None:
+            return None
+        if self._reserved is None or self._reserved[:2] != (allocator, self.account):
+            self._reserved = (allocator, self.account) + allocator.reserve(self.account)
+        return self._reserved[2]
+
+    def _submitted(self, trx_result):
+        self.trx_result = trx_result
+        #bad sequence means that sequences reserved for the account are out of sync
+        if self._reserved is not None and not trx_result.is_success() \
+                and trx_result.transaction_error == 'tx_bad_seq':
+            allocator, account, seq, epoch = self._reserved
+            allocator.resync(account, epoch)
+            self._reserved = None
+
+    def _build(self, account_seq):
+        signatures = self.signatures if self._parsed is not None else []
+        self._prepare(account_seq)
+        #signatures of envelope given to from_xdr are valid only for the same transaction
+        if signatures:
+            if self._prepared[0] != self._parsed:
+                raise Exception('Transaction changed, signatures of its envelope would be lost')
+            self.signatures = signatures
+        return self.sign().envelope()
+
+    def _prepare(self, account_seq):
         self.__add_set_options_op()
 
-        base_fee = self.fee if self.fee else BASE_FEE*len(self.ops)
+        if self.fee:
+            base_fee = self.fee
+        elif self._envelope_fee is not None:
+            fee, count = self._envelope_fee
+            base_fee = fee*len(self.ops) // count
+        else:
+            base_fee = BASE_FEE*len(self.ops)
         time_bounds = [XDR.time_bounds_to_xdr(self.time_bounds)] if self.time_bounds else []
 
         xdr = Xdr.nullclass()
@@ -929,30 +1423,19 @@ class NewTransaction(object):
                 self.ops,
                 xdr)
 
-        trxtypepacker = Xdr.StellarXDRPacker()
-        trxtypepacker.pack_EnvelopeType(Xdr.const.ENVELOPE_TYPE_TX)
-        trxtype = trxtypepacker.get_buffer()
-
+        #hash covers envelope type followed by transaction, which is packed once
         trxpacker = Xdr.StellarXDRPacker()
         trxpacker.pack_Transaction(trxxdr)
         trx = trxpacker.get_buffer()
+        trx_hash = hashlib.sha256(network_id + _ENVELOPE_TYPE_TX + trx).digest()
 
-        trx_hash = hashlib.sha256(network_id + trxtype + trx).digest()
-
-        signatures = []
-        for signer in self.signers:
-            signatures += [_sign_trx_hash(signer, trx_hash)]
-
-        tre = Xdr.types.TransactionEnvelope(trxxdr, signatures)
-
-        txpacker = Xdr.StellarXDRPacker()
-        txpacker.pack_TransactionEnvelope(tre)
-
-        return base64.b64encode(txpacker.get_buffer()).decode('utf-8')
+        self._prepared = (trx, trx_hash)
+        self.signatures = []
+        return self._prepared
 
     def submit(self):
         """Submits transaction to network in context of this new transaction. """
-        self.trx_result = post_transaction(self.build())
+        self._submitted(post_transaction(self.build()))
 
     def is_success(self):
         """Returns whether transaction was successful after submitting to network """
@@ -972,17 +1455,26 @@ class NewTransaction(object):
             raise Exception('Transaction not submitted')
         return self.trx_result.errors()
 
+    #Returns account id of given account id or federation address
+    def _resolve(self, address):
+        return _address_to_account(address)
+
+    #Returns operation with given body and source account
+    def _operation(self, body):
+        source = self.op_source if self.op_source else self.account
+        return Xdr.types.Operation([XDR.address_to_xdr(source)], body)
+
     def create_account(self, account, starting_balance):
         """Creates account with given starting balance
         """
-        account = _address_to_account(account)
+        account = self._resolve(account)
 
         body = Xdr.nullclass()
         body.type = Xdr.const.CREATE_ACCOUNT
         body.createAccountOp = Xdr.types.CreateAccountOp(
                 XDR.address_to_xdr(account),
                 XDR.amount_to_xdr(starting_balance))
-        self.ops += [Xdr.types.Operation([XDR.address_to_xdr(self.account)], body)]
+        self.ops += [self._operation(body)]
 
         return self
 
@@ -990,7 +1482,7 @@ class NewTransaction(object):
         """Pays given account with given amount of specified asset.
         asset can be 'native' or tuple in format (asset_code, asset_issuer).
         """
-        account = _address_to_account(account)
+        account = self._resolve(account)
 
         body = Xdr.nullclass()
         body.type = Xdr.const.PAYMENT
@@ -998,7 +1490,7 @@ class NewTransaction(object):
                 XDR.address_to_xdr(account),
                 XDR.asset_to_xdr(asset),
                 XDR.amount_to_xdr(amount))
-        self.ops += [Xdr.types.Operation([XDR.address_to_xdr(self.account)], body)]
+        self.ops += [self._operation(body)]
 
         return self
 
@@ -1008,7 +1500,7 @@ class NewTransaction(object):
         asset for intermediate exchanges can be specified (those path asset can be 'native' or 
         tuple in format (asset_code, asset_issuer).
         """
-        destination = _address_to_account(destination)
+        destination = self._resolve(destination)
 
         pathxdr = []
         #XXX is this tested?
@@ -1024,7 +1516,7 @@ class NewTransaction(object):
                 XDR.asset_to_xdr(dest_asset),
                 XDR.amount_to_xdr(dest_amount),
                 pathxdr)
-        self.ops += [Xdr.types.Operation([XDR.address_to_xdr(self.account)], body)]
+        self.ops += [self._operation(body)]
 
         return self
 
@@ -1047,7 +1539,7 @@ class NewTransaction(object):
                 XDR.asset_to_xdr(buy_asset),
                 XDR.amount_to_xdr(sell_amount),
                 XDR.price_to_xdr(price))
-        self.ops += [Xdr.types.Operation([XDR.address_to_xdr(self.account)], body)]
+        self.ops += [self._operation(body)]
 
         return self
 
@@ -1064,7 +1556,7 @@ class NewTransaction(object):
                 XDR.amount_to_xdr(sell_amount),
                 XDR.price_to_xdr(price),
                 offer_id)
-        self.ops += [Xdr.types.Operation([XDR.address_to_xdr(self.account)], body)]
+        self.ops += [self._operation(body)]
 
         return self
 
@@ -1075,7 +1567,7 @@ class NewTransaction(object):
 
     def set_inflation_destination(self, account):
         """Sets the inflation of given account (SET_OPTIONS operation)"""
-        self.set_options_op['inflation'] = _address_to_account(account)
+        self.set_options_op['inflation'] = self._resolve(account)
 
         return self
 
@@ -1164,7 +1656,9 @@ class NewTransaction(object):
                     low_, medium_, high_,
                     home_domain_,
                     signer_)
-            self.ops += [Xdr.types.Operation([XDR.address_to_xdr(self.account)], body)]
+            self.ops += [self._operation(body)]
+            #added once, even if transaction is prepared again
+            self.set_options_op = {}
 
     def create_or_update_trust(self, asset, limit):
         """Creates or update trust for given asset with specified limit.
@@ -1176,7 +1670,7 @@ class NewTransaction(object):
         body.changeTrustOp = Xdr.types.ChangeTrustOp(
                 XDR.asset_to_xdr(asset),
                 XDR.amount_to_xdr(limit))
-        self.ops += [Xdr.types.Operation([XDR.address_to_xdr(self.account)], body)]
+        self.ops += [self._operation(body)]
 
         return self
 
@@ -1193,30 +1687,30 @@ class NewTransaction(object):
                 XDR.address_to_xdr(account),
                 XDR.assetcode_to_xdr(asset_code),
                 is_allow)
-        self.ops += [Xdr.types.Operation([XDR.address_to_xdr(self.account)], body)]
+        self.ops += [self._operation(body)]
 
         return self
 
     def authorize_trust(self, account, asset_code):
         """Authorize given account to perform transaction for given asset_code. """
-        account = _address_to_account(account)
+        account = self._resolve(account)
 
         return self.__perform_trust_op(account, asset_code, True)
        
     def deauthorize_trust(self, account, asset_code):
         """Deauthorize given account to perform transaction for given asset_code. """
-        account = _address_to_account(account)
+        account = self._resolve(account)
 
         return self.__perform_trust_op(account, asset_code, False)
 
     def merge_this_account_with(self, account):
         """Merges current account with input account"""
-        account = _address_to_account(account)
+        account = self._resolve(account)
 
         body = Xdr.nullclass()
         body.type = Xdr.const.ACCOUNT_MERGE
         body.destination = XDR.address_to_xdr(account)
-        self.ops += [Xdr.types.Operation([XDR.address_to_xdr(self.account)], body)]
+        self.ops += [self._operation(body)]
 
         return self
 
@@ -1224,7 +1718,7 @@ class NewTransaction(object):
         """Runs inflation process with this account """
         body = Xdr.nullclass()
         body.type = Xdr.const.INFLATION
-        self.ops += [Xdr.types.Operation([XDR.address_to_xdr(self.account)], body)]
+        self.ops += [self._operation(body)]
 
         return self
 
@@ -1238,7 +1732,7 @@ class NewTransaction(object):
         body = Xdr.nullclass()
         body.type = Xdr.const.MANAGE_DATA
         body.manageDataOp = Xdr.types.ManageDataOp(key, value)
-        self.ops += [Xdr.types.Operation([XDR.address_to_xdr(self.account)], body)]
+        self.ops += [self._operation(body)]
 
         return self
 
@@ -1379,17 +1873,22 @@ def orderbook(buying, selling):
     """
     return Orderbooks._All(selling, buying)
 
-def new_transaction(account, signers=[], seq=None, fee=None, memo=None, time_bounds=[]):
+def new_transaction(account, signers=[], seq=None, fee=None, memo=None, time_bounds=[],
+        allocator=None):
     """
     Creates new transaction.
     account - can be public key or secret. If account is self signed then
     secret of the account is sufficient. Otherwise public key in account parameter
     and signers must have secrets of the necessary signers of that account.
     seq - sequence of transaction(int), if not given will get last sequence and increment by one
+           (or reserve it locally if sequence allocator is set up, see setup_sequences)
     fee - fee(int), if given, will be used instead of default fee of 100 stroops/op.
     memo - optional text memo in string format or tuple (memo_type, memo_data) for other formats. 
            available other formats are ('id', 'hash', 'return')
     time_bounds - if given, upper and lower bounds for the transaction to be effective.
+    allocator - SequenceAllocator used to reserve seq if seq is not given, instead of
+           global one enabled by setup_sequences. If there is neither, seq is fetched
+           from horizon.
 
     Can be used with with-statement as follows:
 
@@ -1414,7 +1913,7 @@ def new_transaction(account, signers=[], seq=None, fee=None, memo=None, time_bou
     set inflation destination and auth flags in single transaction then it will only
     cost you 100 stroops. 
     """
-    return NewTransaction(account, signers, seq, fee, memo, time_bounds)
+    return NewTransaction(account, signers, seq, fee, memo, time_bounds, allocator)
 
 def post_transaction(envelope_xdr):
     """
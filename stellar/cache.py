@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+Caches of horizon resources.
+
+HistoryCache keeps closed history (ledgers, transactions, operations and payments)
+on disk, so that it is not downloaded again by later runs:
+
+    cache = stellar.setup_history_cache('horizon.sqlite', max_bytes=1 << 30)
+    for t in stellar.transactions().iterate():
+        ...
+    print(cache.hits, cache.misses)
+
+AccountCache keeps fetched accounts for a few seconds, optionally invalidating them
+as soon as effects stream shows they changed:
+
+    stellar.setup_account_cache(ttl=10, invalidate=True)
+"""
+
+import os
+import json
+import time
+import logging
+import sqlite3
+import threading
+
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+class HistoryCache(object):
+    """
+    SQLite cache of parsed horizon responses keyed by URL. Least recently used
+    entries are evicted when total size of cached responses exceeds max_bytes.
+    Cache can be shared by threads and (through the same file) by processes.
+    """
+    def __init__(self, path=':memory:', max_bytes=256 << 20):
+        self.path = path
+        '''database file, in-memory database by default'''
+        self.max_bytes = max_bytes
+        '''maximum total size of cached responses (in bytes of json)'''
+        self.hits = 0
+        '''number of responses found in cache'''
+        self.misses = 0
+        '''number of responses not found in cache'''
+        self._lock = threading.Lock()
+        self._db = None
+        self._pid = None
+
+    def __getstate__(self):
+        return (self.path, self.max_bytes)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __len__(self):
+        with self._lock:
+            return self._connect().execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def get(self, url):
+        """Returns cached response of given url, None if it is not cached"""
+        with self._lock:
+            db = self._connect()
+            row = db.execute('SELECT data FROM entries WHERE url = ?', (url,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._used += 1
+            db.execute('UPDATE entries SET used = ? WHERE url = ?', (self._used, url))
+        return json.loads(row[0])
+
+    def put(self, url, data):
+        """Caches response of given url, evicting least recently used responses if
+        cache is full"""
+        data = json.dumps(data, separators=(',', ':'))
+        with self._lock:
+            db = self._connect()
+            row = db.execute('SELECT size FROM entries WHERE url = ?', (url,)).fetchone()
+            self._used += 1
+            db.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)',
+                    (url, data, len(data), self._used))
+            self._size += len(data) - (row[0] if row else 0)
+            if self._size > self.max_bytes:
+                self._evict(db)
+
+    def clear(self):
+        """Removes all cached responses and resets counters"""
+        with self._lock:
+            self._connect().execute('DELETE FROM entries')
+            self._size = 0
+            self.hits = self.misses = 0
+
+    def close(self):
+        """Closes database, it is opened again on next use"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    #Returns connection of current process, connection is not usable after fork
+    def _connect(self):
+        if self._db is None or self._pid != os.getpid():
+            self._db = sqlite3.connect(self.path, timeout=30, isolation_level=None,
+                    check_same_thread=False)
+            self._pid = os.getpid()
+            if self.path != ':memory:':
+                self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS entries (url TEXT PRIMARY KEY, '
+                    'data TEXT NOT NULL, size INTEGER NOT NULL, used INTEGER NOT NULL)')
+            self._db.execute('CREATE INDEX IF NOT EXISTS entries_used ON entries (used)')
+            self._used, self._size = self._db.execute(
+                    'SELECT COALESCE(MAX(used), 0), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        return self._db
+
+    #Removes least recently used entries, so that cache fits into max_bytes
+    def _evict(self, db):
+        evicted = []
+        for url, size in db.execute('SELECT url, size FROM entries ORDER BY used'):
+            if self._size <= self.max_bytes:
+                break
+            evicted.append((url,))
+            self._size -= size
+        db.executemany('DELETE FROM entries WHERE url = ?', evicted)
+
+class AccountCache(object):
+    """
+    In-process cache of accounts, entries expire after ttl seconds and least recently
+    used ones are evicted above max_entries. Accounts can be invalidated as soon as
+    they change by watching stream of changed accounts (see watch()).
+    """
+    def __init__(self, ttl=5.0, max_entries=10000):
+        self.ttl = ttl
+        '''seconds after which cached account is fetched again'''
+        self.max_entries = max_entries
+        '''maximum number of cached accounts'''
+        self.hits = 0
+        '''number of accounts found in cache'''
+        self.misses = 0
+        '''number of accounts not found in cache (or expired)'''
+        self._entries = OrderedDict()
+        self._fetching = {}
+        self._lock = threading.Lock()
+        self._watching = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, accid):
+        """Returns cached account, None if it is not cached or it expired"""
+        with self._lock:
+            entry = self._entries.pop(accid, None)
+            if entry is None or entry[1] <= time.time():
+                self.misses += 1
+                return None
+            self._entries[accid] = entry
+            self.hits += 1
+            return entry[0]
+
+    def put(self, accid, account):
+        """Caches given account"""
+        with self._lock:
+            self._put(accid, account)
+
+    def fetch(self, accid, fetch):
+        """Returns cached account, or account returned by fetch() which is cached
+        unless account is invalidated while it is being fetched"""
+        account = self.get(accid)
+        if account is not None:
+            return account
+        marker = object()
+        with self._lock:
+            self._fetching[accid] = marker
+        try:
+            account = fetch()
+        finally:
+            with self._lock:
+                if self._fetching.get(accid) is marker:
+                    del self._fetching[accid]
+                    if account is not None:
+                        self._put(accid, account)
+        return account
+
+    def invalidate(self, accid):
+        """Removes given account from cache"""
+        with self._lock:
+            self._entries.pop(accid, None)
+            self._fetching.pop(accid, None)
+
+    def clear(self):
+        """Removes all accounts from cache"""
+        with self._lock:
+            self._entries.clear()
+            self._fetching.clear()
+
+    def watch(self, changes, retry_delay=1.0):
+        """Invalidates accounts given by changes() (generator of account ids) in
+        background thread. If generator fails (or ends), cache is cleared, as changes
+        could be missed, and changes() is called again after retry_delay seconds."""
+        self.stop()
+        stopped = threading.Event()
+        thread = threading.Thread(target=self._watch, args=(changes, retry_delay, stopped))
+        thread.daemon = True
+        self._watching = stopped
+        thread.start()
+
+    def stop(self):
+        """Stops watching changes, background thread ends on next change"""
+        if self._watching is not None:
+            self._watching.set()
+            self._watching = None
+
+    def _put(self, accid, account):
+        self._entries.pop(accid, None)
+        self._entries[accid] = (account, time.time() + self.ttl)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _watch(self, changes, retry_delay, stopped):
+        while not stopped.is_set():
+            try:
+                for accid in changes():
+                    if stopped.is_set():
+                        return
+                    self.invalidate(accid)
+            except Exception:
+                logger.exception('watching account changes failed')
+            self.clear()
+            stopped.wait(retry_delay)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Channel accounts for high-throughput submission. Single source account can only
+get one transaction per ledger through without sequence conflicts, so the paying
+account is used as source of the operations only, while transactions are sourced
+from (and sequenced by) a set of channel accounts, which are rotated:
+
+    pool = stellar.channel_pool(payer_secret, [channel_secret1, channel_secret2])
+    for destination, amount in payouts:
+        with pool.new_transaction() as t:
+            t.pay(destination, amount)
+    pool.close()
+
+    for t in pool.submitted:
+        print(t.result())
+
+Each channel holds at most one transaction in flight, and transactions of different
+channels are submitted concurrently, so throughput scales with number of channels.
+Channels only pay the fees, payments and other operations are executed on paying
+account, which must sign each transaction along with the channel.
+"""
+
+import threading
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .api import NewTransaction, SequenceAllocator
+from .keys import account_from_secret
+
+#Returns list of (account, secret) pairs of given channel secrets or pairs
+def _channel_keys(channels):
+    return [c if isinstance(c, tuple) else (account_from_secret(c), c) for c in channels]
+
+class ChannelTransaction(NewTransaction):
+    """NewTransaction of ChannelPool. Its operations are sourced from paying account,
+    while transaction source is channel leased when transaction is being submitted.
+    submit() (and so the with-statement) queues transaction and returns immediately.
+    """
+    def __init__(self, pool, fee, memo, time_bounds):
+        NewTransaction.__init__(self, pool.account, pool.signers, None, fee, memo,
+                time_bounds, pool.allocator)
+        self.op_source = self.account
+        self.pool = pool
+        '''channel pool of this transaction'''
+        self.channel = None
+        '''channel account which was used as source of transaction'''
+        self.future = None
+        '''future of TransactionResult, set when transaction is submitted'''
+
+    def submit(self):
+        """Queues transaction for submission using next free channel. Returns future of
+        TransactionResult."""
+        self.future = self.pool.submit(self)
+        return self.future
+
+    def wait(self, timeout=None):
+        """Waits for queued transaction to be submitted and returns TransactionResult"""
+        if self.future is None:
+            raise Exception('Transaction not submitted')
+        return self.future.result(timeout)
+
+    #Submits transaction from pool worker with given channel
+    def _submit_with(self, channel, signer):
+        self.account = self.channel = channel
+        self.signers = self.pool.signers + [signer]
+        NewTransaction.submit(self)
+        return self.trx_result
+
+class ChannelPool(object):
+    """
+    Pool of channel accounts used as transaction source for operations of paying
+    account. Each channel gets its own sequence tracking (SequenceAllocator) and
+    submissions of different channels run concurrently.
+    """
+    def __init__(self, account, channels, signers=[], allocator=None):
+        if len(signers) == 0 and account.startswith('S'):
+            signers = [account]
+            account = account_from_secret(account)
+        if len(signers) == 0:
+            raise ValueError('signer(s) missing')
+        if len(channels) == 0:
+            raise ValueError('channel(s) missing')
+
+        self.account = account
+        '''paying account, source of operations'''
+        self.signers = list(signers)
+        '''secrets of signers of paying account'''
+        self.allocator = allocator or SequenceAllocator()
+        '''sequence allocator of channel accounts'''
+        self.submitted = []
+        '''transactions submitted using this pool, in the order of submission'''
+
+        self._channels = queue.Queue()
+        for channel in _channel_keys(channels):
+            self._channels.put(channel)
+        self._executor = ThreadPoolExecutor(max_workers=len(channels))
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def new_transaction(self, fee=None, memo=None, time_bounds=[]):
+        """Creates new transaction whose operations are executed on paying account.
+        It is submitted using next free channel when submit() is called (or when
+        with-statement completes)."""
+        return ChannelTransaction(self, fee, memo, time_bounds)
+
+    def submit(self, trx):
+        """Queues given ChannelTransaction for submission, returns future of TransactionResult"""
+        with self._lock:
+            self.submitted.append(trx)
+            return self._executor.submit(self._submit, trx)
+
+    def _submit(self, trx):
+        channel, signer = self._channels.get()
+        try:
+            return trx._submit_with(channel, signer)
+        finally:
+            self._channels.put((channel, signer))
+
+    def close(self, wait=True):
+        """Stops accepting new transactions. If wait is True, waits until all queued
+        transactions are submitted."""
+        self._executor.shutdown(wait=wait)
+
+def channel_pool(account, channels, signers=[], allocator=None):
+    """
+    Creates pool of channel accounts for concurrent submission of transactions of
+    given paying account.
+    account - public key or secret of paying account (source of operations). If it is
+    public key, then signers must have secrets of its signers.
+    channels - list of secrets of channel accounts (or (account, secret) pairs),
+    sources of transactions. Channel accounts only need to have balance for fees.
+    allocator - optional SequenceAllocator for channel accounts.
+    """
+    return ChannelPool(account, channels, signers, allocator)
@@ -4,6 +4,9 @@ import binascii
 import crc16
 import struct
 import base64
+import threading
+
+from collections import OrderedDict
 
 KEY_TYPES = {
         'public' : '30',
@@ -38,3 +41,91 @@ def account_from_secret(secret):
     checksum = crc16.crc16xmodem(payload)
     checksum = struct.pack('H', checksum)
     return base64.b32encode(payload + checksum).decode('utf-8')
+
+def account_from_public_key(public_key):
+    """Returns account-id given raw ed25519 public key"""
+    payload = binascii.a2b_hex(KEY_TYPES['public']) + bytes(public_key)
+    checksum = struct.pack('H', crc16.crc16xmodem(payload))
+    return base64.b32encode(payload + checksum).decode('utf-8')
+
+class SigningKey(object):
+    """Decoded secret key with its verifying key and signature hint"""
+    __slots__ = ('secret', 'signing_key', 'verifying_key', 'hint')
+
+    def __init__(self, secret):
+        self.secret = secret
+        self.signing_key = ed25519.SigningKey(base64.b32decode(secret)[1:-2])
+        self.verifying_key = self.signing_key.get_verifying_key().to_bytes()
+        '''raw ed25519 public key'''
+        self.hint = self.verifying_key[-4:]
+        '''last 4 bytes of public key, hint of decorated signature'''
+
+    def sign(self, data):
+        """Returns (hint, signature) pair of given data"""
+        return (self.hint, self.signing_key.sign(data))
+
+class Keyring(object):
+    """
+    Holds decoded signing keys, so that secrets are decoded and verifying keys are
+    derived only once. Keyring can be passed as signers of transaction, then it signs
+    with all its keys:
+
+        keyring = stellar.Keyring([secret1, secret2])
+        stellar.new_transaction(account, signers=keyring).pay(destination, '10').submit()
+
+    Keys of other (ad-hoc) secrets are kept in bounded LRU cache of cache_size keys.
+    """
+    def __init__(self, secrets=[], cache_size=256):
+        self.cache_size = cache_size
+        '''maximum number of cached keys of ad-hoc secrets'''
+        self._keys = OrderedDict()
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        for secret in secrets:
+            self.add(secret)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(list(self._keys))
+
+    def __contains__(self, secret):
+        return secret in self._keys
+
+    def __getstate__(self):
+        return (list(self._keys), self.cache_size)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def add(self, secret):
+        """Adds given secret to keyring, returns its SigningKey"""
+        with self._lock:
+            key = self._keys.get(secret)
+            if key is None:
+                key = self._cache.pop(secret, None) or SigningKey(secret)
+                self._keys[secret] = key
+        return key
+
+    def key(self, secret):
+        """Returns SigningKey of given secret, which need not be added to keyring"""
+        key = self._keys.get(secret)
+        if key is not None:
+            return key
+        with self._lock:
+            key = self._cache.pop(secret, None)
+        if key is None:
+            key = SigningKey(secret)
+        with self._lock:
+            self._cache[secret] = key
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return key
+
+    def sign(self, data, secrets=None):
+        """Returns list of (hint, signature) pairs of given data signed with all keys
+        of keyring, or with keys of given secrets"""
+        if secrets is None:
+            return [key.sign(data) for key in list(self._keys.values())]
+        return [self.key(secret).sign(data) for secret in secrets]
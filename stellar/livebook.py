@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+Local order book kept up to date from horizon. LiveOrderbook starts from order book
+snapshot and applies trade effects of effects stream to it, so that best prices and
+depth are available without polling horizon:
+
+    book = stellar.LiveOrderbook(('USD', issuer), 'native')
+    book.on_change(lambda book, side, price_r, amount: print(side, price_r, amount))
+    book.start()
+    print(book.best_bid(), book.best_ask())
+
+Horizon offer effects (offer_created, offer_removed, offer_updated) do not describe
+the offer, so they only mark the book stale and it is re-synced from snapshot (at
+most every min_resync seconds). Book is re-synced every resync_interval seconds as
+well, to correct drift.
+"""
+
+import bisect
+import logging
+import threading
+import time
+
+from decimal import Decimal
+from fractions import Fraction
+
+from . import api
+from .api import Orderbooks
+from .router import _asset_key
+
+logger = logging.getLogger(__name__)
+
+EFFECT_OFFER_CREATED = 30
+EFFECT_OFFER_REMOVED = 31
+EFFECT_OFFER_UPDATED = 32
+EFFECT_TRADE = 33
+
+#one stroop, amounts of trade can differ from offer price by rounding
+_STROOP = Decimal('0.0000001')
+
+class _Side(object):
+    #Price levels of one side, sorted so that the best level is first. Keys are
+    #Fraction prices (negated for bids), levels are [amount, (n, d)].
+    def __init__(self, descending):
+        self.sign = -1 if descending else 1
+        self.keys = []
+        self.levels = {}
+
+    def load(self, entries):
+        self.levels = dict((self.sign * Fraction(n, d), [Decimal(amount), (n, d)])
+                for amount, (n, d), price in entries)
+        self.keys = sorted(self.levels)
+
+    def entries(self, n=None):
+        keys = self.keys if n is None else self.keys[:n]
+        return [_entry(self.levels[k]) for k in keys]
+
+    #Returns key of level closest to given price, O(log n)
+    def nearest(self, price):
+        if not self.keys:
+            return None
+        key = self.sign * price
+        i = bisect.bisect_left(self.keys, key)
+        candidates = self.keys[max(0, i - 1):i + 1]
+        return min(candidates, key=lambda k: abs(k - key))
+
+    #Reduces amount of level with given key, level is removed when it is used up.
+    #Finding level is O(log n), removing it from sorted keys is O(n) (list deletion).
+    def reduce(self, key, amount):
+        level = self.levels[key]
+        level[0] -= amount
+        if level[0] <= 0:
+            del self.levels[key]
+            del self.keys[bisect.bisect_left(self.keys, key)]
+            return Decimal(0)
+        return level[0]
+
+#Returns level in Orderbook format (amount, (n, d), price)
+def _entry(level):
+    amount, (n, d) = level
+    return (str(amount), (n, d), str((Decimal(n) / Decimal(d)).quantize(_STROOP)))
+
+class LiveOrderbook(object):
+    """
+    Order book of given assets (selling is base, buying is counter asset) kept in
+    memory. Like in horizon order book, asks are offers selling base asset with
+    amount in base asset, bids are offers buying it with amount in counter asset,
+    price being amount of counter asset per unit of base asset.
+    Trade lookups are O(log n) in number of price levels, removal of used up level
+    is O(n) as price levels are kept in sorted list.
+    """
+    def __init__(self, selling, buying, resync_interval=60.0, min_resync=1.0):
+        self.selling = selling
+        '''base asset, 'native' or (asset_code, asset_issuer)'''
+        self.buying = buying
+        '''counter asset, 'native' or (asset_code, asset_issuer)'''
+        self.resync_interval = resync_interval
+        '''seconds after which book is re-synced from snapshot'''
+        self.min_resync = min_resync
+        '''minimum seconds between re-syncs of stale book'''
+        self.trades = 0
+        '''number of trades applied to the book'''
+        self.resyncs = 0
+        '''number of snapshots loaded'''
+        self.synced_at = None
+        '''time of the last snapshot'''
+        self._base = _asset_key(selling)
+        self._counter = _asset_key(buying)
+        self._asks = _Side(descending=False)
+        self._bids = _Side(descending=True)
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._stale = threading.Event()
+        self._stopped = threading.Event()
+
+    def on_change(self, callback):
+        """Calls callback(book, side, price_r, amount) when amount of price level
+        changes, side is 'ask' or 'bid' (amount 0 means level was removed), or
+        callback(book, 'snapshot', None, None) when book is re-synced"""
+        self._callbacks.append(callback)
+
+    def best_ask(self):
+        """Returns the lowest ask as (amount, (n, d), price), None if there is none"""
+        with self._lock:
+            asks = self._asks.entries(1)
+        return asks[0] if asks else None
+
+    def best_bid(self):
+        """Returns the highest bid as (amount, (n, d), price), None if there is none"""
+        with self._lock:
+            bids = self._bids.entries(1)
+        return bids[0] if bids else None
+
+    def spread(self):
+        """Returns difference of best ask and best bid price (Decimal), None if a
+        side is empty"""
+        with self._lock:
+            if not self._asks.keys or not self._bids.keys:
+                return None
+            spread = self._asks.keys[0] + self._bids.keys[0]
+        return Decimal(spread.numerator) / Decimal(spread.denominator)
+
+    def asks(self, n=None):
+        """Returns n best asks (all if None) in Orderbook.asks format"""
+        with self._lock:
+            return self._asks.entries(n)
+
+    def bids(self, n=None):
+        """Returns n best bids (all if None) in Orderbook.bids format"""
+        with self._lock:
+            return self._bids.entries(n)
+
+    def depth(self, side, price):
+        """Returns total amount (Decimal) of asks at or below given price (side='ask')
+        or of bids at or above it (side='bid')"""
+        levels = self._asks if side == 'ask' else self._bids
+        key = levels.sign * Fraction(Decimal(price))
+        with self._lock:
+            keys = levels.keys[:bisect.bisect_right(levels.keys, key)]
+            return sum((levels.levels[k][0] for k in keys), Decimal(0))
+
+    def resync(self):
+        """Replaces book with snapshot from horizon"""
+        snapshot = Orderbooks._All(self.selling, self.buying).fetch()
+        with self._lock:
+            self._asks.load(snapshot.asks)
+            self._bids.load(snapshot.bids)
+            self.synced_at = time.time()
+            self.resyncs += 1
+            self._stale.clear()
+        self._notify('snapshot', None, None)
+
+    def apply(self, effect):
+        """Applies given effect (Effects.Effect) to the book. Returns whether the
+        book changed."""
+        if effect.type_i in (EFFECT_OFFER_CREATED, EFFECT_OFFER_REMOVED, EFFECT_OFFER_UPDATED):
+            self._stale.set()
+            return False
+        if effect.type_i != EFFECT_TRADE:
+            return False
+
+        sold, bought = _asset_key(effect.sold_asset), _asset_key(effect.bought_asset)
+        sold_amount, bought_amount = Decimal(effect.sold_amount), Decimal(effect.bought_amount)
+        if sold_amount <= 0 or bought_amount <= 0:
+            return False
+        #both parties get trade effect, only the one of offer owner (maker) matches
+        #level of the book, as book is not crossed
+        if (sold, bought) == (self._base, self._counter):
+            side, levels = 'ask', self._asks
+            price = Fraction(bought_amount) / Fraction(sold_amount)
+        elif (sold, bought) == (self._counter, self._base):
+            side, levels = 'bid', self._bids
+            price = Fraction(sold_amount) / Fraction(bought_amount)
+        else:
+            return False
+
+        with self._lock:
+            key = levels.nearest(price)
+            if key is None:
+                return False
+            n, d = levels.levels[key][1]
+            level_price = Fraction(n, d)
+            #offer price and amounts of trade differ by rounding to stroops
+            if side == 'ask':
+                mismatch = abs(level_price * Fraction(sold_amount) - Fraction(bought_amount))
+            else:
+                mismatch = abs(level_price * Fraction(bought_amount) - Fraction(sold_amount))
+            if mismatch > Fraction(_STROOP):
+                return False
+            amount = levels.reduce(key, sold_amount)
+            self.trades += 1
+        self._notify(side, (n, d), amount)
+        return True
+
+    def follow(self, effects):
+        """Applies given effects (e.g. stellar.effects().stream(cursor='now')) until
+        they end or stop() is called"""
+        for effect in effects:
+            if self._stopped.is_set():
+                return
+            try:
+                self.apply(effect)
+            except Exception:
+                logger.exception('failed to apply %s', effect)
+
+    def start(self, effects=None):
+        """Loads snapshot and follows given effects (all effects from now by default)
+        in background thread, book is re-synced in another one"""
+        self._stopped.clear()
+        if effects is None:
+            effects = api.effects().stream(cursor='now')
+        self.resync()
+        for target, args in ((self.follow, (effects,)), (self._resync_loop, ())):
+            thread = threading.Thread(target=target, args=args, name='stellar-orderbook')
+            thread.daemon = True
+            thread.start()
+
+    def stop(self):
+        """Stops following effects (on the next effect) and re-syncing"""
+        self._stopped.set()
+        self._stale.set()
+
+    def _resync_loop(self):
+        while not self._stopped.is_set():
+            timeout = self.synced_at + self.resync_interval - time.time()
+            if self._stale.wait(max(0, timeout)):
+                #offer effects come in bursts, re-sync once they settle
+                self._stopped.wait(max(0, self.synced_at + self.min_resync - time.time()))
+            if self._stopped.is_set():
+                return
+            try:
+                self.resync()
+            except Exception:
+                logger.exception('order book re-sync failed')
+                self._stopped.wait(self.min_resync)
+
+    def _notify(self, side, price_r, amount):
+        for callback in self._callbacks:
+            try:
+                callback(self, side, price_r, amount)
+            except Exception:
+                logger.exception('order book callback failed')
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Bulk payouts. Rows of (destination, amount, asset) are packed into transactions of
+up to 100 payment operations, which are built and signed in parallel and submitted
+with bounded concurrency. Outcome of each row is reported separately:
+
+    with open('payouts.csv') as f:
+        results = stellar.bulk_pay(secret, stellar.payouts.csv_rows(f))
+
+    for r in results:
+        if r.pending:
+            print(r.destination, r.amount, 'check transaction', r.trxid)
+        elif not r.success:
+            print(r.destination, r.amount, r.error)
+
+Transactions of single source account must reach the network in sequence order, so
+they are submitted one after another. Given channel accounts (see stellar.channels)
+transactions are spread over channels and each channel submits concurrently.
+
+If submission fails after transaction could have reached the network (e.g. read
+timeout), transaction is looked up by its hash. Rows of transaction which is not
+found are pending, they must not be paid again until the transaction is known to
+have failed (or its sequence was used by other transaction).
+"""
+
+import csv
+import json
+
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from . import api
+from .api import NewTransaction, SequenceAllocator, TransactionResult, post_transaction
+from .channels import _channel_keys
+from .keys import account_from_secret
+from .utils import FED, HttpException
+
+MAX_OPS = 100
+
+class PayoutResult(object):
+    """Outcome of single payout row"""
+    def __init__(self, index, row):
+        self.index = index
+        '''index of the row in input'''
+        self.destination, self.amount, self.asset = row
+        self.success = False
+        '''whether payment was executed'''
+        self.pending = False
+        '''whether outcome is unknown, transaction trxid could still be applied'''
+        self.error = None
+        '''operation error (e.g. op_no_destination), transaction error or exception message'''
+        self.trxid = None
+        '''id of submitted transaction, if it was successful or is pending'''
+        self.ledid = None
+
+    def __repr__(self):
+        outcome = 'success' if self.success else ('pending %s' % self.trxid
+                if self.pending else self.error)
+        return 'PayoutResult(%s, %s, %s, %s)' % (self.index, self.destination,
+                self.amount, outcome)
+
+def csv_rows(stream):
+    """Returns generator of payout rows from csv stream with columns destination,
+    amount and optionally asset_code and asset_issuer (native asset if missing).
+    Header line is skipped if first column is 'destination'."""
+    for i, line in enumerate(csv.reader(stream)):
+        if not line or (i == 0 and line[0].strip() == 'destination'):
+            continue
+        line = [c.strip() for c in line]
+        yield _row(line[0], line[1], *line[2:4])
+
+def ndjson_rows(stream):
+    """Returns generator of payout rows from stream of json objects (one per line)
+    with keys destination, amount and optionally asset ('native' or [code, issuer])
+    or asset_code and asset_issuer."""
+    for line in stream:
+        if not line.strip():
+            continue
+        r = json.loads(line)
+        asset = r.get('asset')
+        if asset is None:
+            yield _row(r['destination'], r['amount'], r.get('asset_code'), r.get('asset_issuer'))
+        else:
+            yield (r['destination'], r['amount'], asset if asset == 'native' else tuple(asset))
+
+def _row(destination, amount, asset_code=None, asset_issuer=None):
+    if not asset_code or asset_code == 'native':
+        return (destination, amount, 'native')
+    return (destination, amount, (asset_code, asset_issuer))
+
+#Builds and signs transaction paying given rows. Module level so that it can be run
+#in process pool, network is passed as (horizon, password) of the caller.
+def _build_envelope(account, signers, source, seq, fee, memo, rows, network):
+    if api.horizon != network[0] or api.network_password != network[1]:
+        api.setup_custom_network(*network)
+    trx = NewTransaction(source, signers, seq, fee, memo, [])
+    if source != account:
+        trx.op_source = account
+    for destination, amount, asset in rows:
+        trx.pay(destination, amount, asset)
+    return trx.build()
+
+#Returns transaction with given hash from horizon, None if it is not found
+def _find_transaction(trxid):
+    try:
+        return api.transaction(trxid).fetch()
+    except HttpException:
+        return None
+
+class _Chunk(object):
+    def __init__(self, first, rows, source):
+        self.first = first
+        self.rows = rows
+        self.source = source
+
+class _Payout(object):
+    def __init__(self, account, signers, fee, memo, allocator):
+        self.account = account
+        self.signers = signers
+        self.fee = fee
+        self.memo = memo
+        self.allocator = allocator
+        self.network = (api.horizon, api.network_password)
+
+    def build_args(self, chunk):
+        source, signers = self.account, self.signers
+        if chunk.source is not None:
+            source, signers = chunk.source[0], self.signers + [chunk.source[1]]
+        return (self.account, signers, source, self.allocator.next(source), self.fee,
+                self.memo, chunk.rows, self.network)
+
+    #Submits chunks of single source in sequence order. If submission fails without
+    #consuming sequence, remaining chunks of the source are rebuilt with new sequence.
+    def submit_chain(self, chain, results):
+        rebuild = False
+        for chunk, envelope in chain:
+            trx_result, error, sent, pending = None, None, False, None
+            try:
+                if rebuild:
+                    envelope = _build_envelope(*self.build_args(chunk))
+                else:
+                    envelope = envelope.result()
+                sent = True
+                trx_result = post_transaction(envelope)
+            except Exception as e:
+                error = str(e)
+
+            #transaction could have been applied even if submission failed (or timed out)
+            if sent and (trx_result is None or trx_result.status >= 500):
+                trxid = api._envelope_hash(envelope)
+                trx = _find_transaction(trxid)
+                if trx is not None:
+                    trx_result = TransactionResult({'hash' : trx.hash, 'ledger' : trx.ledger})
+                else:
+                    pending = trxid
+                    error = error or trx_result.error
+            self.record(chunk, trx_result, results, error, pending)
+
+            #failed transaction (tx_failed) consumes sequence, others do not, so
+            #envelopes built with following sequences can not be used anymore
+            if trx_result is None or (not trx_result.is_success()
+                    and trx_result.transaction_error != 'tx_failed'):
+                source = chunk.source[0] if chunk.source else self.account
+                self.allocator.resync(source)
+                rebuild = True
+
+    def record(self, chunk, trx_result, results, error, pending=None):
+        for i, row in enumerate(chunk.rows):
+            r = results[chunk.first + i]
+            if pending is not None:
+                r.pending = True
+                r.trxid = pending
+                r.error = error
+            elif trx_result is None:
+                r.error = error
+            elif trx_result.is_success():
+                r.success = True
+                r.trxid, r.ledid = trx_result.result()
+            else:
+                op_errors = trx_result.operation_errors
+                #all operations of failed transaction are rolled back
+                op_error = op_errors[i] if i < len(op_errors) else None
+                r.error = op_error if op_error and op_error != 'op_success' \
+                        else (trx_result.transaction_error or trx_result.error)
+
+def bulk_pay(account, rows, signers=[], channels=[], fee=None, memo=None,
+        ops_per_transaction=MAX_OPS, workers=4, processes=False, max_in_flight=None,
+        allocator=None):
+    """
+    Pays given rows from account, packing up to ops_per_transaction payments in each
+    transaction. Returns list of PayoutResult, one per row in the input order.
+    account - public key or secret of paying account. If it is public key, then
+    signers must have secrets of its signers.
+    rows - iterable of (destination, amount) or (destination, amount, asset) tuples,
+    asset being 'native' or (asset_code, asset_issuer). See csv_rows and ndjson_rows.
+    Federation addresses among destinations are resolved at once (FED.resolve_many).
+    channels - optional secrets (or (account, secret) pairs) of channel accounts used
+    as transaction sources, so that transactions can be submitted concurrently.
+    workers - number of threads (or processes if processes is True) which build and
+    sign transactions.
+    max_in_flight - maximum number of concurrent submissions, number of channels (or 1)
+    by default.
+    allocator - SequenceAllocator used for sequences of source accounts, global one
+    (setup_sequences) or new one by default.
+    """
+    if len(signers) == 0 and account.startswith('S'):
+        signers = [account]
+        account = account_from_secret(account)
+    if len(signers) == 0:
+        raise ValueError('signer(s) missing')
+    if not 0 < ops_per_transaction <= MAX_OPS:
+        raise ValueError('ops_per_transaction must be between 1 and %d' % MAX_OPS)
+
+    rows = [r if len(r) == 3 else (r[0], r[1], 'native') for r in rows]
+    results = [PayoutResult(i, r) for i, r in enumerate(rows)]
+
+    #federation addresses are resolved up front, rows which can not be resolved fail
+    accounts, errors = FED.resolve_many(set(r[0] for r in rows))
+    for r in results:
+        if r.destination in errors:
+            r.error = str(errors[r.destination])
+    payable = [r for r in results if r.error is None]
+    rows = [(accounts[r.destination], r.amount, r.asset) for r in payable]
+    if not rows:
+        return results
+
+    channels = _channel_keys(channels)
+    payout = _Payout(api._address_to_account(account), list(signers), fee, memo,
+            allocator or api.sequences or SequenceAllocator())
+
+    sources = channels if channels else [None]
+    chains = dict((i, []) for i in range(len(sources)))
+    pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    builder = pool(max_workers=workers)
+    submitter = ThreadPoolExecutor(max_workers=max_in_flight or len(sources))
+    try:
+        #sequences are reserved here in order, so envelopes can be built in any order
+        for n, first in enumerate(range(0, len(rows), ops_per_transaction)):
+            chunk = _Chunk(first, rows[first:first + ops_per_transaction],
+                    sources[n % len(sources)])
+            envelope = builder.submit(_build_envelope, *payout.build_args(chunk))
+            chains[n % len(sources)].append((chunk, envelope))
+
+        submitted = [submitter.submit(payout.submit_chain, chain, payable)
+                for chain in chains.values() if chain]
+        for f in submitted:
+            f.result()
+    finally:
+        builder.shutdown(wait=False)
+        submitter.shutdown(wait=True)
+    return results
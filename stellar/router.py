@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+Client-side routing of single stream. Instead of stream per watched account, one
+stream of all payments (or operations, effects) is followed and its records are
+dispatched to callbacks of accounts and assets they involve:
+
+    router = stellar.Router()
+    for accid in custodial_accounts:
+        router.watch_account(accid, on_payment)
+    router.watch_asset(('USD', issuer), on_usd)
+    router.start(stellar.payments().stream(cursor='now'))
+
+    router.watch_account(new_accid, on_payment)   #no reconnect needed
+
+Records are matched by dict lookups, so routing cost does not depend on number of
+watched accounts. Router can be fed by StreamHub as well:
+
+    hub.subscribe(stellar.aio.payments(), callback=router.route)
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+#record attributes holding accounts (of payments, operations and effects)
+_ACCOUNT_FIELDS = ('source_account', 'destination', 'from_account', 'to_account',
+        'account', 'funder', 'merged_to', 'trustor', 'trustee', 'seller')
+
+#record attributes holding assets
+_ASSET_FIELDS = ('asset', 'send_asset', 'buying_asset', 'selling_asset',
+        'sold_asset', 'bought_asset', 'trustasset')
+
+#Returns index key given asset as 'native', (asset_code, asset_issuer) or api.Asset
+def _asset_key(asset):
+    if asset == 'native' or getattr(asset, 'asset_type', None) == 'native':
+        return 'native'
+    if hasattr(asset, 'asset_code'):
+        return (asset.asset_code, asset.asset_issuer)
+    if len(asset) == 1 and asset[0] == 'native':
+        return 'native'
+    return (asset[0], asset[1])
+
+class Router(object):
+    """
+    Dispatches records to callbacks watching accounts or assets involved in them.
+    Watch list can be changed from any thread while records are routed.
+    """
+    def __init__(self):
+        self.routed = 0
+        '''number of records dispatched to at least one callback'''
+        self.unmatched = 0
+        '''number of records not involving any watched account or asset'''
+        #values are tuples, replaced (not mutated) so that route() needs no lock
+        self._accounts = {}
+        self._assets = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def watch_account(self, accid, callback):
+        """Calls callback(record) for records involving given account"""
+        with self._lock:
+            self._accounts[accid] = self._accounts.get(accid, ()) + (callback,)
+
+    def unwatch_account(self, accid, callback=None):
+        """Stops calling given callback (all callbacks if None) for given account"""
+        with self._lock:
+            Router._remove(self._accounts, accid, callback)
+
+    def watch_asset(self, asset, callback):
+        """Calls callback(record) for records involving given asset, 'native' or
+        (asset_code, asset_issuer)"""
+        key = _asset_key(asset)
+        with self._lock:
+            self._assets[key] = self._assets.get(key, ()) + (callback,)
+
+    def unwatch_asset(self, asset, callback=None):
+        """Stops calling given callback (all callbacks if None) for given asset"""
+        with self._lock:
+            Router._remove(self._assets, _asset_key(asset), callback)
+
+    def watched_accounts(self):
+        """Returns set of watched accounts"""
+        return set(self._accounts)
+
+    def watched_assets(self):
+        """Returns set of watched assets, 'native' or (asset_code, asset_issuer)"""
+        return set(self._assets)
+
+    def route(self, record):
+        """Calls callbacks watching accounts or assets of given record, each callback
+        once. Returns number of called callbacks."""
+        callbacks = []
+        if self._accounts:
+            for field in _ACCOUNT_FIELDS:
+                accid = getattr(record, field, None)
+                if accid is not None:
+                    callbacks.extend(self._accounts.get(accid, ()))
+        if self._assets:
+            for field in _ASSET_FIELDS:
+                asset = getattr(record, field, None)
+                if asset is not None:
+                    callbacks.extend(self._assets.get(_asset_key(asset), ()))
+        if not callbacks:
+            self.unmatched += 1
+            return 0
+
+        self.routed += 1
+        called = set()
+        for callback in callbacks:
+            if callback in called:
+                continue
+            called.add(callback)
+            try:
+                callback(record)
+            except Exception:
+                logger.exception('callback failed for %s', record)
+        return len(called)
+
+    def run(self, records):
+        """Routes given records (e.g. stellar.payments().stream()) until they end"""
+        for record in records:
+            self.route(record)
+
+    def start(self, records):
+        """Routes given records in background thread"""
+        self._thread = threading.Thread(target=self.run, args=(records,),
+                name='stellar-router')
+        self._thread.daemon = True
+        self._thread.start()
+        return self._thread
+
+    @staticmethod
+    def _remove(index, key, callback):
+        callbacks = tuple(c for c in index.get(key, ()) if callback is not None and c != callback)
+        if callbacks:
+            index[key] = callbacks
+        else:
+            index.pop(key, None)
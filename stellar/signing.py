@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Batch signing of transactions on a process pool. ed25519 signing holds the GIL, so
+threads do not sign in parallel. BatchSigner starts worker processes, each holding
+its own Keyring of given signers, and signs packed transactions given as
+(transaction XDR, transaction hash) pairs, returning TransactionEnvelope XDRs:
+
+    with stellar.BatchSigner([secret1, secret2]) as signer:
+        envelopes = signer.sign(transactions)
+
+Pairs are returned by NewTransaction.prepare(). Transaction XDR is packed Transaction
+(bytes or base64 string) and hash is sha256 of network id, envelope type and the
+transaction, i.e. what is signed.
+"""
+
+import base64
+
+from concurrent.futures import ProcessPoolExecutor
+
+from .api import _pack_envelope
+from .keys import Keyring
+from .xdr import Xdr
+
+_worker_keyring = None
+
+#Creates keyring of the worker process
+def _init_worker(secrets):
+    global _worker_keyring
+    _worker_keyring = Keyring(secrets)
+
+#Signs transaction in worker process
+def _sign_in_worker(transaction):
+    return _sign(_worker_keyring, transaction)
+
+#Returns envelope of given (transaction, hash) pair signed with all keys of keyring
+def _sign(keyring, transaction):
+    trx, trx_hash = transaction
+    if not isinstance(trx, bytes):
+        trx = base64.b64decode(trx)
+    signatures = [Xdr.types.DecoratedSignature(hint, signature)
+            for hint, signature in keyring.sign(trx_hash)]
+    return _pack_envelope(trx, signatures)
+
+class BatchSigner(object):
+    """
+    Pool of processes signing transactions with given signers (secrets or Keyring).
+    Workers are started once and keep decoded keys, so that the signer can be reused
+    for many batches. If processes is 0, transactions are signed in current process.
+    """
+    def __init__(self, signers, processes=None, chunksize=64):
+        if len(signers) == 0:
+            raise ValueError('signer(s) missing')
+        self.keyring = signers if isinstance(signers, Keyring) else Keyring(signers)
+        '''keyring of signers, used directly if processes is 0'''
+        self.chunksize = chunksize
+        '''number of transactions sent to worker at once'''
+        self._executor = None
+        if processes != 0:
+            self._executor = ProcessPoolExecutor(processes, initializer=_init_worker,
+                    initargs=(list(self.keyring),))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def sign(self, transactions):
+        """Signs given (transaction XDR, hash) pairs, returns list of base64
+        TransactionEnvelope XDRs in the same order"""
+        if self._executor is None:
+            return [_sign(self.keyring, t) for t in transactions]
+        return list(self._executor.map(_sign_in_worker, transactions,
+            chunksize=self.chunksize))
+
+    def close(self):
+        """Stops worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown()
+
+def sign_batch(transactions, signers, processes=None, chunksize=64):
+    """
+    Signs given (transaction XDR, hash) pairs with all given signers (secrets or
+    Keyring) on pool of processes (number of CPUs by default). Returns list of base64
+    TransactionEnvelope XDRs. Use BatchSigner to sign many batches with same signers.
+    """
+    with BatchSigner(signers, processes, chunksize) as signer:
+        return signer.sign(transactions)
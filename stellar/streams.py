@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""
+Resumable streams. Stream remembers paging token of the last record it delivered and
+when connection drops (or horizon closes it) it reconnects from that cursor, waiting
+exponentially longer (with random jitter) after each failed attempt. Given checkpoint
+file, the cursor is persisted, so that restarted process continues where it stopped:
+
+    for payment in stellar.payments().stream(checkpoint='payments.cursor'):
+        store(payment)
+
+Record counts as processed (and its cursor is saved) when the next record is
+requested or when commit() is called, so that record which failed to be processed
+is delivered again after restart.
+
+Buffered stream is read by background thread into bounded queue, so that consumer
+can take records in batches (e.g. for bulk inserts) while stream is being read:
+
+    stream = stellar.payments().stream(checkpoint='payments.cursor').buffered(
+            maxsize=10000, overflow='spill')
+    while True:
+        payments = stream.get_batch(500, timeout=1.0)
+        store_all(payments)
+        stream.commit()
+"""
+
+import os
+import json
+import time
+import pickle
+import random
+import logging
+import tempfile
+import threading
+
+from collections import deque
+
+from .utils import HTTP, HttpException
+
+logger = logging.getLogger(__name__)
+
+def load_checkpoint(path):
+    """Returns cursor saved in given checkpoint file, None if there is none"""
+    try:
+        with open(path) as f:
+            return f.read().strip() or None
+    except IOError:
+        return None
+
+def save_checkpoint(path, cursor):
+    """Saves cursor to given checkpoint file, file is replaced atomically"""
+    tmp = '%s.tmp' % path
+    with open(tmp, 'w') as f:
+        f.write(cursor)
+    if hasattr(os, 'replace'):
+        os.replace(tmp, path)
+    else:
+        os.rename(tmp, path)
+
+#Returns seconds to wait before given (1-based) reconnect attempt, "full jitter"
+#spreads reconnects of many streams after horizon restart
+def _backoff(attempt, min_delay, max_delay):
+    return random.uniform(0, min(max_delay, min_delay * 2 ** (attempt - 1)))
+
+#Returns whether failed stream request should be retried, client errors are final
+def _retriable(e):
+    return not (400 <= e.error < 500) or e.error == 429
+
+class Stream(object):
+    """
+    Iterator over records of server sent events stream, which reconnects from the
+    last delivered record. Records have paging token (or SSE id) as cursor.
+    """
+    def __init__(self, url, mapper, cursor=None, checkpoint=None, min_delay=0.5,
+            max_delay=60.0, max_retries=None):
+        """url - function returning stream url given cursor (None for the first one)
+        mapper - function mapping json record to returned object
+        checkpoint - path of file where cursor is persisted, saved cursor takes
+        precedence over given one
+        max_retries - number of consecutive failed reconnects after which stream
+        fails, unlimited by default
+        """
+        self.url = url
+        self.mapper = mapper
+        self.checkpoint = checkpoint
+        '''path of file where cursor is persisted'''
+        self.cursor = cursor
+        '''cursor of the last processed record'''
+        if checkpoint is not None:
+            self.cursor = load_checkpoint(checkpoint) or cursor
+        self.min_delay = min_delay
+        '''seconds to wait (at most) before first reconnect'''
+        self.max_delay = max_delay
+        '''maximum seconds to wait before reconnect'''
+        self.max_retries = max_retries
+        '''maximum number of consecutive failed reconnects'''
+        self.reconnects = 0
+        '''number of reconnects so far'''
+        self._delivered = None
+        self._autocommit = True
+        self._records = self._iterate()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._records)
+
+    next = __next__
+
+    def commit(self, cursor=None):
+        """Marks last delivered record (or record with given cursor) as processed,
+        saving its cursor"""
+        if cursor is None:
+            cursor, self._delivered = self._delivered, None
+        if cursor is not None:
+            self.cursor = cursor
+            if self.checkpoint is not None:
+                save_checkpoint(self.checkpoint, cursor)
+
+    def buffered(self, maxsize=10000, overflow='block', spill_dir=None):
+        """Returns BufferedStream, which reads this stream in background thread into
+        queue of given size. overflow is 'block', 'drop-oldest' or 'spill' (to
+        temporary file in spill_dir), see BoundedQueue."""
+        return BufferedStream(self, BoundedQueue(maxsize, overflow, spill_dir))
+
+    def close(self):
+        """Closes connection, last delivered record is not committed"""
+        self._records.close()
+
+    def _iterate(self):
+        attempt = 0
+        while True:
+            error = None
+            try:
+                #delivered records can wait in buffer, uncommitted
+                cursor = self._delivered or self.cursor
+                for event_id, data in HTTP.events(self.url(cursor)):
+                    if data == '"hello"':
+                        continue
+                    attempt = 0
+                    record = json.loads(data)
+                    self._delivered = record.get('paging_token') or event_id
+                    yield self.mapper(record)
+                    if self._autocommit:
+                        self.commit()
+            except HttpException as e:
+                if not _retriable(e):
+                    raise
+                error = e
+                logger.warning('stream failed at cursor %s: %s', self.cursor, e)
+
+            attempt += 1
+            if self.max_retries is not None and attempt > self.max_retries:
+                if error is not None:
+                    raise error
+                return
+            self.reconnects += 1
+            time.sleep(_backoff(attempt, self.min_delay, self.max_delay))
+
+class BoundedQueue(object):
+    """
+    Thread-safe FIFO queue of at most maxsize items in memory. When it is full, put()
+    either blocks (overflow='block'), drops the oldest item (overflow='drop-oldest')
+    or writes items to temporary file (overflow='spill'), from which they are read
+    back in order once items in memory are taken.
+    """
+    OVERFLOWS = ('block', 'drop-oldest', 'spill')
+
+    def __init__(self, maxsize=10000, overflow='block', spill_dir=None):
+        if overflow not in BoundedQueue.OVERFLOWS:
+            raise ValueError('overflow must be one of %s' % ', '.join(BoundedQueue.OVERFLOWS))
+        self.maxsize = maxsize
+        '''maximum number of items in memory'''
+        self.overflow = overflow
+        '''what put() does when queue is full'''
+        self.spill_dir = spill_dir
+        '''directory of spill file, default temporary directory'''
+        self.dropped = 0
+        '''number of items dropped (overflow='drop-oldest')'''
+        self.spilled = 0
+        '''number of items written to spill file (overflow='spill')'''
+        self._items = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._spill = None
+        self._spill_count = 0
+        self._read_pos = self._write_pos = 0
+
+    def __len__(self):
+        with self._cond:
+            return len(self._items) + self._spill_count
+
+    def put(self, item):
+        """Adds item to queue, raises ValueError if queue is closed"""
+        with self._cond:
+            if self.overflow == 'block':
+                while len(self._items) >= self.maxsize and not self._closed:
+                    self._cond.wait()
+            if self._closed:
+                raise ValueError('queue is closed')
+            if self.overflow == 'spill' and (self._spill_count or len(self._items) >= self.maxsize):
+                #once items are spilled, following ones are spilled too to keep order
+                self._write_spill(item)
+            else:
+                if len(self._items) >= self.maxsize:
+                    self._items.popleft()
+                    self.dropped += 1
+                self._items.append(item)
+            self._cond.notify_all()
+
+    def get_batch(self, max_n=100, timeout=None):
+        """Returns up to max_n items, waiting at most timeout seconds (forever if None)
+        for the first one. Returns empty list on timeout or if queue is closed and empty."""
+        deadline = None if timeout is None else time.time() + timeout
+        with self._cond:
+            while not self._items and not self._spill_count and not self._closed:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return []
+                self._cond.wait(remaining)
+            if not self._items and self._spill_count:
+                self._read_spill(self.maxsize)
+            batch = [self._items.popleft() for i in range(min(max_n, len(self._items)))]
+            if batch:
+                self._cond.notify_all()
+            return batch
+
+    def close(self):
+        """Closes queue, items in it can still be taken, blocked put() fails"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self):
+        """whether queue is closed"""
+        return self._closed
+
+    def _write_spill(self, item):
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(dir=self.spill_dir)
+        self._spill.seek(self._write_pos)
+        pickle.dump(item, self._spill, pickle.HIGHEST_PROTOCOL)
+        self._write_pos = self._spill.tell()
+        self._spill_count += 1
+        self.spilled += 1
+
+    #Moves up to n spilled items to memory, file is reused when it is read whole
+    def _read_spill(self, n):
+        self._spill.seek(self._read_pos)
+        for i in range(min(n, self._spill_count)):
+            self._items.append(pickle.load(self._spill))
+            self._spill_count -= 1
+        self._read_pos = self._spill.tell()
+        if not self._spill_count:
+            self._spill.seek(0)
+            self._spill.truncate()
+            self._read_pos = self._write_pos = 0
+
+class BufferedStream(object):
+    """
+    Stream read by background thread into BoundedQueue. Consumer takes records by
+    get_batch() (or by iterating) and calls commit() once they are processed, which
+    saves cursor of the last taken record. Records dropped by overflow='drop-oldest'
+    are skipped.
+    """
+    def __init__(self, stream, queue):
+        stream._autocommit = False
+        self.stream = stream
+        '''underlying Stream'''
+        self.queue = queue
+        '''BoundedQueue of (cursor, record) pairs'''
+        self.error = None
+        '''error which ended the stream'''
+        self._taken = None
+        self._thread = threading.Thread(target=self._read, name='stellar-stream-reader')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __iter__(self):
+        while True:
+            batch = self.get_batch()
+            if not batch:
+                return
+            for record in batch:
+                yield record
+
+    def get_batch(self, max_n=100, timeout=None):
+        """Returns up to max_n records, waiting at most timeout seconds (forever if
+        None) for the first one. Returns empty list on timeout or when stream ended,
+        raises error which ended the stream once all its records were taken."""
+        items = self.queue.get_batch(max_n, timeout)
+        if not items and self.queue.closed and self.error is not None and not len(self.queue):
+            raise self.error
+        if items:
+            self._taken = items[-1][0]
+        return [record for cursor, record in items]
+
+    def commit(self):
+        """Marks records taken so far as processed, saving cursor of the last one"""
+        if self._taken is not None:
+            self.stream.commit(self._taken)
+
+    def close(self):
+        """Stops reading, records already read can still be taken"""
+        self.queue.close()
+
+    def _read(self):
+        try:
+            for record in self.stream:
+                self.queue.put((self.stream._delivered, record))
+        except Exception as e:
+            #put() fails once consumer closed the queue
+            if not self.queue.closed:
+                logger.error('stream failed: %s', e)
+                self.error = e
+        finally:
+            self.queue.close()
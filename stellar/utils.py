@@ -1,9 +1,18 @@
 import requests
+import requests.adapters
 import sseclient
+import threading
 import base64
+import codecs
+import copy
+import os
+import time
 import binascii
+import email.utils
 
 from decimal import Decimal
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from .xdr import Xdr
 
@@ -13,10 +22,112 @@ class HttpException(Exception):
         self.error = error
 
 class HTTP(object):
+    """
+    Class containing methods to talk to horizon and other http endpoints.
+    All requests go through single pooled keep-alive session, which can be
+    tuned using configure() or replaced using set_session().
+    """
+    pool_connections = 10
+    '''number of per-host connection pools to keep'''
+    pool_maxsize = 10
+    '''max number of connections kept alive per host'''
+    pool_block = False
+    '''if True, block when all connections for host are busy instead of opening new one'''
+    max_retries = 0
+    '''number of retries for failed connection attempts'''
+    keep_alive = True
+    '''if False, connection is closed after every request'''
+    connect_timeout = 3.05
+    '''seconds to wait for establishing connection'''
+    read_timeout = 30
+    '''seconds to wait for response (not applied to streams)'''
+
+    _session = None
+    #whether _session was created by HTTP (sessions given to set_session are not closed)
+    _owned = False
+    _lock = threading.Lock()
+
+    @staticmethod
+    def configure(pool_connections=None, pool_maxsize=None, pool_block=None,
+            max_retries=None, keep_alive=None, connect_timeout=None, read_timeout=None):
+        """Configures pooled session. Only given options are changed, and
+        new session with those options is created on next request. Session given
+        to set_session() is not closed.
+        """
+        options = {
+                'pool_connections' : pool_connections,
+                'pool_maxsize' : pool_maxsize,
+                'pool_block' : pool_block,
+                'max_retries' : max_retries,
+                'keep_alive' : keep_alive,
+                'connect_timeout' : connect_timeout,
+                'read_timeout' : read_timeout,
+                }
+        with HTTP._lock:
+            for k, v in options.items():
+                if v is not None:
+                    setattr(HTTP, k, v)
+            HTTP._close_session()
+
+    @staticmethod
+    def set_session(session):
+        """Sets session (e.g. custom requests.Session) to be used for all requests.
+        Passing None discards it and default pooled session is created on next request.
+        Given session is not closed by HTTP, it is owned by caller.
+        """
+        with HTTP._lock:
+            HTTP._close_session()
+            HTTP._session = session
+
+    @staticmethod
+    def session():
+        """Returns session used for all requests, creating it if needed"""
+        session = HTTP._session
+        if session is None:
+            with HTTP._lock:
+                if HTTP._session is None:
+                    HTTP._session = HTTP._new_session()
+                    HTTP._owned = True
+                session = HTTP._session
+        return session
+
+    @staticmethod
+    def timeout():
+        """Returns (connect, read) timeout used for requests"""
+        return (HTTP.connect_timeout, HTTP.read_timeout)
+
+    @staticmethod
+    def _new_session():
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+                pool_connections=HTTP.pool_connections,
+                pool_maxsize=HTTP.pool_maxsize,
+                pool_block=HTTP.pool_block,
+                max_retries=HTTP.max_retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not HTTP.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    @staticmethod
+    def _close_session():
+        if HTTP._session is not None and HTTP._owned:
+            HTTP._session.close()
+        HTTP._session = None
+        HTTP._owned = False
+
+    @staticmethod
+    def _forget_session():
+        #connections of parent process must not be shared with forked child
+        HTTP._session = None
+        HTTP._owned = False
+        HTTP._lock = threading.Lock()
+
     @staticmethod
     def get(url):
         try:
-            json = requests.get(url).json()
+            json = HTTP.session().get(url, timeout=HTTP.timeout()).json()
             status = json['status'] if 'status' in json else 0
             if status > 400 and status <= 500:
                 raise HttpException(json['title'], status)
@@ -28,7 +139,7 @@ class HTTP(object):
     @staticmethod
     def post(url, data):
         try:
-            json = requests.post(url, data).json()
+            json = HTTP.session().post(url, data, timeout=HTTP.timeout()).json()
             status = json['status'] if 'status' in json else 0
             if status > 400 and status <= 500:
                 raise HttpException(json['title'], status)
@@ -40,11 +151,56 @@ class HTTP(object):
     @staticmethod
     def stream(url):
         try:
-            return sseclient.SSEClient(url)
+            return sseclient.SSEClient(url, session=HTTP.session(),
+                    timeout=(HTTP.connect_timeout, None))
+        except requests.exceptions.RequestException as e:
+            raise HttpException(str(e), -1)
+
+    @staticmethod
+    def events(url, last_id=None):
+        """Generator yielding (event-id, data) pairs of server sent events. Unlike
+        stream() it does not reconnect, generator ends when server closes connection."""
+        headers = {'Accept' : 'text/event-stream', 'Cache-Control' : 'no-cache'}
+        if last_id:
+            headers['Last-Event-ID'] = last_id
+        try:
+            r = HTTP.session().get(url, headers=headers, stream=True,
+                    timeout=(HTTP.connect_timeout, None))
+            try:
+                if r.status_code != 200:
+                    raise HttpException('Stream failed for url %s' % url, r.status_code)
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                buf, event_id, data = '', None, []
+                #chunks are yielded as they arrive, not after chunk_size bytes
+                for chunk in r.iter_content(chunk_size=None):
+                    lines = (buf + decoder.decode(chunk)).split('\n')
+                    buf = lines.pop()
+                    for line in lines:
+                        line = line.rstrip('\r')
+                        if not line:
+                            if data:
+                                yield event_id, '\n'.join(data)
+                            event_id, data = None, []
+                        elif line.startswith(':'):
+                            continue
+                        else:
+                            field, _, value = line.partition(':')
+                            if value.startswith(' '):
+                                value = value[1:]
+                            if field == 'data':
+                                data.append(value)
+                            elif field == 'id':
+                                event_id = value
+            finally:
+                r.close()
         except requests.exceptions.RequestException as e:
             raise HttpException(str(e), -1)
 
 
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=HTTP._forget_session)
+
+
 class XDR(object):
     #Returns xdr for stellar address where 
     #public address in format such as GBWF6NTCPGBROJIPF54XXYRLTUGBDLLORPFDK4FGQQ3IRI4T5PHCGVXV
@@ -148,15 +304,73 @@ class XDR(object):
         else:
             return Xdr.types.Memo(type=Xdr.const.MEMO_NONE)
 
+    #Returns memo in format accepted by memo_to_xdr given memo xdr
+    @staticmethod
+    def xdr_to_memo(memo):
+        if memo.type == Xdr.const.MEMO_TEXT:
+            return bytes(memo.text).decode('utf-8')
+        elif memo.type == Xdr.const.MEMO_ID:
+            return ('id', memo.id)
+        elif memo.type == Xdr.const.MEMO_HASH:
+            return ('hash', binascii.hexlify(memo.hash))
+        elif memo.type == Xdr.const.MEMO_RETURN:
+            return ('return', binascii.hexlify(memo.retHash))
+        return None
+
     @staticmethod
     def time_bounds_to_xdr(time_bounds):
         return Xdr.types.TimeBounds(time_bounds[0], time_bounds[1])
 
 
+class _Lookup(object):
+    #Lookup in progress, threads looking up the same key wait for its result
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
 class FED(object):
     """
     Class containing utility methods for federation services.
+    Resolved addresses and federation servers of domains (from stellar.toml) are
+    cached, see configure(). Concurrent lookups of the same address (or domain)
+    wait for single request.
     """
+    ttl = 300
+    '''seconds for which resolved address is cached'''
+    negative_ttl = 60
+    '''seconds for which unknown address (or domain without federation) is cached'''
+    toml_ttl = 3600
+    '''seconds for which stellar.toml is cached if its response has no cache headers'''
+    max_entries = 10000
+    '''maximum number of cached addresses and domains'''
+
+    _entries = OrderedDict()
+    _pending = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def configure(ttl=None, negative_ttl=None, toml_ttl=None, max_entries=None):
+        """Configures federation cache, only given options are changed. Setting
+        ttl, negative_ttl and toml_ttl to 0 disables caching."""
+        options = {
+                'ttl' : ttl,
+                'negative_ttl' : negative_ttl,
+                'toml_ttl' : toml_ttl,
+                'max_entries' : max_entries,
+                }
+        with FED._lock:
+            for k, v in options.items():
+                if v is not None:
+                    setattr(FED, k, v)
+            FED._entries.clear()
+
+    @staticmethod
+    def clear_cache():
+        """Removes all cached addresses and domains"""
+        with FED._lock:
+            FED._entries.clear()
+
     @staticmethod
     def resolve_to_account(fed_addr):
         """
@@ -167,23 +381,186 @@ class FED(object):
         if '*' not in fed_addr:
             raise Exception('Not valid federation address %s' % fed_addr)
 
-        name, domain = fed_addr.split('*')
+        return FED._lookup(('address', fed_addr), lambda: FED._query(fed_addr))
+
+    @staticmethod
+    def resolve_many(addresses, per_domain=4, workers=16):
+        """
+        Resolves given addresses (federation addresses or account ids, which are
+        returned as they are) concurrently. Addresses are grouped by domain, so that
+        stellar.toml of every domain is fetched once, and at most per_domain addresses
+        of single domain are resolved at the same time (by workers threads in total).
+        Returns (accounts, errors) dicts, account id and exception by address.
+
+            accounts, errors = FED.resolve_many(['bob*example.com', 'alice*example.com'])
+        """
+        accounts, errors, domains = {}, {}, {}
+        for address in addresses:
+            if address in accounts or address in errors:
+                continue
+            if '*' not in address:
+                accounts[address] = address
+            elif address.count('*') != 1:
+                errors[address] = Exception('Not valid federation address %s' % address)
+            else:
+                domain = address.split('*')[1].lower()
+                domains.setdefault(domain, set()).add(address)
+        if not domains:
+            return accounts, errors
+
+        #domain tasks fetch stellar.toml and submit (not wait for) resolution of names
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            def resolve(names, federation):
+                for address in names:
+                    try:
+                        accounts[address] = FED._lookup(('address', address),
+                                lambda: FED._query(address, federation))
+                    except Exception as e:
+                        errors[address] = e
+
+            def resolve_domain(domain, names):
+                try:
+                    federation = FED.federation_server(domain)
+                except Exception as e:
+                    for address in names:
+                        errors[address] = e
+                    return []
+                names = sorted(names)
+                return [executor.submit(resolve, names[i::per_domain], federation)
+                        for i in range(min(per_domain, len(names)))]
+
+            tasks = [executor.submit(resolve_domain, domain, names)
+                    for domain, names in domains.items()]
+            for task in tasks:
+                for f in task.result():
+                    f.result()
+        return accounts, errors
+
+    @staticmethod
+    def federation_server(domain):
+        """Returns federation server of given domain, as found in its stellar.toml"""
+        return FED._lookup(('domain', domain.lower()), lambda: FED._fetch_toml(domain))
+
+    #Returns cached result of given key or result of load(), which returns
+    #(result, ttl), result is exception for negative answer (cached as well).
+    #Exceptions raised by load() are not cached.
+    @staticmethod
+    def _lookup(key, load):
+        with FED._lock:
+            entry = FED._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                FED._entries[key] = FED._entries.pop(key)
+                return FED._result(entry[0])
+            lookup = FED._pending.get(key)
+            owner = lookup is None
+            if owner:
+                lookup = FED._pending[key] = _Lookup()
+
+        if not owner:
+            lookup.done.wait()
+            if lookup.error is not None:
+                raise lookup.error
+            return FED._result(lookup.result)
+
+        try:
+            lookup.result, ttl = load()
+        except BaseException as e:
+            #waiters fail as well, also when lookup was interrupted
+            lookup.error = e
+            raise
+        else:
+            if ttl > 0:
+                with FED._lock:
+                    FED._entries.pop(key, None)
+                    FED._entries[key] = (lookup.result, time.time() + ttl)
+                    while len(FED._entries) > FED.max_entries:
+                        FED._entries.popitem(last=False)
+            return FED._result(lookup.result)
+        finally:
+            with FED._lock:
+                del FED._pending[key]
+            lookup.done.set()
+
+    #Returns result of lookup, raises copy of negative answer (so that traceback of
+    #cached exception does not grow)
+    @staticmethod
+    def _result(result):
+        if isinstance(result, Exception):
+            raise copy.copy(result)
+        return result
+
+    #Returns (account_id, ttl) of given address from federation server of its domain
+    @staticmethod
+    def _query(fed_addr, federation=None):
+        if federation is None:
+            name, domain = fed_addr.split('*')
+            federation = FED.federation_server(domain)
+
+        try:
+            r = HTTP.session().get('%s?q=%s&type=name' % (federation, fed_addr),
+                    timeout=HTTP.timeout())
+        except requests.exceptions.RequestException as e:
+            raise HttpException(str(e), -1)
+        if r.status_code == 404:
+            return HttpException('Address %s not found' % fed_addr, 404), FED.negative_ttl
+        if r.status_code != 200:
+            raise HttpException('Lookup query failed for url %s' % r.url, r.status_code)
+
+        return r.json()['account_id'], FED.ttl
+
+    #Returns (federation_server, ttl) from stellar.toml of given domain
+    @staticmethod
+    def _fetch_toml(domain):
         toml_addr = 'https://%s/.well-known/stellar.toml' % domain
 
-        r = requests.get(toml_addr)
+        try:
+            r = HTTP.session().get(toml_addr, timeout=HTTP.timeout())
+        except requests.exceptions.RequestException as e:
+            raise HttpException(str(e), -1)
+        if r.status_code == 404:
+            return HttpException('toml file not found', r.status_code), FED.negative_ttl
         if r.status_code != 200:
             raise HttpException('toml file not found', r.status_code)
 
         federation = None
         for line in r.iter_lines():
-            k, v = line.split('=')
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
+            if '=' not in line:
+                continue
+            k, v = line.split('=', 1)
             if k.strip() == 'FEDERATION_SERVER':
                 federation = v.strip()[1:-1]
         if not federation:
-            raise Exception('Federation not supported at domain %s' % domain)
+            return Exception('Federation not supported at domain %s' % domain), FED.negative_ttl
+
+        return federation, FED._max_age(r.headers)
+
+    #Returns seconds for which response with given headers can be cached
+    @staticmethod
+    def _max_age(headers):
+        if FED.toml_ttl <= 0:
+            return 0
+        cache_control = [d.strip().lower() for d in headers.get('Cache-Control', '').split(',')]
+        if 'no-store' in cache_control or 'no-cache' in cache_control:
+            return 0
+        for directive in cache_control:
+            if directive.startswith('max-age='):
+                try:
+                    return max(0, int(directive[8:]) - int(headers.get('Age', 0)))
+                except ValueError:
+                    return 0
+        if 'Expires' in headers:
+            expires = email.utils.parsedate_tz(headers['Expires'])
+            return max(0, email.utils.mktime_tz(expires) - time.time()) if expires else 0
+        return FED.toml_ttl
+
+    @staticmethod
+    def _forget_pending():
+        #lookups of parent process threads never complete in forked child
+        FED._pending = {}
+        FED._lock = threading.Lock()
 
-        r = requests.get('%s?q=%s&type=name' % (federation, fed_addr))
-        if r.status_code != 200:
-            raise HttpException('Lookup query failed for url %s' % r.url, r.status_code)
 
-        return r.json()['account_id']
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=FED._forget_pending)
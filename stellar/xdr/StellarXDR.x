@@ -0,0 +1,1003 @@
+namespace stellar {
+
+typedef opaque Hash[32];
+
+typedef opaque uint256[32];
+
+typedef unsigned int uint32;
+
+typedef int int32;
+
+typedef unsigned hyper uint64;
+
+typedef hyper int64;
+
+enum CryptoKeyType {
+    KEY_TYPE_ED25519 = 0,
+    KEY_TYPE_PRE_AUTH_TX = 1,
+    KEY_TYPE_HASH_X = 2
+};
+
+enum PublicKeyType {
+    PUBLIC_KEY_TYPE_ED25519 = KEY_TYPE_ED25519
+};
+
+enum SignerKeyType {
+    SIGNER_KEY_TYPE_ED25519 = KEY_TYPE_ED25519,
+    SIGNER_KEY_TYPE_PRE_AUTH_TX = KEY_TYPE_PRE_AUTH_TX,
+    SIGNER_KEY_TYPE_HASH_X = KEY_TYPE_HASH_X
+};
+
+union PublicKey switch(PublicKeyType type) {
+    case PUBLIC_KEY_TYPE_ED25519:
+        uint256 ed25519;
+};
+
+union SignerKey switch(SignerKeyType type) {
+    case SIGNER_KEY_TYPE_ED25519:
+        uint256 ed25519;
+    case SIGNER_KEY_TYPE_PRE_AUTH_TX:
+        uint256 preAuthTx;
+    case SIGNER_KEY_TYPE_HASH_X:
+        uint256 hashX;
+};
+
+typedef opaque Signature<64>;
+
+typedef opaque SignatureHint[4];
+
+typedef PublicKey NodeID;
+
+struct Curve25519Secret {
+    opaque key[32];
+};
+
+struct Curve25519Public {
+    opaque key[32];
+};
+
+struct HmacSha256Key {
+    opaque key[32];
+};
+
+struct HmacSha256Mac {
+    opaque mac[32];
+};
+
+typedef PublicKey AccountID;
+
+typedef opaque Thresholds[4];
+
+typedef string string32<32>;
+
+typedef string string64<64>;
+
+typedef uint64 SequenceNumber;
+
+typedef opaque DataValue<64>;
+
+enum AssetType {
+    ASSET_TYPE_NATIVE = 0,
+    ASSET_TYPE_CREDIT_ALPHANUM4 = 1,
+    ASSET_TYPE_CREDIT_ALPHANUM12 = 2
+};
+
+union Asset switch(AssetType type) {
+    case ASSET_TYPE_NATIVE:
+        void;
+    case ASSET_TYPE_CREDIT_ALPHANUM4:
+        struct {
+            opaque assetCode[4];
+            AccountID issuer;
+        } alphaNum4;
+    case ASSET_TYPE_CREDIT_ALPHANUM12:
+        struct {
+            opaque assetCode[12];
+            AccountID issuer;
+        } alphaNum12;
+};
+
+struct Price {
+    int32 n;
+    int32 d;
+};
+
+enum ThresholdIndexes {
+    THRESHOLD_MASTER_WEIGHT = 0,
+    THRESHOLD_LOW = 1,
+    THRESHOLD_MED = 2,
+    THRESHOLD_HIGH = 3
+};
+
+enum LedgerEntryType {
+    ACCOUNT = 0,
+    TRUSTLINE = 1,
+    OFFER = 2,
+    DATA = 3
+};
+
+struct Signer {
+    SignerKey key;
+    uint32 weight;
+};
+
+enum AccountFlags {
+    AUTH_REQUIRED_FLAG = 0x1,
+    AUTH_REVOCABLE_FLAG = 0x2,
+    AUTH_IMMUTABLE_FLAG = 0x4
+};
+
+struct AccountEntry {
+    AccountID accountID;
+    int64 balance;
+    SequenceNumber seqNum;
+    uint32 numSubEntries;
+    AccountID inflationDest<1>;
+    uint32 flags;
+    string32 homeDomain;
+    Thresholds thresholds;
+    Signer signers<20>;
+    union switch(int v) {
+        case 0:
+            void;
+    } ext;
+};
+
+enum TrustLineFlags {
+    AUTHORIZED_FLAG = 1
+};
+
+struct TrustLineEntry {
+    AccountID accountID;
+    Asset asset;
+    int64 balance;
+    int64 limit;
+    uint32 flags;
+    union switch(int v) {
+        case 0:
+            void;
+    } ext;
+};
+
+enum OfferEntryFlags {
+    PASSIVE_FLAG = 1
+};
+
+struct OfferEntry {
+    AccountID sellerID;
+    uint64 offerID;
+    Asset selling;
+    Asset buying;
+    int64 amount;
+    Price price;
+    uint32 flags;
+    union switch(int v) {
+        case 0:
+            void;
+    } ext;
+};
+
+struct DataEntry {
+    AccountID accountID;
+    string64 dataName;
+    DataValue dataValue;
+    union switch(int v) {
+        case 0:
+            void;
+    } ext;
+};
+
+struct LedgerEntry {
+    uint32 lastModifiedLedgerSeq;
+    union switch(LedgerEntryType type) {
+        case ACCOUNT:
+            AccountEntry account;
+        case TRUSTLINE:
+            TrustLineEntry trustLine;
+        case OFFER:
+            OfferEntry offer;
+        case DATA:
+            DataEntry data;
+    } data;
+    union switch(int v) {
+        case 0:
+            void;
+    } ext;
+};
+
+enum EnvelopeType {
+    ENVELOPE_TYPE_SCP = 1,
+    ENVELOPE_TYPE_TX = 2,
+    ENVELOPE_TYPE_AUTH = 3
+};
+
+struct DecoratedSignature {
+    SignatureHint hint;
+    Signature signature;
+};
+
+enum OperationType {
+    CREATE_ACCOUNT = 0,
+    PAYMENT = 1,
+    PATH_PAYMENT = 2,
+    MANAGE_OFFER = 3,
+    CREATE_PASSIVE_OFFER = 4,
+    SET_OPTIONS = 5,
+    CHANGE_TRUST = 6,
+    ALLOW_TRUST = 7,
+    ACCOUNT_MERGE = 8,
+    INFLATION = 9,
+    MANAGE_DATA = 10
+};
+
+struct CreateAccountOp {
+    AccountID destination;
+    int64 startingBalance;
+};
+
+struct PaymentOp {
+    AccountID destination;
+    Asset asset;
+    int64 amount;
+};
+
+struct PathPaymentOp {
+    Asset sendAsset;
+    int64 sendMax;
+    AccountID destination;
+    Asset destAsset;
+    int64 destAmount;
+    Asset path<5>;
+};
+
+struct ManageOfferOp {
+    Asset selling;
+    Asset buying;
+    int64 amount;
+    Price price;
+    uint64 offerID;
+};
+
+struct CreatePassiveOfferOp {
+    Asset selling;
+    Asset buying;
+    int64 amount;
+    Price price;
+};
+
+struct SetOptionsOp {
+    AccountID inflationDest<1>;
+    uint32 clearFlags<1>;
+    uint32 setFlags<1>;
+    uint32 masterWeight<1>;
+    uint32 lowThreshold<1>;
+    uint32 medThreshold<1>;
+    uint32 highThreshold<1>;
+    string32 homeDomain<1>;
+    Signer signer<1>;
+};
+
+struct ChangeTrustOp {
+    Asset line;
+    int64 limit;
+};
+
+struct AllowTrustOp {
+    AccountID trustor;
+    union switch(AssetType type) {
+        case ASSET_TYPE_CREDIT_ALPHANUM4:
+            opaque assetCode4[4];
+        case ASSET_TYPE_CREDIT_ALPHANUM12:
+            opaque assetCode12[12];
+    } asset;
+    bool authorize;
+};
+
+struct ManageDataOp {
+    string64 dataName;
+    DataValue dataValue<1>;
+};
+
+struct Operation {
+    AccountID sourceAccount<1>;
+    union switch(OperationType type) {
+        case CREATE_ACCOUNT:
+            CreateAccountOp createAccountOp;
+        case PAYMENT:
+            PaymentOp paymentOp;
+        case PATH_PAYMENT:
+            PathPaymentOp pathPaymentOp;
+        case MANAGE_OFFER:
+            ManageOfferOp manageOfferOp;
+        case CREATE_PASSIVE_OFFER:
+            CreatePassiveOfferOp createPassiveOfferOp;
+        case SET_OPTIONS:
+            SetOptionsOp setOptionsOp;
+        case CHANGE_TRUST:
+            ChangeTrustOp changeTrustOp;
+        case ALLOW_TRUST:
+            AllowTrustOp allowTrustOp;
+        case ACCOUNT_MERGE:
+            AccountID destination;
+        case INFLATION:
+            void;
+        case MANAGE_DATA:
+            ManageDataOp manageDataOp;
+    } body;
+};
+
+enum MemoType {
+    MEMO_NONE = 0,
+    MEMO_TEXT = 1,
+    MEMO_ID = 2,
+    MEMO_HASH = 3,
+    MEMO_RETURN = 4
+};
+
+union Memo switch(MemoType type) {
+    case MEMO_NONE:
+        void;
+    case MEMO_TEXT:
+        string text<28>;
+    case MEMO_ID:
+        uint64 id;
+    case MEMO_HASH:
+        Hash hash;
+    case MEMO_RETURN:
+        Hash retHash;
+};
+
+struct TimeBounds {
+    uint64 minTime;
+    uint64 maxTime;
+};
+
+struct Transaction {
+    AccountID sourceAccount;
+    uint32 fee;
+    SequenceNumber seqNum;
+    TimeBounds timeBounds<1>;
+    Memo memo;
+    Operation operations<100>;
+    union switch(int v) {
+        case 0:
+            void;
+    } ext;
+};
+
+struct TransactionSignaturePayload {
+    Hash networkId;
+    union switch(EnvelopeType type) {
+        case ENVELOPE_TYPE_TX:
+            Transaction tx;
+    } taggedTransaction;
+};
+
+struct TransactionEnvelope {
+    Transaction tx;
+    DecoratedSignature signatures<20>;
+};
+
+struct ClaimOfferAtom {
+    AccountID sellerID;
+    uint64 offerID;
+    Asset assetSold;
+    int64 amountSold;
+    Asset assetBought;
+    int64 amountBought;
+};
+
+enum CreateAccountResultCode {
+    CREATE_ACCOUNT_SUCCESS = 0,
+    CREATE_ACCOUNT_MALFORMED = -1,
+    CREATE_ACCOUNT_UNDERFUNDED = -2,
+    CREATE_ACCOUNT_LOW_RESERVE = -3,
+    CREATE_ACCOUNT_ALREADY_EXIST = -4
+};
+
+union CreateAccountResult switch(CreateAccountResultCode code) {
+    case CREATE_ACCOUNT_SUCCESS:
+        void;
+    default:
+        void;
+};
+
+enum PaymentResultCode {
+    PAYMENT_SUCCESS = 0,
+    PAYMENT_MALFORMED = -1,
+    PAYMENT_UNDERFUNDED = -2,
+    PAYMENT_SRC_NO_TRUST = -3,
+    PAYMENT_SRC_NOT_AUTHORIZED = -4,
+    PAYMENT_NO_DESTINATION = -5,
+    PAYMENT_NO_TRUST = -6,
+    PAYMENT_NOT_AUTHORIZED = -7,
+    PAYMENT_LINE_FULL = -8,
+    PAYMENT_NO_ISSUER = -9
+};
+
+union PaymentResult switch(PaymentResultCode code) {
+    case PAYMENT_SUCCESS:
+        void;
+    default:
+        void;
+};
+
+enum PathPaymentResultCode {
+    PATH_PAYMENT_SUCCESS = 0,
+    PATH_PAYMENT_MALFORMED = -1,
+    PATH_PAYMENT_UNDERFUNDED = -2,
+    PATH_PAYMENT_SRC_NO_TRUST = -3,
+    PATH_PAYMENT_SRC_NOT_AUTHORIZED = -4,
+    PATH_PAYMENT_NO_DESTINATION = -5,
+    PATH_PAYMENT_NO_TRUST = -6,
+    PATH_PAYMENT_NOT_AUTHORIZED = -7,
+    PATH_PAYMENT_LINE_FULL = -8,
+    PATH_PAYMENT_NO_ISSUER = -9,
+    PATH_PAYMENT_TOO_FEW_OFFERS = -10,
+    PATH_PAYMENT_OFFER_CROSS_SELF = -11,
+    PATH_PAYMENT_OVER_SENDMAX = -12
+};
+
+struct SimplePaymentResult {
+    AccountID destination;
+    Asset asset;
+    int64 amount;
+};
+
+union PathPaymentResult switch(PathPaymentResultCode code) {
+    case PATH_PAYMENT_SUCCESS:
+        struct {
+            ClaimOfferAtom offers<>;
+            SimplePaymentResult last;
+        } success;
+    case PATH_PAYMENT_NO_ISSUER:
+        Asset noIssuer;
+    default:
+        void;
+};
+
+enum ManageOfferResultCode {
+    MANAGE_OFFER_SUCCESS = 0,
+    MANAGE_OFFER_MALFORMED = -1,
+    MANAGE_OFFER_SELL_NO_TRUST = -2,
+    MANAGE_OFFER_BUY_NO_TRUST = -3,
+    MANAGE_OFFER_SELL_NOT_AUTHORIZED = -4,
+    MANAGE_OFFER_BUY_NOT_AUTHORIZED = -5,
+    MANAGE_OFFER_LINE_FULL = -6,
+    MANAGE_OFFER_UNDERFUNDED = -7,
+    MANAGE_OFFER_CROSS_SELF = -8,
+    MANAGE_OFFER_SELL_NO_ISSUER = -9,
+    MANAGE_OFFER_BUY_NO_ISSUER = -10,
+    MANAGE_OFFER_NOT_FOUND = -11,
+    MANAGE_OFFER_LOW_RESERVE = -12
+};
+
+enum ManageOfferEffect {
+    MANAGE_OFFER_CREATED = 0,
+    MANAGE_OFFER_UPDATED = 1,
+    MANAGE_OFFER_DELETED = 2
+};
+
+struct ManageOfferSuccessResult {
+    ClaimOfferAtom offersClaimed<>;
+    union switch(ManageOfferEffect effect) {
+        case MANAGE_OFFER_CREATED:
+        case MANAGE_OFFER_UPDATED:
+            OfferEntry offer;
+        default:
+            void;
+    } offer;
+};
+
+union ManageOfferResult switch(ManageOfferResultCode code) {
+    case MANAGE_OFFER_SUCCESS:
+        ManageOfferSuccessResult success;
+    default:
+        void;
+};
+
+enum SetOptionsResultCode {
+    SET_OPTIONS_SUCCESS = 0,
+    SET_OPTIONS_LOW_RESERVE = -1,
+    SET_OPTIONS_TOO_MANY_SIGNERS = -2,
+    SET_OPTIONS_BAD_FLAGS = -3,
+    SET_OPTIONS_INVALID_INFLATION = -4,
+    SET_OPTIONS_CANT_CHANGE = -5,
+    SET_OPTIONS_UNKNOWN_FLAG = -6,
+    SET_OPTIONS_THRESHOLD_OUT_OF_RANGE = -7,
+    SET_OPTIONS_BAD_SIGNER = -8,
+    SET_OPTIONS_INVALID_HOME_DOMAIN = -9
+};
+
+union SetOptionsResult switch(SetOptionsResultCode code) {
+    case SET_OPTIONS_SUCCESS:
+        void;
+    default:
+        void;
+};
+
+enum ChangeTrustResultCode {
+    CHANGE_TRUST_SUCCESS = 0,
+    CHANGE_TRUST_MALFORMED = -1,
+    CHANGE_TRUST_NO_ISSUER = -2,
+    CHANGE_TRUST_INVALID_LIMIT = -3,
+    CHANGE_TRUST_LOW_RESERVE = -4,
+    CHANGE_TRUST_SELF_NOT_ALLOWED = -5
+};
+
+union ChangeTrustResult switch(ChangeTrustResultCode code) {
+    case CHANGE_TRUST_SUCCESS:
+        void;
+    default:
+        void;
+};
+
+enum AllowTrustResultCode {
+    ALLOW_TRUST_SUCCESS = 0,
+    ALLOW_TRUST_MALFORMED = -1,
+    ALLOW_TRUST_NO_TRUST_LINE = -2,
+    ALLOW_TRUST_TRUST_NOT_REQUIRED = -3,
+    ALLOW_TRUST_CANT_REVOKE = -4,
+    ALLOW_TRUST_SELF_NOT_ALLOWED = -5
+};
+
+union AllowTrustResult switch(AllowTrustResultCode code) {
+    case ALLOW_TRUST_SUCCESS:
+        void;
+    default:
+        void;
+};
+
+enum AccountMergeResultCode {
+    ACCOUNT_MERGE_SUCCESS = 0,
+    ACCOUNT_MERGE_MALFORMED = -1,
+    ACCOUNT_MERGE_NO_ACCOUNT = -2,
+    ACCOUNT_MERGE_IMMUTABLE_SET = -3,
+    ACCOUNT_MERGE_HAS_SUB_ENTRIES = -4
+};
+
+union AccountMergeResult switch(AccountMergeResultCode code) {
+    case ACCOUNT_MERGE_SUCCESS:
+        int64 sourceAccountBalance;
+    default:
+        void;
+};
+
+enum InflationResultCode {
+    INFLATION_SUCCESS = 0,
+    INFLATION_NOT_TIME = -1
+};
+
+struct InflationPayout {
+    AccountID destination;
+    int64 amount;
+};
+
+union InflationResult switch(InflationResultCode code) {
+    case INFLATION_SUCCESS:
+        InflationPayout payouts<>;
+    default:
+        void;
+};
+
+enum ManageDataResultCode {
+    MANAGE_DATA_SUCCESS = 0,
+    MANAGE_DATA_NOT_SUPPORTED_YET = -1,
+    MANAGE_DATA_NAME_NOT_FOUND = -2,
+    MANAGE_DATA_LOW_RESERVE = -3,
+    MANAGE_DATA_INVALID_NAME = -4
+};
+
+union ManageDataResult switch(ManageDataResultCode code) {
+    case MANAGE_DATA_SUCCESS:
+        void;
+    default:
+        void;
+};
+
+enum OperationResultCode {
+    opINNER = 0,
+    opBAD_AUTH = -1,
+    opNO_ACCOUNT = -2
+};
+
+union OperationResult switch(OperationResultCode code) {
+    case opINNER:
+        union switch(OperationType type) {
+            case CREATE_ACCOUNT:
+                CreateAccountResult createAccountResult;
+            case PAYMENT:
+                PaymentResult paymentResult;
+            case PATH_PAYMENT:
+                PathPaymentResult pathPaymentResult;
+            case MANAGE_OFFER:
+                ManageOfferResult manageOfferResult;
+            case CREATE_PASSIVE_OFFER:
+                ManageOfferResult createPassiveOfferResult;
+            case SET_OPTIONS:
+                SetOptionsResult setOptionsResult;
+            case CHANGE_TRUST:
+                ChangeTrustResult changeTrustResult;
+            case ALLOW_TRUST:
+                AllowTrustResult allowTrustResult;
+            case ACCOUNT_MERGE:
+                AccountMergeResult accountMergeResult;
+            case INFLATION:
+                InflationResult inflationResult;
+            case MANAGE_DATA:
+                ManageDataResult manageDataResult;
+        } tr;
+    default:
+        void;
+};
+
+enum TransactionResultCode {
+    txSUCCESS = 0,
+    txFAILED = -1,
+    txTOO_EARLY = -2,
+    txTOO_LATE = -3,
+    txMISSING_OPERATION = -4,
+    txBAD_SEQ = -5,
+    txBAD_AUTH = -6,
+    txINSUFFICIENT_BALANCE = -7,
+    txNO_ACCOUNT = -8,
+    txINSUFFICIENT_FEE = -9,
+    txBAD_AUTH_EXTRA = -10,
+    txINTERNAL_ERROR = -11
+};
+
+struct TransactionResult {
+    int64 feeCharged;
+    union switch(TransactionResultCode code) {
+        case txSUCCESS:
+        case txFAILED:
+            OperationResult results<>;
+        default:
+            void;
+    } result;
+    union switch(int v) {
+        case 0:
+            void;
+    } ext;
+};
+
+typedef opaque UpgradeType<128>;
+
+struct StellarValue {
+    Hash txSetHash;
+    uint64 closeTime;
+    UpgradeType upgrades<6>;
+    union switch(int v) {
+        case 0:
+            void;
+    } ext;
+};
+
+struct LedgerHeader {
+    uint32 ledgerVersion;
+    Hash previousLedgerHash;
+    StellarValue scpValue;
+    Hash txSetResultHash;
+    Hash bucketListHash;
+    uint32 ledgerSeq;
+    int64 totalCoins;
+    int64 feePool;
+    uint32 inflationSeq;
+    uint64 idPool;
+    uint32 baseFee;
+    uint32 baseReserve;
+    uint32 maxTxSetSize;
+    Hash skipList[4];
+    union switch(int v) {
+        case 0:
+            void;
+    } ext;
+};
+
+enum LedgerUpgradeType {
+    LEDGER_UPGRADE_VERSION = 1,
+    LEDGER_UPGRADE_BASE_FEE = 2,
+    LEDGER_UPGRADE_MAX_TX_SET_SIZE = 3
+};
+
+union LedgerUpgrade switch(LedgerUpgradeType type) {
+    case LEDGER_UPGRADE_VERSION:
+        uint32 newLedgerVersion;
+    case LEDGER_UPGRADE_BASE_FEE:
+        uint32 newBaseFee;
+    case LEDGER_UPGRADE_MAX_TX_SET_SIZE:
+        uint32 newMaxTxSetSize;
+};
+
+union LedgerKey switch(LedgerEntryType type) {
+    case ACCOUNT:
+        struct {
+            AccountID accountID;
+        } account;
+    case TRUSTLINE:
+        struct {
+            AccountID accountID;
+            Asset asset;
+        } trustLine;
+    case OFFER:
+        struct {
+            AccountID sellerID;
+            uint64 offerID;
+        } offer;
+    case DATA:
+        struct {
+            AccountID accountID;
+            string64 dataName;
+        } data;
+};
+
+enum BucketEntryType {
+    LIVEENTRY = 0,
+    DEADENTRY = 1
+};
+
+union BucketEntry switch(BucketEntryType type) {
+    case LIVEENTRY:
+        LedgerEntry liveEntry;
+    case DEADENTRY:
+        LedgerKey deadEntry;
+};
+
+struct TransactionSet {
+    Hash previousLedgerHash;
+    TransactionEnvelope txs<>;
+};
+
+struct TransactionResultPair {
+    Hash transactionHash;
+    TransactionResult result;
+};
+
+struct TransactionResultSet {
+    TransactionResultPair results<>;
+};
+
+struct TransactionHistoryEntry {
+    uint32 ledgerSeq;
+    TransactionSet txSet;
+    union switch(int v) {
+        case 0:
+            void;
+    } ext;
+};
+
+struct TransactionHistoryResultEntry {
+    uint32 ledgerSeq;
+    TransactionResultSet txResultSet;
+    union switch(int v) {
+        case 0:
+            void;
+    } ext;
+};
+
+struct LedgerHeaderHistoryEntry {
+    Hash hash;
+    LedgerHeader header;
+    union switch(int v) {
+        case 0:
+            void;
+    } ext;
+};
+
+struct LedgerSCPMessages {
+    uint32 ledgerSeq;
+    SCPEnvelope messages<>;
+};
+
+struct SCPHistoryEntryV0 {
+    SCPQuorumSet quorumSets<>;
+    LedgerSCPMessages ledgerMessages;
+};
+
+union SCPHistoryEntry switch(int v) {
+    case 0:
+        SCPHistoryEntryV0 v0;
+};
+
+enum LedgerEntryChangeType {
+    LEDGER_ENTRY_CREATED = 0,
+    LEDGER_ENTRY_UPDATED = 1,
+    LEDGER_ENTRY_REMOVED = 2,
+    LEDGER_ENTRY_STATE = 3
+};
+
+union LedgerEntryChange switch(LedgerEntryChangeType type) {
+    case LEDGER_ENTRY_CREATED:
+        LedgerEntry created;
+    case LEDGER_ENTRY_UPDATED:
+        LedgerEntry updated;
+    case LEDGER_ENTRY_REMOVED:
+        LedgerKey removed;
+    case LEDGER_ENTRY_STATE:
+        LedgerEntry state;
+};
+
+typedef LedgerEntryChange LedgerEntryChanges<>;
+
+struct OperationMeta {
+    LedgerEntryChanges changes;
+};
+
+union TransactionMeta switch(int v) {
+    case 0:
+        OperationMeta operations<>;
+};
+
+typedef opaque Value<>;
+
+struct SCPBallot {
+    uint32 counter;
+    Value value;
+};
+
+enum SCPStatementType {
+    SCP_ST_PREPARE = 0,
+    SCP_ST_CONFIRM = 1,
+    SCP_ST_EXTERNALIZE = 2,
+    SCP_ST_NOMINATE = 3
+};
+
+struct SCPNomination {
+    Hash quorumSetHash;
+    Value votes<>;
+    Value accepted<>;
+};
+
+struct SCPStatement {
+    NodeID nodeID;
+    uint64 slotIndex;
+    union switch(SCPStatementType type) {
+        case SCP_ST_PREPARE:
+            struct {
+                Hash quorumSetHash;
+                SCPBallot ballot;
+                SCPBallot prepared<1>;
+                SCPBallot preparedPrime<1>;
+                uint32 nC;
+                uint32 nH;
+            } prepare;
+        case SCP_ST_CONFIRM:
+            struct {
+                SCPBallot ballot;
+                uint32 nPrepared;
+                uint32 nCommit;
+                uint32 nH;
+                Hash quorumSetHash;
+            } confirm;
+        case SCP_ST_EXTERNALIZE:
+            struct {
+                SCPBallot commit;
+                uint32 nH;
+                Hash commitQuorumSetHash;
+            } externalize;
+        case SCP_ST_NOMINATE:
+            SCPNomination nominate;
+    } pledges;
+};
+
+struct SCPEnvelope {
+    SCPStatement statement;
+    Signature signature;
+};
+
+struct SCPQuorumSet {
+    uint32 threshold;
+    PublicKey validators<>;
+    SCPQuorumSet innerSets<>;
+};
+
+enum ErrorCode {
+    ERR_MISC = 0,
+    ERR_DATA = 1,
+    ERR_CONF = 2,
+    ERR_AUTH = 3,
+    ERR_LOAD = 4
+};
+
+struct Error {
+    ErrorCode code;
+    string msg<100>;
+};
+
+struct AuthCert {
+    Curve25519Public pubkey;
+    uint64 expiration;
+    Signature sig;
+};
+
+struct Hello {
+    uint32 ledgerVersion;
+    uint32 overlayVersion;
+    uint32 overlayMinVersion;
+    Hash networkID;
+    string versionStr<100>;
+    int listeningPort;
+    NodeID peerID;
+    AuthCert cert;
+    uint256 nonce;
+};
+
+struct Auth {
+    int unused;
+};
+
+enum IPAddrType {
+    IPv4 = 0,
+    IPv6 = 1
+};
+
+struct PeerAddress {
+    union switch(IPAddrType type) {
+        case IPv4:
+            opaque ipv4[4];
+        case IPv6:
+            opaque ipv6[16];
+    } ip;
+    uint32 port;
+    uint32 numFailures;
+};
+
+enum MessageType {
+    ERROR_MSG = 0,
+    AUTH = 2,
+    DONT_HAVE = 3,
+    GET_PEERS = 4,
+    PEERS = 5,
+    GET_TX_SET = 6,
+    TX_SET = 7,
+    TRANSACTION = 8,
+    GET_SCP_QUORUMSET = 9,
+    SCP_QUORUMSET = 10,
+    SCP_MESSAGE = 11,
+    GET_SCP_STATE = 12,
+    HELLO = 13
+};
+
+struct DontHave {
+    MessageType type;
+    uint256 reqHash;
+};
+
+union StellarMessage switch(MessageType type) {
+    case ERROR_MSG:
+        Error error;
+    case HELLO:
+        Hello hello;
+    case AUTH:
+        Auth auth;
+    case DONT_HAVE:
+        DontHave dontHave;
+    case GET_PEERS:
+        void;
+    case PEERS:
+        PeerAddress peers<>;
+    case GET_TX_SET:
+        uint256 txSetHash;
+    case TX_SET:
+        TransactionSet txSet;
+    case TRANSACTION:
+        TransactionEnvelope transaction;
+    case GET_SCP_QUORUMSET:
+        uint256 qSetHash;
+    case SCP_QUORUMSET:
+        SCPQuorumSet qSet;
+    case SCP_MESSAGE:
+        SCPEnvelope envelope;
+    case GET_SCP_STATE:
+        uint32 getSCPLedgerSeq;
+};
+
+union AuthenticatedMessage switch(uint32 v) {
+    case 0:
+        struct {
+            uint64 sequence;
+            StellarMessage message;
+            HmacSha256Mac mac;
+        } v0;
+};
+}
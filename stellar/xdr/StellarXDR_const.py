@@ -1,4 +1,4 @@
-# Generated by xdrgen.py from ../xdr on Mon Feb 13 22:40:23 2017
+# Generated by xdrgen.py from StellarXDR.x on Sun Oct 18 18:54:15 2026
 KEY_TYPE_ED25519 = 0
 KEY_TYPE_PRE_AUTH_TX = 1
 KEY_TYPE_HASH_X = 2
@@ -1,37 +1,76 @@
-# Generated by xdrgen.py from ../xdr on Mon Feb 13 22:40:23 2017
+# Generated by xdrgen.py from StellarXDR.x on Sun Oct 18 18:54:15 2026
+import struct
 from . import StellarXDR_const as const
 from . import StellarXDR_type as types
-import xdrlib
-from xdrlib import Error as XDRError
+from . import codec
+from .codec import Error as XDRError
 
 class nullclass(object):
     pass
 
-class StellarXDRPacker(xdrlib.Packer):
+_CryptoKeyType_values = frozenset([const.KEY_TYPE_ED25519, const.KEY_TYPE_PRE_AUTH_TX, const.KEY_TYPE_HASH_X])
+_PublicKeyType_values = frozenset([const.PUBLIC_KEY_TYPE_ED25519])
+_SignerKeyType_values = frozenset([const.SIGNER_KEY_TYPE_ED25519, const.SIGNER_KEY_TYPE_PRE_AUTH_TX, const.SIGNER_KEY_TYPE_HASH_X])
+_AssetType_values = frozenset([const.ASSET_TYPE_NATIVE, const.ASSET_TYPE_CREDIT_ALPHANUM4, const.ASSET_TYPE_CREDIT_ALPHANUM12])
+_struct_ii = struct.Struct('>ii')
+_ThresholdIndexes_values = frozenset([const.THRESHOLD_MASTER_WEIGHT, const.THRESHOLD_LOW, const.THRESHOLD_MED, const.THRESHOLD_HIGH])
+_LedgerEntryType_values = frozenset([const.ACCOUNT, const.TRUSTLINE, const.OFFER, const.DATA])
+_AccountFlags_values = frozenset([const.AUTH_REQUIRED_FLAG, const.AUTH_REVOCABLE_FLAG, const.AUTH_IMMUTABLE_FLAG])
+_struct_qQI = struct.Struct('>qQI')
+_TrustLineFlags_values = frozenset([const.AUTHORIZED_FLAG])
+_struct_qqI = struct.Struct('>qqI')
+_OfferEntryFlags_values = frozenset([const.PASSIVE_FLAG])
+_EnvelopeType_values = frozenset([const.ENVELOPE_TYPE_SCP, const.ENVELOPE_TYPE_TX, const.ENVELOPE_TYPE_AUTH])
+_OperationType_values = frozenset([const.CREATE_ACCOUNT, const.PAYMENT, const.PATH_PAYMENT, const.MANAGE_OFFER, const.CREATE_PASSIVE_OFFER, const.SET_OPTIONS, const.CHANGE_TRUST, const.ALLOW_TRUST, const.ACCOUNT_MERGE, const.INFLATION, const.MANAGE_DATA])
+_MemoType_values = frozenset([const.MEMO_NONE, const.MEMO_TEXT, const.MEMO_ID, const.MEMO_HASH, const.MEMO_RETURN])
+_struct_QQ = struct.Struct('>QQ')
+_struct_IQ = struct.Struct('>IQ')
+_CreateAccountResultCode_values = frozenset([const.CREATE_ACCOUNT_SUCCESS, const.CREATE_ACCOUNT_MALFORMED, const.CREATE_ACCOUNT_UNDERFUNDED, const.CREATE_ACCOUNT_LOW_RESERVE, const.CREATE_ACCOUNT_ALREADY_EXIST])
+_PaymentResultCode_values = frozenset([const.PAYMENT_SUCCESS, const.PAYMENT_MALFORMED, const.PAYMENT_UNDERFUNDED, const.PAYMENT_SRC_NO_TRUST, const.PAYMENT_SRC_NOT_AUTHORIZED, const.PAYMENT_NO_DESTINATION, const.PAYMENT_NO_TRUST, const.PAYMENT_NOT_AUTHORIZED, const.PAYMENT_LINE_FULL, const.PAYMENT_NO_ISSUER])
+_PathPaymentResultCode_values = frozenset([const.PATH_PAYMENT_SUCCESS, const.PATH_PAYMENT_MALFORMED, const.PATH_PAYMENT_UNDERFUNDED, const.PATH_PAYMENT_SRC_NO_TRUST, const.PATH_PAYMENT_SRC_NOT_AUTHORIZED, const.PATH_PAYMENT_NO_DESTINATION, const.PATH_PAYMENT_NO_TRUST, const.PATH_PAYMENT_NOT_AUTHORIZED, const.PATH_PAYMENT_LINE_FULL, const.PATH_PAYMENT_NO_ISSUER, const.PATH_PAYMENT_TOO_FEW_OFFERS, const.PATH_PAYMENT_OFFER_CROSS_SELF, const.PATH_PAYMENT_OVER_SENDMAX])
+_ManageOfferResultCode_values = frozenset([const.MANAGE_OFFER_SUCCESS, const.MANAGE_OFFER_MALFORMED, const.MANAGE_OFFER_SELL_NO_TRUST, const.MANAGE_OFFER_BUY_NO_TRUST, const.MANAGE_OFFER_SELL_NOT_AUTHORIZED, const.MANAGE_OFFER_BUY_NOT_AUTHORIZED, const.MANAGE_OFFER_LINE_FULL, const.MANAGE_OFFER_UNDERFUNDED, const.MANAGE_OFFER_CROSS_SELF, const.MANAGE_OFFER_SELL_NO_ISSUER, const.MANAGE_OFFER_BUY_NO_ISSUER, const.MANAGE_OFFER_NOT_FOUND, const.MANAGE_OFFER_LOW_RESERVE])
+_ManageOfferEffect_values = frozenset([const.MANAGE_OFFER_CREATED, const.MANAGE_OFFER_UPDATED, const.MANAGE_OFFER_DELETED])
+_SetOptionsResultCode_values = frozenset([const.SET_OPTIONS_SUCCESS, const.SET_OPTIONS_LOW_RESERVE, const.SET_OPTIONS_TOO_MANY_SIGNERS, const.SET_OPTIONS_BAD_FLAGS, const.SET_OPTIONS_INVALID_INFLATION, const.SET_OPTIONS_CANT_CHANGE, const.SET_OPTIONS_UNKNOWN_FLAG, const.SET_OPTIONS_THRESHOLD_OUT_OF_RANGE, const.SET_OPTIONS_BAD_SIGNER, const.SET_OPTIONS_INVALID_HOME_DOMAIN])
+_ChangeTrustResultCode_values = frozenset([const.CHANGE_TRUST_SUCCESS, const.CHANGE_TRUST_MALFORMED, const.CHANGE_TRUST_NO_ISSUER, const.CHANGE_TRUST_INVALID_LIMIT, const.CHANGE_TRUST_LOW_RESERVE, const.CHANGE_TRUST_SELF_NOT_ALLOWED])
+_AllowTrustResultCode_values = frozenset([const.ALLOW_TRUST_SUCCESS, const.ALLOW_TRUST_MALFORMED, const.ALLOW_TRUST_NO_TRUST_LINE, const.ALLOW_TRUST_TRUST_NOT_REQUIRED, const.ALLOW_TRUST_CANT_REVOKE, const.ALLOW_TRUST_SELF_NOT_ALLOWED])
+_AccountMergeResultCode_values = frozenset([const.ACCOUNT_MERGE_SUCCESS, const.ACCOUNT_MERGE_MALFORMED, const.ACCOUNT_MERGE_NO_ACCOUNT, const.ACCOUNT_MERGE_IMMUTABLE_SET, const.ACCOUNT_MERGE_HAS_SUB_ENTRIES])
+_InflationResultCode_values = frozenset([const.INFLATION_SUCCESS, const.INFLATION_NOT_TIME])
+_ManageDataResultCode_values = frozenset([const.MANAGE_DATA_SUCCESS, const.MANAGE_DATA_NOT_SUPPORTED_YET, const.MANAGE_DATA_NAME_NOT_FOUND, const.MANAGE_DATA_LOW_RESERVE, const.MANAGE_DATA_INVALID_NAME])
+_OperationResultCode_values = frozenset([const.opINNER, const.opBAD_AUTH, const.opNO_ACCOUNT])
+_TransactionResultCode_values = frozenset([const.txSUCCESS, const.txFAILED, const.txTOO_EARLY, const.txTOO_LATE, const.txMISSING_OPERATION, const.txBAD_SEQ, const.txBAD_AUTH, const.txINSUFFICIENT_BALANCE, const.txNO_ACCOUNT, const.txINSUFFICIENT_FEE, const.txBAD_AUTH_EXTRA, const.txINTERNAL_ERROR])
+_struct_IqqIQIII = struct.Struct('>IqqIQIII')
+_LedgerUpgradeType_values = frozenset([const.LEDGER_UPGRADE_VERSION, const.LEDGER_UPGRADE_BASE_FEE, const.LEDGER_UPGRADE_MAX_TX_SET_SIZE])
+_BucketEntryType_values = frozenset([const.LIVEENTRY, const.DEADENTRY])
+_LedgerEntryChangeType_values = frozenset([const.LEDGER_ENTRY_CREATED, const.LEDGER_ENTRY_UPDATED, const.LEDGER_ENTRY_REMOVED, const.LEDGER_ENTRY_STATE])
+_SCPStatementType_values = frozenset([const.SCP_ST_PREPARE, const.SCP_ST_CONFIRM, const.SCP_ST_EXTERNALIZE, const.SCP_ST_NOMINATE])
+_struct_II = struct.Struct('>II')
+_struct_III = struct.Struct('>III')
+_ErrorCode_values = frozenset([const.ERR_MISC, const.ERR_DATA, const.ERR_CONF, const.ERR_AUTH, const.ERR_LOAD])
+_IPAddrType_values = frozenset([const.IPv4, const.IPv6])
+_MessageType_values = frozenset([const.ERROR_MSG, const.AUTH, const.DONT_HAVE, const.GET_PEERS, const.PEERS, const.GET_TX_SET, const.TX_SET, const.TRANSACTION, const.GET_SCP_QUORUMSET, const.SCP_QUORUMSET, const.SCP_MESSAGE, const.GET_SCP_STATE, const.HELLO])
+
+@codec.filterable
+class StellarXDRPacker(codec.Packer):
     def __init__(self, check_enum=True, check_array=True):
-        xdrlib.Packer.__init__(self)
+        codec.Packer.__init__(self)
         self.check_enum = check_enum
         self.check_array = check_array
 
-    pack_bool = xdrlib.Packer.pack_bool
-    pack_unsigned = xdrlib.Packer.pack_uint
-    pack_quadruple = xdrlib.Packer.pack_double
-    pack_int = xdrlib.Packer.pack_int
-    pack_double = xdrlib.Packer.pack_double
-    pack_hyper = xdrlib.Packer.pack_hyper
-    pack_string = xdrlib.Packer.pack_string
-    pack_opaque = xdrlib.Packer.pack_opaque
-    pack_float = xdrlib.Packer.pack_float
-    pack_uint = xdrlib.Packer.pack_uint
-    pack_uhyper = xdrlib.Packer.pack_uhyper
+    pack_int = codec.Packer.pack_int
+    pack_uint = codec.Packer.pack_uint
+    pack_unsigned = codec.Packer.pack_uint
+    pack_hyper = codec.Packer.pack_hyper
+    pack_uhyper = codec.Packer.pack_uhyper
+    pack_float = codec.Packer.pack_float
+    pack_double = codec.Packer.pack_double
+    pack_quadruple = codec.Packer.pack_double
+    pack_bool = codec.Packer.pack_bool
+    pack_opaque = codec.Packer.pack_opaque
+    pack_string = codec.Packer.pack_string
     def pack_Hash(self, data):
-        if hasattr(self, 'filter_Hash'):
-            data = getattr(self, 'filter_Hash')(data)
         self.pack_fopaque(32, data)
 
     def pack_uint256(self, data):
-        if hasattr(self, 'filter_uint256'):
-            data = getattr(self, 'filter_uint256')(data)
         self.pack_fopaque(32, data)
 
     pack_uint32 = pack_uint
@@ -43,29 +82,21 @@ class StellarXDRPacker(xdrlib.Packer):
     pack_int64 = pack_hyper
 
     def pack_CryptoKeyType(self, data):
-        if hasattr(self, 'filter_CryptoKeyType'):
-            data = getattr(self, 'filter_CryptoKeyType')(data)
-        if self.check_enum and data not in [const.KEY_TYPE_ED25519, const.KEY_TYPE_PRE_AUTH_TX, const.KEY_TYPE_HASH_X]:
+        if self.check_enum and data not in _CryptoKeyType_values:
             raise XDRError('value=%s not in enum CryptoKeyType' % data)
         self.pack_int(data)
 
     def pack_PublicKeyType(self, data):
-        if hasattr(self, 'filter_PublicKeyType'):
-            data = getattr(self, 'filter_PublicKeyType')(data)
-        if self.check_enum and data not in [const.PUBLIC_KEY_TYPE_ED25519]:
+        if self.check_enum and data not in _PublicKeyType_values:
             raise XDRError('value=%s not in enum PublicKeyType' % data)
         self.pack_int(data)
 
     def pack_SignerKeyType(self, data):
-        if hasattr(self, 'filter_SignerKeyType'):
-            data = getattr(self, 'filter_SignerKeyType')(data)
-        if self.check_enum and data not in [const.SIGNER_KEY_TYPE_ED25519, const.SIGNER_KEY_TYPE_PRE_AUTH_TX, const.SIGNER_KEY_TYPE_HASH_X]:
+        if self.check_enum and data not in _SignerKeyType_values:
             raise XDRError('value=%s not in enum SignerKeyType' % data)
         self.pack_int(data)
 
     def pack_PublicKey(self, data):
-        if hasattr(self, 'filter_PublicKey'):
-            data = getattr(self, 'filter_PublicKey')(data)
         if data.type is None:
             raise TypeError('data.type == None')
         self.pack_PublicKeyType(data.type)
@@ -77,8 +108,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.type)
 
     def pack_SignerKey(self, data):
-        if hasattr(self, 'filter_SignerKey'):
-            data = getattr(self, 'filter_SignerKey')(data)
         if data.type is None:
             raise TypeError('data.type == None')
         self.pack_SignerKeyType(data.type)
@@ -98,43 +127,31 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.type)
 
     def pack_Signature(self, data):
-        if hasattr(self, 'filter_Signature'):
-            data = getattr(self, 'filter_Signature')(data)
         if len(data) > 64 and self.check_array:
             raise XDRError('array length too long for data')
         self.pack_opaque(data)
 
     def pack_SignatureHint(self, data):
-        if hasattr(self, 'filter_SignatureHint'):
-            data = getattr(self, 'filter_SignatureHint')(data)
         self.pack_fopaque(4, data)
 
     pack_NodeID = pack_PublicKey
 
     def pack_Curve25519Secret(self, data):
-        if hasattr(self, 'filter_Curve25519Secret'):
-            data = getattr(self, 'filter_Curve25519Secret')(data)
         if data.key is None:
             raise TypeError('data.key == None')
         self.pack_fopaque(32, data.key)
 
     def pack_Curve25519Public(self, data):
-        if hasattr(self, 'filter_Curve25519Public'):
-            data = getattr(self, 'filter_Curve25519Public')(data)
         if data.key is None:
             raise TypeError('data.key == None')
         self.pack_fopaque(32, data.key)
 
     def pack_HmacSha256Key(self, data):
-        if hasattr(self, 'filter_HmacSha256Key'):
-            data = getattr(self, 'filter_HmacSha256Key')(data)
         if data.key is None:
             raise TypeError('data.key == None')
         self.pack_fopaque(32, data.key)
 
     def pack_HmacSha256Mac(self, data):
-        if hasattr(self, 'filter_HmacSha256Mac'):
-            data = getattr(self, 'filter_HmacSha256Mac')(data)
         if data.mac is None:
             raise TypeError('data.mac == None')
         self.pack_fopaque(32, data.mac)
@@ -142,20 +159,14 @@ class StellarXDRPacker(xdrlib.Packer):
     pack_AccountID = pack_PublicKey
 
     def pack_Thresholds(self, data):
-        if hasattr(self, 'filter_Thresholds'):
-            data = getattr(self, 'filter_Thresholds')(data)
         self.pack_fopaque(4, data)
 
     def pack_string32(self, data):
-        if hasattr(self, 'filter_string32'):
-            data = getattr(self, 'filter_string32')(data)
         if len(data) > 32 and self.check_array:
             raise XDRError('array length too long for data')
         self.pack_string(data)
 
     def pack_string64(self, data):
-        if hasattr(self, 'filter_string64'):
-            data = getattr(self, 'filter_string64')(data)
         if len(data) > 64 and self.check_array:
             raise XDRError('array length too long for data')
         self.pack_string(data)
@@ -163,22 +174,16 @@ class StellarXDRPacker(xdrlib.Packer):
     pack_SequenceNumber = pack_uint64
 
     def pack_DataValue(self, data):
-        if hasattr(self, 'filter_DataValue'):
-            data = getattr(self, 'filter_DataValue')(data)
         if len(data) > 64 and self.check_array:
             raise XDRError('array length too long for data')
         self.pack_opaque(data)
 
     def pack_AssetType(self, data):
-        if hasattr(self, 'filter_AssetType'):
-            data = getattr(self, 'filter_AssetType')(data)
-        if self.check_enum and data not in [const.ASSET_TYPE_NATIVE, const.ASSET_TYPE_CREDIT_ALPHANUM4, const.ASSET_TYPE_CREDIT_ALPHANUM12]:
+        if self.check_enum and data not in _AssetType_values:
             raise XDRError('value=%s not in enum AssetType' % data)
         self.pack_int(data)
 
     def pack_Asset(self, data):
-        if hasattr(self, 'filter_Asset'):
-            data = getattr(self, 'filter_Asset')(data)
         if data.type is None:
             raise TypeError('data.type == None')
         self.pack_AssetType(data.type)
@@ -206,32 +211,19 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.type)
 
     def pack_Price(self, data):
-        if hasattr(self, 'filter_Price'):
-            data = getattr(self, 'filter_Price')(data)
-        if data.n is None:
-            raise TypeError('data.n == None')
-        self.pack_int32(data.n)
-        if data.d is None:
-            raise TypeError('data.d == None')
-        self.pack_int32(data.d)
+        self.pack_struct(_struct_ii, data.n, data.d)
 
     def pack_ThresholdIndexes(self, data):
-        if hasattr(self, 'filter_ThresholdIndexes'):
-            data = getattr(self, 'filter_ThresholdIndexes')(data)
-        if self.check_enum and data not in [const.THRESHOLD_MASTER_WEIGHT, const.THRESHOLD_LOW, const.THRESHOLD_MED, const.THRESHOLD_HIGH]:
+        if self.check_enum and data not in _ThresholdIndexes_values:
             raise XDRError('value=%s not in enum ThresholdIndexes' % data)
         self.pack_int(data)
 
     def pack_LedgerEntryType(self, data):
-        if hasattr(self, 'filter_LedgerEntryType'):
-            data = getattr(self, 'filter_LedgerEntryType')(data)
-        if self.check_enum and data not in [const.ACCOUNT, const.TRUSTLINE, const.OFFER, const.DATA]:
+        if self.check_enum and data not in _LedgerEntryType_values:
             raise XDRError('value=%s not in enum LedgerEntryType' % data)
         self.pack_int(data)
 
     def pack_Signer(self, data):
-        if hasattr(self, 'filter_Signer'):
-            data = getattr(self, 'filter_Signer')(data)
         if data.key is None:
             raise TypeError('data.key == None')
         self.pack_SignerKey(data.key)
@@ -240,27 +232,15 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_uint32(data.weight)
 
     def pack_AccountFlags(self, data):
-        if hasattr(self, 'filter_AccountFlags'):
-            data = getattr(self, 'filter_AccountFlags')(data)
-        if self.check_enum and data not in [const.AUTH_REQUIRED_FLAG, const.AUTH_REVOCABLE_FLAG, const.AUTH_IMMUTABLE_FLAG]:
+        if self.check_enum and data not in _AccountFlags_values:
             raise XDRError('value=%s not in enum AccountFlags' % data)
         self.pack_int(data)
 
     def pack_AccountEntry(self, data):
-        if hasattr(self, 'filter_AccountEntry'):
-            data = getattr(self, 'filter_AccountEntry')(data)
         if data.accountID is None:
             raise TypeError('data.accountID == None')
         self.pack_AccountID(data.accountID)
-        if data.balance is None:
-            raise TypeError('data.balance == None')
-        self.pack_int64(data.balance)
-        if data.seqNum is None:
-            raise TypeError('data.seqNum == None')
-        self.pack_SequenceNumber(data.seqNum)
-        if data.numSubEntries is None:
-            raise TypeError('data.numSubEntries == None')
-        self.pack_uint32(data.numSubEntries)
+        self.pack_struct(_struct_qQI, data.balance, data.seqNum, data.numSubEntries)
         if data.inflationDest is None:
             raise TypeError('data.inflationDest == None')
         if len(data.inflationDest) > 1 and self.check_array:
@@ -291,30 +271,18 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.ext.v)
 
     def pack_TrustLineFlags(self, data):
-        if hasattr(self, 'filter_TrustLineFlags'):
-            data = getattr(self, 'filter_TrustLineFlags')(data)
-        if self.check_enum and data not in [const.AUTHORIZED_FLAG]:
+        if self.check_enum and data not in _TrustLineFlags_values:
             raise XDRError('value=%s not in enum TrustLineFlags' % data)
         self.pack_int(data)
 
     def pack_TrustLineEntry(self, data):
-        if hasattr(self, 'filter_TrustLineEntry'):
-            data = getattr(self, 'filter_TrustLineEntry')(data)
         if data.accountID is None:
             raise TypeError('data.accountID == None')
         self.pack_AccountID(data.accountID)
         if data.asset is None:
             raise TypeError('data.asset == None')
         self.pack_Asset(data.asset)
-        if data.balance is None:
-            raise TypeError('data.balance == None')
-        self.pack_int64(data.balance)
-        if data.limit is None:
-            raise TypeError('data.limit == None')
-        self.pack_int64(data.limit)
-        if data.flags is None:
-            raise TypeError('data.flags == None')
-        self.pack_uint32(data.flags)
+        self.pack_struct(_struct_qqI, data.balance, data.limit, data.flags)
         if data.ext is None:
             raise TypeError('data.ext == None')
         if data.ext.v is None:
@@ -326,15 +294,11 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.ext.v)
 
     def pack_OfferEntryFlags(self, data):
-        if hasattr(self, 'filter_OfferEntryFlags'):
-            data = getattr(self, 'filter_OfferEntryFlags')(data)
-        if self.check_enum and data not in [const.PASSIVE_FLAG]:
+        if self.check_enum and data not in _OfferEntryFlags_values:
             raise XDRError('value=%s not in enum OfferEntryFlags' % data)
         self.pack_int(data)
 
     def pack_OfferEntry(self, data):
-        if hasattr(self, 'filter_OfferEntry'):
-            data = getattr(self, 'filter_OfferEntry')(data)
         if data.sellerID is None:
             raise TypeError('data.sellerID == None')
         self.pack_AccountID(data.sellerID)
@@ -367,8 +331,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.ext.v)
 
     def pack_DataEntry(self, data):
-        if hasattr(self, 'filter_DataEntry'):
-            data = getattr(self, 'filter_DataEntry')(data)
         if data.accountID is None:
             raise TypeError('data.accountID == None')
         self.pack_AccountID(data.accountID)
@@ -389,8 +351,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.ext.v)
 
     def pack_LedgerEntry(self, data):
-        if hasattr(self, 'filter_LedgerEntry'):
-            data = getattr(self, 'filter_LedgerEntry')(data)
         if data.lastModifiedLedgerSeq is None:
             raise TypeError('data.lastModifiedLedgerSeq == None')
         self.pack_uint32(data.lastModifiedLedgerSeq)
@@ -428,15 +388,11 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.ext.v)
 
     def pack_EnvelopeType(self, data):
-        if hasattr(self, 'filter_EnvelopeType'):
-            data = getattr(self, 'filter_EnvelopeType')(data)
-        if self.check_enum and data not in [const.ENVELOPE_TYPE_SCP, const.ENVELOPE_TYPE_TX, const.ENVELOPE_TYPE_AUTH]:
+        if self.check_enum and data not in _EnvelopeType_values:
             raise XDRError('value=%s not in enum EnvelopeType' % data)
         self.pack_int(data)
 
     def pack_DecoratedSignature(self, data):
-        if hasattr(self, 'filter_DecoratedSignature'):
-            data = getattr(self, 'filter_DecoratedSignature')(data)
         if data.hint is None:
             raise TypeError('data.hint == None')
         self.pack_SignatureHint(data.hint)
@@ -445,15 +401,11 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_Signature(data.signature)
 
     def pack_OperationType(self, data):
-        if hasattr(self, 'filter_OperationType'):
-            data = getattr(self, 'filter_OperationType')(data)
-        if self.check_enum and data not in [const.CREATE_ACCOUNT, const.PAYMENT, const.PATH_PAYMENT, const.MANAGE_OFFER, const.CREATE_PASSIVE_OFFER, const.SET_OPTIONS, const.CHANGE_TRUST, const.ALLOW_TRUST, const.ACCOUNT_MERGE, const.INFLATION, const.MANAGE_DATA]:
+        if self.check_enum and data not in _OperationType_values:
             raise XDRError('value=%s not in enum OperationType' % data)
         self.pack_int(data)
 
     def pack_CreateAccountOp(self, data):
-        if hasattr(self, 'filter_CreateAccountOp'):
-            data = getattr(self, 'filter_CreateAccountOp')(data)
         if data.destination is None:
             raise TypeError('data.destination == None')
         self.pack_AccountID(data.destination)
@@ -462,8 +414,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_int64(data.startingBalance)
 
     def pack_PaymentOp(self, data):
-        if hasattr(self, 'filter_PaymentOp'):
-            data = getattr(self, 'filter_PaymentOp')(data)
         if data.destination is None:
             raise TypeError('data.destination == None')
         self.pack_AccountID(data.destination)
@@ -475,8 +425,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_int64(data.amount)
 
     def pack_PathPaymentOp(self, data):
-        if hasattr(self, 'filter_PathPaymentOp'):
-            data = getattr(self, 'filter_PathPaymentOp')(data)
         if data.sendAsset is None:
             raise TypeError('data.sendAsset == None')
         self.pack_Asset(data.sendAsset)
@@ -499,8 +447,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_array(data.path, self.pack_Asset)
 
     def pack_ManageOfferOp(self, data):
-        if hasattr(self, 'filter_ManageOfferOp'):
-            data = getattr(self, 'filter_ManageOfferOp')(data)
         if data.selling is None:
             raise TypeError('data.selling == None')
         self.pack_Asset(data.selling)
@@ -518,8 +464,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_uint64(data.offerID)
 
     def pack_CreatePassiveOfferOp(self, data):
-        if hasattr(self, 'filter_CreatePassiveOfferOp'):
-            data = getattr(self, 'filter_CreatePassiveOfferOp')(data)
         if data.selling is None:
             raise TypeError('data.selling == None')
         self.pack_Asset(data.selling)
@@ -534,8 +478,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_Price(data.price)
 
     def pack_SetOptionsOp(self, data):
-        if hasattr(self, 'filter_SetOptionsOp'):
-            data = getattr(self, 'filter_SetOptionsOp')(data)
         if data.inflationDest is None:
             raise TypeError('data.inflationDest == None')
         if len(data.inflationDest) > 1 and self.check_array:
@@ -583,8 +525,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_array(data.signer, self.pack_Signer)
 
     def pack_ChangeTrustOp(self, data):
-        if hasattr(self, 'filter_ChangeTrustOp'):
-            data = getattr(self, 'filter_ChangeTrustOp')(data)
         if data.line is None:
             raise TypeError('data.line == None')
         self.pack_Asset(data.line)
@@ -593,8 +533,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_int64(data.limit)
 
     def pack_AllowTrustOp(self, data):
-        if hasattr(self, 'filter_AllowTrustOp'):
-            data = getattr(self, 'filter_AllowTrustOp')(data)
         if data.trustor is None:
             raise TypeError('data.trustor == None')
         self.pack_AccountID(data.trustor)
@@ -618,8 +556,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_bool(data.authorize)
 
     def pack_ManageDataOp(self, data):
-        if hasattr(self, 'filter_ManageDataOp'):
-            data = getattr(self, 'filter_ManageDataOp')(data)
         if data.dataName is None:
             raise TypeError('data.dataName == None')
         self.pack_string64(data.dataName)
@@ -630,8 +566,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_array(data.dataValue, self.pack_DataValue)
 
     def pack_Operation(self, data):
-        if hasattr(self, 'filter_Operation'):
-            data = getattr(self, 'filter_Operation')(data)
         if data.sourceAccount is None:
             raise TypeError('data.sourceAccount == None')
         if len(data.sourceAccount) > 1 and self.check_array:
@@ -688,15 +622,11 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.body.type)
 
     def pack_MemoType(self, data):
-        if hasattr(self, 'filter_MemoType'):
-            data = getattr(self, 'filter_MemoType')(data)
-        if self.check_enum and data not in [const.MEMO_NONE, const.MEMO_TEXT, const.MEMO_ID, const.MEMO_HASH, const.MEMO_RETURN]:
+        if self.check_enum and data not in _MemoType_values:
             raise XDRError('value=%s not in enum MemoType' % data)
         self.pack_int(data)
 
     def pack_Memo(self, data):
-        if hasattr(self, 'filter_Memo'):
-            data = getattr(self, 'filter_Memo')(data)
         if data.type is None:
             raise TypeError('data.type == None')
         self.pack_MemoType(data.type)
@@ -724,27 +654,13 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.type)
 
     def pack_TimeBounds(self, data):
-        if hasattr(self, 'filter_TimeBounds'):
-            data = getattr(self, 'filter_TimeBounds')(data)
-        if data.minTime is None:
-            raise TypeError('data.minTime == None')
-        self.pack_uint64(data.minTime)
-        if data.maxTime is None:
-            raise TypeError('data.maxTime == None')
-        self.pack_uint64(data.maxTime)
+        self.pack_struct(_struct_QQ, data.minTime, data.maxTime)
 
     def pack_Transaction(self, data):
-        if hasattr(self, 'filter_Transaction'):
-            data = getattr(self, 'filter_Transaction')(data)
         if data.sourceAccount is None:
             raise TypeError('data.sourceAccount == None')
         self.pack_AccountID(data.sourceAccount)
-        if data.fee is None:
-            raise TypeError('data.fee == None')
-        self.pack_uint32(data.fee)
-        if data.seqNum is None:
-            raise TypeError('data.seqNum == None')
-        self.pack_SequenceNumber(data.seqNum)
+        self.pack_struct(_struct_IQ, data.fee, data.seqNum)
         if data.timeBounds is None:
             raise TypeError('data.timeBounds == None')
         if len(data.timeBounds) > 1 and self.check_array:
@@ -769,8 +685,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.ext.v)
 
     def pack_TransactionSignaturePayload(self, data):
-        if hasattr(self, 'filter_TransactionSignaturePayload'):
-            data = getattr(self, 'filter_TransactionSignaturePayload')(data)
         if data.networkId is None:
             raise TypeError('data.networkId == None')
         self.pack_Hash(data.networkId)
@@ -787,8 +701,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.taggedTransaction.type)
 
     def pack_TransactionEnvelope(self, data):
-        if hasattr(self, 'filter_TransactionEnvelope'):
-            data = getattr(self, 'filter_TransactionEnvelope')(data)
         if data.tx is None:
             raise TypeError('data.tx == None')
         self.pack_Transaction(data.tx)
@@ -799,8 +711,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_array(data.signatures, self.pack_DecoratedSignature)
 
     def pack_ClaimOfferAtom(self, data):
-        if hasattr(self, 'filter_ClaimOfferAtom'):
-            data = getattr(self, 'filter_ClaimOfferAtom')(data)
         if data.sellerID is None:
             raise TypeError('data.sellerID == None')
         self.pack_AccountID(data.sellerID)
@@ -821,15 +731,11 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_int64(data.amountBought)
 
     def pack_CreateAccountResultCode(self, data):
-        if hasattr(self, 'filter_CreateAccountResultCode'):
-            data = getattr(self, 'filter_CreateAccountResultCode')(data)
-        if self.check_enum and data not in [const.CREATE_ACCOUNT_SUCCESS, const.CREATE_ACCOUNT_MALFORMED, const.CREATE_ACCOUNT_UNDERFUNDED, const.CREATE_ACCOUNT_LOW_RESERVE, const.CREATE_ACCOUNT_ALREADY_EXIST]:
+        if self.check_enum and data not in _CreateAccountResultCode_values:
             raise XDRError('value=%s not in enum CreateAccountResultCode' % data)
         self.pack_int(data)
 
     def pack_CreateAccountResult(self, data):
-        if hasattr(self, 'filter_CreateAccountResult'):
-            data = getattr(self, 'filter_CreateAccountResult')(data)
         if data.code is None:
             raise TypeError('data.code == None')
         self.pack_CreateAccountResultCode(data.code)
@@ -839,15 +745,11 @@ class StellarXDRPacker(xdrlib.Packer):
             pass
 
     def pack_PaymentResultCode(self, data):
-        if hasattr(self, 'filter_PaymentResultCode'):
-            data = getattr(self, 'filter_PaymentResultCode')(data)
-        if self.check_enum and data not in [const.PAYMENT_SUCCESS, const.PAYMENT_MALFORMED, const.PAYMENT_UNDERFUNDED, const.PAYMENT_SRC_NO_TRUST, const.PAYMENT_SRC_NOT_AUTHORIZED, const.PAYMENT_NO_DESTINATION, const.PAYMENT_NO_TRUST, const.PAYMENT_NOT_AUTHORIZED, const.PAYMENT_LINE_FULL, const.PAYMENT_NO_ISSUER]:
+        if self.check_enum and data not in _PaymentResultCode_values:
             raise XDRError('value=%s not in enum PaymentResultCode' % data)
         self.pack_int(data)
 
     def pack_PaymentResult(self, data):
-        if hasattr(self, 'filter_PaymentResult'):
-            data = getattr(self, 'filter_PaymentResult')(data)
         if data.code is None:
             raise TypeError('data.code == None')
         self.pack_PaymentResultCode(data.code)
@@ -857,15 +759,11 @@ class StellarXDRPacker(xdrlib.Packer):
             pass
 
     def pack_PathPaymentResultCode(self, data):
-        if hasattr(self, 'filter_PathPaymentResultCode'):
-            data = getattr(self, 'filter_PathPaymentResultCode')(data)
-        if self.check_enum and data not in [const.PATH_PAYMENT_SUCCESS, const.PATH_PAYMENT_MALFORMED, const.PATH_PAYMENT_UNDERFUNDED, const.PATH_PAYMENT_SRC_NO_TRUST, const.PATH_PAYMENT_SRC_NOT_AUTHORIZED, const.PATH_PAYMENT_NO_DESTINATION, const.PATH_PAYMENT_NO_TRUST, const.PATH_PAYMENT_NOT_AUTHORIZED, const.PATH_PAYMENT_LINE_FULL, const.PATH_PAYMENT_NO_ISSUER, const.PATH_PAYMENT_TOO_FEW_OFFERS, const.PATH_PAYMENT_OFFER_CROSS_SELF, const.PATH_PAYMENT_OVER_SENDMAX]:
+        if self.check_enum and data not in _PathPaymentResultCode_values:
             raise XDRError('value=%s not in enum PathPaymentResultCode' % data)
         self.pack_int(data)
 
     def pack_SimplePaymentResult(self, data):
-        if hasattr(self, 'filter_SimplePaymentResult'):
-            data = getattr(self, 'filter_SimplePaymentResult')(data)
         if data.destination is None:
             raise TypeError('data.destination == None')
         self.pack_AccountID(data.destination)
@@ -877,8 +775,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_int64(data.amount)
 
     def pack_PathPaymentResult(self, data):
-        if hasattr(self, 'filter_PathPaymentResult'):
-            data = getattr(self, 'filter_PathPaymentResult')(data)
         if data.code is None:
             raise TypeError('data.code == None')
         self.pack_PathPaymentResultCode(data.code)
@@ -899,22 +795,16 @@ class StellarXDRPacker(xdrlib.Packer):
             pass
 
     def pack_ManageOfferResultCode(self, data):
-        if hasattr(self, 'filter_ManageOfferResultCode'):
-            data = getattr(self, 'filter_ManageOfferResultCode')(data)
-        if self.check_enum and data not in [const.MANAGE_OFFER_SUCCESS, const.MANAGE_OFFER_MALFORMED, const.MANAGE_OFFER_SELL_NO_TRUST, const.MANAGE_OFFER_BUY_NO_TRUST, const.MANAGE_OFFER_SELL_NOT_AUTHORIZED, const.MANAGE_OFFER_BUY_NOT_AUTHORIZED, const.MANAGE_OFFER_LINE_FULL, const.MANAGE_OFFER_UNDERFUNDED, const.MANAGE_OFFER_CROSS_SELF, const.MANAGE_OFFER_SELL_NO_ISSUER, const.MANAGE_OFFER_BUY_NO_ISSUER, const.MANAGE_OFFER_NOT_FOUND, const.MANAGE_OFFER_LOW_RESERVE]:
+        if self.check_enum and data not in _ManageOfferResultCode_values:
             raise XDRError('value=%s not in enum ManageOfferResultCode' % data)
         self.pack_int(data)
 
     def pack_ManageOfferEffect(self, data):
-        if hasattr(self, 'filter_ManageOfferEffect'):
-            data = getattr(self, 'filter_ManageOfferEffect')(data)
-        if self.check_enum and data not in [const.MANAGE_OFFER_CREATED, const.MANAGE_OFFER_UPDATED, const.MANAGE_OFFER_DELETED]:
+        if self.check_enum and data not in _ManageOfferEffect_values:
             raise XDRError('value=%s not in enum ManageOfferEffect' % data)
         self.pack_int(data)
 
     def pack_ManageOfferSuccessResult(self, data):
-        if hasattr(self, 'filter_ManageOfferSuccessResult'):
-            data = getattr(self, 'filter_ManageOfferSuccessResult')(data)
         if data.offersClaimed is None:
             raise TypeError('data.offersClaimed == None')
         self.pack_array(data.offersClaimed, self.pack_ClaimOfferAtom)
@@ -931,8 +821,6 @@ class StellarXDRPacker(xdrlib.Packer):
             pass
 
     def pack_ManageOfferResult(self, data):
-        if hasattr(self, 'filter_ManageOfferResult'):
-            data = getattr(self, 'filter_ManageOfferResult')(data)
         if data.code is None:
             raise TypeError('data.code == None')
         self.pack_ManageOfferResultCode(data.code)
@@ -944,15 +832,11 @@ class StellarXDRPacker(xdrlib.Packer):
             pass
 
     def pack_SetOptionsResultCode(self, data):
-        if hasattr(self, 'filter_SetOptionsResultCode'):
-            data = getattr(self, 'filter_SetOptionsResultCode')(data)
-        if self.check_enum and data not in [const.SET_OPTIONS_SUCCESS, const.SET_OPTIONS_LOW_RESERVE, const.SET_OPTIONS_TOO_MANY_SIGNERS, const.SET_OPTIONS_BAD_FLAGS, const.SET_OPTIONS_INVALID_INFLATION, const.SET_OPTIONS_CANT_CHANGE, const.SET_OPTIONS_UNKNOWN_FLAG, const.SET_OPTIONS_THRESHOLD_OUT_OF_RANGE, const.SET_OPTIONS_BAD_SIGNER, const.SET_OPTIONS_INVALID_HOME_DOMAIN]:
+        if self.check_enum and data not in _SetOptionsResultCode_values:
             raise XDRError('value=%s not in enum SetOptionsResultCode' % data)
         self.pack_int(data)
 
     def pack_SetOptionsResult(self, data):
-        if hasattr(self, 'filter_SetOptionsResult'):
-            data = getattr(self, 'filter_SetOptionsResult')(data)
         if data.code is None:
             raise TypeError('data.code == None')
         self.pack_SetOptionsResultCode(data.code)
@@ -962,15 +846,11 @@ class StellarXDRPacker(xdrlib.Packer):
             pass
 
     def pack_ChangeTrustResultCode(self, data):
-        if hasattr(self, 'filter_ChangeTrustResultCode'):
-            data = getattr(self, 'filter_ChangeTrustResultCode')(data)
-        if self.check_enum and data not in [const.CHANGE_TRUST_SUCCESS, const.CHANGE_TRUST_MALFORMED, const.CHANGE_TRUST_NO_ISSUER, const.CHANGE_TRUST_INVALID_LIMIT, const.CHANGE_TRUST_LOW_RESERVE, const.CHANGE_TRUST_SELF_NOT_ALLOWED]:
+        if self.check_enum and data not in _ChangeTrustResultCode_values:
             raise XDRError('value=%s not in enum ChangeTrustResultCode' % data)
         self.pack_int(data)
 
     def pack_ChangeTrustResult(self, data):
-        if hasattr(self, 'filter_ChangeTrustResult'):
-            data = getattr(self, 'filter_ChangeTrustResult')(data)
         if data.code is None:
             raise TypeError('data.code == None')
         self.pack_ChangeTrustResultCode(data.code)
@@ -980,15 +860,11 @@ class StellarXDRPacker(xdrlib.Packer):
             pass
 
     def pack_AllowTrustResultCode(self, data):
-        if hasattr(self, 'filter_AllowTrustResultCode'):
-            data = getattr(self, 'filter_AllowTrustResultCode')(data)
-        if self.check_enum and data not in [const.ALLOW_TRUST_SUCCESS, const.ALLOW_TRUST_MALFORMED, const.ALLOW_TRUST_NO_TRUST_LINE, const.ALLOW_TRUST_TRUST_NOT_REQUIRED, const.ALLOW_TRUST_CANT_REVOKE, const.ALLOW_TRUST_SELF_NOT_ALLOWED]:
+        if self.check_enum and data not in _AllowTrustResultCode_values:
             raise XDRError('value=%s not in enum AllowTrustResultCode' % data)
         self.pack_int(data)
 
     def pack_AllowTrustResult(self, data):
-        if hasattr(self, 'filter_AllowTrustResult'):
-            data = getattr(self, 'filter_AllowTrustResult')(data)
         if data.code is None:
             raise TypeError('data.code == None')
         self.pack_AllowTrustResultCode(data.code)
@@ -998,15 +874,11 @@ class StellarXDRPacker(xdrlib.Packer):
             pass
 
     def pack_AccountMergeResultCode(self, data):
-        if hasattr(self, 'filter_AccountMergeResultCode'):
-            data = getattr(self, 'filter_AccountMergeResultCode')(data)
-        if self.check_enum and data not in [const.ACCOUNT_MERGE_SUCCESS, const.ACCOUNT_MERGE_MALFORMED, const.ACCOUNT_MERGE_NO_ACCOUNT, const.ACCOUNT_MERGE_IMMUTABLE_SET, const.ACCOUNT_MERGE_HAS_SUB_ENTRIES]:
+        if self.check_enum and data not in _AccountMergeResultCode_values:
             raise XDRError('value=%s not in enum AccountMergeResultCode' % data)
         self.pack_int(data)
 
     def pack_AccountMergeResult(self, data):
-        if hasattr(self, 'filter_AccountMergeResult'):
-            data = getattr(self, 'filter_AccountMergeResult')(data)
         if data.code is None:
             raise TypeError('data.code == None')
         self.pack_AccountMergeResultCode(data.code)
@@ -1018,15 +890,11 @@ class StellarXDRPacker(xdrlib.Packer):
             pass
 
     def pack_InflationResultCode(self, data):
-        if hasattr(self, 'filter_InflationResultCode'):
-            data = getattr(self, 'filter_InflationResultCode')(data)
-        if self.check_enum and data not in [const.INFLATION_SUCCESS, const.INFLATION_NOT_TIME]:
+        if self.check_enum and data not in _InflationResultCode_values:
             raise XDRError('value=%s not in enum InflationResultCode' % data)
         self.pack_int(data)
 
     def pack_InflationPayout(self, data):
-        if hasattr(self, 'filter_InflationPayout'):
-            data = getattr(self, 'filter_InflationPayout')(data)
         if data.destination is None:
             raise TypeError('data.destination == None')
         self.pack_AccountID(data.destination)
@@ -1035,8 +903,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_int64(data.amount)
 
     def pack_InflationResult(self, data):
-        if hasattr(self, 'filter_InflationResult'):
-            data = getattr(self, 'filter_InflationResult')(data)
         if data.code is None:
             raise TypeError('data.code == None')
         self.pack_InflationResultCode(data.code)
@@ -1048,15 +914,11 @@ class StellarXDRPacker(xdrlib.Packer):
             pass
 
     def pack_ManageDataResultCode(self, data):
-        if hasattr(self, 'filter_ManageDataResultCode'):
-            data = getattr(self, 'filter_ManageDataResultCode')(data)
-        if self.check_enum and data not in [const.MANAGE_DATA_SUCCESS, const.MANAGE_DATA_NOT_SUPPORTED_YET, const.MANAGE_DATA_NAME_NOT_FOUND, const.MANAGE_DATA_LOW_RESERVE, const.MANAGE_DATA_INVALID_NAME]:
+        if self.check_enum and data not in _ManageDataResultCode_values:
             raise XDRError('value=%s not in enum ManageDataResultCode' % data)
         self.pack_int(data)
 
     def pack_ManageDataResult(self, data):
-        if hasattr(self, 'filter_ManageDataResult'):
-            data = getattr(self, 'filter_ManageDataResult')(data)
         if data.code is None:
             raise TypeError('data.code == None')
         self.pack_ManageDataResultCode(data.code)
@@ -1066,15 +928,11 @@ class StellarXDRPacker(xdrlib.Packer):
             pass
 
     def pack_OperationResultCode(self, data):
-        if hasattr(self, 'filter_OperationResultCode'):
-            data = getattr(self, 'filter_OperationResultCode')(data)
-        if self.check_enum and data not in [const.opINNER, const.opBAD_AUTH, const.opNO_ACCOUNT]:
+        if self.check_enum and data not in _OperationResultCode_values:
             raise XDRError('value=%s not in enum OperationResultCode' % data)
         self.pack_int(data)
 
     def pack_OperationResult(self, data):
-        if hasattr(self, 'filter_OperationResult'):
-            data = getattr(self, 'filter_OperationResult')(data)
         if data.code is None:
             raise TypeError('data.code == None')
         self.pack_OperationResultCode(data.code)
@@ -1134,15 +992,11 @@ class StellarXDRPacker(xdrlib.Packer):
             pass
 
     def pack_TransactionResultCode(self, data):
-        if hasattr(self, 'filter_TransactionResultCode'):
-            data = getattr(self, 'filter_TransactionResultCode')(data)
-        if self.check_enum and data not in [const.txSUCCESS, const.txFAILED, const.txTOO_EARLY, const.txTOO_LATE, const.txMISSING_OPERATION, const.txBAD_SEQ, const.txBAD_AUTH, const.txINSUFFICIENT_BALANCE, const.txNO_ACCOUNT, const.txINSUFFICIENT_FEE, const.txBAD_AUTH_EXTRA, const.txINTERNAL_ERROR]:
+        if self.check_enum and data not in _TransactionResultCode_values:
             raise XDRError('value=%s not in enum TransactionResultCode' % data)
         self.pack_int(data)
 
     def pack_TransactionResult(self, data):
-        if hasattr(self, 'filter_TransactionResult'):
-            data = getattr(self, 'filter_TransactionResult')(data)
         if data.feeCharged is None:
             raise TypeError('data.feeCharged == None')
         self.pack_int64(data.feeCharged)
@@ -1168,15 +1022,11 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.ext.v)
 
     def pack_UpgradeType(self, data):
-        if hasattr(self, 'filter_UpgradeType'):
-            data = getattr(self, 'filter_UpgradeType')(data)
         if len(data) > 128 and self.check_array:
             raise XDRError('array length too long for data')
         self.pack_opaque(data)
 
     def pack_StellarValue(self, data):
-        if hasattr(self, 'filter_StellarValue'):
-            data = getattr(self, 'filter_StellarValue')(data)
         if data.txSetHash is None:
             raise TypeError('data.txSetHash == None')
         self.pack_Hash(data.txSetHash)
@@ -1199,8 +1049,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.ext.v)
 
     def pack_LedgerHeader(self, data):
-        if hasattr(self, 'filter_LedgerHeader'):
-            data = getattr(self, 'filter_LedgerHeader')(data)
         if data.ledgerVersion is None:
             raise TypeError('data.ledgerVersion == None')
         self.pack_uint32(data.ledgerVersion)
@@ -1216,30 +1064,7 @@ class StellarXDRPacker(xdrlib.Packer):
         if data.bucketListHash is None:
             raise TypeError('data.bucketListHash == None')
         self.pack_Hash(data.bucketListHash)
-        if data.ledgerSeq is None:
-            raise TypeError('data.ledgerSeq == None')
-        self.pack_uint32(data.ledgerSeq)
-        if data.totalCoins is None:
-            raise TypeError('data.totalCoins == None')
-        self.pack_int64(data.totalCoins)
-        if data.feePool is None:
-            raise TypeError('data.feePool == None')
-        self.pack_int64(data.feePool)
-        if data.inflationSeq is None:
-            raise TypeError('data.inflationSeq == None')
-        self.pack_uint32(data.inflationSeq)
-        if data.idPool is None:
-            raise TypeError('data.idPool == None')
-        self.pack_uint64(data.idPool)
-        if data.baseFee is None:
-            raise TypeError('data.baseFee == None')
-        self.pack_uint32(data.baseFee)
-        if data.baseReserve is None:
-            raise TypeError('data.baseReserve == None')
-        self.pack_uint32(data.baseReserve)
-        if data.maxTxSetSize is None:
-            raise TypeError('data.maxTxSetSize == None')
-        self.pack_uint32(data.maxTxSetSize)
+        self.pack_struct(_struct_IqqIQIII, data.ledgerSeq, data.totalCoins, data.feePool, data.inflationSeq, data.idPool, data.baseFee, data.baseReserve, data.maxTxSetSize)
         if data.skipList is None:
             raise TypeError('data.skipList == None')
         self.pack_farray(4, data.skipList, self.pack_Hash)
@@ -1254,15 +1079,11 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.ext.v)
 
     def pack_LedgerUpgradeType(self, data):
-        if hasattr(self, 'filter_LedgerUpgradeType'):
-            data = getattr(self, 'filter_LedgerUpgradeType')(data)
-        if self.check_enum and data not in [const.LEDGER_UPGRADE_VERSION, const.LEDGER_UPGRADE_BASE_FEE, const.LEDGER_UPGRADE_MAX_TX_SET_SIZE]:
+        if self.check_enum and data not in _LedgerUpgradeType_values:
             raise XDRError('value=%s not in enum LedgerUpgradeType' % data)
         self.pack_int(data)
 
     def pack_LedgerUpgrade(self, data):
-        if hasattr(self, 'filter_LedgerUpgrade'):
-            data = getattr(self, 'filter_LedgerUpgrade')(data)
         if data.type is None:
             raise TypeError('data.type == None')
         self.pack_LedgerUpgradeType(data.type)
@@ -1282,8 +1103,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.type)
 
     def pack_LedgerKey(self, data):
-        if hasattr(self, 'filter_LedgerKey'):
-            data = getattr(self, 'filter_LedgerKey')(data)
         if data.type is None:
             raise TypeError('data.type == None')
         self.pack_LedgerEntryType(data.type)
@@ -1324,15 +1143,11 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.type)
 
     def pack_BucketEntryType(self, data):
-        if hasattr(self, 'filter_BucketEntryType'):
-            data = getattr(self, 'filter_BucketEntryType')(data)
-        if self.check_enum and data not in [const.LIVEENTRY, const.DEADENTRY]:
+        if self.check_enum and data not in _BucketEntryType_values:
             raise XDRError('value=%s not in enum BucketEntryType' % data)
         self.pack_int(data)
 
     def pack_BucketEntry(self, data):
-        if hasattr(self, 'filter_BucketEntry'):
-            data = getattr(self, 'filter_BucketEntry')(data)
         if data.type is None:
             raise TypeError('data.type == None')
         self.pack_BucketEntryType(data.type)
@@ -1348,8 +1163,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.type)
 
     def pack_TransactionSet(self, data):
-        if hasattr(self, 'filter_TransactionSet'):
-            data = getattr(self, 'filter_TransactionSet')(data)
         if data.previousLedgerHash is None:
             raise TypeError('data.previousLedgerHash == None')
         self.pack_Hash(data.previousLedgerHash)
@@ -1358,8 +1171,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_array(data.txs, self.pack_TransactionEnvelope)
 
     def pack_TransactionResultPair(self, data):
-        if hasattr(self, 'filter_TransactionResultPair'):
-            data = getattr(self, 'filter_TransactionResultPair')(data)
         if data.transactionHash is None:
             raise TypeError('data.transactionHash == None')
         self.pack_Hash(data.transactionHash)
@@ -1368,15 +1179,11 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_TransactionResult(data.result)
 
     def pack_TransactionResultSet(self, data):
-        if hasattr(self, 'filter_TransactionResultSet'):
-            data = getattr(self, 'filter_TransactionResultSet')(data)
         if data.results is None:
             raise TypeError('data.results == None')
         self.pack_array(data.results, self.pack_TransactionResultPair)
 
     def pack_TransactionHistoryEntry(self, data):
-        if hasattr(self, 'filter_TransactionHistoryEntry'):
-            data = getattr(self, 'filter_TransactionHistoryEntry')(data)
         if data.ledgerSeq is None:
             raise TypeError('data.ledgerSeq == None')
         self.pack_uint32(data.ledgerSeq)
@@ -1394,8 +1201,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.ext.v)
 
     def pack_TransactionHistoryResultEntry(self, data):
-        if hasattr(self, 'filter_TransactionHistoryResultEntry'):
-            data = getattr(self, 'filter_TransactionHistoryResultEntry')(data)
         if data.ledgerSeq is None:
             raise TypeError('data.ledgerSeq == None')
         self.pack_uint32(data.ledgerSeq)
@@ -1413,8 +1218,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.ext.v)
 
     def pack_LedgerHeaderHistoryEntry(self, data):
-        if hasattr(self, 'filter_LedgerHeaderHistoryEntry'):
-            data = getattr(self, 'filter_LedgerHeaderHistoryEntry')(data)
         if data.hash is None:
             raise TypeError('data.hash == None')
         self.pack_Hash(data.hash)
@@ -1432,8 +1235,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.ext.v)
 
     def pack_LedgerSCPMessages(self, data):
-        if hasattr(self, 'filter_LedgerSCPMessages'):
-            data = getattr(self, 'filter_LedgerSCPMessages')(data)
         if data.ledgerSeq is None:
             raise TypeError('data.ledgerSeq == None')
         self.pack_uint32(data.ledgerSeq)
@@ -1442,8 +1243,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_array(data.messages, self.pack_SCPEnvelope)
 
     def pack_SCPHistoryEntryV0(self, data):
-        if hasattr(self, 'filter_SCPHistoryEntryV0'):
-            data = getattr(self, 'filter_SCPHistoryEntryV0')(data)
         if data.quorumSets is None:
             raise TypeError('data.quorumSets == None')
         self.pack_array(data.quorumSets, self.pack_SCPQuorumSet)
@@ -1452,8 +1251,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_LedgerSCPMessages(data.ledgerMessages)
 
     def pack_SCPHistoryEntry(self, data):
-        if hasattr(self, 'filter_SCPHistoryEntry'):
-            data = getattr(self, 'filter_SCPHistoryEntry')(data)
         if data.v is None:
             raise TypeError('data.v == None')
         self.pack_int(data.v)
@@ -1465,15 +1262,11 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.v)
 
     def pack_LedgerEntryChangeType(self, data):
-        if hasattr(self, 'filter_LedgerEntryChangeType'):
-            data = getattr(self, 'filter_LedgerEntryChangeType')(data)
-        if self.check_enum and data not in [const.LEDGER_ENTRY_CREATED, const.LEDGER_ENTRY_UPDATED, const.LEDGER_ENTRY_REMOVED, const.LEDGER_ENTRY_STATE]:
+        if self.check_enum and data not in _LedgerEntryChangeType_values:
             raise XDRError('value=%s not in enum LedgerEntryChangeType' % data)
         self.pack_int(data)
 
     def pack_LedgerEntryChange(self, data):
-        if hasattr(self, 'filter_LedgerEntryChange'):
-            data = getattr(self, 'filter_LedgerEntryChange')(data)
         if data.type is None:
             raise TypeError('data.type == None')
         self.pack_LedgerEntryChangeType(data.type)
@@ -1497,20 +1290,14 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.type)
 
     def pack_LedgerEntryChanges(self, data):
-        if hasattr(self, 'filter_LedgerEntryChanges'):
-            data = getattr(self, 'filter_LedgerEntryChanges')(data)
         self.pack_array(data, self.pack_LedgerEntryChange)
 
     def pack_OperationMeta(self, data):
-        if hasattr(self, 'filter_OperationMeta'):
-            data = getattr(self, 'filter_OperationMeta')(data)
         if data.changes is None:
             raise TypeError('data.changes == None')
         self.pack_LedgerEntryChanges(data.changes)
 
     def pack_TransactionMeta(self, data):
-        if hasattr(self, 'filter_TransactionMeta'):
-            data = getattr(self, 'filter_TransactionMeta')(data)
         if data.v is None:
             raise TypeError('data.v == None')
         self.pack_int(data.v)
@@ -1522,13 +1309,9 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.v)
 
     def pack_Value(self, data):
-        if hasattr(self, 'filter_Value'):
-            data = getattr(self, 'filter_Value')(data)
         self.pack_opaque(data)
 
     def pack_SCPBallot(self, data):
-        if hasattr(self, 'filter_SCPBallot'):
-            data = getattr(self, 'filter_SCPBallot')(data)
         if data.counter is None:
             raise TypeError('data.counter == None')
         self.pack_uint32(data.counter)
@@ -1537,15 +1320,11 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_Value(data.value)
 
     def pack_SCPStatementType(self, data):
-        if hasattr(self, 'filter_SCPStatementType'):
-            data = getattr(self, 'filter_SCPStatementType')(data)
-        if self.check_enum and data not in [const.SCP_ST_PREPARE, const.SCP_ST_CONFIRM, const.SCP_ST_EXTERNALIZE, const.SCP_ST_NOMINATE]:
+        if self.check_enum and data not in _SCPStatementType_values:
             raise XDRError('value=%s not in enum SCPStatementType' % data)
         self.pack_int(data)
 
     def pack_SCPNomination(self, data):
-        if hasattr(self, 'filter_SCPNomination'):
-            data = getattr(self, 'filter_SCPNomination')(data)
         if data.quorumSetHash is None:
             raise TypeError('data.quorumSetHash == None')
         self.pack_Hash(data.quorumSetHash)
@@ -1557,8 +1336,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_array(data.accepted, self.pack_Value)
 
     def pack_SCPStatement(self, data):
-        if hasattr(self, 'filter_SCPStatement'):
-            data = getattr(self, 'filter_SCPStatement')(data)
         if data.nodeID is None:
             raise TypeError('data.nodeID == None')
         self.pack_NodeID(data.nodeID)
@@ -1589,27 +1366,14 @@ class StellarXDRPacker(xdrlib.Packer):
             if len(data.pledges.prepare.preparedPrime) > 1 and self.check_array:
                 raise XDRError('array length too long for data.pledges.prepare.preparedPrime')
             self.pack_array(data.pledges.prepare.preparedPrime, self.pack_SCPBallot)
-            if data.pledges.prepare.nC is None:
-                raise TypeError('data.pledges.prepare.nC == None')
-            self.pack_uint32(data.pledges.prepare.nC)
-            if data.pledges.prepare.nH is None:
-                raise TypeError('data.pledges.prepare.nH == None')
-            self.pack_uint32(data.pledges.prepare.nH)
+            self.pack_struct(_struct_II, data.pledges.prepare.nC, data.pledges.prepare.nH)
         elif data.pledges.type == const.SCP_ST_CONFIRM:
             if data.pledges.confirm is None:
                 raise TypeError('data.pledges.confirm == None')
             if data.pledges.confirm.ballot is None:
                 raise TypeError('data.pledges.confirm.ballot == None')
             self.pack_SCPBallot(data.pledges.confirm.ballot)
-            if data.pledges.confirm.nPrepared is None:
-                raise TypeError('data.pledges.confirm.nPrepared == None')
-            self.pack_uint32(data.pledges.confirm.nPrepared)
-            if data.pledges.confirm.nCommit is None:
-                raise TypeError('data.pledges.confirm.nCommit == None')
-            self.pack_uint32(data.pledges.confirm.nCommit)
-            if data.pledges.confirm.nH is None:
-                raise TypeError('data.pledges.confirm.nH == None')
-            self.pack_uint32(data.pledges.confirm.nH)
+            self.pack_struct(_struct_III, data.pledges.confirm.nPrepared, data.pledges.confirm.nCommit, data.pledges.confirm.nH)
             if data.pledges.confirm.quorumSetHash is None:
                 raise TypeError('data.pledges.confirm.quorumSetHash == None')
             self.pack_Hash(data.pledges.confirm.quorumSetHash)
@@ -1633,8 +1397,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.pledges.type)
 
     def pack_SCPEnvelope(self, data):
-        if hasattr(self, 'filter_SCPEnvelope'):
-            data = getattr(self, 'filter_SCPEnvelope')(data)
         if data.statement is None:
             raise TypeError('data.statement == None')
         self.pack_SCPStatement(data.statement)
@@ -1643,8 +1405,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_Signature(data.signature)
 
     def pack_SCPQuorumSet(self, data):
-        if hasattr(self, 'filter_SCPQuorumSet'):
-            data = getattr(self, 'filter_SCPQuorumSet')(data)
         if data.threshold is None:
             raise TypeError('data.threshold == None')
         self.pack_uint32(data.threshold)
@@ -1656,15 +1416,11 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_array(data.innerSets, self.pack_SCPQuorumSet)
 
     def pack_ErrorCode(self, data):
-        if hasattr(self, 'filter_ErrorCode'):
-            data = getattr(self, 'filter_ErrorCode')(data)
-        if self.check_enum and data not in [const.ERR_MISC, const.ERR_DATA, const.ERR_CONF, const.ERR_AUTH, const.ERR_LOAD]:
+        if self.check_enum and data not in _ErrorCode_values:
             raise XDRError('value=%s not in enum ErrorCode' % data)
         self.pack_int(data)
 
     def pack_Error(self, data):
-        if hasattr(self, 'filter_Error'):
-            data = getattr(self, 'filter_Error')(data)
         if data.code is None:
             raise TypeError('data.code == None')
         self.pack_ErrorCode(data.code)
@@ -1675,8 +1431,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_string(data.msg)
 
     def pack_AuthCert(self, data):
-        if hasattr(self, 'filter_AuthCert'):
-            data = getattr(self, 'filter_AuthCert')(data)
         if data.pubkey is None:
             raise TypeError('data.pubkey == None')
         self.pack_Curve25519Public(data.pubkey)
@@ -1688,17 +1442,7 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_Signature(data.sig)
 
     def pack_Hello(self, data):
-        if hasattr(self, 'filter_Hello'):
-            data = getattr(self, 'filter_Hello')(data)
-        if data.ledgerVersion is None:
-            raise TypeError('data.ledgerVersion == None')
-        self.pack_uint32(data.ledgerVersion)
-        if data.overlayVersion is None:
-            raise TypeError('data.overlayVersion == None')
-        self.pack_uint32(data.overlayVersion)
-        if data.overlayMinVersion is None:
-            raise TypeError('data.overlayMinVersion == None')
-        self.pack_uint32(data.overlayMinVersion)
+        self.pack_struct(_struct_III, data.ledgerVersion, data.overlayVersion, data.overlayMinVersion)
         if data.networkID is None:
             raise TypeError('data.networkID == None')
         self.pack_Hash(data.networkID)
@@ -1721,22 +1465,16 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_uint256(data.nonce)
 
     def pack_Auth(self, data):
-        if hasattr(self, 'filter_Auth'):
-            data = getattr(self, 'filter_Auth')(data)
         if data.unused is None:
             raise TypeError('data.unused == None')
         self.pack_int(data.unused)
 
     def pack_IPAddrType(self, data):
-        if hasattr(self, 'filter_IPAddrType'):
-            data = getattr(self, 'filter_IPAddrType')(data)
-        if self.check_enum and data not in [const.IPv4, const.IPv6]:
+        if self.check_enum and data not in _IPAddrType_values:
             raise XDRError('value=%s not in enum IPAddrType' % data)
         self.pack_int(data)
 
     def pack_PeerAddress(self, data):
-        if hasattr(self, 'filter_PeerAddress'):
-            data = getattr(self, 'filter_PeerAddress')(data)
         if data.ip is None:
             raise TypeError('data.ip == None')
         if data.ip.type is None:
@@ -1752,23 +1490,14 @@ class StellarXDRPacker(xdrlib.Packer):
             self.pack_fopaque(16, data.ip.ipv6)
         else:
             raise XDRError('bad switch=%s' % data.ip.type)
-        if data.port is None:
-            raise TypeError('data.port == None')
-        self.pack_uint32(data.port)
-        if data.numFailures is None:
-            raise TypeError('data.numFailures == None')
-        self.pack_uint32(data.numFailures)
+        self.pack_struct(_struct_II, data.port, data.numFailures)
 
     def pack_MessageType(self, data):
-        if hasattr(self, 'filter_MessageType'):
-            data = getattr(self, 'filter_MessageType')(data)
-        if self.check_enum and data not in [const.ERROR_MSG, const.AUTH, const.DONT_HAVE, const.GET_PEERS, const.PEERS, const.GET_TX_SET, const.TX_SET, const.TRANSACTION, const.GET_SCP_QUORUMSET, const.SCP_QUORUMSET, const.SCP_MESSAGE, const.GET_SCP_STATE, const.HELLO]:
+        if self.check_enum and data not in _MessageType_values:
             raise XDRError('value=%s not in enum MessageType' % data)
         self.pack_int(data)
 
     def pack_DontHave(self, data):
-        if hasattr(self, 'filter_DontHave'):
-            data = getattr(self, 'filter_DontHave')(data)
         if data.type is None:
             raise TypeError('data.type == None')
         self.pack_MessageType(data.type)
@@ -1777,8 +1506,6 @@ class StellarXDRPacker(xdrlib.Packer):
         self.pack_uint256(data.reqHash)
 
     def pack_StellarMessage(self, data):
-        if hasattr(self, 'filter_StellarMessage'):
-            data = getattr(self, 'filter_StellarMessage')(data)
         if data.type is None:
             raise TypeError('data.type == None')
         self.pack_MessageType(data.type)
@@ -1836,8 +1563,6 @@ class StellarXDRPacker(xdrlib.Packer):
             raise XDRError('bad switch=%s' % data.type)
 
     def pack_AuthenticatedMessage(self, data):
-        if hasattr(self, 'filter_AuthenticatedMessage'):
-            data = getattr(self, 'filter_AuthenticatedMessage')(data)
         if data.v is None:
             raise TypeError('data.v == None')
         self.pack_uint32(data.v)
@@ -1856,33 +1581,30 @@ class StellarXDRPacker(xdrlib.Packer):
         else:
             raise XDRError('bad switch=%s' % data.v)
 
-class StellarXDRUnpacker(xdrlib.Unpacker):
+@codec.filterable
+class StellarXDRUnpacker(codec.Unpacker):
     def __init__(self, data, check_enum=True, check_array=True):
-        xdrlib.Unpacker.__init__(self, data)
+        codec.Unpacker.__init__(self, data)
         self.check_enum = check_enum
         self.check_array = check_array
 
-    unpack_bool = xdrlib.Unpacker.unpack_bool
-    unpack_unsigned = xdrlib.Unpacker.unpack_uint
-    unpack_quadruple = xdrlib.Unpacker.unpack_double
-    unpack_int = xdrlib.Unpacker.unpack_int
-    unpack_double = xdrlib.Unpacker.unpack_double
-    unpack_hyper = xdrlib.Unpacker.unpack_hyper
-    unpack_string = xdrlib.Unpacker.unpack_string
-    unpack_opaque = xdrlib.Unpacker.unpack_opaque
-    unpack_float = xdrlib.Unpacker.unpack_float
-    unpack_uint = xdrlib.Unpacker.unpack_uint
-    unpack_uhyper = xdrlib.Unpacker.unpack_uhyper
+    unpack_int = codec.Unpacker.unpack_int
+    unpack_uint = codec.Unpacker.unpack_uint
+    unpack_unsigned = codec.Unpacker.unpack_uint
+    unpack_hyper = codec.Unpacker.unpack_hyper
+    unpack_uhyper = codec.Unpacker.unpack_uhyper
+    unpack_float = codec.Unpacker.unpack_float
+    unpack_double = codec.Unpacker.unpack_double
+    unpack_quadruple = codec.Unpacker.unpack_double
+    unpack_bool = codec.Unpacker.unpack_bool
+    unpack_opaque = codec.Unpacker.unpack_opaque
+    unpack_string = codec.Unpacker.unpack_string
     def unpack_Hash(self):
         data = self.unpack_fopaque(32)
-        if hasattr(self, 'filter_Hash'):
-            data = getattr(self, 'filter_Hash')(data)
         return data
 
     def unpack_uint256(self):
         data = self.unpack_fopaque(32)
-        if hasattr(self, 'filter_uint256'):
-            data = getattr(self, 'filter_uint256')(data)
         return data
 
     unpack_uint32 = unpack_uint
@@ -1895,26 +1617,20 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
 
     def unpack_CryptoKeyType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.KEY_TYPE_ED25519, const.KEY_TYPE_PRE_AUTH_TX, const.KEY_TYPE_HASH_X]:
+        if self.check_enum and data not in _CryptoKeyType_values:
             raise XDRError('value=%s not in enum CryptoKeyType' % data)
-        if hasattr(self, 'filter_CryptoKeyType'):
-            data = getattr(self, 'filter_CryptoKeyType')(data)
         return data
 
     def unpack_PublicKeyType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.PUBLIC_KEY_TYPE_ED25519]:
+        if self.check_enum and data not in _PublicKeyType_values:
             raise XDRError('value=%s not in enum PublicKeyType' % data)
-        if hasattr(self, 'filter_PublicKeyType'):
-            data = getattr(self, 'filter_PublicKeyType')(data)
         return data
 
     def unpack_SignerKeyType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.SIGNER_KEY_TYPE_ED25519, const.SIGNER_KEY_TYPE_PRE_AUTH_TX, const.SIGNER_KEY_TYPE_HASH_X]:
+        if self.check_enum and data not in _SignerKeyType_values:
             raise XDRError('value=%s not in enum SignerKeyType' % data)
-        if hasattr(self, 'filter_SignerKeyType'):
-            data = getattr(self, 'filter_SignerKeyType')(data)
         return data
 
     def unpack_PublicKey(self):
@@ -1924,8 +1640,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.ed25519 = self.unpack_uint256()
         else:
             raise XDRError('bad switch=%s' % data.type)
-        if hasattr(self, 'filter_PublicKey'):
-            data = getattr(self, 'filter_PublicKey')(data)
         return data
 
     def unpack_SignerKey(self):
@@ -1939,22 +1653,16 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.hashX = self.unpack_uint256()
         else:
             raise XDRError('bad switch=%s' % data.type)
-        if hasattr(self, 'filter_SignerKey'):
-            data = getattr(self, 'filter_SignerKey')(data)
         return data
 
     def unpack_Signature(self):
         data = self.unpack_opaque()
         if len(data) > 64 and self.check_array:
             raise XDRError('array length too long for data')
-        if hasattr(self, 'filter_Signature'):
-            data = getattr(self, 'filter_Signature')(data)
         return data
 
     def unpack_SignatureHint(self):
         data = self.unpack_fopaque(4)
-        if hasattr(self, 'filter_SignatureHint'):
-            data = getattr(self, 'filter_SignatureHint')(data)
         return data
 
     unpack_NodeID = unpack_PublicKey
@@ -1962,53 +1670,39 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
     def unpack_Curve25519Secret(self):
         data = types.Curve25519Secret()
         data.key = self.unpack_fopaque(32)
-        if hasattr(self, 'filter_Curve25519Secret'):
-            data = getattr(self, 'filter_Curve25519Secret')(data)
         return data
 
     def unpack_Curve25519Public(self):
         data = types.Curve25519Public()
         data.key = self.unpack_fopaque(32)
-        if hasattr(self, 'filter_Curve25519Public'):
-            data = getattr(self, 'filter_Curve25519Public')(data)
         return data
 
     def unpack_HmacSha256Key(self):
         data = types.HmacSha256Key()
         data.key = self.unpack_fopaque(32)
-        if hasattr(self, 'filter_HmacSha256Key'):
-            data = getattr(self, 'filter_HmacSha256Key')(data)
         return data
 
     def unpack_HmacSha256Mac(self):
         data = types.HmacSha256Mac()
         data.mac = self.unpack_fopaque(32)
-        if hasattr(self, 'filter_HmacSha256Mac'):
-            data = getattr(self, 'filter_HmacSha256Mac')(data)
         return data
 
     unpack_AccountID = unpack_PublicKey
 
     def unpack_Thresholds(self):
         data = self.unpack_fopaque(4)
-        if hasattr(self, 'filter_Thresholds'):
-            data = getattr(self, 'filter_Thresholds')(data)
         return data
 
     def unpack_string32(self):
         data = self.unpack_string()
         if len(data) > 32 and self.check_array:
             raise XDRError('array length too long for data')
-        if hasattr(self, 'filter_string32'):
-            data = getattr(self, 'filter_string32')(data)
         return data
 
     def unpack_string64(self):
         data = self.unpack_string()
         if len(data) > 64 and self.check_array:
             raise XDRError('array length too long for data')
-        if hasattr(self, 'filter_string64'):
-            data = getattr(self, 'filter_string64')(data)
         return data
 
     unpack_SequenceNumber = unpack_uint64
@@ -2017,16 +1711,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data = self.unpack_opaque()
         if len(data) > 64 and self.check_array:
             raise XDRError('array length too long for data')
-        if hasattr(self, 'filter_DataValue'):
-            data = getattr(self, 'filter_DataValue')(data)
         return data
 
     def unpack_AssetType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.ASSET_TYPE_NATIVE, const.ASSET_TYPE_CREDIT_ALPHANUM4, const.ASSET_TYPE_CREDIT_ALPHANUM12]:
+        if self.check_enum and data not in _AssetType_values:
             raise XDRError('value=%s not in enum AssetType' % data)
-        if hasattr(self, 'filter_AssetType'):
-            data = getattr(self, 'filter_AssetType')(data)
         return data
 
     def unpack_Asset(self):
@@ -2044,56 +1734,41 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.alphaNum12.issuer = self.unpack_AccountID()
         else:
             raise XDRError('bad switch=%s' % data.type)
-        if hasattr(self, 'filter_Asset'):
-            data = getattr(self, 'filter_Asset')(data)
         return data
 
     def unpack_Price(self):
         data = types.Price()
-        data.n = self.unpack_int32()
-        data.d = self.unpack_int32()
-        if hasattr(self, 'filter_Price'):
-            data = getattr(self, 'filter_Price')(data)
+        data.n, data.d = self.unpack_struct(_struct_ii)
         return data
 
     def unpack_ThresholdIndexes(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.THRESHOLD_MASTER_WEIGHT, const.THRESHOLD_LOW, const.THRESHOLD_MED, const.THRESHOLD_HIGH]:
+        if self.check_enum and data not in _ThresholdIndexes_values:
             raise XDRError('value=%s not in enum ThresholdIndexes' % data)
-        if hasattr(self, 'filter_ThresholdIndexes'):
-            data = getattr(self, 'filter_ThresholdIndexes')(data)
         return data
 
     def unpack_LedgerEntryType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.ACCOUNT, const.TRUSTLINE, const.OFFER, const.DATA]:
+        if self.check_enum and data not in _LedgerEntryType_values:
             raise XDRError('value=%s not in enum LedgerEntryType' % data)
-        if hasattr(self, 'filter_LedgerEntryType'):
-            data = getattr(self, 'filter_LedgerEntryType')(data)
         return data
 
     def unpack_Signer(self):
         data = types.Signer()
         data.key = self.unpack_SignerKey()
         data.weight = self.unpack_uint32()
-        if hasattr(self, 'filter_Signer'):
-            data = getattr(self, 'filter_Signer')(data)
         return data
 
     def unpack_AccountFlags(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.AUTH_REQUIRED_FLAG, const.AUTH_REVOCABLE_FLAG, const.AUTH_IMMUTABLE_FLAG]:
+        if self.check_enum and data not in _AccountFlags_values:
             raise XDRError('value=%s not in enum AccountFlags' % data)
-        if hasattr(self, 'filter_AccountFlags'):
-            data = getattr(self, 'filter_AccountFlags')(data)
         return data
 
     def unpack_AccountEntry(self):
         data = types.AccountEntry()
         data.accountID = self.unpack_AccountID()
-        data.balance = self.unpack_int64()
-        data.seqNum = self.unpack_SequenceNumber()
-        data.numSubEntries = self.unpack_uint32()
+        data.balance, data.seqNum, data.numSubEntries = self.unpack_struct(_struct_qQI)
         data.inflationDest = self.unpack_array(self.unpack_AccountID)
         if len(data.inflationDest) > 1 and self.check_array:
             raise XDRError('array length too long for data.inflationDest')
@@ -2109,41 +1784,31 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError('bad switch=%s' % data.ext.v)
-        if hasattr(self, 'filter_AccountEntry'):
-            data = getattr(self, 'filter_AccountEntry')(data)
         return data
 
     def unpack_TrustLineFlags(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.AUTHORIZED_FLAG]:
+        if self.check_enum and data not in _TrustLineFlags_values:
             raise XDRError('value=%s not in enum TrustLineFlags' % data)
-        if hasattr(self, 'filter_TrustLineFlags'):
-            data = getattr(self, 'filter_TrustLineFlags')(data)
         return data
 
     def unpack_TrustLineEntry(self):
         data = types.TrustLineEntry()
         data.accountID = self.unpack_AccountID()
         data.asset = self.unpack_Asset()
-        data.balance = self.unpack_int64()
-        data.limit = self.unpack_int64()
-        data.flags = self.unpack_uint32()
+        data.balance, data.limit, data.flags = self.unpack_struct(_struct_qqI)
         data.ext = nullclass()
         data.ext.v = self.unpack_int()
         if data.ext.v == 0:
             pass
         else:
             raise XDRError('bad switch=%s' % data.ext.v)
-        if hasattr(self, 'filter_TrustLineEntry'):
-            data = getattr(self, 'filter_TrustLineEntry')(data)
         return data
 
     def unpack_OfferEntryFlags(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.PASSIVE_FLAG]:
+        if self.check_enum and data not in _OfferEntryFlags_values:
             raise XDRError('value=%s not in enum OfferEntryFlags' % data)
-        if hasattr(self, 'filter_OfferEntryFlags'):
-            data = getattr(self, 'filter_OfferEntryFlags')(data)
         return data
 
     def unpack_OfferEntry(self):
@@ -2161,8 +1826,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError('bad switch=%s' % data.ext.v)
-        if hasattr(self, 'filter_OfferEntry'):
-            data = getattr(self, 'filter_OfferEntry')(data)
         return data
 
     def unpack_DataEntry(self):
@@ -2176,8 +1839,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError('bad switch=%s' % data.ext.v)
-        if hasattr(self, 'filter_DataEntry'):
-            data = getattr(self, 'filter_DataEntry')(data)
         return data
 
     def unpack_LedgerEntry(self):
@@ -2201,40 +1862,30 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError('bad switch=%s' % data.ext.v)
-        if hasattr(self, 'filter_LedgerEntry'):
-            data = getattr(self, 'filter_LedgerEntry')(data)
         return data
 
     def unpack_EnvelopeType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.ENVELOPE_TYPE_SCP, const.ENVELOPE_TYPE_TX, const.ENVELOPE_TYPE_AUTH]:
+        if self.check_enum and data not in _EnvelopeType_values:
             raise XDRError('value=%s not in enum EnvelopeType' % data)
-        if hasattr(self, 'filter_EnvelopeType'):
-            data = getattr(self, 'filter_EnvelopeType')(data)
         return data
 
     def unpack_DecoratedSignature(self):
         data = types.DecoratedSignature()
         data.hint = self.unpack_SignatureHint()
         data.signature = self.unpack_Signature()
-        if hasattr(self, 'filter_DecoratedSignature'):
-            data = getattr(self, 'filter_DecoratedSignature')(data)
         return data
 
     def unpack_OperationType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.CREATE_ACCOUNT, const.PAYMENT, const.PATH_PAYMENT, const.MANAGE_OFFER, const.CREATE_PASSIVE_OFFER, const.SET_OPTIONS, const.CHANGE_TRUST, const.ALLOW_TRUST, const.ACCOUNT_MERGE, const.INFLATION, const.MANAGE_DATA]:
+        if self.check_enum and data not in _OperationType_values:
             raise XDRError('value=%s not in enum OperationType' % data)
-        if hasattr(self, 'filter_OperationType'):
-            data = getattr(self, 'filter_OperationType')(data)
         return data
 
     def unpack_CreateAccountOp(self):
         data = types.CreateAccountOp()
         data.destination = self.unpack_AccountID()
         data.startingBalance = self.unpack_int64()
-        if hasattr(self, 'filter_CreateAccountOp'):
-            data = getattr(self, 'filter_CreateAccountOp')(data)
         return data
 
     def unpack_PaymentOp(self):
@@ -2242,8 +1893,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.destination = self.unpack_AccountID()
         data.asset = self.unpack_Asset()
         data.amount = self.unpack_int64()
-        if hasattr(self, 'filter_PaymentOp'):
-            data = getattr(self, 'filter_PaymentOp')(data)
         return data
 
     def unpack_PathPaymentOp(self):
@@ -2256,8 +1905,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.path = self.unpack_array(self.unpack_Asset)
         if len(data.path) > 5 and self.check_array:
             raise XDRError('array length too long for data.path')
-        if hasattr(self, 'filter_PathPaymentOp'):
-            data = getattr(self, 'filter_PathPaymentOp')(data)
         return data
 
     def unpack_ManageOfferOp(self):
@@ -2267,8 +1914,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.amount = self.unpack_int64()
         data.price = self.unpack_Price()
         data.offerID = self.unpack_uint64()
-        if hasattr(self, 'filter_ManageOfferOp'):
-            data = getattr(self, 'filter_ManageOfferOp')(data)
         return data
 
     def unpack_CreatePassiveOfferOp(self):
@@ -2277,8 +1922,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.buying = self.unpack_Asset()
         data.amount = self.unpack_int64()
         data.price = self.unpack_Price()
-        if hasattr(self, 'filter_CreatePassiveOfferOp'):
-            data = getattr(self, 'filter_CreatePassiveOfferOp')(data)
         return data
 
     def unpack_SetOptionsOp(self):
@@ -2310,16 +1953,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.signer = self.unpack_array(self.unpack_Signer)
         if len(data.signer) > 1 and self.check_array:
             raise XDRError('array length too long for data.signer')
-        if hasattr(self, 'filter_SetOptionsOp'):
-            data = getattr(self, 'filter_SetOptionsOp')(data)
         return data
 
     def unpack_ChangeTrustOp(self):
         data = types.ChangeTrustOp()
         data.line = self.unpack_Asset()
         data.limit = self.unpack_int64()
-        if hasattr(self, 'filter_ChangeTrustOp'):
-            data = getattr(self, 'filter_ChangeTrustOp')(data)
         return data
 
     def unpack_AllowTrustOp(self):
@@ -2334,8 +1973,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         else:
             raise XDRError('bad switch=%s' % data.asset.type)
         data.authorize = self.unpack_bool()
-        if hasattr(self, 'filter_AllowTrustOp'):
-            data = getattr(self, 'filter_AllowTrustOp')(data)
         return data
 
     def unpack_ManageDataOp(self):
@@ -2344,8 +1981,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.dataValue = self.unpack_array(self.unpack_DataValue)
         if len(data.dataValue) > 1 and self.check_array:
             raise XDRError('array length too long for data.dataValue')
-        if hasattr(self, 'filter_ManageDataOp'):
-            data = getattr(self, 'filter_ManageDataOp')(data)
         return data
 
     def unpack_Operation(self):
@@ -2379,16 +2014,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.body.manageDataOp = self.unpack_ManageDataOp()
         else:
             raise XDRError('bad switch=%s' % data.body.type)
-        if hasattr(self, 'filter_Operation'):
-            data = getattr(self, 'filter_Operation')(data)
         return data
 
     def unpack_MemoType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.MEMO_NONE, const.MEMO_TEXT, const.MEMO_ID, const.MEMO_HASH, const.MEMO_RETURN]:
+        if self.check_enum and data not in _MemoType_values:
             raise XDRError('value=%s not in enum MemoType' % data)
-        if hasattr(self, 'filter_MemoType'):
-            data = getattr(self, 'filter_MemoType')(data)
         return data
 
     def unpack_Memo(self):
@@ -2408,23 +2039,17 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.retHash = self.unpack_Hash()
         else:
             raise XDRError('bad switch=%s' % data.type)
-        if hasattr(self, 'filter_Memo'):
-            data = getattr(self, 'filter_Memo')(data)
         return data
 
     def unpack_TimeBounds(self):
         data = types.TimeBounds()
-        data.minTime = self.unpack_uint64()
-        data.maxTime = self.unpack_uint64()
-        if hasattr(self, 'filter_TimeBounds'):
-            data = getattr(self, 'filter_TimeBounds')(data)
+        data.minTime, data.maxTime = self.unpack_struct(_struct_QQ)
         return data
 
     def unpack_Transaction(self):
         data = types.Transaction()
         data.sourceAccount = self.unpack_AccountID()
-        data.fee = self.unpack_uint32()
-        data.seqNum = self.unpack_SequenceNumber()
+        data.fee, data.seqNum = self.unpack_struct(_struct_IQ)
         data.timeBounds = self.unpack_array(self.unpack_TimeBounds)
         if len(data.timeBounds) > 1 and self.check_array:
             raise XDRError('array length too long for data.timeBounds')
@@ -2438,8 +2063,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError('bad switch=%s' % data.ext.v)
-        if hasattr(self, 'filter_Transaction'):
-            data = getattr(self, 'filter_Transaction')(data)
         return data
 
     def unpack_TransactionSignaturePayload(self):
@@ -2451,8 +2074,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.taggedTransaction.tx = self.unpack_Transaction()
         else:
             raise XDRError('bad switch=%s' % data.taggedTransaction.type)
-        if hasattr(self, 'filter_TransactionSignaturePayload'):
-            data = getattr(self, 'filter_TransactionSignaturePayload')(data)
         return data
 
     def unpack_TransactionEnvelope(self):
@@ -2461,8 +2082,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.signatures = self.unpack_array(self.unpack_DecoratedSignature)
         if len(data.signatures) > 20 and self.check_array:
             raise XDRError('array length too long for data.signatures')
-        if hasattr(self, 'filter_TransactionEnvelope'):
-            data = getattr(self, 'filter_TransactionEnvelope')(data)
         return data
 
     def unpack_ClaimOfferAtom(self):
@@ -2473,16 +2092,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.amountSold = self.unpack_int64()
         data.assetBought = self.unpack_Asset()
         data.amountBought = self.unpack_int64()
-        if hasattr(self, 'filter_ClaimOfferAtom'):
-            data = getattr(self, 'filter_ClaimOfferAtom')(data)
         return data
 
     def unpack_CreateAccountResultCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.CREATE_ACCOUNT_SUCCESS, const.CREATE_ACCOUNT_MALFORMED, const.CREATE_ACCOUNT_UNDERFUNDED, const.CREATE_ACCOUNT_LOW_RESERVE, const.CREATE_ACCOUNT_ALREADY_EXIST]:
+        if self.check_enum and data not in _CreateAccountResultCode_values:
             raise XDRError('value=%s not in enum CreateAccountResultCode' % data)
-        if hasattr(self, 'filter_CreateAccountResultCode'):
-            data = getattr(self, 'filter_CreateAccountResultCode')(data)
         return data
 
     def unpack_CreateAccountResult(self):
@@ -2492,16 +2107,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             pass
-        if hasattr(self, 'filter_CreateAccountResult'):
-            data = getattr(self, 'filter_CreateAccountResult')(data)
         return data
 
     def unpack_PaymentResultCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.PAYMENT_SUCCESS, const.PAYMENT_MALFORMED, const.PAYMENT_UNDERFUNDED, const.PAYMENT_SRC_NO_TRUST, const.PAYMENT_SRC_NOT_AUTHORIZED, const.PAYMENT_NO_DESTINATION, const.PAYMENT_NO_TRUST, const.PAYMENT_NOT_AUTHORIZED, const.PAYMENT_LINE_FULL, const.PAYMENT_NO_ISSUER]:
+        if self.check_enum and data not in _PaymentResultCode_values:
             raise XDRError('value=%s not in enum PaymentResultCode' % data)
-        if hasattr(self, 'filter_PaymentResultCode'):
-            data = getattr(self, 'filter_PaymentResultCode')(data)
         return data
 
     def unpack_PaymentResult(self):
@@ -2511,16 +2122,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             pass
-        if hasattr(self, 'filter_PaymentResult'):
-            data = getattr(self, 'filter_PaymentResult')(data)
         return data
 
     def unpack_PathPaymentResultCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.PATH_PAYMENT_SUCCESS, const.PATH_PAYMENT_MALFORMED, const.PATH_PAYMENT_UNDERFUNDED, const.PATH_PAYMENT_SRC_NO_TRUST, const.PATH_PAYMENT_SRC_NOT_AUTHORIZED, const.PATH_PAYMENT_NO_DESTINATION, const.PATH_PAYMENT_NO_TRUST, const.PATH_PAYMENT_NOT_AUTHORIZED, const.PATH_PAYMENT_LINE_FULL, const.PATH_PAYMENT_NO_ISSUER, const.PATH_PAYMENT_TOO_FEW_OFFERS, const.PATH_PAYMENT_OFFER_CROSS_SELF, const.PATH_PAYMENT_OVER_SENDMAX]:
+        if self.check_enum and data not in _PathPaymentResultCode_values:
             raise XDRError('value=%s not in enum PathPaymentResultCode' % data)
-        if hasattr(self, 'filter_PathPaymentResultCode'):
-            data = getattr(self, 'filter_PathPaymentResultCode')(data)
         return data
 
     def unpack_SimplePaymentResult(self):
@@ -2528,8 +2135,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.destination = self.unpack_AccountID()
         data.asset = self.unpack_Asset()
         data.amount = self.unpack_int64()
-        if hasattr(self, 'filter_SimplePaymentResult'):
-            data = getattr(self, 'filter_SimplePaymentResult')(data)
         return data
 
     def unpack_PathPaymentResult(self):
@@ -2543,24 +2148,18 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.noIssuer = self.unpack_Asset()
         else:
             pass
-        if hasattr(self, 'filter_PathPaymentResult'):
-            data = getattr(self, 'filter_PathPaymentResult')(data)
         return data
 
     def unpack_ManageOfferResultCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.MANAGE_OFFER_SUCCESS, const.MANAGE_OFFER_MALFORMED, const.MANAGE_OFFER_SELL_NO_TRUST, const.MANAGE_OFFER_BUY_NO_TRUST, const.MANAGE_OFFER_SELL_NOT_AUTHORIZED, const.MANAGE_OFFER_BUY_NOT_AUTHORIZED, const.MANAGE_OFFER_LINE_FULL, const.MANAGE_OFFER_UNDERFUNDED, const.MANAGE_OFFER_CROSS_SELF, const.MANAGE_OFFER_SELL_NO_ISSUER, const.MANAGE_OFFER_BUY_NO_ISSUER, const.MANAGE_OFFER_NOT_FOUND, const.MANAGE_OFFER_LOW_RESERVE]:
+        if self.check_enum and data not in _ManageOfferResultCode_values:
             raise XDRError('value=%s not in enum ManageOfferResultCode' % data)
-        if hasattr(self, 'filter_ManageOfferResultCode'):
-            data = getattr(self, 'filter_ManageOfferResultCode')(data)
         return data
 
     def unpack_ManageOfferEffect(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.MANAGE_OFFER_CREATED, const.MANAGE_OFFER_UPDATED, const.MANAGE_OFFER_DELETED]:
+        if self.check_enum and data not in _ManageOfferEffect_values:
             raise XDRError('value=%s not in enum ManageOfferEffect' % data)
-        if hasattr(self, 'filter_ManageOfferEffect'):
-            data = getattr(self, 'filter_ManageOfferEffect')(data)
         return data
 
     def unpack_ManageOfferSuccessResult(self):
@@ -2572,8 +2171,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.offer.offer = self.unpack_OfferEntry()
         else:
             pass
-        if hasattr(self, 'filter_ManageOfferSuccessResult'):
-            data = getattr(self, 'filter_ManageOfferSuccessResult')(data)
         return data
 
     def unpack_ManageOfferResult(self):
@@ -2583,16 +2180,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.success = self.unpack_ManageOfferSuccessResult()
         else:
             pass
-        if hasattr(self, 'filter_ManageOfferResult'):
-            data = getattr(self, 'filter_ManageOfferResult')(data)
         return data
 
     def unpack_SetOptionsResultCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.SET_OPTIONS_SUCCESS, const.SET_OPTIONS_LOW_RESERVE, const.SET_OPTIONS_TOO_MANY_SIGNERS, const.SET_OPTIONS_BAD_FLAGS, const.SET_OPTIONS_INVALID_INFLATION, const.SET_OPTIONS_CANT_CHANGE, const.SET_OPTIONS_UNKNOWN_FLAG, const.SET_OPTIONS_THRESHOLD_OUT_OF_RANGE, const.SET_OPTIONS_BAD_SIGNER, const.SET_OPTIONS_INVALID_HOME_DOMAIN]:
+        if self.check_enum and data not in _SetOptionsResultCode_values:
             raise XDRError('value=%s not in enum SetOptionsResultCode' % data)
-        if hasattr(self, 'filter_SetOptionsResultCode'):
-            data = getattr(self, 'filter_SetOptionsResultCode')(data)
         return data
 
     def unpack_SetOptionsResult(self):
@@ -2602,16 +2195,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             pass
-        if hasattr(self, 'filter_SetOptionsResult'):
-            data = getattr(self, 'filter_SetOptionsResult')(data)
         return data
 
     def unpack_ChangeTrustResultCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.CHANGE_TRUST_SUCCESS, const.CHANGE_TRUST_MALFORMED, const.CHANGE_TRUST_NO_ISSUER, const.CHANGE_TRUST_INVALID_LIMIT, const.CHANGE_TRUST_LOW_RESERVE, const.CHANGE_TRUST_SELF_NOT_ALLOWED]:
+        if self.check_enum and data not in _ChangeTrustResultCode_values:
             raise XDRError('value=%s not in enum ChangeTrustResultCode' % data)
-        if hasattr(self, 'filter_ChangeTrustResultCode'):
-            data = getattr(self, 'filter_ChangeTrustResultCode')(data)
         return data
 
     def unpack_ChangeTrustResult(self):
@@ -2621,16 +2210,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             pass
-        if hasattr(self, 'filter_ChangeTrustResult'):
-            data = getattr(self, 'filter_ChangeTrustResult')(data)
         return data
 
     def unpack_AllowTrustResultCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.ALLOW_TRUST_SUCCESS, const.ALLOW_TRUST_MALFORMED, const.ALLOW_TRUST_NO_TRUST_LINE, const.ALLOW_TRUST_TRUST_NOT_REQUIRED, const.ALLOW_TRUST_CANT_REVOKE, const.ALLOW_TRUST_SELF_NOT_ALLOWED]:
+        if self.check_enum and data not in _AllowTrustResultCode_values:
             raise XDRError('value=%s not in enum AllowTrustResultCode' % data)
-        if hasattr(self, 'filter_AllowTrustResultCode'):
-            data = getattr(self, 'filter_AllowTrustResultCode')(data)
         return data
 
     def unpack_AllowTrustResult(self):
@@ -2640,16 +2225,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             pass
-        if hasattr(self, 'filter_AllowTrustResult'):
-            data = getattr(self, 'filter_AllowTrustResult')(data)
         return data
 
     def unpack_AccountMergeResultCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.ACCOUNT_MERGE_SUCCESS, const.ACCOUNT_MERGE_MALFORMED, const.ACCOUNT_MERGE_NO_ACCOUNT, const.ACCOUNT_MERGE_IMMUTABLE_SET, const.ACCOUNT_MERGE_HAS_SUB_ENTRIES]:
+        if self.check_enum and data not in _AccountMergeResultCode_values:
             raise XDRError('value=%s not in enum AccountMergeResultCode' % data)
-        if hasattr(self, 'filter_AccountMergeResultCode'):
-            data = getattr(self, 'filter_AccountMergeResultCode')(data)
         return data
 
     def unpack_AccountMergeResult(self):
@@ -2659,24 +2240,18 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.sourceAccountBalance = self.unpack_int64()
         else:
             pass
-        if hasattr(self, 'filter_AccountMergeResult'):
-            data = getattr(self, 'filter_AccountMergeResult')(data)
         return data
 
     def unpack_InflationResultCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.INFLATION_SUCCESS, const.INFLATION_NOT_TIME]:
+        if self.check_enum and data not in _InflationResultCode_values:
             raise XDRError('value=%s not in enum InflationResultCode' % data)
-        if hasattr(self, 'filter_InflationResultCode'):
-            data = getattr(self, 'filter_InflationResultCode')(data)
         return data
 
     def unpack_InflationPayout(self):
         data = types.InflationPayout()
         data.destination = self.unpack_AccountID()
         data.amount = self.unpack_int64()
-        if hasattr(self, 'filter_InflationPayout'):
-            data = getattr(self, 'filter_InflationPayout')(data)
         return data
 
     def unpack_InflationResult(self):
@@ -2686,16 +2261,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.payouts = self.unpack_array(self.unpack_InflationPayout)
         else:
             pass
-        if hasattr(self, 'filter_InflationResult'):
-            data = getattr(self, 'filter_InflationResult')(data)
         return data
 
     def unpack_ManageDataResultCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.MANAGE_DATA_SUCCESS, const.MANAGE_DATA_NOT_SUPPORTED_YET, const.MANAGE_DATA_NAME_NOT_FOUND, const.MANAGE_DATA_LOW_RESERVE, const.MANAGE_DATA_INVALID_NAME]:
+        if self.check_enum and data not in _ManageDataResultCode_values:
             raise XDRError('value=%s not in enum ManageDataResultCode' % data)
-        if hasattr(self, 'filter_ManageDataResultCode'):
-            data = getattr(self, 'filter_ManageDataResultCode')(data)
         return data
 
     def unpack_ManageDataResult(self):
@@ -2705,16 +2276,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             pass
-        if hasattr(self, 'filter_ManageDataResult'):
-            data = getattr(self, 'filter_ManageDataResult')(data)
         return data
 
     def unpack_OperationResultCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.opINNER, const.opBAD_AUTH, const.opNO_ACCOUNT]:
+        if self.check_enum and data not in _OperationResultCode_values:
             raise XDRError('value=%s not in enum OperationResultCode' % data)
-        if hasattr(self, 'filter_OperationResultCode'):
-            data = getattr(self, 'filter_OperationResultCode')(data)
         return data
 
     def unpack_OperationResult(self):
@@ -2749,16 +2316,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
                 raise XDRError('bad switch=%s' % data.tr.type)
         else:
             pass
-        if hasattr(self, 'filter_OperationResult'):
-            data = getattr(self, 'filter_OperationResult')(data)
         return data
 
     def unpack_TransactionResultCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.txSUCCESS, const.txFAILED, const.txTOO_EARLY, const.txTOO_LATE, const.txMISSING_OPERATION, const.txBAD_SEQ, const.txBAD_AUTH, const.txINSUFFICIENT_BALANCE, const.txNO_ACCOUNT, const.txINSUFFICIENT_FEE, const.txBAD_AUTH_EXTRA, const.txINTERNAL_ERROR]:
+        if self.check_enum and data not in _TransactionResultCode_values:
             raise XDRError('value=%s not in enum TransactionResultCode' % data)
-        if hasattr(self, 'filter_TransactionResultCode'):
-            data = getattr(self, 'filter_TransactionResultCode')(data)
         return data
 
     def unpack_TransactionResult(self):
@@ -2776,16 +2339,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError('bad switch=%s' % data.ext.v)
-        if hasattr(self, 'filter_TransactionResult'):
-            data = getattr(self, 'filter_TransactionResult')(data)
         return data
 
     def unpack_UpgradeType(self):
         data = self.unpack_opaque()
         if len(data) > 128 and self.check_array:
             raise XDRError('array length too long for data')
-        if hasattr(self, 'filter_UpgradeType'):
-            data = getattr(self, 'filter_UpgradeType')(data)
         return data
 
     def unpack_StellarValue(self):
@@ -2801,8 +2360,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError('bad switch=%s' % data.ext.v)
-        if hasattr(self, 'filter_StellarValue'):
-            data = getattr(self, 'filter_StellarValue')(data)
         return data
 
     def unpack_LedgerHeader(self):
@@ -2812,14 +2369,7 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.scpValue = self.unpack_StellarValue()
         data.txSetResultHash = self.unpack_Hash()
         data.bucketListHash = self.unpack_Hash()
-        data.ledgerSeq = self.unpack_uint32()
-        data.totalCoins = self.unpack_int64()
-        data.feePool = self.unpack_int64()
-        data.inflationSeq = self.unpack_uint32()
-        data.idPool = self.unpack_uint64()
-        data.baseFee = self.unpack_uint32()
-        data.baseReserve = self.unpack_uint32()
-        data.maxTxSetSize = self.unpack_uint32()
+        data.ledgerSeq, data.totalCoins, data.feePool, data.inflationSeq, data.idPool, data.baseFee, data.baseReserve, data.maxTxSetSize = self.unpack_struct(_struct_IqqIQIII)
         data.skipList = self.unpack_farray(4, self.unpack_Hash)
         data.ext = nullclass()
         data.ext.v = self.unpack_int()
@@ -2827,16 +2377,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError('bad switch=%s' % data.ext.v)
-        if hasattr(self, 'filter_LedgerHeader'):
-            data = getattr(self, 'filter_LedgerHeader')(data)
         return data
 
     def unpack_LedgerUpgradeType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.LEDGER_UPGRADE_VERSION, const.LEDGER_UPGRADE_BASE_FEE, const.LEDGER_UPGRADE_MAX_TX_SET_SIZE]:
+        if self.check_enum and data not in _LedgerUpgradeType_values:
             raise XDRError('value=%s not in enum LedgerUpgradeType' % data)
-        if hasattr(self, 'filter_LedgerUpgradeType'):
-            data = getattr(self, 'filter_LedgerUpgradeType')(data)
         return data
 
     def unpack_LedgerUpgrade(self):
@@ -2850,8 +2396,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.newMaxTxSetSize = self.unpack_uint32()
         else:
             raise XDRError('bad switch=%s' % data.type)
-        if hasattr(self, 'filter_LedgerUpgrade'):
-            data = getattr(self, 'filter_LedgerUpgrade')(data)
         return data
 
     def unpack_LedgerKey(self):
@@ -2874,16 +2418,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.data.dataName = self.unpack_string64()
         else:
             raise XDRError('bad switch=%s' % data.type)
-        if hasattr(self, 'filter_LedgerKey'):
-            data = getattr(self, 'filter_LedgerKey')(data)
         return data
 
     def unpack_BucketEntryType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.LIVEENTRY, const.DEADENTRY]:
+        if self.check_enum and data not in _BucketEntryType_values:
             raise XDRError('value=%s not in enum BucketEntryType' % data)
-        if hasattr(self, 'filter_BucketEntryType'):
-            data = getattr(self, 'filter_BucketEntryType')(data)
         return data
 
     def unpack_BucketEntry(self):
@@ -2895,31 +2435,23 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.deadEntry = self.unpack_LedgerKey()
         else:
             raise XDRError('bad switch=%s' % data.type)
-        if hasattr(self, 'filter_BucketEntry'):
-            data = getattr(self, 'filter_BucketEntry')(data)
         return data
 
     def unpack_TransactionSet(self):
         data = types.TransactionSet()
         data.previousLedgerHash = self.unpack_Hash()
         data.txs = self.unpack_array(self.unpack_TransactionEnvelope)
-        if hasattr(self, 'filter_TransactionSet'):
-            data = getattr(self, 'filter_TransactionSet')(data)
         return data
 
     def unpack_TransactionResultPair(self):
         data = types.TransactionResultPair()
         data.transactionHash = self.unpack_Hash()
         data.result = self.unpack_TransactionResult()
-        if hasattr(self, 'filter_TransactionResultPair'):
-            data = getattr(self, 'filter_TransactionResultPair')(data)
         return data
 
     def unpack_TransactionResultSet(self):
         data = types.TransactionResultSet()
         data.results = self.unpack_array(self.unpack_TransactionResultPair)
-        if hasattr(self, 'filter_TransactionResultSet'):
-            data = getattr(self, 'filter_TransactionResultSet')(data)
         return data
 
     def unpack_TransactionHistoryEntry(self):
@@ -2932,8 +2464,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError('bad switch=%s' % data.ext.v)
-        if hasattr(self, 'filter_TransactionHistoryEntry'):
-            data = getattr(self, 'filter_TransactionHistoryEntry')(data)
         return data
 
     def unpack_TransactionHistoryResultEntry(self):
@@ -2946,8 +2476,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError('bad switch=%s' % data.ext.v)
-        if hasattr(self, 'filter_TransactionHistoryResultEntry'):
-            data = getattr(self, 'filter_TransactionHistoryResultEntry')(data)
         return data
 
     def unpack_LedgerHeaderHistoryEntry(self):
@@ -2960,24 +2488,18 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError('bad switch=%s' % data.ext.v)
-        if hasattr(self, 'filter_LedgerHeaderHistoryEntry'):
-            data = getattr(self, 'filter_LedgerHeaderHistoryEntry')(data)
         return data
 
     def unpack_LedgerSCPMessages(self):
         data = types.LedgerSCPMessages()
         data.ledgerSeq = self.unpack_uint32()
         data.messages = self.unpack_array(self.unpack_SCPEnvelope)
-        if hasattr(self, 'filter_LedgerSCPMessages'):
-            data = getattr(self, 'filter_LedgerSCPMessages')(data)
         return data
 
     def unpack_SCPHistoryEntryV0(self):
         data = types.SCPHistoryEntryV0()
         data.quorumSets = self.unpack_array(self.unpack_SCPQuorumSet)
         data.ledgerMessages = self.unpack_LedgerSCPMessages()
-        if hasattr(self, 'filter_SCPHistoryEntryV0'):
-            data = getattr(self, 'filter_SCPHistoryEntryV0')(data)
         return data
 
     def unpack_SCPHistoryEntry(self):
@@ -2987,16 +2509,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.v0 = self.unpack_SCPHistoryEntryV0()
         else:
             raise XDRError('bad switch=%s' % data.v)
-        if hasattr(self, 'filter_SCPHistoryEntry'):
-            data = getattr(self, 'filter_SCPHistoryEntry')(data)
         return data
 
     def unpack_LedgerEntryChangeType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.LEDGER_ENTRY_CREATED, const.LEDGER_ENTRY_UPDATED, const.LEDGER_ENTRY_REMOVED, const.LEDGER_ENTRY_STATE]:
+        if self.check_enum and data not in _LedgerEntryChangeType_values:
             raise XDRError('value=%s not in enum LedgerEntryChangeType' % data)
-        if hasattr(self, 'filter_LedgerEntryChangeType'):
-            data = getattr(self, 'filter_LedgerEntryChangeType')(data)
         return data
 
     def unpack_LedgerEntryChange(self):
@@ -3012,21 +2530,15 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.state = self.unpack_LedgerEntry()
         else:
             raise XDRError('bad switch=%s' % data.type)
-        if hasattr(self, 'filter_LedgerEntryChange'):
-            data = getattr(self, 'filter_LedgerEntryChange')(data)
         return data
 
     def unpack_LedgerEntryChanges(self):
         data = self.unpack_array(self.unpack_LedgerEntryChange)
-        if hasattr(self, 'filter_LedgerEntryChanges'):
-            data = getattr(self, 'filter_LedgerEntryChanges')(data)
         return data
 
     def unpack_OperationMeta(self):
         data = types.OperationMeta()
         data.changes = self.unpack_LedgerEntryChanges()
-        if hasattr(self, 'filter_OperationMeta'):
-            data = getattr(self, 'filter_OperationMeta')(data)
         return data
 
     def unpack_TransactionMeta(self):
@@ -3036,30 +2548,22 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.operations = self.unpack_array(self.unpack_OperationMeta)
         else:
             raise XDRError('bad switch=%s' % data.v)
-        if hasattr(self, 'filter_TransactionMeta'):
-            data = getattr(self, 'filter_TransactionMeta')(data)
         return data
 
     def unpack_Value(self):
         data = self.unpack_opaque()
-        if hasattr(self, 'filter_Value'):
-            data = getattr(self, 'filter_Value')(data)
         return data
 
     def unpack_SCPBallot(self):
         data = types.SCPBallot()
         data.counter = self.unpack_uint32()
         data.value = self.unpack_Value()
-        if hasattr(self, 'filter_SCPBallot'):
-            data = getattr(self, 'filter_SCPBallot')(data)
         return data
 
     def unpack_SCPStatementType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.SCP_ST_PREPARE, const.SCP_ST_CONFIRM, const.SCP_ST_EXTERNALIZE, const.SCP_ST_NOMINATE]:
+        if self.check_enum and data not in _SCPStatementType_values:
             raise XDRError('value=%s not in enum SCPStatementType' % data)
-        if hasattr(self, 'filter_SCPStatementType'):
-            data = getattr(self, 'filter_SCPStatementType')(data)
         return data
 
     def unpack_SCPNomination(self):
@@ -3067,8 +2571,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.quorumSetHash = self.unpack_Hash()
         data.votes = self.unpack_array(self.unpack_Value)
         data.accepted = self.unpack_array(self.unpack_Value)
-        if hasattr(self, 'filter_SCPNomination'):
-            data = getattr(self, 'filter_SCPNomination')(data)
         return data
 
     def unpack_SCPStatement(self):
@@ -3087,14 +2589,11 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.pledges.prepare.preparedPrime = self.unpack_array(self.unpack_SCPBallot)
             if len(data.pledges.prepare.preparedPrime) > 1 and self.check_array:
                 raise XDRError('array length too long for data.pledges.prepare.preparedPrime')
-            data.pledges.prepare.nC = self.unpack_uint32()
-            data.pledges.prepare.nH = self.unpack_uint32()
+            data.pledges.prepare.nC, data.pledges.prepare.nH = self.unpack_struct(_struct_II)
         elif data.pledges.type == const.SCP_ST_CONFIRM:
             data.pledges.confirm = nullclass()
             data.pledges.confirm.ballot = self.unpack_SCPBallot()
-            data.pledges.confirm.nPrepared = self.unpack_uint32()
-            data.pledges.confirm.nCommit = self.unpack_uint32()
-            data.pledges.confirm.nH = self.unpack_uint32()
+            data.pledges.confirm.nPrepared, data.pledges.confirm.nCommit, data.pledges.confirm.nH = self.unpack_struct(_struct_III)
             data.pledges.confirm.quorumSetHash = self.unpack_Hash()
         elif data.pledges.type == const.SCP_ST_EXTERNALIZE:
             data.pledges.externalize = nullclass()
@@ -3105,16 +2604,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.pledges.nominate = self.unpack_SCPNomination()
         else:
             raise XDRError('bad switch=%s' % data.pledges.type)
-        if hasattr(self, 'filter_SCPStatement'):
-            data = getattr(self, 'filter_SCPStatement')(data)
         return data
 
     def unpack_SCPEnvelope(self):
         data = types.SCPEnvelope()
         data.statement = self.unpack_SCPStatement()
         data.signature = self.unpack_Signature()
-        if hasattr(self, 'filter_SCPEnvelope'):
-            data = getattr(self, 'filter_SCPEnvelope')(data)
         return data
 
     def unpack_SCPQuorumSet(self):
@@ -3122,16 +2617,12 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.threshold = self.unpack_uint32()
         data.validators = self.unpack_array(self.unpack_PublicKey)
         data.innerSets = self.unpack_array(self.unpack_SCPQuorumSet)
-        if hasattr(self, 'filter_SCPQuorumSet'):
-            data = getattr(self, 'filter_SCPQuorumSet')(data)
         return data
 
     def unpack_ErrorCode(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.ERR_MISC, const.ERR_DATA, const.ERR_CONF, const.ERR_AUTH, const.ERR_LOAD]:
+        if self.check_enum and data not in _ErrorCode_values:
             raise XDRError('value=%s not in enum ErrorCode' % data)
-        if hasattr(self, 'filter_ErrorCode'):
-            data = getattr(self, 'filter_ErrorCode')(data)
         return data
 
     def unpack_Error(self):
@@ -3140,8 +2631,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.msg = self.unpack_string()
         if len(data.msg) > 100 and self.check_array:
             raise XDRError('array length too long for data.msg')
-        if hasattr(self, 'filter_Error'):
-            data = getattr(self, 'filter_Error')(data)
         return data
 
     def unpack_AuthCert(self):
@@ -3149,15 +2638,11 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.pubkey = self.unpack_Curve25519Public()
         data.expiration = self.unpack_uint64()
         data.sig = self.unpack_Signature()
-        if hasattr(self, 'filter_AuthCert'):
-            data = getattr(self, 'filter_AuthCert')(data)
         return data
 
     def unpack_Hello(self):
         data = types.Hello()
-        data.ledgerVersion = self.unpack_uint32()
-        data.overlayVersion = self.unpack_uint32()
-        data.overlayMinVersion = self.unpack_uint32()
+        data.ledgerVersion, data.overlayVersion, data.overlayMinVersion = self.unpack_struct(_struct_III)
         data.networkID = self.unpack_Hash()
         data.versionStr = self.unpack_string()
         if len(data.versionStr) > 100 and self.check_array:
@@ -3166,23 +2651,17 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
         data.peerID = self.unpack_NodeID()
         data.cert = self.unpack_AuthCert()
         data.nonce = self.unpack_uint256()
-        if hasattr(self, 'filter_Hello'):
-            data = getattr(self, 'filter_Hello')(data)
         return data
 
     def unpack_Auth(self):
         data = types.Auth()
         data.unused = self.unpack_int()
-        if hasattr(self, 'filter_Auth'):
-            data = getattr(self, 'filter_Auth')(data)
         return data
 
     def unpack_IPAddrType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.IPv4, const.IPv6]:
+        if self.check_enum and data not in _IPAddrType_values:
             raise XDRError('value=%s not in enum IPAddrType' % data)
-        if hasattr(self, 'filter_IPAddrType'):
-            data = getattr(self, 'filter_IPAddrType')(data)
         return data
 
     def unpack_PeerAddress(self):
@@ -3195,26 +2674,19 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.ip.ipv6 = self.unpack_fopaque(16)
         else:
             raise XDRError('bad switch=%s' % data.ip.type)
-        data.port = self.unpack_uint32()
-        data.numFailures = self.unpack_uint32()
-        if hasattr(self, 'filter_PeerAddress'):
-            data = getattr(self, 'filter_PeerAddress')(data)
+        data.port, data.numFailures = self.unpack_struct(_struct_II)
         return data
 
     def unpack_MessageType(self):
         data = self.unpack_int()
-        if self.check_enum and data not in [const.ERROR_MSG, const.AUTH, const.DONT_HAVE, const.GET_PEERS, const.PEERS, const.GET_TX_SET, const.TX_SET, const.TRANSACTION, const.GET_SCP_QUORUMSET, const.SCP_QUORUMSET, const.SCP_MESSAGE, const.GET_SCP_STATE, const.HELLO]:
+        if self.check_enum and data not in _MessageType_values:
             raise XDRError('value=%s not in enum MessageType' % data)
-        if hasattr(self, 'filter_MessageType'):
-            data = getattr(self, 'filter_MessageType')(data)
         return data
 
     def unpack_DontHave(self):
         data = types.DontHave()
         data.type = self.unpack_MessageType()
         data.reqHash = self.unpack_uint256()
-        if hasattr(self, 'filter_DontHave'):
-            data = getattr(self, 'filter_DontHave')(data)
         return data
 
     def unpack_StellarMessage(self):
@@ -3248,8 +2720,6 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.getSCPLedgerSeq = self.unpack_uint32()
         else:
             raise XDRError('bad switch=%s' % data.type)
-        if hasattr(self, 'filter_StellarMessage'):
-            data = getattr(self, 'filter_StellarMessage')(data)
         return data
 
     def unpack_AuthenticatedMessage(self):
@@ -3262,7 +2732,5 @@ class StellarXDRUnpacker(xdrlib.Unpacker):
             data.v0.mac = self.unpack_HmacSha256Mac()
         else:
             raise XDRError('bad switch=%s' % data.v)
-        if hasattr(self, 'filter_AuthenticatedMessage'):
-            data = getattr(self, 'filter_AuthenticatedMessage')(data)
         return data
 
@@ -1,18 +1,29 @@
-# Generated by xdrgen.py from ../xdr on Mon Feb 13 22:40:23 2017
+# Generated by xdrgen.py from StellarXDR.x on Sun Oct 18 18:57:13 2026
 from . import StellarXDR_const as const
+from operator import attrgetter
+
+def _void(data):
+    return None
+
 class PublicKey:
     # XDR definition:
     # union PublicKey switch(PublicKeyType type) {
     #     case PUBLIC_KEY_TYPE_ED25519:
     #         uint256 ed25519;
     # };
+    __slots__ = ('type', 'ed25519')
     def __init__(self, type=None, ed25519=None):
         self.type = type
         self.ed25519 = ed25519
 
-    switch = property(lambda s: {const.PUBLIC_KEY_TYPE_ED25519:s.ed25519,}[s.type])
+    _arms = {
+        const.PUBLIC_KEY_TYPE_ED25519: attrgetter('ed25519'),
+    }
+    switch = property(lambda s: s._arms[s.type](s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -34,15 +45,23 @@ class SignerKey:
     #     case SIGNER_KEY_TYPE_HASH_X:
     #         uint256 hashX;
     # };
+    __slots__ = ('type', 'ed25519', 'preAuthTx', 'hashX')
     def __init__(self, type=None, ed25519=None, preAuthTx=None, hashX=None):
         self.type = type
         self.ed25519 = ed25519
         self.preAuthTx = preAuthTx
         self.hashX = hashX
 
-    switch = property(lambda s: {const.SIGNER_KEY_TYPE_ED25519:s.ed25519,const.SIGNER_KEY_TYPE_PRE_AUTH_TX:s.preAuthTx,const.SIGNER_KEY_TYPE_HASH_X:s.hashX,}[s.type])
+    _arms = {
+        const.SIGNER_KEY_TYPE_ED25519: attrgetter('ed25519'),
+        const.SIGNER_KEY_TYPE_PRE_AUTH_TX: attrgetter('preAuthTx'),
+        const.SIGNER_KEY_TYPE_HASH_X: attrgetter('hashX'),
+    }
+    switch = property(lambda s: s._arms[s.type](s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -64,6 +83,7 @@ class Curve25519Secret:
     # struct Curve25519Secret {
     #     opaque key[32];
     # };
+    __slots__ = ('key',)
     def __init__(self, key=None):
         self.key = key
 
@@ -79,6 +99,7 @@ class Curve25519Public:
     # struct Curve25519Public {
     #     opaque key[32];
     # };
+    __slots__ = ('key',)
     def __init__(self, key=None):
         self.key = key
 
@@ -94,6 +115,7 @@ class HmacSha256Key:
     # struct HmacSha256Key {
     #     opaque key[32];
     # };
+    __slots__ = ('key',)
     def __init__(self, key=None):
         self.key = key
 
@@ -109,6 +131,7 @@ class HmacSha256Mac:
     # struct HmacSha256Mac {
     #     opaque mac[32];
     # };
+    __slots__ = ('mac',)
     def __init__(self, mac=None):
         self.mac = mac
 
@@ -136,14 +159,22 @@ class Asset:
     #             AccountID issuer;
     #         } alphaNum12;
     # };
+    __slots__ = ('type', 'alphaNum4', 'alphaNum12')
     def __init__(self, type=None, alphaNum4=None, alphaNum12=None):
         self.type = type
         self.alphaNum4 = alphaNum4
         self.alphaNum12 = alphaNum12
 
-    switch = property(lambda s: {const.ASSET_TYPE_NATIVE:None,const.ASSET_TYPE_CREDIT_ALPHANUM4:s.alphaNum4,const.ASSET_TYPE_CREDIT_ALPHANUM12:s.alphaNum12,}[s.type])
+    _arms = {
+        const.ASSET_TYPE_NATIVE: _void,
+        const.ASSET_TYPE_CREDIT_ALPHANUM4: attrgetter('alphaNum4'),
+        const.ASSET_TYPE_CREDIT_ALPHANUM12: attrgetter('alphaNum12'),
+    }
+    switch = property(lambda s: s._arms[s.type](s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -163,6 +194,7 @@ class Price:
     #     int32 n;
     #     int32 d;
     # };
+    __slots__ = ('n', 'd')
     def __init__(self, n=None, d=None):
         self.n = n
         self.d = d
@@ -182,11 +214,14 @@ class Signer:
     #     SignerKey key;
     #     uint32 weight;
     # };
+    __slots__ = ('key', 'weight')
     def __init__(self, key=None, weight=None):
         self.key = key
         self.weight = weight
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.key, attr)
 
     def __repr__(self):
@@ -215,6 +250,7 @@ class AccountEntry:
     #             void;
     #     } ext;
     # };
+    __slots__ = ('accountID', 'balance', 'seqNum', 'numSubEntries', 'inflationDest', 'flags', 'homeDomain', 'thresholds', 'signers', 'ext')
     def __init__(self, accountID=None, balance=None, seqNum=None, numSubEntries=None, inflationDest=None, flags=None, homeDomain=None, thresholds=None, signers=None, ext=None):
         self.accountID = accountID
         self.balance = balance
@@ -265,6 +301,7 @@ class TrustLineEntry:
     #             void;
     #     } ext;
     # };
+    __slots__ = ('accountID', 'asset', 'balance', 'limit', 'flags', 'ext')
     def __init__(self, accountID=None, asset=None, balance=None, limit=None, flags=None, ext=None):
         self.accountID = accountID
         self.asset = asset
@@ -305,6 +342,7 @@ class OfferEntry:
     #             void;
     #     } ext;
     # };
+    __slots__ = ('sellerID', 'offerID', 'selling', 'buying', 'amount', 'price', 'flags', 'ext')
     def __init__(self, sellerID=None, offerID=None, selling=None, buying=None, amount=None, price=None, flags=None, ext=None):
         self.sellerID = sellerID
         self.offerID = offerID
@@ -347,6 +385,7 @@ class DataEntry:
     #             void;
     #     } ext;
     # };
+    __slots__ = ('accountID', 'dataName', 'dataValue', 'ext')
     def __init__(self, accountID=None, dataName=None, dataValue=None, ext=None):
         self.accountID = accountID
         self.dataName = dataName
@@ -385,6 +424,7 @@ class LedgerEntry:
     #             void;
     #     } ext;
     # };
+    __slots__ = ('lastModifiedLedgerSeq', 'data', 'ext')
     def __init__(self, lastModifiedLedgerSeq=None, data=None, ext=None):
         self.lastModifiedLedgerSeq = lastModifiedLedgerSeq
         self.data = data
@@ -407,6 +447,7 @@ class DecoratedSignature:
     #     SignatureHint hint;
     #     Signature signature;
     # };
+    __slots__ = ('hint', 'signature')
     def __init__(self, hint=None, signature=None):
         self.hint = hint
         self.signature = signature
@@ -426,11 +467,14 @@ class CreateAccountOp:
     #     AccountID destination;
     #     int64 startingBalance;
     # };
+    __slots__ = ('destination', 'startingBalance')
     def __init__(self, destination=None, startingBalance=None):
         self.destination = destination
         self.startingBalance = startingBalance
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.destination, attr)
 
     def __repr__(self):
@@ -449,6 +493,7 @@ class PaymentOp:
     #     Asset asset;
     #     int64 amount;
     # };
+    __slots__ = ('destination', 'asset', 'amount')
     def __init__(self, destination=None, asset=None, amount=None):
         self.destination = destination
         self.asset = asset
@@ -475,6 +520,7 @@ class PathPaymentOp:
     #     int64 destAmount;
     #     Asset path<5>;
     # };
+    __slots__ = ('sendAsset', 'sendMax', 'destination', 'destAsset', 'destAmount', 'path')
     def __init__(self, sendAsset=None, sendMax=None, destination=None, destAsset=None, destAmount=None, path=None):
         self.sendAsset = sendAsset
         self.sendMax = sendMax
@@ -509,6 +555,7 @@ class ManageOfferOp:
     #     Price price;
     #     uint64 offerID;
     # };
+    __slots__ = ('selling', 'buying', 'amount', 'price', 'offerID')
     def __init__(self, selling=None, buying=None, amount=None, price=None, offerID=None):
         self.selling = selling
         self.buying = buying
@@ -539,6 +586,7 @@ class CreatePassiveOfferOp:
     #     int64 amount;
     #     Price price;
     # };
+    __slots__ = ('selling', 'buying', 'amount', 'price')
     def __init__(self, selling=None, buying=None, amount=None, price=None):
         self.selling = selling
         self.buying = buying
@@ -571,6 +619,7 @@ class SetOptionsOp:
     #     string32 homeDomain<1>;
     #     Signer signer<1>;
     # };
+    __slots__ = ('inflationDest', 'clearFlags', 'setFlags', 'masterWeight', 'lowThreshold', 'medThreshold', 'highThreshold', 'homeDomain', 'signer')
     def __init__(self, inflationDest=None, clearFlags=None, setFlags=None, masterWeight=None, lowThreshold=None, medThreshold=None, highThreshold=None, homeDomain=None, signer=None):
         self.inflationDest = inflationDest
         self.clearFlags = clearFlags
@@ -611,11 +660,14 @@ class ChangeTrustOp:
     #     Asset line;
     #     int64 limit;
     # };
+    __slots__ = ('line', 'limit')
     def __init__(self, line=None, limit=None):
         self.line = line
         self.limit = limit
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.line, attr)
 
     def __repr__(self):
@@ -639,6 +691,7 @@ class AllowTrustOp:
     #     } asset;
     #     bool authorize;
     # };
+    __slots__ = ('trustor', 'asset', 'authorize')
     def __init__(self, trustor=None, asset=None, authorize=None):
         self.trustor = trustor
         self.asset = asset
@@ -661,6 +714,7 @@ class ManageDataOp:
     #     string64 dataName;
     #     DataValue dataValue<1>;
     # };
+    __slots__ = ('dataName', 'dataValue')
     def __init__(self, dataName=None, dataValue=None):
         self.dataName = dataName
         self.dataValue = dataValue
@@ -703,11 +757,14 @@ class Operation:
     #             ManageDataOp manageDataOp;
     #     } body;
     # };
+    __slots__ = ('sourceAccount', 'body')
     def __init__(self, sourceAccount=None, body=None):
         self.sourceAccount = sourceAccount
         self.body = body
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.body, attr)
 
     def __repr__(self):
@@ -733,6 +790,7 @@ class Memo:
     #     case MEMO_RETURN:
     #         Hash retHash;
     # };
+    __slots__ = ('type', 'text', 'id', 'hash', 'retHash')
     def __init__(self, type=None, text=None, id=None, hash=None, retHash=None):
         self.type = type
         self.text = text
@@ -740,9 +798,18 @@ class Memo:
         self.hash = hash
         self.retHash = retHash
 
-    switch = property(lambda s: {const.MEMO_NONE:None,const.MEMO_TEXT:s.text,const.MEMO_ID:s.id,const.MEMO_HASH:s.hash,const.MEMO_RETURN:s.retHash,}[s.type])
+    _arms = {
+        const.MEMO_NONE: _void,
+        const.MEMO_TEXT: attrgetter('text'),
+        const.MEMO_ID: attrgetter('id'),
+        const.MEMO_HASH: attrgetter('hash'),
+        const.MEMO_RETURN: attrgetter('retHash'),
+    }
+    switch = property(lambda s: s._arms[s.type](s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -766,6 +833,7 @@ class TimeBounds:
     #     uint64 minTime;
     #     uint64 maxTime;
     # };
+    __slots__ = ('minTime', 'maxTime')
     def __init__(self, minTime=None, maxTime=None):
         self.minTime = minTime
         self.maxTime = maxTime
@@ -793,6 +861,7 @@ class Transaction:
     #             void;
     #     } ext;
     # };
+    __slots__ = ('sourceAccount', 'fee', 'seqNum', 'timeBounds', 'memo', 'operations', 'ext')
     def __init__(self, sourceAccount=None, fee=None, seqNum=None, timeBounds=None, memo=None, operations=None, ext=None):
         self.sourceAccount = sourceAccount
         self.fee = fee
@@ -830,11 +899,14 @@ class TransactionSignaturePayload:
     #             Transaction tx;
     #     } taggedTransaction;
     # };
+    __slots__ = ('networkId', 'taggedTransaction')
     def __init__(self, networkId=None, taggedTransaction=None):
         self.networkId = networkId
         self.taggedTransaction = taggedTransaction
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.taggedTransaction, attr)
 
     def __repr__(self):
@@ -852,11 +924,14 @@ class TransactionEnvelope:
     #     Transaction tx;
     #     DecoratedSignature signatures<20>;
     # };
+    __slots__ = ('tx', 'signatures')
     def __init__(self, tx=None, signatures=None):
         self.tx = tx
         self.signatures = signatures
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.tx, attr)
 
     def __repr__(self):
@@ -878,6 +953,7 @@ class ClaimOfferAtom:
     #     Asset assetBought;
     #     int64 amountBought;
     # };
+    __slots__ = ('sellerID', 'offerID', 'assetSold', 'amountSold', 'assetBought', 'amountBought')
     def __init__(self, sellerID=None, offerID=None, assetSold=None, amountSold=None, assetBought=None, amountBought=None):
         self.sellerID = sellerID
         self.offerID = offerID
@@ -911,12 +987,19 @@ class CreateAccountResult:
     #     default:
     #         void;
     # };
+    __slots__ = ('code',)
     def __init__(self, code=None):
         self.code = code
 
-    switch = property(lambda s: {const.CREATE_ACCOUNT_SUCCESS:None,}.get(s.code, None))
+    _arms = {
+        const.CREATE_ACCOUNT_SUCCESS: _void,
+    }
+    _default = staticmethod(_void)
+    switch = property(lambda s: s._arms.get(s.code, s._default)(s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -934,12 +1017,19 @@ class PaymentResult:
     #     default:
     #         void;
     # };
+    __slots__ = ('code',)
     def __init__(self, code=None):
         self.code = code
 
-    switch = property(lambda s: {const.PAYMENT_SUCCESS:None,}.get(s.code, None))
+    _arms = {
+        const.PAYMENT_SUCCESS: _void,
+    }
+    _default = staticmethod(_void)
+    switch = property(lambda s: s._arms.get(s.code, s._default)(s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -956,6 +1046,7 @@ class SimplePaymentResult:
     #     Asset asset;
     #     int64 amount;
     # };
+    __slots__ = ('destination', 'asset', 'amount')
     def __init__(self, destination=None, asset=None, amount=None):
         self.destination = destination
         self.asset = asset
@@ -985,14 +1076,22 @@ class PathPaymentResult:
     #     default:
     #         void;
     # };
+    __slots__ = ('code', 'success', 'noIssuer')
     def __init__(self, code=None, success=None, noIssuer=None):
         self.code = code
         self.success = success
         self.noIssuer = noIssuer
 
-    switch = property(lambda s: {const.PATH_PAYMENT_SUCCESS:s.success,const.PATH_PAYMENT_NO_ISSUER:s.noIssuer,}.get(s.code, None))
+    _arms = {
+        const.PATH_PAYMENT_SUCCESS: attrgetter('success'),
+        const.PATH_PAYMENT_NO_ISSUER: attrgetter('noIssuer'),
+    }
+    _default = staticmethod(_void)
+    switch = property(lambda s: s._arms.get(s.code, s._default)(s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1018,11 +1117,14 @@ class ManageOfferSuccessResult:
     #             void;
     #     } offer;
     # };
+    __slots__ = ('offersClaimed', 'offer')
     def __init__(self, offersClaimed=None, offer=None):
         self.offersClaimed = offersClaimed
         self.offer = offer
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.offer, attr)
 
     def __repr__(self):
@@ -1042,13 +1144,20 @@ class ManageOfferResult:
     #     default:
     #         void;
     # };
+    __slots__ = ('code', 'success')
     def __init__(self, code=None, success=None):
         self.code = code
         self.success = success
 
-    switch = property(lambda s: {const.MANAGE_OFFER_SUCCESS:s.success,}.get(s.code, None))
+    _arms = {
+        const.MANAGE_OFFER_SUCCESS: attrgetter('success'),
+    }
+    _default = staticmethod(_void)
+    switch = property(lambda s: s._arms.get(s.code, s._default)(s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1068,12 +1177,19 @@ class SetOptionsResult:
     #     default:
     #         void;
     # };
+    __slots__ = ('code',)
     def __init__(self, code=None):
         self.code = code
 
-    switch = property(lambda s: {const.SET_OPTIONS_SUCCESS:None,}.get(s.code, None))
+    _arms = {
+        const.SET_OPTIONS_SUCCESS: _void,
+    }
+    _default = staticmethod(_void)
+    switch = property(lambda s: s._arms.get(s.code, s._default)(s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1091,12 +1207,19 @@ class ChangeTrustResult:
     #     default:
     #         void;
     # };
+    __slots__ = ('code',)
     def __init__(self, code=None):
         self.code = code
 
-    switch = property(lambda s: {const.CHANGE_TRUST_SUCCESS:None,}.get(s.code, None))
+    _arms = {
+        const.CHANGE_TRUST_SUCCESS: _void,
+    }
+    _default = staticmethod(_void)
+    switch = property(lambda s: s._arms.get(s.code, s._default)(s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1114,12 +1237,19 @@ class AllowTrustResult:
     #     default:
     #         void;
     # };
+    __slots__ = ('code',)
     def __init__(self, code=None):
         self.code = code
 
-    switch = property(lambda s: {const.ALLOW_TRUST_SUCCESS:None,}.get(s.code, None))
+    _arms = {
+        const.ALLOW_TRUST_SUCCESS: _void,
+    }
+    _default = staticmethod(_void)
+    switch = property(lambda s: s._arms.get(s.code, s._default)(s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1137,13 +1267,20 @@ class AccountMergeResult:
     #     default:
     #         void;
     # };
+    __slots__ = ('code', 'sourceAccountBalance')
     def __init__(self, code=None, sourceAccountBalance=None):
         self.code = code
         self.sourceAccountBalance = sourceAccountBalance
 
-    switch = property(lambda s: {const.ACCOUNT_MERGE_SUCCESS:s.sourceAccountBalance,}.get(s.code, None))
+    _arms = {
+        const.ACCOUNT_MERGE_SUCCESS: attrgetter('sourceAccountBalance'),
+    }
+    _default = staticmethod(_void)
+    switch = property(lambda s: s._arms.get(s.code, s._default)(s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1161,11 +1298,14 @@ class InflationPayout:
     #     AccountID destination;
     #     int64 amount;
     # };
+    __slots__ = ('destination', 'amount')
     def __init__(self, destination=None, amount=None):
         self.destination = destination
         self.amount = amount
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.destination, attr)
 
     def __repr__(self):
@@ -1185,13 +1325,20 @@ class InflationResult:
     #     default:
     #         void;
     # };
+    __slots__ = ('code', 'payouts')
     def __init__(self, code=None, payouts=None):
         self.code = code
         self.payouts = payouts
 
-    switch = property(lambda s: {const.INFLATION_SUCCESS:s.payouts,}.get(s.code, None))
+    _arms = {
+        const.INFLATION_SUCCESS: attrgetter('payouts'),
+    }
+    _default = staticmethod(_void)
+    switch = property(lambda s: s._arms.get(s.code, s._default)(s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1211,12 +1358,19 @@ class ManageDataResult:
     #     default:
     #         void;
     # };
+    __slots__ = ('code',)
     def __init__(self, code=None):
         self.code = code
 
-    switch = property(lambda s: {const.MANAGE_DATA_SUCCESS:None,}.get(s.code, None))
+    _arms = {
+        const.MANAGE_DATA_SUCCESS: _void,
+    }
+    _default = staticmethod(_void)
+    switch = property(lambda s: s._arms.get(s.code, s._default)(s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1257,13 +1411,20 @@ class OperationResult:
     #     default:
     #         void;
     # };
+    __slots__ = ('code', 'tr')
     def __init__(self, code=None, tr=None):
         self.code = code
         self.tr = tr
 
-    switch = property(lambda s: {const.opINNER:s.tr,}.get(s.code, None))
+    _arms = {
+        const.opINNER: attrgetter('tr'),
+    }
+    _default = staticmethod(_void)
+    switch = property(lambda s: s._arms.get(s.code, s._default)(s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1291,6 +1452,7 @@ class TransactionResult:
     #             void;
     #     } ext;
     # };
+    __slots__ = ('feeCharged', 'result', 'ext')
     def __init__(self, feeCharged=None, result=None, ext=None):
         self.feeCharged = feeCharged
         self.result = result
@@ -1318,6 +1480,7 @@ class StellarValue:
     #             void;
     #     } ext;
     # };
+    __slots__ = ('txSetHash', 'closeTime', 'upgrades', 'ext')
     def __init__(self, txSetHash=None, closeTime=None, upgrades=None, ext=None):
         self.txSetHash = txSetHash
         self.closeTime = closeTime
@@ -1325,6 +1488,8 @@ class StellarValue:
         self.ext = ext
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.ext, attr)
 
     def __repr__(self):
@@ -1362,6 +1527,7 @@ class LedgerHeader:
     #             void;
     #     } ext;
     # };
+    __slots__ = ('ledgerVersion', 'previousLedgerHash', 'scpValue', 'txSetResultHash', 'bucketListHash', 'ledgerSeq', 'totalCoins', 'feePool', 'inflationSeq', 'idPool', 'baseFee', 'baseReserve', 'maxTxSetSize', 'skipList', 'ext')
     def __init__(self, ledgerVersion=None, previousLedgerHash=None, scpValue=None, txSetResultHash=None, bucketListHash=None, ledgerSeq=None, totalCoins=None, feePool=None, inflationSeq=None, idPool=None, baseFee=None, baseReserve=None, maxTxSetSize=None, skipList=None, ext=None):
         self.ledgerVersion = ledgerVersion
         self.previousLedgerHash = previousLedgerHash
@@ -1424,15 +1590,23 @@ class LedgerUpgrade:
     #     case LEDGER_UPGRADE_MAX_TX_SET_SIZE:
     #         uint32 newMaxTxSetSize;
     # };
+    __slots__ = ('type', 'newLedgerVersion', 'newBaseFee', 'newMaxTxSetSize')
     def __init__(self, type=None, newLedgerVersion=None, newBaseFee=None, newMaxTxSetSize=None):
         self.type = type
         self.newLedgerVersion = newLedgerVersion
         self.newBaseFee = newBaseFee
         self.newMaxTxSetSize = newMaxTxSetSize
 
-    switch = property(lambda s: {const.LEDGER_UPGRADE_VERSION:s.newLedgerVersion,const.LEDGER_UPGRADE_BASE_FEE:s.newBaseFee,const.LEDGER_UPGRADE_MAX_TX_SET_SIZE:s.newMaxTxSetSize,}[s.type])
+    _arms = {
+        const.LEDGER_UPGRADE_VERSION: attrgetter('newLedgerVersion'),
+        const.LEDGER_UPGRADE_BASE_FEE: attrgetter('newBaseFee'),
+        const.LEDGER_UPGRADE_MAX_TX_SET_SIZE: attrgetter('newMaxTxSetSize'),
+    }
+    switch = property(lambda s: s._arms[s.type](s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1471,6 +1645,7 @@ class LedgerKey:
     #             string64 dataName;
     #         } data;
     # };
+    __slots__ = ('type', 'account', 'trustLine', 'offer', 'data')
     def __init__(self, type=None, account=None, trustLine=None, offer=None, data=None):
         self.type = type
         self.account = account
@@ -1478,9 +1653,17 @@ class LedgerKey:
         self.offer = offer
         self.data = data
 
-    switch = property(lambda s: {const.ACCOUNT:s.account,const.TRUSTLINE:s.trustLine,const.OFFER:s.offer,const.DATA:s.data,}[s.type])
+    _arms = {
+        const.ACCOUNT: attrgetter('account'),
+        const.TRUSTLINE: attrgetter('trustLine'),
+        const.OFFER: attrgetter('offer'),
+        const.DATA: attrgetter('data'),
+    }
+    switch = property(lambda s: s._arms[s.type](s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1506,14 +1689,21 @@ class BucketEntry:
     #     case DEADENTRY:
     #         LedgerKey deadEntry;
     # };
+    __slots__ = ('type', 'liveEntry', 'deadEntry')
     def __init__(self, type=None, liveEntry=None, deadEntry=None):
         self.type = type
         self.liveEntry = liveEntry
         self.deadEntry = deadEntry
 
-    switch = property(lambda s: {const.LIVEENTRY:s.liveEntry,const.DEADENTRY:s.deadEntry,}[s.type])
+    _arms = {
+        const.LIVEENTRY: attrgetter('liveEntry'),
+        const.DEADENTRY: attrgetter('deadEntry'),
+    }
+    switch = property(lambda s: s._arms[s.type](s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1533,6 +1723,7 @@ class TransactionSet:
     #     Hash previousLedgerHash;
     #     TransactionEnvelope txs<>;
     # };
+    __slots__ = ('previousLedgerHash', 'txs')
     def __init__(self, previousLedgerHash=None, txs=None):
         self.previousLedgerHash = previousLedgerHash
         self.txs = txs
@@ -1552,11 +1743,14 @@ class TransactionResultPair:
     #     Hash transactionHash;
     #     TransactionResult result;
     # };
+    __slots__ = ('transactionHash', 'result')
     def __init__(self, transactionHash=None, result=None):
         self.transactionHash = transactionHash
         self.result = result
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.result, attr)
 
     def __repr__(self):
@@ -1573,6 +1767,7 @@ class TransactionResultSet:
     # struct TransactionResultSet {
     #     TransactionResultPair results<>;
     # };
+    __slots__ = ('results',)
     def __init__(self, results=None):
         self.results = results
 
@@ -1593,6 +1788,7 @@ class TransactionHistoryEntry:
     #             void;
     #     } ext;
     # };
+    __slots__ = ('ledgerSeq', 'txSet', 'ext')
     def __init__(self, ledgerSeq=None, txSet=None, ext=None):
         self.ledgerSeq = ledgerSeq
         self.txSet = txSet
@@ -1619,6 +1815,7 @@ class TransactionHistoryResultEntry:
     #             void;
     #     } ext;
     # };
+    __slots__ = ('ledgerSeq', 'txResultSet', 'ext')
     def __init__(self, ledgerSeq=None, txResultSet=None, ext=None):
         self.ledgerSeq = ledgerSeq
         self.txResultSet = txResultSet
@@ -1645,6 +1842,7 @@ class LedgerHeaderHistoryEntry:
     #             void;
     #     } ext;
     # };
+    __slots__ = ('hash', 'header', 'ext')
     def __init__(self, hash=None, header=None, ext=None):
         self.hash = hash
         self.header = header
@@ -1667,6 +1865,7 @@ class LedgerSCPMessages:
     #     uint32 ledgerSeq;
     #     SCPEnvelope messages<>;
     # };
+    __slots__ = ('ledgerSeq', 'messages')
     def __init__(self, ledgerSeq=None, messages=None):
         self.ledgerSeq = ledgerSeq
         self.messages = messages
@@ -1686,11 +1885,14 @@ class SCPHistoryEntryV0:
     #     SCPQuorumSet quorumSets<>;
     #     LedgerSCPMessages ledgerMessages;
     # };
+    __slots__ = ('quorumSets', 'ledgerMessages')
     def __init__(self, quorumSets=None, ledgerMessages=None):
         self.quorumSets = quorumSets
         self.ledgerMessages = ledgerMessages
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.ledgerMessages, attr)
 
     def __repr__(self):
@@ -1708,13 +1910,19 @@ class SCPHistoryEntry:
     #     case 0:
     #         SCPHistoryEntryV0 v0;
     # };
+    __slots__ = ('v', 'v0')
     def __init__(self, v=None, v0=None):
         self.v = v
         self.v0 = v0
 
-    switch = property(lambda s: {0:s.v0,}[s.v])
+    _arms = {
+        0: attrgetter('v0'),
+    }
+    switch = property(lambda s: s._arms[s.v](s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1738,6 +1946,7 @@ class LedgerEntryChange:
     #     case LEDGER_ENTRY_STATE:
     #         LedgerEntry state;
     # };
+    __slots__ = ('type', 'created', 'updated', 'removed', 'state')
     def __init__(self, type=None, created=None, updated=None, removed=None, state=None):
         self.type = type
         self.created = created
@@ -1745,9 +1954,17 @@ class LedgerEntryChange:
         self.removed = removed
         self.state = state
 
-    switch = property(lambda s: {const.LEDGER_ENTRY_CREATED:s.created,const.LEDGER_ENTRY_UPDATED:s.updated,const.LEDGER_ENTRY_REMOVED:s.removed,const.LEDGER_ENTRY_STATE:s.state,}[s.type])
+    _arms = {
+        const.LEDGER_ENTRY_CREATED: attrgetter('created'),
+        const.LEDGER_ENTRY_UPDATED: attrgetter('updated'),
+        const.LEDGER_ENTRY_REMOVED: attrgetter('removed'),
+        const.LEDGER_ENTRY_STATE: attrgetter('state'),
+    }
+    switch = property(lambda s: s._arms[s.type](s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1770,6 +1987,7 @@ class OperationMeta:
     # struct OperationMeta {
     #     LedgerEntryChanges changes;
     # };
+    __slots__ = ('changes',)
     def __init__(self, changes=None):
         self.changes = changes
 
@@ -1786,13 +2004,19 @@ class TransactionMeta:
     #     case 0:
     #         OperationMeta operations<>;
     # };
+    __slots__ = ('v', 'operations')
     def __init__(self, v=None, operations=None):
         self.v = v
         self.operations = operations
 
-    switch = property(lambda s: {0:s.operations,}[s.v])
+    _arms = {
+        0: attrgetter('operations'),
+    }
+    switch = property(lambda s: s._arms[s.v](s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -1810,6 +2034,7 @@ class SCPBallot:
     #     uint32 counter;
     #     Value value;
     # };
+    __slots__ = ('counter', 'value')
     def __init__(self, counter=None, value=None):
         self.counter = counter
         self.value = value
@@ -1830,6 +2055,7 @@ class SCPNomination:
     #     Value votes<>;
     #     Value accepted<>;
     # };
+    __slots__ = ('quorumSetHash', 'votes', 'accepted')
     def __init__(self, quorumSetHash=None, votes=None, accepted=None):
         self.quorumSetHash = quorumSetHash
         self.votes = votes
@@ -1879,6 +2105,7 @@ class SCPStatement:
     #             SCPNomination nominate;
     #     } pledges;
     # };
+    __slots__ = ('nodeID', 'slotIndex', 'pledges')
     def __init__(self, nodeID=None, slotIndex=None, pledges=None):
         self.nodeID = nodeID
         self.slotIndex = slotIndex
@@ -1901,11 +2128,14 @@ class SCPEnvelope:
     #     SCPStatement statement;
     #     Signature signature;
     # };
+    __slots__ = ('statement', 'signature')
     def __init__(self, statement=None, signature=None):
         self.statement = statement
         self.signature = signature
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.statement, attr)
 
     def __repr__(self):
@@ -1924,6 +2154,7 @@ class SCPQuorumSet:
     #     PublicKey validators<>;
     #     SCPQuorumSet innerSets<>;
     # };
+    __slots__ = ('threshold', 'validators', 'innerSets')
     def __init__(self, threshold=None, validators=None, innerSets=None):
         self.threshold = threshold
         self.validators = validators
@@ -1946,6 +2177,7 @@ class Error:
     #     ErrorCode code;
     #     string msg<100>;
     # };
+    __slots__ = ('code', 'msg')
     def __init__(self, code=None, msg=None):
         self.code = code
         self.msg = msg
@@ -1966,12 +2198,15 @@ class AuthCert:
     #     uint64 expiration;
     #     Signature sig;
     # };
+    __slots__ = ('pubkey', 'expiration', 'sig')
     def __init__(self, pubkey=None, expiration=None, sig=None):
         self.pubkey = pubkey
         self.expiration = expiration
         self.sig = sig
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.pubkey, attr)
 
     def __repr__(self):
@@ -1998,6 +2233,7 @@ class Hello:
     #     AuthCert cert;
     #     uint256 nonce;
     # };
+    __slots__ = ('ledgerVersion', 'overlayVersion', 'overlayMinVersion', 'networkID', 'versionStr', 'listeningPort', 'peerID', 'cert', 'nonce')
     def __init__(self, ledgerVersion=None, overlayVersion=None, overlayMinVersion=None, networkID=None, versionStr=None, listeningPort=None, peerID=None, cert=None, nonce=None):
         self.ledgerVersion = ledgerVersion
         self.overlayVersion = overlayVersion
@@ -2037,6 +2273,7 @@ class Auth:
     # struct Auth {
     #     int unused;
     # };
+    __slots__ = ('unused',)
     def __init__(self, unused=None):
         self.unused = unused
 
@@ -2059,12 +2296,15 @@ class PeerAddress:
     #     uint32 port;
     #     uint32 numFailures;
     # };
+    __slots__ = ('ip', 'port', 'numFailures')
     def __init__(self, ip=None, port=None, numFailures=None):
         self.ip = ip
         self.port = port
         self.numFailures = numFailures
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.ip, attr)
 
     def __repr__(self):
@@ -2084,6 +2324,7 @@ class DontHave:
     #     MessageType type;
     #     uint256 reqHash;
     # };
+    __slots__ = ('type', 'reqHash')
     def __init__(self, type=None, reqHash=None):
         self.type = type
         self.reqHash = reqHash
@@ -2127,6 +2368,7 @@ class StellarMessage:
     #     case GET_SCP_STATE:
     #         uint32 getSCPLedgerSeq;
     # };
+    __slots__ = ('type', 'error', 'hello', 'auth', 'dontHave', 'peers', 'txSetHash', 'txSet', 'transaction', 'qSetHash', 'qSet', 'envelope', 'getSCPLedgerSeq')
     def __init__(self, type=None, error=None, hello=None, auth=None, dontHave=None, peers=None, txSetHash=None, txSet=None, transaction=None, qSetHash=None, qSet=None, envelope=None, getSCPLedgerSeq=None):
         self.type = type
         self.error = error
@@ -2142,9 +2384,26 @@ class StellarMessage:
         self.envelope = envelope
         self.getSCPLedgerSeq = getSCPLedgerSeq
 
-    switch = property(lambda s: {const.ERROR_MSG:s.error,const.HELLO:s.hello,const.AUTH:s.auth,const.DONT_HAVE:s.dontHave,const.GET_PEERS:None,const.PEERS:s.peers,const.GET_TX_SET:s.txSetHash,const.TX_SET:s.txSet,const.TRANSACTION:s.transaction,const.GET_SCP_QUORUMSET:s.qSetHash,const.SCP_QUORUMSET:s.qSet,const.SCP_MESSAGE:s.envelope,const.GET_SCP_STATE:s.getSCPLedgerSeq,}[s.type])
+    _arms = {
+        const.ERROR_MSG: attrgetter('error'),
+        const.HELLO: attrgetter('hello'),
+        const.AUTH: attrgetter('auth'),
+        const.DONT_HAVE: attrgetter('dontHave'),
+        const.GET_PEERS: _void,
+        const.PEERS: attrgetter('peers'),
+        const.GET_TX_SET: attrgetter('txSetHash'),
+        const.TX_SET: attrgetter('txSet'),
+        const.TRANSACTION: attrgetter('transaction'),
+        const.GET_SCP_QUORUMSET: attrgetter('qSetHash'),
+        const.SCP_QUORUMSET: attrgetter('qSet'),
+        const.SCP_MESSAGE: attrgetter('envelope'),
+        const.GET_SCP_STATE: attrgetter('getSCPLedgerSeq'),
+    }
+    switch = property(lambda s: s._arms[s.type](s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
@@ -2188,13 +2447,19 @@ class AuthenticatedMessage:
     #             HmacSha256Mac mac;
     #         } v0;
     # };
+    __slots__ = ('v', 'v0')
     def __init__(self, v=None, v0=None):
         self.v = v
         self.v0 = v0
 
-    switch = property(lambda s: {0:s.v0,}[s.v])
+    _arms = {
+        0: attrgetter('v0'),
+    }
+    switch = property(lambda s: s._arms[s.v](s))
 
     def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         return getattr(self.switch, attr)
 
     def __repr__(self):
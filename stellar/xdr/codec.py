@@ -0,0 +1,318 @@
+"""
+XDR packer and unpacker (RFC 4506) used as base classes of generated
+StellarXDRPacker and StellarXDRUnpacker.
+
+API is same as of xdrlib.Packer/Unpacker (which is deprecated and removed
+in recent python), and produces byte-identical output. Values are written
+with precompiled struct.Struct objects directly into growable bytearray,
+instead of building output through many small writes.
+"""
+import struct
+import functools
+
+_int = struct.Struct('>i')
+_uint = struct.Struct('>I')
+_hyper = struct.Struct('>q')
+_uhyper = struct.Struct('>Q')
+_float = struct.Struct('>f')
+_double = struct.Struct('>d')
+
+_int_pack_into = _int.pack_into
+_uint_pack_into = _uint.pack_into
+_uhyper_pack_into = _uhyper.pack_into
+
+_UHYPER_MASK = 0xffffffffffffffff
+
+class Error(Exception):
+    """Exception class for this module."""
+    def __init__(self, msg):
+        super(Error, self).__init__(msg)
+        self.msg = msg
+
+    def __repr__(self):
+        return repr(self.msg)
+
+    def __str__(self):
+        return str(self.msg)
+
+class ConversionError(Error):
+    pass
+
+def filterable(cls):
+    """
+    Class decorator of packer/unpacker generated by xdrgen in fast mode, whose
+    methods do not look for filter_X hooks on every call. Instead, pack_X
+    (unpack_X) of subclass defining filter_X is wrapped once, when subclass
+    is created.
+    """
+    prefix = 'pack_' if issubclass(cls, Packer) else 'unpack_'
+    owner = cls.__qualname__ + '.'
+    #typedef aliases (pack_Y = pack_X) map to generated function, so that
+    #they use filter_X same as generated code with inline hooks does
+    cls._filtered = dict((name, func) for name, func in vars(cls).items()
+            if name.startswith(prefix)
+            and getattr(func, '__qualname__', '').startswith(owner))
+    return cls
+
+def _bind_filters(cls, wrap):
+    for name, func in getattr(cls, '_filtered', {}).items():
+        current = getattr(cls, name)
+        if current is not func and getattr(current, '__wrapped__', None) is not func:
+            continue #overridden by subclass
+        hook = getattr(cls, 'filter_' + func.__name__.split('_', 1)[1], None)
+        setattr(cls, name, wrap(func, hook) if hook else func)
+
+def _pack_filtered(func, hook):
+    @functools.wraps(func)
+    def pack(self, data):
+        return func(self, hook(self, data))
+    return pack
+
+def _unpack_filtered(func, hook):
+    @functools.wraps(func)
+    def unpack(self):
+        return hook(self, func(self))
+    return unpack
+
+class Packer(object):
+    """Pack various data representations into a buffer."""
+
+    def __init_subclass__(cls, **kwargs):
+        super(Packer, cls).__init_subclass__(**kwargs)
+        _bind_filters(cls, _pack_filtered)
+
+    def __init__(self, size=256):
+        self.reset(size)
+
+    def reset(self, size=256):
+        self._buf = bytearray(size)
+        self._pos = 0
+
+    def get_buffer(self):
+        return bytes(memoryview(self._buf)[:self._pos])
+    # backwards compatibility
+    get_buf = get_buffer
+
+    def _grow(self, end):
+        #buffer is only extended with zeros and never written behind current
+        #position, so padding of opaque data need not be written explicitly
+        buf = self._buf
+        buf.extend(bytes(max(end - len(buf), len(buf))))
+
+    def _pack_retry(self, st, pos, values, error):
+        #pack_into fails both for invalid value and for buffer being too small,
+        #so buffer is grown only when needed and then packing is retried
+        if pos + st.size <= len(self._buf):
+            raise ConversionError(error.args[0])
+        self._grow(pos + st.size)
+        try:
+            st.pack_into(self._buf, pos, *values)
+        except struct.error as e:
+            raise ConversionError(e.args[0])
+
+    def pack_struct(self, st, *values):
+        """Packs values using given precompiled struct.Struct"""
+        pos = self._pos
+        try:
+            st.pack_into(self._buf, pos, *values)
+        except struct.error as e:
+            if None in values:
+                raise TypeError('None value packed with format %s' % st.format)
+            self._pack_retry(st, pos, values, e)
+        self._pos = pos + st.size
+
+    def pack_uint(self, x):
+        pos = self._pos
+        try:
+            _uint_pack_into(self._buf, pos, x)
+        except struct.error as e:
+            self._pack_retry(_uint, pos, (x,), e)
+        self._pos = pos + 4
+
+    def pack_int(self, x):
+        pos = self._pos
+        try:
+            _int_pack_into(self._buf, pos, x)
+        except struct.error as e:
+            self._pack_retry(_int, pos, (x,), e)
+        self._pos = pos + 4
+
+    pack_enum = pack_int
+
+    def pack_bool(self, x):
+        self.pack_uint(1 if x else 0)
+
+    def pack_uhyper(self, x):
+        #like xdrlib, any integer is written as its low 64 bits, so that
+        #hyper and uhyper share same packing
+        pos = self._pos
+        try:
+            x &= _UHYPER_MASK
+            _uhyper_pack_into(self._buf, pos, x)
+        except TypeError as e:
+            raise ConversionError(e.args[0])
+        except struct.error as e:
+            self._pack_retry(_uhyper, pos, (x,), e)
+        self._pos = pos + 8
+
+    pack_hyper = pack_uhyper
+
+    def pack_float(self, x):
+        self.pack_struct(_float, x)
+
+    def pack_double(self, x):
+        self.pack_struct(_double, x)
+
+    def pack_fstring(self, n, s):
+        if n < 0:
+            raise ValueError('fstring size must be nonnegative')
+        if len(s) > n:
+            s = s[:n]
+        pos = self._pos
+        end = pos + ((n+3)//4)*4
+        if end > len(self._buf):
+            self._grow(end)
+        self._buf[pos:pos+len(s)] = s
+        self._pos = end
+
+    pack_fopaque = pack_fstring
+
+    def pack_string(self, s):
+        n = len(s)
+        self.pack_uint(n)
+        self.pack_fstring(n, s)
+
+    pack_opaque = pack_string
+    pack_bytes = pack_string
+
+    def pack_list(self, list, pack_item):
+        for item in list:
+            self.pack_uint(1)
+            pack_item(item)
+        self.pack_uint(0)
+
+    def pack_farray(self, n, list, pack_item):
+        if len(list) != n:
+            raise ValueError('wrong array size')
+        for item in list:
+            pack_item(item)
+
+    def pack_array(self, list, pack_item):
+        self.pack_uint(len(list))
+        for item in list:
+            pack_item(item)
+
+class Unpacker(object):
+    """Unpacks various data representations from the given buffer."""
+
+    def __init_subclass__(cls, **kwargs):
+        super(Unpacker, cls).__init_subclass__(**kwargs)
+        _bind_filters(cls, _unpack_filtered)
+
+    def __init__(self, data):
+        self.reset(data)
+
+    def reset(self, data):
+        self._buf = data
+        self._pos = 0
+
+    def get_position(self):
+        return self._pos
+
+    def set_position(self, position):
+        self._pos = position
+
+    def get_buffer(self):
+        return self._buf
+
+    def done(self):
+        if self._pos < len(self._buf):
+            raise Error('unextracted data remains')
+
+    def unpack_struct(self, st):
+        """Unpacks tuple of values using given precompiled struct.Struct"""
+        pos = self._pos
+        end = pos + st.size
+        if end > len(self._buf):
+            raise EOFError
+        self._pos = end
+        return st.unpack_from(self._buf, pos)
+
+    def unpack_uint(self):
+        pos = self._pos
+        if pos + 4 > len(self._buf):
+            raise EOFError
+        self._pos = pos + 4
+        return _uint.unpack_from(self._buf, pos)[0]
+
+    def unpack_int(self):
+        pos = self._pos
+        if pos + 4 > len(self._buf):
+            raise EOFError
+        self._pos = pos + 4
+        return _int.unpack_from(self._buf, pos)[0]
+
+    unpack_enum = unpack_int
+
+    def unpack_bool(self):
+        return bool(self.unpack_int())
+
+    def unpack_uhyper(self):
+        pos = self._pos
+        if pos + 8 > len(self._buf):
+            raise EOFError
+        self._pos = pos + 8
+        return _uhyper.unpack_from(self._buf, pos)[0]
+
+    def unpack_hyper(self):
+        pos = self._pos
+        if pos + 8 > len(self._buf):
+            raise EOFError
+        self._pos = pos + 8
+        return _hyper.unpack_from(self._buf, pos)[0]
+
+    def unpack_float(self):
+        return self.unpack_struct(_float)[0]
+
+    def unpack_double(self):
+        return self.unpack_struct(_double)[0]
+
+    def unpack_fstring(self, n):
+        if n < 0:
+            raise ValueError('fstring size must be nonnegative')
+        i = self._pos
+        j = i + (n+3)//4*4
+        if j > len(self._buf):
+            raise EOFError
+        self._pos = j
+        return self._buf[i:i+n]
+
+    unpack_fopaque = unpack_fstring
+
+    def unpack_string(self):
+        n = self.unpack_uint()
+        return self.unpack_fstring(n)
+
+    unpack_opaque = unpack_string
+    unpack_bytes = unpack_string
+
+    def unpack_list(self, unpack_item):
+        list = []
+        while 1:
+            x = self.unpack_uint()
+            if x == 0: break
+            if x != 1:
+                raise ConversionError('0 or 1 expected, got %r' % (x,))
+            item = unpack_item()
+            list.append(item)
+        return list
+
+    def unpack_farray(self, n, unpack_item):
+        list = []
+        for i in range(n):
+            list.append(unpack_item())
+        return list
+
+    def unpack_array(self, unpack_item):
+        n = self.unpack_uint()
+        return [unpack_item() for i in range(n)]
@@ -747,6 +747,16 @@ def id_unique(dict_id, name, lineno):
         return True
 
 
+def module_def(name, value):
+    """Registers module level definition of packer file, returns its name"""
+    unique, i = name, 1
+    while module_defs.get(unique, value) != value:
+        i += 1
+        unique = "%s%d" % (name, i)
+    module_defs[unique] = value
+    return unique
+
+
 class CaseSpec(object):
     def __init__(self, cases, declarations):
         self.cases = cases
@@ -802,7 +812,7 @@ class Info(object):
         return None
 
     def _get_filter(self):
-        if use_filters:
+        if use_filters and not fast_mode:
             filter1 = "%sif hasattr(self, 'filter_%s'):\n" % (indent2, self.id)
             filter2 = "%sdata = getattr(self, 'filter_%s')(data)\n" % (indent * 3, self.id)
             return filter1 + filter2
@@ -841,6 +851,20 @@ class Info(object):
         else:
             return "const." + value
 
+    def getattr_guard(self, prefix=indent):
+        # attributes of __slots__ class are unset until __init__ runs (e.g.
+        # on copy or unpickling), so special names are not passed through
+        if not use_slots:
+            return ''
+        return "%s%sif attr.startswith('__'):\n" \
+               "%s%s%sraise AttributeError(attr)\n" % \
+               (prefix, indent, prefix, indent, indent)
+
+    def typeslots(self, varlist, prefix=indent):
+        if not use_slots:
+            return ''
+        return "%s__slots__ = %r\n" % (prefix, tuple([var.id for var in varlist]))
+
     def typeinit(self, varlist, prefix=indent):
         initargs = ''.join([", %s=None" % var.id for var in varlist])
         initvars = ''.join(["%s%sself.%s = %s\n" % (prefix, indent, var.id, var.id)
@@ -931,29 +955,60 @@ class Info(object):
             subheader = array = varindent = ''
         return prefix + varindent, newdata, subheader, array
 
+    def enum_values(self):
+        """Returns expression with allowed values of enum"""
+        varlist = ', '.join(["const.%s" % l.id for l in self.body])
+        if not fast_mode:
+            return "[%s]" % varlist
+        return module_def("_%s_values" % self.id, "frozenset([%s])" % varlist)
+
     def packenum(self, prefix, data='data'):
         prefix, data, subheader, array = self._array_pack(prefix, data)
-        varlist = ["const.%s" % l.id for l in self.body]
-        check = "%sif self.check_enum and %s not in [%s]:\n" \
+        check = "%sif self.check_enum and %s not in %s:\n" \
                 "%s%sraise XDRError('value=%%s not in enum %s' %% %s)\n" % \
-                (prefix, data, ', '.join(varlist),
+                (prefix, data, self.enum_values(),
                  prefix, indent, self.id, data)
         pack = check + "%sself.pack_int(%s)\n" % (prefix, data)
         return subheader + pack + array
 
     def unpackenum(self, prefix, data='data'):
         prefix, data, subheader, array = self._array_unpack(prefix, data)
-        varlist = ["const.%s" % l.id for l in self.body]
-        check = "%sif self.check_enum and %s not in [%s]:\n" \
+        check = "%sif self.check_enum and %s not in %s:\n" \
                 "%s%sraise XDRError('value=%%s not in enum %s' %% %s)\n" % \
-                (prefix, data, ', '.join(varlist),
+                (prefix, data, self.enum_values(),
                  prefix, indent, self.id, data)
         unpack = "%s%s = self.unpack_int()\n" % (prefix, data)
         return subheader + unpack + check + array
 
+    def struct_runs(self):
+        """Splits struct body into declarations and, in fast mode, runs of
+        consecutive fixed size fields (as lists of (declaration, format))"""
+        runs = []
+        for l in self.body:
+            code = fast_mode and l.struct_format()
+            if not code:
+                runs.append(l)
+            elif runs and isinstance(runs[-1], list):
+                runs[-1].append((l, code))
+            else:
+                runs.append([(l, code)])
+        return [r[0][0] if isinstance(r, list) and len(r) == 1 else r
+                for r in runs]
+
+    def _fixed_struct(self, run):
+        fmt = '>' + ''.join([code for l, code in run])
+        return module_def("_struct_%s" % fmt[1:], "struct.Struct('%s')" % fmt)
+
     def packstruct(self, prefix, data='data'):
         prefix, data, subheader, array = self._array_pack(prefix, data)
-        pack = ''.join([l.packout(prefix, data) for l in self.body])
+        pack = ''
+        for l in self.struct_runs():
+            if isinstance(l, list):
+                pack += "%sself.pack_struct(%s, %s)\n" % \
+                        (prefix, self._fixed_struct(l),
+                         ', '.join(["%s.%s" % (data, d.id) for d, c in l]))
+            else:
+                pack += l.packout(prefix, data)
         return subheader + pack + array
 
     def unpackstruct(self, prefix, data='data'):
@@ -962,8 +1017,14 @@ class Info(object):
             classname = "types.%s" % self.id
         else:
             classname = 'nullclass'
-        unpack = "%s%s = %s()\n" % (prefix, data, classname) + \
-                 ''.join([l.unpackout(prefix, data) for l in self.body])
+        unpack = "%s%s = %s()\n" % (prefix, data, classname)
+        for l in self.struct_runs():
+            if isinstance(l, list):
+                unpack += "%s%s = self.unpack_struct(%s)\n" % \
+                          (prefix, ', '.join(["%s.%s" % (data, d.id) for d, c in l]),
+                           self._fixed_struct(l))
+            else:
+                unpack += l.unpackout(prefix, data)
         return subheader + unpack + array
 
     def packunion(self, prefix, data='data'):
@@ -1137,7 +1198,7 @@ class struct_info(Info):
         xdrdef = "%sXDR definition:\n%sstruct %s {\n%s%s};\n" % \
                  (comment, comment, self.id, xdrbody, comment)
         varlist = [l for l in self.body if l.type != 'void']
-        init = self.typeinit(varlist)
+        init = self.typeslots(varlist) + self.typeinit(varlist)
         repr = self.typerepr(varlist)
         pass_attr = self.pass_through(varlist)
         return "class %s:\n%s%s\n%s%s\n" % \
@@ -1157,9 +1218,9 @@ class struct_info(Info):
             return ''
         candidates = [var for var in varlist if check(var)]
         if len(candidates) == 1:
-            return "%sdef __getattr__(self, attr):\n" \
+            return "%sdef __getattr__(self, attr):\n%s" \
                    "%sreturn getattr(self.%s, attr)\n\n" % \
-                   (indent, indent2, candidates[0].id)
+                   (indent, self.getattr_guard(), indent2, candidates[0].id)
         else:
             return ''
 
@@ -1193,11 +1254,13 @@ class union_info(Info):
         self.parent = True
 
     def union_getattr(self, prefix=indent):
-        return "%sdef __getattr__(self, attr):\n" \
+        return "%sdef __getattr__(self, attr):\n%s" \
                "%s%sreturn getattr(self.switch, attr)\n" % \
-               (prefix, prefix, indent)
+               (prefix, self.getattr_guard(prefix), prefix, indent)
 
     def union_switch(self, prefix=indent):
+        if use_slots:
+            return self.union_arms(prefix)
         d = '{'
         for l in self.body[1:-1]:
             for c in l.cases:
@@ -1221,6 +1284,29 @@ class union_info(Info):
             get = "[s.%s]" % key
         return "%sswitch = property(lambda s: %s%s)\n" % (prefix, d, get)
 
+    def union_arms(self, prefix=indent):
+        """Switch looking up getter of selected arm in class level dict,
+        instead of building dict of all arms on every access"""
+        def getter(id):
+            if id is None:
+                return "_void"
+            return "attrgetter('%s')" % id
+
+        arms = ''.join(["%s%s%s: %s,\n" % (prefix, indent, self.fullname(c),
+                                            getter(l.declarations[0].id))
+                        for l in self.body[1:-1] for c in l.cases])
+        out = "%s_arms = {\n%s%s}\n" % (prefix, arms, prefix)
+        key = self.body[0].declarations[0].id
+        default = self.body[-1].declarations
+        if default != []:
+            id = default[0].id
+            out += "%s_default = %s\n" % \
+                   (prefix, "staticmethod(_void)" if id is None else getter(id))
+            get = "s._arms.get(s.%s, s._default)(s)" % key
+        else:
+            get = "s._arms[s.%s](s)" % key
+        return out + "%sswitch = property(lambda s: %s)\n" % (prefix, get)
+
     def type_output(self):
         comment = '%s# ' % indent
         xdrbody = self.xdrbody(comment)
@@ -1232,7 +1318,7 @@ class union_info(Info):
         varlist = []
         for c in self.body:
             varlist += [l for l in c.declarations if l.type != 'void']
-        init = self.typeinit(varlist)
+        init = self.typeslots(varlist) + self.typeinit(varlist)
         repr = self.typerepr(varlist)
         return "class %s:\n%s%s\n%s\n%s\n%s\n" % \
                (self.id, xdrdef, init, self.union_switch(),
@@ -1305,6 +1391,22 @@ class type_info(Info):
             name = prefix + self.type
         return "%s %s%s;" % (name, self.id, self.brackets())
 
+    def struct_format(self):
+        """Returns struct format of fixed size declaration of primitive type
+        (also through typedef aliases), or None. Typedefs of arrays are left
+        out, as they have pack method of their own (with filter hook)."""
+        if self.array:
+            if self.fixed and self.type == 'opaque' and self.len.isdigit():
+                n = int(self.len)
+                return '%ds' % n + 'x' * (-n % 4)
+            return None
+        info = self
+        while info.type in name_dict and isinstance(name_dict[info.type], type_info):
+            info = name_dict[info.type]
+            if info.array:
+                return None
+        return struct_formats.get(info.type)
+
     def packout(self, prefix='', data='data'):
         check = "%sif %s.%s is None:\n" \
                 "%s%sraise TypeError('%s.%s == None')\n" % \
@@ -1423,14 +1525,21 @@ name_dict = {}  # list of global names seen, to avoid conflict
 use_filters = True  # Option which causes hooks to be generated which
 # allows easy subclassing to, for example,
 # automatically exand opaque segments
+fast_mode = False  # Option which emits packer without per call filter
+# checks (hooks are bound by codec.filterable at
+# subclass creation), checks enums against frozensets
+# and packs runs of fixed size fields with one struct
+use_slots = False  # Option which emits types with __slots__ and unions
+# selecting arm through class level dict of getters
+module_defs = {}  # module level names (enum sets, structs) used in fast mode
 allow_attr_passthrough = True  # Option which allows substructure attrs to
 # be referenced directly, in cases where there
 # is a unique substructure to search.
 pack_header = """\
 from . import %s as const
 from . import %s as types
-import xdrlib
-from xdrlib import Error as XDRError
+from . import codec
+from .codec import Error as XDRError
 
 class nullclass(object):
     pass
@@ -1438,23 +1547,41 @@ class nullclass(object):
 """
 
 pack_init = """\
-class %sPacker(xdrlib.Packer):
+class %sPacker(codec.Packer):
 %sdef __init__(self, check_enum=True, check_array=True):
-%sxdrlib.Packer.__init__(self)
+%scodec.Packer.__init__(self)
 %sself.check_enum = check_enum
 %sself.check_array = check_array
 
 """ % ("%s", indent, indent2, indent2, indent2)
 
 unpack_init = """\
-class %sUnpacker(xdrlib.Unpacker):
+class %sUnpacker(codec.Unpacker):
 %sdef __init__(self, data, check_enum=True, check_array=True):
-%sxdrlib.Unpacker.__init__(self, data)
+%scodec.Unpacker.__init__(self, data)
 %sself.check_enum = check_enum
 %sself.check_array = check_array
 
 """ % ("%s", indent, indent2, indent2, indent2)
 
+# struct formats of primitives collapsed in fast mode; bool is left out, as
+# pack_bool accepts any truthy value
+struct_formats = {"int": "i",
+                  "uint": "I",
+                  "unsigned": "I",
+                  "hyper": "q",
+                  "uhyper": "Q",
+                  "float": "f",
+                  "double": "d"}
+
+types_slots_header = """\
+from operator import attrgetter
+
+def _void(data):
+    return None
+
+"""
+
 known_basics = {"int": "pack_int",
                 # "enum" : "pack_enum",
                 "uint": "pack_uint",
@@ -1463,23 +1590,27 @@ known_basics = {"int": "pack_int",
                 "uhyper": "pack_uhyper",
                 "float": "pack_float",
                 "double": "pack_double",
-                # Note: xdrlib.py does not have a
+                # Note: codec.py does not have a
                 # pack_quadruple currently.
                 "quadruple": "pack_double",
                 "bool": "pack_bool",
                 "opaque": "pack_opaque",
                 "string": "pack_string"}
-packer_start = ''.join(["%spack_%s = xdrlib.Packer.%s\n" % (indent, k, v)
+packer_start = ''.join(["%spack_%s = codec.Packer.%s\n" % (indent, k, v)
                         for k, v in known_basics.items()])
 
-unpacker_start = ''.join(["%sunpack_%s = xdrlib.Unpacker.un%s\n" % (indent, k, v)
+unpacker_start = ''.join(["%sunpack_%s = codec.Unpacker.un%s\n" % (indent, k, v)
                           for k, v in known_basics.items()])
 
 
-def run(infile, filters=True, pass_attrs=True, debug=False):
-    global use_filters, allow_attr_passthrough
+def run(infile, filters=True, pass_attrs=True, debug=False, fast=False, slots=False,
+        outdir='.'):
+    global use_filters, allow_attr_passthrough, fast_mode, use_slots, module_defs
     use_filters = filters
     allow_attr_passthrough = pass_attrs
+    fast_mode = fast
+    use_slots = slots
+    module_defs = {}
 
     # Parse the input data with yacc
     global name_dict
@@ -1521,20 +1652,17 @@ def run(infile, filters=True, pass_attrs=True, debug=False):
 
     comment_string = "# Generated by xdrgen.py from {0:s} on {1:s}\n" \
         .format(infile, time.asctime())
-    const_fd = open(constants_file + ".py", "w", newline='\n')
+    const_fd = open(os.path.join(outdir, constants_file + ".py"), "w", newline='\n')
     const_fd.write(comment_string)
-    type_fd = open(types_file + ".py", "w", newline='\n')
+    type_fd = open(os.path.join(outdir, types_file + ".py"), "w", newline='\n')
     type_fd.write(comment_string)
     type_fd.write("from . import %s as const\n" % constants_file)
-    pack_fd = open(packer_file + ".py", "w", newline='\n')
-    pack_fd.write(comment_string)
-    pack_fd.write(pack_header % (constants_file, types_file))
-    #pack_fd.write(pack_init % name_base.upper())
-    pack_fd.write(pack_init % name_base)
-    pack_fd.write(packer_start)
+    if use_slots:
+        type_fd.write(types_slots_header)
 
     type_list = sorted(name_dict.values(), key=lambda name: name.sortno)
     # type_list.sort()
+    pack_body = unpack_body = ''
     for value in type_list:
         # print value
         output = value.const_output()
@@ -1547,17 +1675,32 @@ def run(infile, filters=True, pass_attrs=True, debug=False):
             type_fd.write(output)
         output = value.pack_output()
         if output is not None:
-            # pack_fd.write("# **** %s %s %s****\n" % (value.id, value.lineno, value.sortno))
-            pack_fd.write(output)
-            pack_fd.write('\n')
-    #pack_fd.write(unpack_init % name_base.upper())
-    pack_fd.write(unpack_init % name_base)
-    pack_fd.write(unpacker_start)
+            # pack_body += "# **** %s %s %s****\n" % (value.id, value.lineno, value.sortno)
+            pack_body += output + '\n'
     for value in type_list:
         output = value.unpack_output()
         if output is not None:
-            pack_fd.write(output)
-            pack_fd.write('\n')
+            unpack_body += output + '\n'
+
+    # packer file is written last, as fast mode collects module level
+    # definitions while generating pack and unpack methods
+    pack_fd = open(os.path.join(outdir, packer_file + ".py"), "w", newline='\n')
+    pack_fd.write(comment_string)
+    if fast_mode:
+        pack_fd.write("import struct\n")
+    pack_fd.write(pack_header % (constants_file, types_file))
+    if module_defs:
+        pack_fd.write(''.join(["%s = %s\n" % (k, v) for k, v in module_defs.items()]))
+        pack_fd.write('\n')
+    decorator = "@codec.filterable\n" if fast_mode and use_filters else ''
+    #pack_fd.write(pack_init % name_base.upper())
+    pack_fd.write(decorator + pack_init % name_base)
+    pack_fd.write(packer_start)
+    pack_fd.write(pack_body)
+    #pack_fd.write(unpack_init % name_base.upper())
+    pack_fd.write(decorator + unpack_init % name_base)
+    pack_fd.write(unpacker_start)
+    pack_fd.write(unpack_body)
 
     const_fd.close()
     type_fd.close()
@@ -1586,11 +1729,14 @@ def readfile(file_path, parser):
 # Section: main
 #
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: {0:s} <filename | directory>".format(sys.argv[0]))
+    args = sys.argv[1:]
+    options = dict((opt, '--' + opt in args) for opt in ('fast', 'slots'))
+    args = [arg for arg in args if arg[2:] not in options]
+    if len(args) != 1:
+        print("Usage: {0:s} [--fast] [--slots] <filename | directory>".format(sys.argv[0]))
         sys.exit(1)
 
-    run(sys.argv[1])
+    run(args[0], **options)
 
 # Local variables:
 # py-indent-offset: 4
@@ -0,0 +1,195 @@
+import asyncio
+import stellar
+import stellar.aio
+from mock import patch, AsyncMock
+
+stellar.setup_test_network()
+
+ledg = {
+        "id": "c7f3c2b6ca4b5f63b7a1a81ba98e4fe12b6e2b76a6d7e1271e0cbc2ee5f9f4cf",
+        "paging_token": "64034663848484864",
+        "hash": "c7f3c2b6ca4b5f63b7a1a81ba98e4fe12b6e2b76a6d7e1271e0cbc2ee5f9f4cf",
+        "prev_hash": "4b0b8bace3b2438b2404776ce57643966855487ba6384724a3c664c7aa4cd9e4",
+        "sequence": 14909232,
+        "transaction_count": 1,
+        "operation_count": 1,
+        "closed_at": "2017-12-05T10:43:13Z",
+        "total_coins": "100000000000.0000000",
+        "fee_pool": "1908.4295225",
+        "base_fee": 100,
+        "base_reserve": "10.0000000",
+        "max_tx_set_size": 50
+        }
+
+def page(records, cursor):
+    return {
+            "_links": {
+                "next": { "href": "https://horizon-testnet.stellar.org/ledgers?cursor=%s&limit=1&order=asc" % cursor },
+                "prev": { "href": "https://horizon-testnet.stellar.org/ledgers?cursor=0&limit=1&order=desc" },
+                },
+            "_embedded": { "records": records }
+            }
+
+def test_aio_fetch():
+    horizon, _ = stellar.get_current_network()
+    with patch.object(stellar.aio.AsyncHTTP, 'get', new_callable=AsyncMock, return_value=ledg) as get_mock:
+        l = asyncio.run(stellar.aio.ledger(14909232).fetch())
+
+    get_mock.assert_called_once_with(horizon + '/ledgers/14909232')
+    assert isinstance(l, stellar.Ledgers.Ledger)
+    assert l.ledseq == 14909232
+
+def test_aio_pages():
+    horizon, _ = stellar.get_current_network()
+    responses = [page([ledg], 1), page([ledg], 2), page([], 3)]
+
+    async def collect():
+        return [p async for p in stellar.aio.ledgers().pages(limit=1)]
+
+    with patch.object(stellar.aio.AsyncHTTP, 'get', new_callable=AsyncMock, side_effect=responses) as get_mock:
+        pages = asyncio.run(collect())
+
+    assert len(pages) == 2
+    assert get_mock.call_count == 3
+    assert get_mock.call_args_list[0][0][0] == horizon + '/ledgers?limit=1&order=asc'
+    assert get_mock.call_args_list[1][0][0] == 'https://horizon-testnet.stellar.org/ledgers?cursor=1&limit=1&order=asc'
+
+def test_aio_stream():
+    horizon, _ = stellar.get_current_network()
+    urls = []
+
+    async def mock_stream(url, last_id=None):
+        urls.append(url)
+        yield None, '"hello"'
+        yield '64034663848484864', stellar.api.json.dumps(ledg)
+
+    async def collect():
+        return [l async for l in stellar.aio.ledgers().stream(cursor='now')]
+
+    with patch.object(stellar.aio.AsyncHTTP, 'stream', mock_stream):
+        ledgers = asyncio.run(collect())
+
+    assert urls == [horizon + '/ledgers?cursor=now&limit=10&order=asc']
+    assert len(ledgers) == 1
+    assert ledgers[0].ledseq == 14909232
+
+def test_aio_chain():
+    horizon, _ = stellar.get_current_network()
+    accid = 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
+    with patch.object(stellar.aio.AsyncHTTP, 'get', new_callable=AsyncMock, return_value=page([], 0)) as get_mock:
+        p = asyncio.run(stellar.aio.account(accid).payments().fetch(limit=5))
+
+    get_mock.assert_called_once_with(horizon + '/accounts/%s/payments?limit=5&order=asc' % accid)
+    assert p.entries() == []
+
+def test_aio_post_transaction():
+    horizon, _ = stellar.get_current_network()
+    with patch.object(stellar.aio.AsyncHTTP, 'post', new_callable=AsyncMock,
+            return_value={ 'hash' : 'cafebabe', 'ledger' : '42' }) as post_mock:
+        res = asyncio.run(stellar.aio.post_transaction('AAAA'))
+
+    post_mock.assert_called_once_with(horizon + '/transactions/', {'tx' : 'AAAA'})
+    assert res.result() == ('cafebabe', '42')
+
+def test_aio_resolve_address():
+    accid = 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
+    with patch.object(stellar.utils.FED, 'resolve_to_account', return_value=accid) as fed_mock:
+        assert asyncio.run(stellar.aio.resolve_address('name*stellar.org')) == accid
+        assert asyncio.run(stellar.aio.resolve_address(accid)) == accid
+        fed_mock.assert_called_once_with('name*stellar.org')
+
+        #transaction does not resolve federation addresses on the event loop
+        t = stellar.aio.new_transaction(accid, signers=['SALCB22A3PL2JFI3GE62BM4S2TE64NJZP4GF2DBGPBC6QIUQ7GI7BRBN'])
+        try:
+            t.pay('name*stellar.org', '1')
+            assert False
+        except ValueError:
+            pass
+        assert fed_mock.call_count == 1
+
+def test_stream_hub():
+    horizon, _ = stellar.get_current_network()
+    urls = []
+
+    async def mock_stream(url, last_id=None, session=None):
+        urls.append(url)
+        yield None, '"hello"'
+        if 'accounts/unknown' in url:
+            raise stellar.utils.HttpException('not found', 404)
+        yield ledg['paging_token'], stellar.api.json.dumps(ledg)
+        if len([u for u in urls if '/ledgers' in u]) < 2:
+            raise stellar.utils.HttpException('reset', -1)
+        await asyncio.sleep(3600)
+
+    async def follow():
+        hub = stellar.aio.StreamHub(min_delay=0)
+        received = []
+        done = asyncio.Event()
+        async def callback(l):
+            received.append(l)
+            if len(received) == 2:
+                done.set()
+        ledgers = hub.subscribe(stellar.aio.ledgers(), callback=callback, key='ledgers')
+        unknown = hub.subscribe(stellar.aio.account('unknown').payments(), key='unknown')
+        run = asyncio.ensure_future(hub.run())
+        await asyncio.wait_for(done.wait(), 5)
+        hub.stop()
+        await run
+        return ledgers, unknown, received
+
+    with patch.object(stellar.aio.AsyncHTTP, 'stream', mock_stream):
+        ledgers, unknown, received = asyncio.run(follow())
+
+    assert [l.ledseq for l in received] == [14909232, 14909232]
+    assert ledgers.events == 2 and ledgers.reconnects == 1
+    assert ledgers.cursor == ledg['paging_token'] and ledgers.lag > 0
+    assert unknown.error.error == 404 and unknown.events == 0
+    assert urls.count(horizon + '/ledgers?cursor=now&limit=200&order=asc') == 1
+    assert urls.count(horizon + '/ledgers?cursor=%s&limit=200&order=asc' % ledg['paging_token']) == 1
+
+def test_stream_hub_queue():
+    async def mock_stream(url, last_id=None, session=None):
+        yield ledg['paging_token'], stellar.api.json.dumps(ledg)
+        await asyncio.sleep(3600)
+
+    with patch.object(stellar.aio.AsyncHTTP, 'stream', mock_stream):
+        hub = stellar.aio.StreamHub()
+        hub.start()
+        try:
+            subscription = hub.subscribe(stellar.aio.ledgers(), key='ledgers')
+            s, l = hub.get_sync(timeout=5)
+        finally:
+            hub.stop()
+
+    assert s is subscription
+    assert l.ledseq == 14909232
+
+def test_stream_hub_start_stop():
+    hub = stellar.aio.StreamHub()
+    hub.start()
+    thread = hub._thread
+    hub.stop()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert hub._thread is None
+
+def test_stream_hub_restart():
+    urls = []
+    async def mock_stream(url, last_id=None, session=None):
+        urls.append(url)
+        yield ledg['paging_token'], stellar.api.json.dumps(ledg)
+        await asyncio.sleep(3600)
+
+    with patch.object(stellar.aio.AsyncHTTP, 'stream', mock_stream):
+        hub = stellar.aio.StreamHub()
+        subscription = hub.subscribe(stellar.aio.ledgers(), key='ledgers')
+        for i in range(2):
+            hub.start()
+            try:
+                s, l = hub.get_sync(timeout=5)
+            finally:
+                hub.stop()
+            assert s is subscription
+
+    assert len(urls) == 2
+    assert 'cursor=%s' % ledg['paging_token'] in urls[1]
@@ -0,0 +1,65 @@
+import numpy as np
+import stellar
+import stellar.analytics
+from stellar.api import Orderbooks
+
+issuer = 'GDUWG5CZ6YJNWOPQB33DOKWVWSNHJAWPWOUNAEBVTM7QRJ66NGFYEFAJ'
+
+def level(amount, n, d):
+    return { 'amount' : amount, 'price_r' : { 'n' : n, 'd' : d }, 'price' : '%.7f' % (float(n) / d) }
+
+def orderbook(bids, asks):
+    return Orderbooks.Orderbook({ 'bids' : [level(*b) for b in bids], 'asks' : [level(*a) for a in asks],
+        'base' : { 'asset_type' : 'credit_alphanum4', 'asset_code' : 'CODR', 'asset_issuer' : issuer },
+        'counter' : { 'asset_type' : 'native' } })
+
+books = [
+        orderbook([('50', 1, 2), ('40', 2, 5)], [('10', 3, 5), ('20', 7, 10), ('30', 1, 1)]),
+        orderbook([('2', 1, 1)], [('5', 2, 1)]),
+        orderbook([], []),
+        ]
+
+def test_book_matrix():
+    m = stellar.analytics.BookMatrix(books)
+    assert len(m) == 3
+    assert m.prices['ask'].shape == (3, 3)
+    assert np.allclose(m.best('ask')[:2], [0.6, 2])
+    assert np.allclose(m.spread()[:2], [0.1, 1])
+    assert np.isnan(m.spread()[2])
+    #bid amounts are converted to base asset
+    assert np.allclose(m.amounts['bid'][0], [100, 100, 0])
+    assert np.allclose(m.cumulative_depth('ask')[0], [10, 30, 60])
+    assert m.price_n['ask'][0, 1] == 7 and m.price_d['ask'][0, 1] == 10
+
+    m = stellar.analytics.BookMatrix(books, levels=1)
+    assert m.prices['ask'].shape == (3, 1)
+
+    live = stellar.LiveOrderbook(('CODR', issuer), 'native')
+    live._asks.load(books[1].asks)
+    m = stellar.analytics.BookMatrix([live])
+    assert np.allclose(m.best('ask'), [2]) and np.isnan(m.best('bid')[0])
+
+def test_vwap_slippage():
+    m = stellar.analytics.BookMatrix(books)
+    vwap = m.vwap('ask', 20)
+    assert np.isclose(vwap[0], (10 * 0.6 + 10 * 0.7) / 20)
+    assert np.isnan(vwap[1]) and np.isnan(vwap[2])
+
+    vwap = m.vwap('bid', [150, 2, 0])
+    assert np.isclose(vwap[0], (100 * 0.5 + 50 * 0.4) / 150)
+    assert np.isclose(vwap[1], 1)
+
+    slippage = m.slippage('ask', [20, 5, 1])
+    assert np.isclose(slippage[0], 0.65 / 0.6 - 1)
+    assert np.isclose(slippage[1], 0)
+    assert np.isclose(m.slippage('bid', 150)[0], 1 - (70 / 150.0) / 0.5)
+
+def test_spread_history():
+    m = stellar.analytics.BookMatrix(books)
+    history = stellar.analytics.SpreadHistory(capacity=2)
+    for t in range(3):
+        history.record(m, timestamp=t)
+    assert len(history) == 2
+    assert list(history.times) == [1, 2]
+    assert history.spreads.shape == (2, 3)
+    assert np.allclose(history.mean()[:2], [0.1, 1])
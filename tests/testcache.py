@@ -0,0 +1,140 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import stellar
+import stellar.utils
+import stellar.cache
+from mock import patch
+
+stellar.setup_test_network()
+
+acc = { "id" : "GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24", "paging_token": "",
+        "account_id": "GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24",
+        "sequence": "100", "subentry_count": 0, "inflation_destination": "",
+        "thresholds": { "low_threshold": 1, "med_threshold": 1, "high_threshold": 1 },
+        "flags": { "auth_required": False, "auth_revocable": False },
+        "balances": [], "signers": [], "data" : {} }
+
+def page(n):
+    return { '_embedded' : { 'records' : [ ledger(i) for i in range(n) ] },
+            '_links' : { 'next' : { 'href' : 'https://horizon-testnet.stellar.org/ledgers?cursor=9&limit=2&order=asc' }, 'prev' : { 'href' : 'prev' } } }
+
+def ledger(seq):
+    return { 'id' : 'l%d' % seq, 'paging_token' : str(seq << 32), 'hash' : 'h%d' % seq,
+            'prev_hash' : '', 'sequence' : seq, 'transaction_count' : 0,
+            'operation_count' : 0, 'closed_at' : '2017-12-05T10:43:13Z',
+            'total_coins' : '100', 'fee_pool' : '0', 'base_fee' : 100,
+            'base_reserve' : '10', 'max_tx_set_size' : 50 }
+
+def test_history_cache():
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, 'cache.sqlite')
+        cache = stellar.HistoryCache(path, max_bytes=100)
+        assert cache.get('a') is None
+        cache.put('a', {'x' : 'a' * 30})
+        cache.put('b', {'x' : 'b' * 30})
+        assert cache.get('a') == {'x' : 'a' * 30}
+        #least recently used entry is evicted
+        cache.put('c', {'x' : 'c' * 30})
+        assert cache.get('b') is None
+        assert (cache.hits, cache.misses) == (1, 2)
+        cache.close()
+
+        cache = stellar.HistoryCache(path, max_bytes=100)
+        assert len(cache) == 2
+        assert cache.get('c') == {'x' : 'c' * 30}
+        cache.clear()
+        assert len(cache) == 0 and cache.hits == 0
+        cache.close()
+    finally:
+        shutil.rmtree(tmp)
+
+def test_fetch_history_cache():
+    cache = stellar.setup_history_cache()
+    try:
+        with patch.object(stellar.utils.HTTP, 'get', return_value=ledger(42)) as get_mock:
+            assert stellar.ledger(42).fetch().ledseq == 42
+            assert stellar.ledger(42).fetch().ledseq == 42
+            assert get_mock.call_count == 1
+
+        #full pages are cached, last page and latest records are not
+        with patch.object(stellar.utils.HTTP, 'get', return_value=page(2)) as get_mock:
+            for i in range(2):
+                stellar.ledgers().fetch(cursor='1', limit=2)
+                stellar.ledgers().fetch(cursor='1', limit=2).next()
+                stellar.ledgers().fetch(limit=2, order='desc')
+                stellar.ledgers().fetch(cursor='1', limit=3)
+            assert get_mock.call_count == 6
+
+        #other resources are not cached
+        with patch.object(stellar.utils.HTTP, 'get', return_value=acc) as get_mock:
+            stellar.account(acc['id']).fetch()
+            stellar.account(acc['id']).fetch()
+            assert get_mock.call_count == 2
+        assert (cache.hits, cache.misses) == (5, 7)
+    finally:
+        stellar.setup_history_cache(enabled=False)
+
+def test_account_cache():
+    cache = stellar.AccountCache(ttl=60, max_entries=2)
+    assert cache.get('a') is None
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None and len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    #account invalidated while being fetched is not cached
+    def fetch():
+        cache.invalidate('d')
+        return 4
+    assert cache.fetch('d', fetch) == 4
+    assert cache.get('d') is None
+    assert cache.fetch('d', lambda: 5) == 5
+    assert cache.fetch('d', lambda: 6) == 5
+
+    cache = stellar.AccountCache(ttl=0)
+    cache.put('a', 1)
+    assert cache.get('a') is None
+
+def test_account_cache_watch():
+    changed = threading.Event()
+    def changes():
+        yield 'a'
+        changed.set()
+        yield 'b'
+        raise Exception('stream closed')
+
+    cache = stellar.AccountCache()
+    cache.put('a', 1)
+    cache.put('c', 3)
+    with patch.object(stellar.cache.AccountCache, 'clear') as clear_mock:
+        cache.watch(changes, retry_delay=60)
+        assert changed.wait(5)
+        for i in range(50):
+            if clear_mock.called:
+                break
+            time.sleep(0.01)
+        cache.stop()
+    assert cache.get('a') is None
+    assert cache.get('c') == 3
+    clear_mock.assert_called_once()
+
+def test_fetch_account_cache():
+    cache = stellar.setup_account_cache()
+    try:
+        with patch.object(stellar.utils.HTTP, 'get', return_value=acc) as get_mock:
+            a = stellar.account(acc['id']).fetch()
+            assert stellar.account(acc['id']).fetch() is a
+            assert get_mock.call_count == 1
+            #sequence of new transaction is always fetched
+            assert stellar.api._fetch_sequence(acc['id']) == 100
+            assert get_mock.call_count == 2
+            cache.invalidate(acc['id'])
+            assert stellar.account(acc['id']).fetch() is not a
+    finally:
+        stellar.setup_account_cache(enabled=False)
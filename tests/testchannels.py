@@ -0,0 +1,64 @@
+import time
+import base64
+import threading
+import stellar
+import stellar.utils
+from stellar.xdr import Xdr
+from stellar.utils import XDR
+from mock import patch
+
+stellar.setup_test_network()
+
+payer = 'GAO4R7CQGQAV2BEPPQ2LRQP3ANUFOJOBNDEM7AAVCWZA5IIUKIO2FKR5'
+payer_secret = 'SABS6T5RZCOGXH6RZJM6BNHAN7KXVK6VKJRUPBW2KFABEWDBTIEPCRUO'
+channel_secret = 'SALCB22A3PL2JFI3GE62BM4S2TE64NJZP4GF2DBGPBC6QIUQ7GI7BRBN'
+channels = [('GBWF6NTCPGBROJIPF54XXYRLTUGBDLLORPFDK4FGQQ3IRI4T5PHCGVXV', channel_secret),
+        ('GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24', channel_secret)]
+dest = 'GDUWG5CZ6YJNWOPQB33DOKWVWSNHJAWPWOUNAEBVTM7QRJ66NGFYEFAJ'
+
+acc = { "id" : "", "paging_token": "", "account_id": "", "sequence": "100",
+        "subentry_count": 0, "inflation_destination": "",
+        "thresholds": { "low_threshold": 1, "med_threshold": 1, "high_threshold": 1 },
+        "flags": { "auth_required": False, "auth_revocable": False },
+        "balances": [], "signers": [], "data" : {} }
+
+def test_channel_pool():
+    lock = threading.Lock()
+    posted = []
+    in_flight = [0, 0]
+    def post(url, data):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.05)
+        tre = Xdr.StellarXDRUnpacker(base64.b64decode(data['tx'])).unpack_TransactionEnvelope()
+        with lock:
+            in_flight[0] -= 1
+            posted.append(tre)
+        return { 'hash' : 'cafebabe', 'ledger' : '42' }
+
+    with patch.object(stellar.utils.HTTP, 'get', return_value=acc) as acc_mock:
+        with patch.object(stellar.utils.HTTP, 'post', side_effect=post):
+            with stellar.channel_pool(payer, channels, signers=[payer_secret]) as pool:
+                for i in range(6):
+                    with pool.new_transaction() as t:
+                        t.pay(dest, '%d' % (i + 1))
+
+    assert acc_mock.call_count == 2
+    assert in_flight[1] == 2
+    assert len(pool.submitted) == 6
+    for t in pool.submitted:
+        assert t.wait().is_success()
+        assert t.channel in [c[0] for c in channels]
+
+    seqs = {}
+    for tre in posted:
+        source = tre.tx.sourceAccount.ed25519
+        assert source in [XDR.address_to_xdr(c[0]).ed25519 for c in channels]
+        seqs.setdefault(source, []).append(tre.tx.seqNum)
+        assert len(tre.signatures) == 2
+        for op in tre.tx.operations:
+            assert op.sourceAccount[0].ed25519 == XDR.address_to_xdr(payer).ed25519
+    assert sum([len(s) for s in seqs.values()]) == 6
+    for s in seqs.values():
+        assert s == list(range(101, 101 + len(s)))
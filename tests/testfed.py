@@ -1,6 +1,7 @@
 import stellar
 import stellar.utils
-import requests
+import threading
+import time
 from mock import patch, call
 
 result = { 'hash' : 'cafebabe', 'ledger' : '42' }
@@ -39,49 +40,143 @@ acc = {
 
 stellar.setup_test_network()
 
-def test_resolve_to_account():
-    class MockResponse(object):
-        def __init__(self, status_code, lines=None, json=None):
-            self.status_code = status_code 
-            self.lines = lines
-            self.jsondict = json
+class MockResponse(object):
+    def __init__(self, status_code, lines=None, json=None, headers={}):
+        self.status_code = status_code 
+        self.lines = lines
+        self.jsondict = json
+        self.headers = headers
+        self.url = ''
+
+    def iter_lines(self):
+        for line in self.lines:
+                yield line
 
-        def iter_lines(self):
-            for line in self.lines:
-                    yield line
-            raise StopIteration
+    def json(self):
+        return self.jsondict
 
-        def json(self):
-            return self.jsondict
+def test_resolve_to_account():
+    stellar.utils.FED.clear_cache()
 
-    def mock_get(req):
+    def mock_get(req, timeout=None):
         if req.endswith('stellar.toml'):
             return MockResponse(200, ["FEDERATION_SERVER = \"https://stellar.org/federation\""])
         elif req.endswith('type=name'):
             return MockResponse(200, json={'account_id' : 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'})
         raise Exception('Unexpected req = %s' % req)
 
-    with patch.object(requests, 'get') as get_mock:
+    with patch.object(stellar.utils.HTTP.session(), 'get') as get_mock:
         get_mock.side_effect = mock_get
         acc = stellar.utils.FED.resolve_to_account('address*stellar.org')
         assert acc == 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
 
+    timeout = stellar.utils.HTTP.timeout()
     calls = [
-            call('https://stellar.org/.well-known/stellar.toml'),
-            call('https://stellar.org/federation?q=address*stellar.org&type=name')
+            call('https://stellar.org/.well-known/stellar.toml', timeout=timeout),
+            call('https://stellar.org/federation?q=address*stellar.org&type=name', timeout=timeout)
             ]
     get_mock.assert_has_calls(calls)
 
-    with patch.object(requests, 'get') as get_mock_1:
+    with patch.object(stellar.utils.HTTP.session(), 'get') as get_mock_1:
         get_mock_1.side_effect = mock_get
         acc = stellar.utils.FED.resolve_to_account('address@email.com*stellar.org')
         assert acc == 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
 
-    calls_1 = [
-            call('https://stellar.org/.well-known/stellar.toml'),
-            call('https://stellar.org/federation?q=address@email.com*stellar.org&type=name')
-            ]
-    get_mock_1.assert_has_calls(calls_1)
+    #stellar.toml of the domain is cached
+    get_mock_1.assert_called_once_with(
+            'https://stellar.org/federation?q=address@email.com*stellar.org&type=name', timeout=timeout)
+
+def test_resolve_to_account_cache():
+    stellar.utils.FED.clear_cache()
+    accid = 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
+
+    def mock_get(req, timeout=None):
+        if req.endswith('stellar.toml'):
+            time.sleep(0.05)
+            return MockResponse(200, [b'# comment', b'FEDERATION_SERVER = "https://stellar.org/federation"'],
+                    headers={'Cache-Control' : 'public, max-age=600'})
+        elif 'q=unknown' in req:
+            return MockResponse(404)
+        elif req.endswith('type=name'):
+            time.sleep(0.05)
+            return MockResponse(200, json={'account_id' : accid})
+        raise Exception('Unexpected req = %s' % req)
+
+    results = []
+    with patch.object(stellar.utils.HTTP.session(), 'get') as get_mock:
+        get_mock.side_effect = mock_get
+        threads = [threading.Thread(target=lambda: results.append(
+            stellar.utils.FED.resolve_to_account('address*stellar.org'))) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == [accid] * 8
+        assert get_mock.call_count == 2
+
+        assert stellar.utils.FED.resolve_to_account('address*stellar.org') == accid
+        assert get_mock.call_count == 2
+
+        for i in range(2):
+            try:
+                stellar.utils.FED.resolve_to_account('unknown*stellar.org')
+                assert False
+            except stellar.utils.HttpException as e:
+                assert e.error == 404
+        assert get_mock.call_count == 3
+
+    with patch.object(stellar.utils.FED, 'ttl', 0):
+        stellar.utils.FED.clear_cache()
+        with patch.object(stellar.utils.HTTP.session(), 'get') as get_mock:
+            get_mock.side_effect = mock_get
+            stellar.utils.FED.resolve_to_account('address*stellar.org')
+            stellar.utils.FED.resolve_to_account('address*stellar.org')
+            assert get_mock.call_count == 3
+
+    #cache headers of stellar.toml are ignored when caching is disabled
+    try:
+        stellar.setup_federation_cache(enabled=False)
+        with patch.object(stellar.utils.HTTP.session(), 'get') as get_mock:
+            get_mock.side_effect = mock_get
+            stellar.utils.FED.resolve_to_account('address*stellar.org')
+            stellar.utils.FED.resolve_to_account('address*stellar.org')
+            assert get_mock.call_count == 4
+    finally:
+        stellar.setup_federation_cache()
+
+def test_resolve_to_account_interrupted():
+    stellar.utils.FED.clear_cache()
+    class Interrupt(BaseException):
+        pass
+
+    def mock_get(req, timeout=None):
+        time.sleep(0.05)
+        raise Interrupt()
+
+    errors = []
+    def resolve():
+        try:
+            stellar.utils.FED.resolve_to_account('address*stellar.org')
+        except Interrupt as e:
+            errors.append(e)
+
+    #lookups waiting for interrupted one fail too
+    with patch.object(stellar.utils.HTTP.session(), 'get') as get_mock:
+        get_mock.side_effect = mock_get
+        threads = [threading.Thread(target=resolve) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(errors) == 4
+        assert get_mock.call_count == 1
+
+def test_toml_max_age():
+    max_age = stellar.utils.FED._max_age
+    assert max_age({}) == stellar.utils.FED.toml_ttl
+    assert max_age({'Cache-Control' : 'max-age=60', 'Age' : '20'}) == 40
+    assert max_age({'Cache-Control' : 'no-cache, max-age=60'}) == 0
+    assert max_age({'Expires' : 'Thu, 01 Dec 1994 16:00:00 GMT'}) == 0
 
 
 def test_fed_create_account():
@@ -219,3 +314,35 @@ def test_account_merge():
     fed_mock.assert_called_once_with('target*stellar.org')
     assert t.is_success()
     assert t.result() == ('cafebabe', '42')
+
+def test_resolve_many():
+    stellar.utils.FED.clear_cache()
+    accid = 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
+    lock = threading.Lock()
+    requests = []
+
+    def mock_get(req, timeout=None):
+        with lock:
+            requests.append(req)
+        if req == 'https://stellar.org/.well-known/stellar.toml':
+            return MockResponse(200, ["FEDERATION_SERVER = \"https://stellar.org/federation\""])
+        elif req == 'https://example.com/.well-known/stellar.toml':
+            return MockResponse(200, ["ACCOUNTS = []"])
+        elif 'q=unknown' in req:
+            return MockResponse(404)
+        elif req.endswith('type=name'):
+            return MockResponse(200, json={'account_id' : accid})
+        raise Exception('Unexpected req = %s' % req)
+
+    names = ['user%d*stellar.org' % i for i in range(10)]
+    addresses = names + ['unknown*stellar.org', 'bob*example.com', 'bob*example.com', accid, 'a*b*c']
+    with patch.object(stellar.utils.HTTP.session(), 'get') as get_mock:
+        get_mock.side_effect = mock_get
+        accounts, errors = stellar.utils.FED.resolve_many(addresses, per_domain=3)
+
+    assert accounts == dict([(a, accid) for a in names + [accid]])
+    assert sorted(errors) == ['a*b*c', 'bob*example.com', 'unknown*stellar.org']
+    assert errors['unknown*stellar.org'].error == 404
+    assert requests.count('https://stellar.org/.well-known/stellar.toml') == 1
+    assert requests.count('https://example.com/.well-known/stellar.toml') == 1
+    assert len(requests) == 13
@@ -0,0 +1,53 @@
+import stellar
+import stellar.utils
+import requests
+from mock import patch, Mock
+
+def test_session_reused():
+    stellar.utils.HTTP.set_session(None)
+    s1 = stellar.utils.HTTP.session()
+    s2 = stellar.utils.HTTP.session()
+    assert s1 is s2
+    assert isinstance(s1, requests.Session)
+
+def test_configure_pool():
+    stellar.setup_http(pool_maxsize=42, read_timeout=7, keep_alive=False)
+    try:
+        session = stellar.utils.HTTP.session()
+        adapter = session.get_adapter('https://horizon-testnet.stellar.org')
+        assert adapter._pool_maxsize == 42
+        assert session.headers['Connection'] == 'close'
+        assert stellar.utils.HTTP.timeout() == (stellar.utils.HTTP.connect_timeout, 7)
+    finally:
+        stellar.setup_http(pool_maxsize=10, read_timeout=30, keep_alive=True)
+
+def test_custom_session():
+    response = Mock()
+    response.json.return_value = {'hash' : 'cafebabe', 'ledger' : '42'}
+    session = Mock()
+    session.get.return_value = response
+    session.post.return_value = response
+
+    stellar.setup_http(session=session)
+    try:
+        assert stellar.utils.HTTP.get('https://horizon-testnet.stellar.org/ledgers/1') == \
+                {'hash' : 'cafebabe', 'ledger' : '42'}
+        res = stellar.post_transaction('AAAA')
+        assert res.result() == ('cafebabe', '42')
+    finally:
+        stellar.utils.HTTP.set_session(None)
+
+    session.get.assert_called_once_with('https://horizon-testnet.stellar.org/ledgers/1',
+            timeout=stellar.utils.HTTP.timeout())
+    session.post.assert_called_once_with('https://horizon-testnet.stellar.org/transactions/',
+            {'tx' : 'AAAA'}, timeout=stellar.utils.HTTP.timeout())
+    #session of caller is not closed when it is replaced
+    session.close.assert_not_called()
+
+def test_pooled_session_closed():
+    stellar.utils.HTTP.set_session(None)
+    session = stellar.utils.HTTP.session()
+    with patch.object(session, 'close') as close_mock:
+        stellar.setup_http(read_timeout=30)
+        close_mock.assert_called_once()
+    assert stellar.utils.HTTP.session() is not session
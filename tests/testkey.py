@@ -9,3 +9,32 @@ def test_account_from_secret():
     public = 'GAO4R7CQGQAV2BEPPQ2LRQP3ANUFOJOBNDEM7AAVCWZA5IIUKIO2FKR5'
     account_id = stellar.account_from_secret(seed)
     assert public == account_id
+
+def test_keyring():
+    import ed25519
+    import base64
+    seed = 'SABS6T5RZCOGXH6RZJM6BNHAN7KXVK6VKJRUPBW2KFABEWDBTIEPCRUO'
+    other = 'SALCB22A3PL2JFI3GE62BM4S2TE64NJZP4GF2DBGPBC6QIUQ7GI7BRBN'
+    keyring = stellar.Keyring([seed], cache_size=1)
+    assert len(keyring) == 1 and seed in keyring and list(keyring) == [seed]
+
+    signing_key = ed25519.SigningKey(base64.b32decode(seed)[1:-2])
+    verifying_key = signing_key.get_verifying_key().to_bytes()
+    assert keyring.sign(b'hash') == [(verifying_key[-4:], signing_key.sign(b'hash'))]
+    assert keyring.key(seed) is keyring.add(seed)
+
+    #ad-hoc secrets are cached, least recently used are evicted
+    key = keyring.key(other)
+    assert keyring.key(other) is key
+    assert other not in keyring
+    keyring.key('SCIMJRYZSY564THEQKGFR5FZ5VLHWB3WS4PQI3IFRVXJ6CIODVBR67VH')
+    assert keyring.key(other) is not key
+    assert len(keyring.sign(b'hash', [seed, other])) == 2
+
+def test_keyring_signers():
+    account = 'GAO4R7CQGQAV2BEPPQ2LRQP3ANUFOJOBNDEM7AAVCWZA5IIUKIO2FKR5'
+    seed = 'SABS6T5RZCOGXH6RZJM6BNHAN7KXVK6VKJRUPBW2KFABEWDBTIEPCRUO'
+    dest = 'GDUWG5CZ6YJNWOPQB33DOKWVWSNHJAWPWOUNAEBVTM7QRJ66NGFYEFAJ'
+    def build(signers):
+        return stellar.new_transaction(account, signers=signers, seq=42).pay(dest, '1').build()
+    assert build(stellar.Keyring([seed])) == build([seed])
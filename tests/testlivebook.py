@@ -0,0 +1,113 @@
+import time
+import stellar
+import stellar.utils
+from decimal import Decimal
+from stellar.api import Effects
+from mock import patch
+
+stellar.setup_test_network()
+
+issuer = 'GDUWG5CZ6YJNWOPQB33DOKWVWSNHJAWPWOUNAEBVTM7QRJ66NGFYEFAJ'
+maker = 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
+taker = 'GBWF6NTCPGBROJIPF54XXYRLTUGBDLLORPFDK4FGQQ3IRI4T5PHCGVXV'
+
+def level(amount, n, d):
+    return { 'amount' : amount, 'price_r' : { 'n' : n, 'd' : d }, 'price' : '%.7f' % (float(n) / d) }
+
+book = {
+        'bids' : [level('50.0000000', 1, 2), level('100.0000000', 2, 5)],
+        'asks' : [level('10.0000000', 3, 5), level('20.0000000', 7, 10), level('30.0000000', 1, 1)],
+        'base' : { 'asset_type' : 'credit_alphanum4', 'asset_code' : 'CODR', 'asset_issuer' : issuer },
+        'counter' : { 'asset_type' : 'native' },
+        }
+
+def asset(prefix, a):
+    if a == 'native':
+        return { prefix + 'asset_type' : 'native' }
+    return { prefix + 'asset_type' : 'credit_alphanum4', prefix + 'asset_code' : a[0],
+            prefix + 'asset_issuer' : a[1] }
+
+def trade(account, seller, sold_amount, sold, bought_amount, bought):
+    data = { 'id' : '1', 'paging_token' : '1', 'account' : account, 'type' : 'trade',
+            'type_i' : 33, 'seller' : seller, 'offer_id' : 42,
+            'sold_amount' : sold_amount, 'bought_amount' : bought_amount }
+    data.update(asset('sold_', sold))
+    data.update(asset('bought_', bought))
+    return Effects.Effect(data)
+
+def effect(type_i):
+    return Effects.Effect({ 'id' : '1', 'paging_token' : '1', 'account' : maker,
+        'type' : 'offer', 'type_i' : type_i })
+
+codr = ('CODR', issuer)
+
+def live_book():
+    b = stellar.LiveOrderbook(codr, 'native')
+    with patch.object(stellar.utils.HTTP, 'get', return_value=book) as get_mock:
+        b.resync()
+    assert get_mock.call_args[0][0].endswith('/order_book?selling_asset_type=credit_alphanum4'
+            '&selling_asset_code=CODR&selling_asset_issuer=%s&buying_asset_type=native' % issuer)
+    return b
+
+def test_snapshot():
+    b = live_book()
+    assert b.best_ask() == ('10.0000000', (3, 5), '0.6000000')
+    assert b.best_bid() == ('50.0000000', (1, 2), '0.5000000')
+    assert b.spread() == Decimal('0.1')
+    assert [a[1] for a in b.asks()] == [(3, 5), (7, 10), (1, 1)]
+    assert [a[1] for a in b.bids()] == [(1, 2), (2, 5)]
+    assert b.depth('ask', '0.7') == Decimal(30)
+    assert b.depth('bid', '0.45') == Decimal(50)
+    assert b.resyncs == 1
+
+def test_apply_trades():
+    b = live_book()
+    changes = []
+    b.on_change(lambda book, side, price_r, amount: changes.append((side, price_r, amount)))
+
+    #taker buys 4 CODR from ask at 0.6, both parties get trade effect
+    assert b.apply(trade(taker, maker, '2.4000000', 'native', '4.0000000', codr)) == False
+    assert b.apply(trade(maker, taker, '4.0000000', codr, '2.4000000', 'native')) == True
+    assert b.best_ask()[0] == '6.0000000'
+
+    #ask at 0.7 used up, amounts rounded to stroops
+    assert b.apply(trade(maker, taker, '20.0000000', codr, '14.0000001', 'native'))
+    assert [a[1] for a in b.asks()] == [(3, 5), (1, 1)]
+
+    #taker sells CODR to bid at 0.5, bid amount is in counter asset
+    assert b.apply(trade(maker, taker, '5.0000000', 'native', '10.0000000', codr))
+    assert b.best_bid()[0] == '45.0000000'
+
+    #other pair and price not in the book
+    assert not b.apply(trade(maker, taker, '1.0000000', ('USD', issuer), '1.0000000', 'native'))
+    assert not b.apply(trade(maker, taker, '1.0000000', codr, '0.8000000', 'native'))
+
+    assert changes == [('ask', (3, 5), Decimal('6')), ('ask', (7, 10), Decimal(0)),
+            ('bid', (1, 2), Decimal('45'))]
+    assert b.trades == 3
+
+def test_offer_effects_resync():
+    b = live_book()
+    b.apply(trade(maker, taker, '4.0000000', codr, '2.4000000', 'native'))
+    assert not b.apply(effect(31))
+    assert b.best_ask()[0] == '6.0000000'
+
+    changes = []
+    b.on_change(lambda book, side, price_r, amount: changes.append(side))
+    b.min_resync = 0.01
+    with patch.object(stellar.utils.HTTP, 'get', return_value=book):
+        #snapshot on start and re-sync of book made stale by offer effect
+        b.start(effects=[effect(30)])
+        for i in range(500):
+            if b.resyncs == 3:
+                break
+            time.sleep(0.01)
+        b.stop()
+
+    assert b.resyncs == 3
+    assert b.best_ask()[0] == '10.0000000'
+    assert changes[:2] == ['snapshot', 'snapshot']
+
+def test_orderbook_function_not_shadowed():
+    assert callable(stellar.orderbook)
+    assert stellar.orderbook is stellar.api.orderbook
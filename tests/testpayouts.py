@@ -0,0 +1,183 @@
+import io
+import base64
+import threading
+import stellar
+import stellar.utils
+from stellar.xdr import Xdr
+from stellar.utils import XDR
+from stellar.payouts import csv_rows, ndjson_rows
+from mock import patch
+
+stellar.setup_test_network()
+
+payer = 'GAO4R7CQGQAV2BEPPQ2LRQP3ANUFOJOBNDEM7AAVCWZA5IIUKIO2FKR5'
+payer_secret = 'SABS6T5RZCOGXH6RZJM6BNHAN7KXVK6VKJRUPBW2KFABEWDBTIEPCRUO'
+channel_secret = 'SALCB22A3PL2JFI3GE62BM4S2TE64NJZP4GF2DBGPBC6QIUQ7GI7BRBN'
+channels = [('GBWF6NTCPGBROJIPF54XXYRLTUGBDLLORPFDK4FGQQ3IRI4T5PHCGVXV', channel_secret),
+        ('GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24', channel_secret)]
+dest = 'GDUWG5CZ6YJNWOPQB33DOKWVWSNHJAWPWOUNAEBVTM7QRJ66NGFYEFAJ'
+issuer = 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
+
+acc = { "id" : "", "paging_token": "", "account_id": "", "sequence": "100",
+        "subentry_count": 0, "inflation_destination": "",
+        "thresholds": { "low_threshold": 1, "med_threshold": 1, "high_threshold": 1 },
+        "flags": { "auth_required": False, "auth_revocable": False },
+        "balances": [], "signers": [], "data" : {} }
+
+def unpack(data):
+    return Xdr.StellarXDRUnpacker(base64.b64decode(data['tx'])).unpack_TransactionEnvelope()
+
+def test_rows():
+    rows = list(csv_rows(io.StringIO(u'destination,amount,asset_code,asset_issuer\n'
+        u'%s, 1.5\n%s,2,USD,%s\n' % (dest, dest, issuer))))
+    assert rows == [(dest, '1.5', 'native'), (dest, '2', ('USD', issuer))]
+
+    rows = list(ndjson_rows(io.StringIO(u'{"destination": "%s", "amount": "1"}\n\n'
+        u'{"destination": "%s", "amount": "2", "asset": ["USD", "%s"]}\n'
+        u'{"destination": "%s", "amount": "3", "asset_code": "EUR", "asset_issuer": "%s"}\n'
+        % (dest, dest, issuer, dest, issuer))))
+    assert rows == [(dest, '1', 'native'), (dest, '2', ('USD', issuer)),
+            (dest, '3', ('EUR', issuer))]
+
+def test_bulk_pay():
+    lock = threading.Lock()
+    posted = []
+    def post(url, data):
+        tre = unpack(data)
+        with lock:
+            posted.append(tre)
+        return { 'hash' : 'cafe%d' % tre.tx.seqNum, 'ledger' : '42' }
+
+    rows = [(dest, '%d' % (i + 1)) for i in range(250)]
+    with patch.object(stellar.utils.HTTP, 'get', return_value=acc) as acc_mock:
+        with patch.object(stellar.utils.HTTP, 'post', side_effect=post):
+            results = stellar.bulk_pay(payer, rows, signers=[payer_secret],
+                    allocator=stellar.SequenceAllocator())
+
+    assert acc_mock.call_count == 1
+    assert [len(tre.tx.operations) for tre in posted] == [100, 100, 50]
+    assert [tre.tx.seqNum for tre in posted] == [101, 102, 103]
+    for tre in posted:
+        assert tre.tx.sourceAccount.ed25519 == XDR.address_to_xdr(payer).ed25519
+    assert [r.index for r in results] == list(range(250))
+    assert all([r.success for r in results])
+    assert results[99].trxid == 'cafe101' and results[100].trxid == 'cafe102'
+    assert results[249].amount == '250' and results[249].asset == 'native'
+
+def test_bulk_pay_channels():
+    lock = threading.Lock()
+    posted = []
+    def post(url, data):
+        tre = unpack(data)
+        with lock:
+            posted.append(tre)
+        if tre.tx.operations[0].body.paymentOp.amount == XDR.amount_to_xdr('1'):
+            #second operation of first transaction fails, transaction is rolled back
+            return { 'status' : 400, 'title' : 'Transaction Failed',
+                    'extras' : { 'result_codes' : { 'transaction' : 'tx_failed',
+                        'operations' : ['op_success', 'op_no_destination', 'op_success'] } } }
+        return { 'hash' : 'cafebabe', 'ledger' : '42' }
+
+    rows = [(dest, '%d' % (i + 1)) for i in range(10)]
+    with patch.object(stellar.utils.HTTP, 'get', return_value=acc) as acc_mock:
+        with patch.object(stellar.utils.HTTP, 'post', side_effect=post):
+            results = stellar.bulk_pay(payer, rows, signers=[payer_secret],
+                    channels=channels, ops_per_transaction=3,
+                    allocator=stellar.SequenceAllocator())
+
+    assert acc_mock.call_count == 2
+    assert len(posted) == 4
+    seqs = {}
+    for tre in posted:
+        seqs.setdefault(tre.tx.sourceAccount.ed25519, []).append(tre.tx.seqNum)
+        assert len(tre.signatures) == 2
+        for op in tre.tx.operations:
+            assert op.sourceAccount[0].ed25519 == XDR.address_to_xdr(payer).ed25519
+    assert sorted(seqs.values()) == [[101, 102], [101, 102]]
+
+    assert [r.error for r in results[:3]] == ['tx_failed', 'op_no_destination', 'tx_failed']
+    assert not any([r.success for r in results[:3]])
+    assert all([r.success for r in results[3:]])
+
+def test_bulk_pay_resync():
+    posted = []
+    def post(url, data):
+        tre = unpack(data)
+        posted.append(tre.tx.seqNum)
+        if len(posted) == 1:
+            return { 'status' : 400, 'title' : 'Transaction Failed',
+                    'extras' : { 'result_codes' : { 'transaction' : 'tx_bad_seq' } } }
+        return { 'hash' : 'cafebabe', 'ledger' : '42' }
+
+    rows = [(dest, '1')] * 3
+    with patch.object(stellar.utils.HTTP, 'get', return_value=acc) as acc_mock:
+        with patch.object(stellar.utils.HTTP, 'post', side_effect=post):
+            results = stellar.bulk_pay(payer, rows, signers=[payer_secret], ops_per_transaction=1,
+                    workers=1, allocator=stellar.SequenceAllocator())
+
+    #sequences after failed transaction are fetched again and rebuilt
+    assert acc_mock.call_count == 2
+    assert posted == [101, 101, 102]
+    assert results[0].error == 'tx_bad_seq'
+    assert results[1].success and results[2].success
+
+def test_bulk_pay_federation():
+    posted = []
+    def post(url, data):
+        posted.append(unpack(data))
+        return { 'hash' : 'cafebabe', 'ledger' : '42' }
+
+    accounts = { 'bob*example.com' : dest, dest : dest }
+    errors = { 'nobody*example.com' : stellar.utils.HttpException('Address not found', 404) }
+    rows = [('bob*example.com', '1'), ('nobody*example.com', '2'), (dest, '3')]
+    with patch.object(stellar.utils.FED, 'resolve_many', return_value=(accounts, errors)) as fed_mock:
+        with patch.object(stellar.utils.HTTP, 'get', return_value=acc):
+            with patch.object(stellar.utils.HTTP, 'post', side_effect=post):
+                results = stellar.bulk_pay(payer, rows, signers=[payer_secret],
+                        allocator=stellar.SequenceAllocator())
+
+    fed_mock.assert_called_once_with(set(['bob*example.com', 'nobody*example.com', dest]))
+    assert len(posted) == 1 and len(posted[0].tx.operations) == 2
+    assert [r.destination for r in results] == [r[0] for r in rows]
+    assert results[0].success and results[2].success
+    assert results[1].error == 'Address not found'
+
+def test_bulk_pay_timeout():
+    posted = []
+    def post(url, data):
+        posted.append(data['tx'])
+        raise stellar.utils.HttpException('Read timed out', -1)
+
+    found = {}
+    def get(url):
+        if '/transactions/' in url:
+            trxid = url.split('/transactions/')[1]
+            if trxid not in found:
+                raise stellar.utils.HttpException('Resource Missing', 404)
+            return found[trxid]
+        return acc
+
+    rows = [(dest, '1')] * 2
+    with patch.object(stellar.utils.HTTP, 'get', side_effect=get):
+        with patch.object(stellar.utils.HTTP, 'post', side_effect=post):
+            results = stellar.bulk_pay(payer, rows, signers=[payer_secret], ops_per_transaction=1,
+                    workers=1, allocator=stellar.SequenceAllocator())
+
+    #transaction which was not found could still be applied
+    assert [r.pending for r in results] == [True, True]
+    assert not any([r.success for r in results])
+    assert results[0].trxid == stellar.api._envelope_hash(posted[0])
+    assert results[0].error == 'Read timed out'
+
+    trxid = stellar.api._envelope_hash(posted[0])
+    found[trxid] = { 'id' : trxid, 'paging_token' : '1', 'hash' : trxid, 'ledger' : 42,
+            'source_account' : payer, 'source_account_sequence' : '101', 'fee_paid' : 100,
+            'operation_count' : 1, 'created_at' : '2017-12-05T10:43:13Z', 'memo_type' : 'none' }
+    posted = []
+    with patch.object(stellar.utils.HTTP, 'get', side_effect=get):
+        with patch.object(stellar.utils.HTTP, 'post', side_effect=post):
+            results = stellar.bulk_pay(payer, rows[:1], signers=[payer_secret],
+                    allocator=stellar.SequenceAllocator())
+
+    assert results[0].success and not results[0].pending
+    assert results[0].trxid == trxid
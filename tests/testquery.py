@@ -1,6 +1,7 @@
 import base64
 import hashlib
 import datetime
+import time
 import stellar
 import stellar.utils
 from mock import patch
@@ -193,6 +194,16 @@ def test_transaction_fetch():
         assert t.memo == ('text', 'Have a nice day!')
         assert t.created_at == datetime.datetime.strptime('2017-12-05T10:43:13Z', '%Y-%m-%dT%H:%M:%SZ')
 
+        #xdr fields are decoded on first access only
+        assert t._decoded == {}
+        assert t.envelope.tx.operations[0].body.createAccountOp.startingBalance == 1000000000
+        assert len(t.envelope.signatures) == 1
+        assert t.envelope is t.envelope
+        assert t.result.feeCharged == 100
+        assert t.result.result.results[0].tr.createAccountResult.code == 0
+        assert len(t.result_meta.operations[0].changes) == 3
+        assert sorted(t._decoded) == ['envelope_xdr', 'result_meta_xdr', 'result_xdr']
+
 def test_transactions_fetch():
     stellar.setup_test_network()
     trxs = {
@@ -1133,3 +1144,126 @@ def test_trades_fetch():
 
         get_mock.assert_called_once_with(endpoint)
 
+
+def test_iterate():
+    stellar.setup_test_network()
+    def ledger(seq):
+        return {
+                "id": "%064x" % seq,
+                "paging_token": str(seq << 32),
+                "hash": "%064x" % seq,
+                "prev_hash": "%064x" % (seq - 1),
+                "sequence": seq,
+                "transaction_count": 0,
+                "operation_count": 0,
+                "closed_at": "2017-12-05T10:43:03Z",
+                "total_coins": "103491574319.4671445",
+                "fee_pool": "1468208.3174528",
+                "base_fee": 100,
+                "base_reserve": "10.0000000",
+                "max_tx_set_size": 50,
+                }
+    def page(seqs, cursor):
+        return {
+                "_links": {
+                    "next": { "href": "https://horizon-testnet.stellar.org/ledgers?cursor=%s&limit=2&order=asc" % cursor },
+                    "prev": { "href": "https://horizon-testnet.stellar.org/ledgers?cursor=0&limit=2&order=desc" },
+                    },
+                "_embedded": { "records": [ledger(s) for s in seqs] }
+                }
+
+    horizon, _ = stellar.get_current_network()
+    pages = [page([1, 2], 'a'), page([3, 4], 'b'), page([5], 'c'), page([], 'd')]
+    with patch.object(stellar.utils.HTTP, 'get', side_effect=pages) as get_mock:
+        ledgers = list(stellar.ledgers().iterate(limit=2))
+
+        assert [l.ledseq for l in ledgers] == [1, 2, 3, 4, 5]
+        assert get_mock.call_count == 4
+        assert get_mock.call_args_list[0][0][0] == horizon + '/ledgers?limit=2&order=asc'
+        assert get_mock.call_args_list[3][0][0] == 'https://horizon-testnet.stellar.org/ledgers?cursor=c&limit=2&order=asc'
+
+    pages = [page([1, 2], 'a'), page([3, 4], 'b'), page([5], 'c'), page([], 'd')]
+    with patch.object(stellar.utils.HTTP, 'get', side_effect=pages) as get_mock:
+        ledgers = list(stellar.ledgers().iterate(limit=2, max_records=3))
+
+        assert [l.ledseq for l in ledgers] == [1, 2, 3]
+        assert get_mock.call_count == 2
+
+def test_backfill():
+    stellar.setup_test_network()
+    horizon, _ = stellar.get_current_network()
+    last_ledger = 100
+    def ledger(seq):
+        return {
+                "id": "%064x" % seq,
+                "paging_token": str(seq << 32),
+                "hash": "%064x" % seq,
+                "prev_hash": "%064x" % (seq - 1),
+                "sequence": seq,
+                "transaction_count": 0,
+                "operation_count": 0,
+                "closed_at": "2017-12-05T10:43:03Z",
+                "total_coins": "103491574319.4671445",
+                "fee_pool": "1468208.3174528",
+                "base_fee": 100,
+                "base_reserve": "10.0000000",
+                "max_tx_set_size": 50,
+                }
+    def mock_get(url):
+        query = dict(q.split('=') for q in url.split('?')[1].split('&'))
+        first = (int(query['cursor']) >> 32) + 1
+        seqs = range(first, min(first + int(query['limit']), last_ledger + 1))
+        cursor = seqs[-1] << 32 if len(seqs) > 0 else query['cursor']
+        return {
+                "_links": {
+                    "next": { "href": horizon + "/ledgers?cursor=%s&limit=%s&order=asc" % (cursor, query['limit']) },
+                    "prev": { "href": horizon + "/ledgers?cursor=0&limit=2&order=desc" },
+                    },
+                "_embedded": { "records": [ledger(s) for s in seqs] }
+                }
+
+    with patch.object(stellar.utils.HTTP, 'get', side_effect=mock_get) as get_mock:
+        ledgers = list(stellar.ledgers().backfill(10, 60, workers=3, ledgers_per_range=7, limit=3))
+        assert [l.ledseq for l in ledgers] == list(range(10, 60))
+
+        ledgers = list(stellar.ledgers().backfill(95, 200, workers=2))
+        assert [l.ledseq for l in ledgers] == list(range(95, 101))
+
+        #records are fetched page by page, few pages ahead of consumed ones
+        get_mock.reset_mock()
+        ledgers = stellar.ledgers().backfill(1, 101, workers=2, ledgers_per_range=50, limit=1)
+        assert next(ledgers).ledseq == 1
+        time.sleep(0.1)
+        assert get_mock.call_count <= 2*2 + 1
+        assert [l.ledseq for l in ledgers] == list(range(2, 101))
+
+def test_backfill_effects():
+    stellar.setup_test_network()
+    horizon, _ = stellar.get_current_network()
+    def effect(seq, i):
+        opid = (seq << 32) | (1 << 12) | 1
+        return {
+                "id": "%019d-%010d" % (opid, i),
+                "paging_token": "%d-%d" % (opid, i),
+                "account": "GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24",
+                "type": "account_removed",
+                "type_i": 1,
+                }
+    effects = [effect(seq, i) for seq in range(1, 31) for i in (1, 2)]
+    def mock_get(url):
+        query = dict(q.split('=') for q in url.split('?')[1].split('&'))
+        cursor = tuple(int(c) for c in query['cursor'].split('-'))
+        records = [e for e in effects
+                if tuple(int(c) for c in e['paging_token'].split('-')) > cursor][:int(query['limit'])]
+        return {
+                "_links": {
+                    "next": { "href": "" },
+                    "prev": { "href": "" },
+                    },
+                "_embedded": { "records": records }
+                }
+
+    with patch.object(stellar.utils.HTTP, 'get', side_effect=mock_get) as get_mock:
+        records = list(stellar.effects().backfill(5, 20, workers=3, ledgers_per_range=4, limit=3))
+        assert [r.paging_token for r in records] == [e['paging_token'] for e in effects[8:38]]
+        assert get_mock.call_args_list[0][0][0].startswith(horizon + '/effects?cursor=%d-0&' % (5 << 32))
@@ -0,0 +1,73 @@
+import threading
+import stellar
+from stellar.api import Payments
+from mock import Mock
+
+alice = 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
+bob = 'GDUWG5CZ6YJNWOPQB33DOKWVWSNHJAWPWOUNAEBVTM7QRJ66NGFYEFAJ'
+carol = 'GBWF6NTCPGBROJIPF54XXYRLTUGBDLLORPFDK4FGQQ3IRI4T5PHCGVXV'
+
+def payment(source, to, asset=None):
+    data = { 'id' : '1', 'paging_token' : '1', 'source_account' : source,
+            'type' : 'payment', 'type_i' : 1, 'created_at' : '2017-12-05T10:43:13Z',
+            'transaction_hash' : 'cafebabe', 'amount' : '1', 'from' : source, 'to' : to,
+            'asset_type' : 'native' }
+    if asset:
+        data.update({ 'asset_type' : 'credit_alphanum4', 'asset_code' : asset[0],
+            'asset_issuer' : asset[1] })
+    return Payments.Payment(data)
+
+def test_route():
+    router = stellar.Router()
+    on_alice, on_bob, on_usd = Mock(), Mock(), Mock()
+    router.watch_account(alice, on_alice)
+    router.watch_account(bob, on_bob)
+    router.watch_asset(('USD', carol), on_usd)
+
+    p1 = payment(alice, bob)
+    assert router.route(p1) == 2
+    on_alice.assert_called_once_with(p1)
+    on_bob.assert_called_once_with(p1)
+
+    p2 = payment(carol, alice, ('USD', carol))
+    assert router.route(p2) == 2
+    on_usd.assert_called_once_with(p2)
+
+    assert router.route(payment(carol, carol)) == 0
+    assert router.routed == 2 and router.unmatched == 1
+
+def test_watch_list_changes():
+    router = stellar.Router()
+    on_alice, other = Mock(), Mock()
+    router.watch_account(alice, on_alice)
+    router.watch_account(alice, other)
+    router.watch_asset('native', other)
+
+    #callback watching both account and asset of the record is called once
+    assert router.route(payment(alice, carol)) == 2
+    assert other.call_count == 1
+
+    router.unwatch_account(alice, other)
+    router.unwatch_asset('native')
+    assert router.route(payment(alice, carol)) == 1
+    assert other.call_count == 1 and on_alice.call_count == 2
+    assert router.watched_assets() == set()
+
+    router.unwatch_account(alice)
+    assert router.watched_accounts() == set()
+    assert router.route(payment(alice, carol)) == 0
+
+def test_start():
+    router = stellar.Router()
+    received = []
+    done = threading.Event()
+    def on_bob(p):
+        received.append(p)
+        done.set()
+    router.watch_account(bob, on_bob)
+    failing = Mock(side_effect=Exception('failed'))
+    router.watch_account(alice, failing)
+
+    router.start([payment(alice, carol), payment(carol, bob)]).join(5)
+    assert failing.call_count == 1
+    assert len(received) == 1 and received[0].destination == bob
@@ -0,0 +1,37 @@
+import base64
+import hashlib
+import stellar
+import stellar.api
+from stellar.xdr import Xdr
+
+stellar.setup_test_network()
+
+account = 'GAO4R7CQGQAV2BEPPQ2LRQP3ANUFOJOBNDEM7AAVCWZA5IIUKIO2FKR5'
+secrets = ['SABS6T5RZCOGXH6RZJM6BNHAN7KXVK6VKJRUPBW2KFABEWDBTIEPCRUO',
+        'SALCB22A3PL2JFI3GE62BM4S2TE64NJZP4GF2DBGPBC6QIUQ7GI7BRBN']
+dest = 'GDUWG5CZ6YJNWOPQB33DOKWVWSNHJAWPWOUNAEBVTM7QRJ66NGFYEFAJ'
+
+def transactions(n):
+    envelopes, pairs = [], []
+    for i in range(n):
+        envelope = stellar.new_transaction(account, signers=secrets, seq=i + 1).pay(dest, '1').build()
+        tre = Xdr.StellarXDRUnpacker(base64.b64decode(envelope)).unpack_TransactionEnvelope()
+        packer = Xdr.StellarXDRPacker()
+        packer.pack_EnvelopeType(Xdr.const.ENVELOPE_TYPE_TX)
+        packer.pack_Transaction(tre.tx)
+        trx_hash = hashlib.sha256(stellar.api.network_id + packer.get_buffer()).digest()
+        trx = packer.get_buffer()[4:]
+        envelopes.append(envelope)
+        pairs.append((trx if i % 2 else base64.b64encode(trx).decode('utf-8'), trx_hash))
+    return envelopes, pairs
+
+def test_sign_batch():
+    envelopes, pairs = transactions(10)
+    assert stellar.sign_batch(pairs, secrets, processes=2, chunksize=3) == envelopes
+    assert stellar.sign_batch(pairs, stellar.Keyring(secrets), processes=0) == envelopes
+
+def test_batch_signer():
+    envelopes, pairs = transactions(4)
+    with stellar.BatchSigner(secrets, processes=1) as signer:
+        assert signer.sign(pairs[:2]) == envelopes[:2]
+        assert signer.sign(pairs[2:]) == envelopes[2:]
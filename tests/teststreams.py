@@ -0,0 +1,155 @@
+import os
+import tempfile
+import threading
+import stellar
+import stellar.utils
+from stellar.streams import Stream, BoundedQueue, load_checkpoint
+from stellar.utils import HttpException
+from mock import patch, Mock
+
+stellar.setup_test_network()
+
+def events(*records):
+    def gen():
+        yield None, '"hello"'
+        for r in records:
+            if isinstance(r, Exception):
+                raise r
+            yield r['paging_token'], '{"paging_token": "%s"}' % r['paging_token']
+    return gen()
+
+def url(cursor):
+    return 'https://horizon/ledgers?cursor=%s' % cursor
+
+def test_events():
+    response = Mock()
+    response.status_code = 200
+    response.iter_content.return_value = [b': keep-alive\n\nid: 1\ndata: "hello"\n\n',
+            b'id: 2\r\ndata: {"a":\r\ndata: "\xc3', b'\xa9"}\r\n\r\nretry: 10\n\n']
+    session = Mock()
+    session.get.return_value = response
+    with patch.object(stellar.utils.HTTP, 'session', return_value=session):
+        events = list(stellar.utils.HTTP.events('https://horizon/ledgers', last_id='42'))
+
+    assert events == [('1', '"hello"'), ('2', u'{"a":\n"\xe9"}')]
+    headers = session.get.call_args[1]['headers']
+    assert headers['Last-Event-ID'] == '42'
+    response.close.assert_called_once()
+
+def test_stream_reconnect():
+    calls = []
+    def mock_events(u):
+        calls.append(u)
+        if len(calls) == 1:
+            return events({'paging_token' : '1'}, {'paging_token' : '2'}, HttpException('reset', -1))
+        elif len(calls) == 2:
+            return events({'paging_token' : '3'})
+        return events()
+
+    path = os.path.join(tempfile.mkdtemp(), 'cursor')
+    with patch.object(stellar.utils.HTTP, 'events', side_effect=mock_events):
+        with patch('time.sleep') as sleep_mock:
+            stream = Stream(url, lambda r: r['paging_token'], checkpoint=path, max_retries=1)
+            assert list(stream) == ['1', '2', '3']
+
+    assert calls == [url(None), url('2'), url('3')]
+    assert stream.reconnects == 2
+    assert sleep_mock.call_count == 2
+    assert stream.cursor == '3'
+    assert load_checkpoint(path) == '3'
+
+def test_stream_checkpoint():
+    path = os.path.join(tempfile.mkdtemp(), 'cursor')
+    with open(path, 'w') as f:
+        f.write('5\n')
+
+    with patch.object(stellar.utils.HTTP, 'events',
+            return_value=events({'paging_token' : '6'}, {'paging_token' : '7'})) as events_mock:
+        stream = Stream(url, lambda r: r['paging_token'], cursor='1', checkpoint=path)
+        assert next(stream) == '6'
+        assert next(stream) == '7'
+        #last record is not processed until it is committed
+        stream.close()
+
+    events_mock.assert_called_once_with(url('5'))
+    assert load_checkpoint(path) == '6'
+    stream.commit()
+    assert load_checkpoint(path) == '7'
+
+def test_stream_not_found():
+    with patch.object(stellar.utils.HTTP, 'events',
+            side_effect=HttpException('not found', 404)):
+        stream = stellar.account('GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24').payments().stream()
+        assert stream.url('42') == 'https://horizon-testnet.stellar.org/accounts/' \
+                'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24/payments?cursor=42&limit=10&order=asc'
+        try:
+            next(stream)
+            assert False
+        except HttpException as e:
+            assert e.error == 404
+        assert stream.reconnects == 0
+
+def test_bounded_queue():
+    q = BoundedQueue(3, 'drop-oldest')
+    for i in range(5):
+        q.put(i)
+    assert q.get_batch(10) == [2, 3, 4]
+    assert q.dropped == 2
+    assert q.get_batch(10, timeout=0.01) == []
+
+    q = BoundedQueue(2, 'spill')
+    for i in range(7):
+        q.put(i)
+    assert len(q) == 7 and q.spilled == 5
+    assert q.get_batch(3) == [0, 1]
+    q.put(7)
+    assert q.get_batch(3) == [2, 3]
+    assert q.get_batch(10) == [4, 5]
+    assert q.get_batch(10) == [6, 7]
+    q.put(8)
+    assert q.get_batch(10) == [8] and q.spilled == 6
+
+    q = BoundedQueue(2, 'block')
+    q.put(0)
+    q.put(1)
+    t = threading.Thread(target=q.put, args=(2,))
+    t.start()
+    t.join(0.05)
+    assert t.is_alive()
+    assert q.get_batch(1) == [0]
+    t.join(1)
+    assert q.get_batch(10) == [1, 2]
+    q.close()
+    assert q.get_batch(10) == []
+    try:
+        q.put(3)
+        assert False
+    except ValueError:
+        pass
+
+def test_buffered_stream():
+    path = os.path.join(tempfile.mkdtemp(), 'cursor')
+    records = [{'paging_token' : str(i)} for i in range(1, 8)]
+    with patch.object(stellar.utils.HTTP, 'events',
+            return_value=events(*(records + [HttpException('not found', 404)]))):
+        stream = Stream(url, lambda r: r['paging_token'], checkpoint=path).buffered(maxsize=2,
+                overflow='spill')
+        stream._thread.join(5)
+        assert stream.queue.spilled == 5
+
+        assert stream.get_batch(3) == ['1', '2']
+        #records are not processed until committed
+        assert load_checkpoint(path) is None
+        stream.commit()
+        assert load_checkpoint(path) == '2'
+
+        batches = []
+        try:
+            while True:
+                batches.append(stream.get_batch(3, timeout=5))
+        except HttpException as e:
+            assert e.error == 404
+
+    assert batches == [['3', '4'], ['5', '6'], ['7']]
+    stream.commit()
+    assert load_checkpoint(path) == '7'
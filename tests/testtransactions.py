@@ -379,3 +379,155 @@ def test_trx_seq():
 
     get_mock.assert_called_once_with('https://horizon-testnet.stellar.org/transactions/', { 'tx' : trx_env })
 
+
+bad_seq_result = { 'status' : 400, 'title' : 'Transaction Failed',
+        'extras' : { 'result_codes' : { 'transaction' : 'tx_bad_seq' } } }
+
+def test_sequence_allocator():
+    import threading
+    fetched = []
+    def fetch_sequence(accid):
+        fetched.append(accid)
+        return 41
+
+    allocator = stellar.SequenceAllocator(fetch_sequence)
+    reserved = []
+    def reserve():
+        for i in range(100):
+            reserved.append(allocator.next('GA'))
+    threads = [threading.Thread(target=reserve) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(reserved) == list(range(42, 442))
+    assert fetched == ['GA']
+    assert allocator.next('GB') == 42
+
+    seq, epoch = allocator.reserve('GA')
+    allocator.resync('GA', epoch)
+    assert allocator.reserve('GA') == (42, epoch + 1)
+    #stale epoch does not resync again
+    allocator.resync('GA', epoch)
+    assert allocator.next('GA') == 43
+    assert fetched == ['GA', 'GB', 'GA']
+
+def test_trx_sequence_allocator():
+    public = 'GAO4R7CQGQAV2BEPPQ2LRQP3ANUFOJOBNDEM7AAVCWZA5IIUKIO2FKR5'
+    secret = 'SABS6T5RZCOGXH6RZJM6BNHAN7KXVK6VKJRUPBW2KFABEWDBTIEPCRUO'
+    dest = 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
+    seqs = []
+    def build(self, account_seq):
+        seqs.append(account_seq)
+        return 'envelope'
+
+    stellar.setup_sequences()
+    try:
+        with patch.object(stellar.NewTransaction, '_build', build):
+            with patch.object(stellar.utils.HTTP, 'get', return_value=acc) as acc_mock:
+                with patch.object(stellar.utils.HTTP, 'post', return_value=result):
+                    for i in range(3):
+                        with stellar.new_transaction(public, signers=[secret]) as t:
+                            t.pay(dest, '42')
+                acc_mock.assert_called_once()
+
+                with patch.object(stellar.utils.HTTP, 'post', return_value=bad_seq_result):
+                    with stellar.new_transaction(public, signers=[secret]) as t:
+                        t.pay(dest, '42')
+                    assert not t.is_success()
+                    t.submit()
+                assert acc_mock.call_count == 2
+    finally:
+        stellar.setup_sequences(False)
+
+    first = int(acc['sequence']) + 1
+    assert seqs == [first, first + 1, first + 2, first + 3, first]
+
+def test_trx_staged_signing():
+    public = 'GAO4R7CQGQAV2BEPPQ2LRQP3ANUFOJOBNDEM7AAVCWZA5IIUKIO2FKR5'
+    secret = 'SABS6T5RZCOGXH6RZJM6BNHAN7KXVK6VKJRUPBW2KFABEWDBTIEPCRUO'
+    cosigner = 'SALCB22A3PL2JFI3GE62BM4S2TE64NJZP4GF2DBGPBC6QIUQ7GI7BRBN'
+    dest = 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
+    def new_transaction(signers):
+        return stellar.new_transaction(public, signers=signers, seq=42).pay(dest, '1')
+
+    t = new_transaction([secret])
+    try:
+        t.envelope()
+        assert False
+    except Exception as e:
+        assert str(e) == 'Transaction not prepared'
+
+    trx, trx_hash = t.prepare()
+    assert len(trx_hash) == 32
+    assert t.sign().envelope() == new_transaction([secret]).build()
+
+    #signatures of other parties are added to already prepared transaction
+    t.sign([cosigner])
+    assert len(t.signatures) == 2
+    assert t.envelope() == new_transaction([secret, cosigner]).build()
+    assert t.prepare() == (trx, trx_hash)
+    assert t.signatures == []
+
+def test_trx_from_xdr():
+    public = 'GAO4R7CQGQAV2BEPPQ2LRQP3ANUFOJOBNDEM7AAVCWZA5IIUKIO2FKR5'
+    secret = 'SABS6T5RZCOGXH6RZJM6BNHAN7KXVK6VKJRUPBW2KFABEWDBTIEPCRUO'
+    cosigner = 'SALCB22A3PL2JFI3GE62BM4S2TE64NJZP4GF2DBGPBC6QIUQ7GI7BRBN'
+    dest = 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
+    def new_transaction(signers):
+        return stellar.new_transaction(public, signers=signers, seq=42, fee=300,
+                memo=('id', 7), time_bounds=[1, 2]).pay(dest, '1', ('USD', dest))
+
+    envelope = new_transaction([secret]).build()
+    t = stellar.NewTransaction.from_xdr(envelope)
+    assert t.account == public
+    assert (t.seq, t.memo, t.time_bounds) == (42, ('id', 7), [1, 2])
+    assert len(t.ops) == 1 and len(t.signatures) == 1
+    assert t.envelope() == envelope
+    assert t.sign([cosigner]).envelope() == new_transaction([secret, cosigner]).build()
+
+    #fee of the envelope is per operation when operations are added
+    t.pay(dest, '2')
+    t.prepare()
+    expected = new_transaction([secret]).pay(dest, '2')
+    expected.fee = 600
+    assert t.sign([secret]).envelope() == expected.build()
+
+    #operations edited in place are packed again
+    t.ops[0].body.paymentOp.amount += 1
+    t.prepare()
+    expected = new_transaction([secret]).pay(dest, '2')
+    expected.ops[0].body.paymentOp.amount += 1
+    expected.fee = 600
+    assert t.sign([secret]).envelope() == expected.build()
+
+def test_trx_from_xdr_submit():
+    public = 'GAO4R7CQGQAV2BEPPQ2LRQP3ANUFOJOBNDEM7AAVCWZA5IIUKIO2FKR5'
+    secret = 'SABS6T5RZCOGXH6RZJM6BNHAN7KXVK6VKJRUPBW2KFABEWDBTIEPCRUO'
+    cosigner = 'SALCB22A3PL2JFI3GE62BM4S2TE64NJZP4GF2DBGPBC6QIUQ7GI7BRBN'
+    dest = 'GDZ4R34MNVITLNZ4KVKBEANJU3UZZFZZLOX7ZVU5AWI7FEL5A6JWDM24'
+    def new_transaction(signers):
+        return stellar.new_transaction(public, signers=signers, seq=42, fee=150,
+                memo=('id', 7), time_bounds=[1, 2]).pay(dest, '1').pay(dest, '2')
+
+    envelope = new_transaction([secret]).build()
+    with patch.object(stellar.utils.HTTP, 'post', return_value=result) as post_mock:
+        stellar.NewTransaction.from_xdr(envelope).submit()
+        post_mock.assert_called_once_with(
+                'https://horizon-testnet.stellar.org/transactions/', {'tx' : envelope})
+
+    #signatures of the envelope are kept when co-signer submits it
+    with patch.object(stellar.utils.HTTP, 'post', return_value=result) as post_mock:
+        with stellar.NewTransaction.from_xdr(envelope, [cosigner]):
+            pass
+        post_mock.assert_called_once_with('https://horizon-testnet.stellar.org/transactions/',
+                {'tx' : new_transaction([secret, cosigner]).build()})
+
+    t = stellar.NewTransaction.from_xdr(envelope)
+    t.pay(dest, '3')
+    try:
+        t.build()
+        assert False
+    except Exception as e:
+        assert 'signatures' in str(e)
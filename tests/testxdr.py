@@ -0,0 +1,175 @@
+import re
+import os
+import base64
+import stellar.xdr.codec as codec
+from stellar.xdr import Xdr
+
+try:
+    import xdrlib
+except ImportError:
+    xdrlib = None
+
+def envelopes():
+    src = ''
+    for f in ('testtransactions.py', 'testfed.py'):
+        with open(os.path.join(os.path.dirname(__file__), f)) as content:
+            src += content.read()
+    return sorted(set(re.findall(r"'(AAAA[A-Za-z0-9+/=]{100,})'", src)))
+
+def test_envelope_roundtrip():
+    envs = envelopes()
+    assert len(envs) > 0
+    for env in envs:
+        raw = base64.b64decode(env)
+        unpacker = Xdr.StellarXDRUnpacker(raw)
+        tre = unpacker.unpack_TransactionEnvelope()
+        unpacker.done()
+
+        packer = Xdr.StellarXDRPacker()
+        packer.pack_TransactionEnvelope(tre)
+        assert packer.get_buffer() == raw
+
+def test_basic_types():
+    p = codec.Packer(size=1)
+    p.pack_int(-2)
+    p.pack_uint(0xffffffff)
+    p.pack_hyper(-3)
+    p.pack_uhyper(2**64 - 1)
+    p.pack_bool(True)
+    p.pack_fopaque(5, b'abcde')
+    p.pack_string(b'xy')
+    p.pack_array([1, 2], p.pack_int)
+    p.pack_double(0.5)
+    buf = p.get_buffer()
+    assert len(buf) == 4 + 4 + 8 + 8 + 4 + 8 + 8 + 12 + 8
+
+    u = codec.Unpacker(buf)
+    assert u.unpack_int() == -2
+    assert u.unpack_uint() == 0xffffffff
+    assert u.unpack_hyper() == -3
+    assert u.unpack_uhyper() == 2**64 - 1
+    assert u.unpack_bool() is True
+    assert u.unpack_fopaque(5) == b'abcde'
+    assert u.unpack_string() == b'xy'
+    assert u.unpack_array(u.unpack_int) == [1, 2]
+    assert u.unpack_double() == 0.5
+    u.done()
+
+    try:
+        u.unpack_int()
+        assert False
+    except EOFError:
+        pass
+
+    try:
+        p.pack_int(2**31)
+        assert False
+    except codec.ConversionError:
+        pass
+
+def test_same_as_xdrlib():
+    if xdrlib is None:
+        return
+
+    def pack(packer):
+        packer.pack_int(-7)
+        packer.pack_uint(7)
+        packer.pack_hyper(-2**40)
+        packer.pack_uhyper(2**63 + 5)
+        packer.pack_bool(0)
+        packer.pack_fopaque(4, b'ab')
+        packer.pack_opaque(b'abcdefg')
+        packer.pack_string(b'')
+        packer.pack_farray(2, [3, 4], packer.pack_uint)
+        packer.pack_float(1.25)
+        return packer.get_buffer()
+
+    assert pack(codec.Packer()) == pack(xdrlib.Packer())
+
+def test_filters():
+    raw = base64.b64decode(envelopes()[0])
+    tre = Xdr.StellarXDRUnpacker(raw).unpack_TransactionEnvelope()
+
+    class FilteringPacker(Xdr.StellarXDRPacker):
+        calls = []
+        def filter_Transaction(self, data):
+            self.calls.append(data.fee)
+            return data
+        #AccountID is typedef of PublicKey, same hook as generated alias used
+        def filter_PublicKey(self, data):
+            self.calls.append('key')
+            return data
+
+    class FilteringUnpacker(Xdr.StellarXDRUnpacker):
+        def filter_Price(self, data):
+            return (data.n, data.d)
+        def filter_Memo(self, data):
+            return 'memo'
+
+    p = FilteringPacker()
+    p.pack_TransactionEnvelope(tre)
+    assert p.get_buffer() == raw
+    assert FilteringPacker.calls[0] == tre.tx.fee
+    assert 'key' in FilteringPacker.calls
+
+    class Subclass(FilteringPacker):
+        pass
+    del FilteringPacker.calls[:]
+    Subclass().pack_Transaction(tre.tx)
+    assert FilteringPacker.calls.count(tre.tx.fee) == 1
+
+    assert FilteringUnpacker(raw).unpack_TransactionEnvelope().tx.memo == 'memo'
+    price = Xdr.StellarXDRPacker()
+    price.pack_Price(Xdr.types.Price(n=1, d=2))
+    assert FilteringUnpacker(price.get_buffer()).unpack_Price() == (1, 2)
+
+    #plain generated classes are left untouched
+    assert Xdr.StellarXDRUnpacker(raw).unpack_TransactionEnvelope().tx.memo != 'memo'
+
+def test_fixed_struct_errors():
+    p = Xdr.StellarXDRPacker()
+    try:
+        p.pack_Price(Xdr.types.Price(n=1))
+        assert False
+    except TypeError:
+        pass
+    try:
+        p.pack_Price(Xdr.types.Price(n=1, d=2**31))
+        assert False
+    except codec.ConversionError:
+        pass
+    try:
+        p.pack_ThresholdIndexes(42)
+        assert False
+    except codec.Error:
+        pass
+
+def test_slots_types():
+    key = Xdr.types.SignerKey(Xdr.const.SIGNER_KEY_TYPE_HASH_X, hashX=b'x' * 32)
+    assert not hasattr(key, '__dict__')
+    assert key.switch == b'x' * 32
+    try:
+        key.unknown = 1
+        assert False
+    except AttributeError:
+        pass
+
+    #default arm of result union is void
+    result = Xdr.types.PaymentResult(code=Xdr.const.PAYMENT_MALFORMED)
+    assert result.switch is None
+    try:
+        Xdr.types.PublicKey(type=42).switch
+        assert False
+    except KeyError:
+        pass
+
+    #unique union member of struct is passed through
+    raw = base64.b64decode(envelopes()[0])
+    tre = Xdr.StellarXDRUnpacker(raw).unpack_TransactionEnvelope()
+    op = tre.tx.operations[0]
+    assert op.type == op.body.type
+
+    import copy
+    packer = Xdr.StellarXDRPacker()
+    packer.pack_TransactionEnvelope(copy.deepcopy(tre))
+    assert packer.get_buffer() == raw